@@ -1,3 +1,4 @@
+import ast
 import subprocess
 import os
 from pathlib import Path
@@ -12,6 +13,8 @@ import argparse
 #   Three generation modes: CAST, GROMET, METADATA
 # Requires that swagger-codegen is installed
 #   On Mac with homebrew:  $ brew install swagger-codegen
+# The CAST model classes are then rewritten as __slots__ classes (see
+#   make_slotted_models()), which can also be done on its own with --slots-only
 # -----------------------------------------------------------------------------
 
 
@@ -34,8 +37,8 @@ SWAGGER_COMMAND = ["swagger-codegen", "generate", "-l", "python", "-o", "./clien
 GENERATED_MODEL_ROOT = "client/swagger_client/models"
 GENERATED_MODEL_IMPORT_PATH = "swagger_client.models"
 
-MODEL_ROOT_CAST = "skema/program_analysis/CAST2GrFN/model/cast"
-IMPORT_PATH_CAST = "skema.program_analysis.CAST2GrFN.model.cast"
+MODEL_ROOT_CAST = "skema/program_analysis/CAST2FN/model/cast"
+IMPORT_PATH_CAST = "skema.program_analysis.CAST2FN.model.cast"
 
 MODEL_ROOT_GROMET = "skema/gromet/fn"
 IMPORT_PATH_GROMET = "skema.gromet.fn"
@@ -43,6 +46,9 @@ IMPORT_PATH_GROMET = "skema.gromet.fn"
 MODEL_ROOT_METADATA = "skema/gromet/metadata"
 IMPORT_PATH_METADATA = "skema.gromet.metadata"
 
+# The model types whose classes are rewritten as __slots__ classes
+SLOTTED_MODEL_TYPES = ['CAST']
+
 
 # -----------------------------------------------------------------------------
 # Implementation
@@ -213,6 +219,182 @@ def delete_generated_client_dir(verbose: bool = True):
         print("    DONE.")
 
 
+def parse_model_class(src_filepath: str) -> dict:
+    """
+    Collect what a slotted model class is generated from, out of a model
+    module generated by swagger-codegen (or already made slotted).
+    :param src_filepath: path of the model module
+    :return: dict of the module docstring, the import lines, the class name and
+        base, the enum values, and the own and inherited fields of the class
+    """
+    source = read_lines_from_file(src_filepath)
+    tree = ast.parse(''.join(source))
+    [class_def] = [node for node in tree.body if isinstance(node, ast.ClassDef)]
+    base = class_def.bases[0].id if class_def.bases else 'object'
+
+    enum_values = list()
+    swagger_types = dict()
+    attribute_map = dict()
+    for node in class_def.body:
+        if isinstance(node, ast.Assign) and len(node.targets) == 1 \
+                and isinstance(node.targets[0], ast.Name):
+            name = node.targets[0].id
+            if name == 'swagger_types':
+                swagger_types = ast.literal_eval(node.value)
+            elif name == 'attribute_map':
+                attribute_map = ast.literal_eval(node.value)
+            elif name.isupper():
+                enum_values.append((name, ast.literal_eval(node.value)))
+
+    imports = [line.rstrip('\n') for line in source
+               if line.startswith('from ') and 'import' in line and '__future__' not in line]
+    return {
+        'docstring': ast.get_docstring(tree, clean=False),
+        'imports': imports,
+        'name': class_def.name,
+        'base': base,
+        'enum_values': enum_values,
+        'swagger_types': swagger_types,
+        'attribute_map': attribute_map,
+    }
+
+
+def format_dict_lines(name: str, values: dict) -> List[str]:
+    """Formats the class attribute name = values the way swagger-codegen does"""
+    items = [f"        '{key}': '{value}'" for key, value in values.items()]
+    return [f'    {name} = {{', ',\n'.join(items), '    }'] if items else [f'    {name} = {{', '    }']
+
+
+def render_slotted_model(model: dict) -> List[str]:
+    """
+    Render the module of a model class that keeps its fields in __slots__
+    instead of a per instance __dict__ of private attributes behind properties.
+    The public API of the swagger-codegen classes is kept: the fields,
+    swagger_types, attribute_map, discriminator, to_dict(), to_str() and equality.
+    :param model: dict returned by parse_model_class()
+    :return: lines of the module
+    """
+    name = model['name']
+    base = model['base']
+    fields = list(model['swagger_types'].keys())
+    slots = ''.join(f"'{field}', " for field in fields).rstrip(' ')
+    if len(fields) > 1:
+        slots = slots.rstrip(',')
+    init_args = ''.join(f'{field}=None, ' for field in fields)
+    if base != 'object':
+        init_args += '*args, **kwargs'
+    init_args = init_args.rstrip(', ')
+
+    lines = ['# coding: utf-8', '', f'"""{model["docstring"]}"""', '',
+             'import pprint', 'import re  # noqa: F401', '', 'import six']
+    lines += model['imports']
+    lines += ['', f'class {name}({base}):',
+              '    """NOTE: This class is auto generated by the swagger code generator program,',
+              '    and made slotted by scripts/codegen_swagger_models.py.',
+              '',
+              '    Do not edit the class manually.',
+              '    """']
+    if model['enum_values']:
+        lines += ['', '    """', '    allowed enum values', '    """']
+        lines += [f'    {key} = "{value}"' for key, value in model['enum_values']]
+    lines += ['    """',
+              '    Attributes:',
+              '      swagger_types (dict): The key is attribute name',
+              '                            and the value is attribute type.',
+              '      attribute_map (dict): The key is attribute name',
+              '                            and the value is json key in definition.',
+              '    """',
+              f'    __slots__ = ({slots})',
+              '',
+              '    discriminator = None',
+              '']
+    for attribute, values in (('swagger_types', model['swagger_types']),
+                              ('attribute_map', model['attribute_map'])):
+        lines += format_dict_lines(attribute, values)
+        if base != 'object':
+            lines += [f'    if hasattr({base}, "{attribute}"):',
+                      f'        {attribute}.update({base}.{attribute})']
+        lines += ['']
+
+    lines += [f'    def __init__(self, {init_args}):  # noqa: E501'.replace('(self, )', '(self)'),
+              f'        """{name} - a model defined in Swagger"""  # noqa: E501']
+    lines += [f'        self.{field} = {field}' for field in fields]
+    if base != 'object':
+        lines += [f'        {base}.__init__(self, *args, **kwargs)']
+
+    lines += ['',
+              '    def to_dict(self):',
+              '        """Returns the model properties as a dict"""',
+              '        result = {}',
+              '',
+              '        for attr, _ in six.iteritems(self.swagger_types):',
+              '            value = getattr(self, attr)',
+              '            if isinstance(value, list):',
+              '                result[attr] = list(map(',
+              '                    lambda x: x.to_dict() if hasattr(x, "to_dict") else x,',
+              '                    value',
+              '                ))',
+              '            elif hasattr(value, "to_dict"):',
+              '                result[attr] = value.to_dict()',
+              '            elif isinstance(value, dict):',
+              '                result[attr] = dict(map(',
+              '                    lambda item: (item[0], item[1].to_dict())',
+              '                    if hasattr(item[1], "to_dict") else item,',
+              '                    value.items()',
+              '                ))',
+              '            else:',
+              '                result[attr] = value',
+              f'        if issubclass({name}, dict):',
+              '            for key, value in self.items():',
+              '                result[key] = value',
+              '',
+              '        return result',
+              '',
+              '    def to_str(self):',
+              '        """Returns the string representation of the model"""',
+              '        return pprint.pformat(self.to_dict())',
+              '',
+              '    def __repr__(self):',
+              '        """For `print` and `pprint`"""',
+              '        return self.to_str()',
+              '',
+              '    def __eq__(self, other):',
+              '        """Returns true if both objects are equal"""',
+              f'        if not isinstance(other, {name}):',
+              '            return False',
+              '',
+              '        if self.swagger_types.keys() != other.swagger_types.keys():',
+              '            return False',
+              '        return all(getattr(self, attr) == getattr(other, attr)',
+              '                   for attr in self.swagger_types)',
+              '',
+              '    def __ne__(self, other):',
+              '        """Returns true if both objects are not equal"""',
+              '        return not self == other']
+    return lines
+
+
+def make_slotted_models(model_root: str, verbose: bool = True):
+    """
+    Rewrite every model class of model_root as a __slots__ class. Large CAST
+    trees are made of many small nodes, so dropping their per instance
+    __dict__ (and the properties in front of it) saves most of their memory.
+    :param model_root: directory of the model modules
+    :param verbose:
+    :return:
+    """
+    if verbose:
+        print("(6) make_slotted_models()")
+    src_files = collect_filepaths(model_root, ignore=['__init__.py'], verbose=False)
+    for filename in sorted(src_files):
+        filepath = os.path.join(model_root, filename)
+        if verbose:
+            print(f"        rewriting {filepath}")
+        write_lines_to_file(filepath, render_slotted_model(parse_model_class(filepath)))
+    if verbose:
+        print("    DONE.")
+
+
 def process(model_type: str, model_version: str, verbose: bool = True):
 
     if model_type == 'CAST':
@@ -254,6 +436,9 @@ def process(model_type: str, model_version: str, verbose: bool = True):
 
     delete_generated_client_dir(verbose=verbose)
 
+    if model_type in SLOTTED_MODEL_TYPES:
+        make_slotted_models(model_root, verbose=verbose)
+
 
 # -----------------------------------------------------------------------------
 # SCRIPT
@@ -262,7 +447,13 @@ def process(model_type: str, model_version: str, verbose: bool = True):
 def main():
     parser = argparse.ArgumentParser(description='Use swagger-codegen to generate '
                                                  'CAST, GROMET and/or METADATA data model')
-    # parser.add_argument()
+    parser.add_argument('--slots-only', action='store_true',
+                        help='Only rewrite the existing CAST model classes as __slots__ classes, '
+                             'without calling swagger-codegen')
+    args = parser.parse_args()
+    if args.slots_only:
+        make_slotted_models(os.path.join(RELATIVE_AUTOMATES_ROOT, MODEL_ROOT_CAST))
+        return
     # process('CAST', CAST_VERSION)
     process('GROMET', GROMET_VERSION)
     # process('METADATA', GROMET_VERSION)
@@ -1,8 +1,11 @@
+import copy
+import functools
 import re
 import sys
 import typing
 from dataclasses import dataclass, field
 from datetime import datetime
+from enum import Enum
 
 from skema.model_assembly.metadata import (
     CodeSpanReference,
@@ -23,14 +26,12 @@ from skema.model_assembly.networks import (
 from skema.model_assembly.structures import VariableIdentifier
 from skema.program_analysis.CAST2FN.ann_cast.annotated_cast import *
 from skema.program_analysis.CAST2FN.model.cast import SourceRef
-
-# NOTE: the GrFN json loading seems to rely on "." as the separator for container scopes
-# For the Annotated Cast pipeline, it is fine to change these separators as long as they
-# don't collide
-# used in ContainerScopePass functions `con_scope_to_str()` and `visit_name()`
-CON_STR_SEP = "."
-# delimiter for fullids
-FULLID_SEP = ":"
+from skema.program_analysis.CAST2FN.ann_cast.symbol_table import (
+    CON_STR_SEP,
+    FULLID_SEP,
+    build_fullid,
+    con_scope_to_str,
+)
 
 # NOTE: we use hyphens between names to create illegal identifiers to prevent name collisions
 LOOPBODY = "loop-body"
@@ -73,9 +74,9 @@ class GrfnContainerSrcRef:
 class GrfnAssignment:
     assignment_node: LambdaNode
     assignment_type: LambdaType
-    # inputs and outputs map fullid to GrFN Var uid
-    inputs: typing.Dict[str, str] = field(default_factory=dict)
-    outputs: typing.Dict[str, str] = field(default_factory=dict)
+    # inputs and outputs map fullid to grfn_id
+    inputs: typing.Dict[int, int] = field(default_factory=dict)
+    outputs: typing.Dict[int, int] = field(default_factory=dict)
     lambda_expr: str = ""
 
 
@@ -339,17 +340,13 @@ def union_dicts(dict1, dict2):
     return {**dict1, **dict2}
 
 
-def con_scope_to_str(scope: typing.List):
-    return CON_STR_SEP.join(scope)
-
-
 def var_dict_to_str(str_start, vars):
     vars_id_and_names = [f" {name}: {id}" for id, name in vars.items()]
     return str_start + ", ".join(vars_id_and_names)
 
 
 def interface_to_str(str_start, interface):
-    return str_start + ", ".join(interface.values())
+    return str_start + ", ".join(map(str, interface.values()))
 
 
 def decision_in_to_str(str_start, decision):
@@ -485,63 +482,6 @@ def call_ret_val_name(node) -> str:
     return f"{func_con_name}_call{node.invocation_index}_ret_val"
 
 
-def ann_cast_name_to_fullid(node):
-    """
-    Returns a string representing the fullid of the name node.
-    The fullid has format
-      'name.id.version.con_scopestr'
-    This should only be called after both VariableVersionPass and
-    ContainerScopePass have completed
-    """
-    return build_fullid(
-        node.name, node.id, node.version, con_scope_to_str(node.con_scope)
-    )
-
-
-def build_fullid(var_name: str, id: int, version: int, con_scopestr: str):
-    """
-    Returns a string representing the fullid.
-    The fullid has format
-      'var_name.id.version.con_scopestr'
-    """
-    pieces = [var_name, str(id), str(version), con_scopestr]
-    if pieces[0] == None:
-        pieces[0] = ""
-    return FULLID_SEP.join(pieces)
-
-
-def parse_fullid(fullid: str) -> typing.Dict:
-    """
-    Parses the fullid, returning a dict with mapping the strings
-      - "var_name"
-      - "id"
-      - "version"
-      - "con_scopestr"
-    to their respective values determined by the fullid
-    """
-    keys = ["var_name", "id", "version", "con_scopestr"]
-    values = fullid.split(FULLID_SEP)
-
-    assert len(keys) == len(values)
-
-    return dict(zip(keys, values))
-
-
-def lambda_var_from_fullid(fullid: str) -> str:
-    """
-    Return a suitable lambda variable name for variable with fullid `fullid`
-    """
-    parsed = parse_fullid(fullid)
-    return f"{parsed['var_name']}_{parsed['id']}"
-
-
-def var_name_from_fullid(fullid: str) -> str:
-    """
-    Return the variable name for variable with fullid `fullid`
-    """
-    return parse_fullid(fullid)["var_name"]
-
-
 def create_grfn_literal_node(metadata: typing.List):
     """
     Creates a GrFN `LambdaNode` with type `LITERAL` and metadata `metadata`.
@@ -620,3 +560,81 @@ def create_grfn_var(var_name: str, id: int, version: int, con_scopestr: str):
     # we fill in the metadata later with a call to add_metadata_to_grfn_var()
     metadata = []
     return VariableNode(uid, identifier, metadata)
+
+
+# The values of an Annotated CAST tree that no pass modifies in place, which
+# copy_func_def shares between a FunctionDef and its copies
+SHARED_VALUE_TYPES = (
+    str,
+    int,
+    float,
+    bool,
+    type(None),
+    Enum,
+    SourceRef,
+    GrfnContainerSrcRef,
+)
+
+
+def copy_func_def(node: AnnCastFunctionDef) -> AnnCastFunctionDef:
+    """
+    Returns a copy of the FunctionDef node for a GrFN 2.2 call site.
+    This is a cheaper copy.deepcopy(), not a way around copying: every Annotated
+    CAST node of node is still copied for every call site, since the passes
+    annotate the nodes of the copy for its call site in place. A node reached
+    more than once (i.e. the owning_func_def of a ModelReturn) is copied once.
+    What it saves over copy.deepcopy() is copying the values no pass modifies in
+    place (see SHARED_VALUE_TYPES), which are shared with node, and the
+    func_def_copy of the Calls of node, which the copy doesn't get:
+    ContainerScopePass makes new ones when it visits the copy.
+    """
+    return copy_ann_cast(node, {})
+
+
+def copy_ann_cast(obj, memo: typing.Dict):
+    """
+    Returns a copy of obj for copy_func_def(), where memo maps the id of every
+    object copied so far to its copy, like the memo of copy.deepcopy()
+    """
+    if isinstance(obj, SHARED_VALUE_TYPES):
+        return obj
+    copied = memo.get(id(obj))
+    if copied is not None:
+        return copied
+
+    if isinstance(obj, AnnCastNode):
+        copied = obj.__class__.__new__(obj.__class__)
+        memo[id(obj)] = copied
+        for name in slot_names(obj.__class__):
+            if hasattr(obj, name):
+                setattr(copied, name, copy_ann_cast(getattr(obj, name), memo))
+        for name, value in obj.__dict__.items():
+            if name == "func_def_copy":
+                value = None
+            copied.__dict__[name] = copy_ann_cast(value, memo)
+    elif isinstance(obj, list):
+        copied = memo[id(obj)] = []
+        copied.extend(copy_ann_cast(item, memo) for item in obj)
+    elif isinstance(obj, dict):
+        copied = memo[id(obj)] = {}
+        for key, value in obj.items():
+            copied[copy_ann_cast(key, memo)] = copy_ann_cast(value, memo)
+    elif isinstance(obj, (tuple, set)):
+        copied = memo[id(obj)] = obj.__class__(
+            copy_ann_cast(item, memo) for item in obj
+        )
+    else:
+        copied = copy.deepcopy(obj, memo)
+    return copied
+
+
+@functools.lru_cache(maxsize=None)
+def slot_names(node_class: type) -> typing.List[str]:
+    """
+    Returns the names of the slots of node_class, i.e. the source_refs of the CAST AstNode
+    """
+    return [
+        name
+        for base in node_class.__mro__
+        for name in getattr(base, "__slots__", ())
+    ]
@@ -24,24 +24,35 @@ from skema.model_assembly.networks import GroundedFunctionNetwork, VariableNode
 from skema.program_analysis.CAST2FN.model.cast.model_import import (
     ModelImport,
 )
+from skema.program_analysis.pipeline_context import PipelineContext
+from skema.program_analysis.CAST2FN.ann_cast.symbol_table import SymbolTable
 
 
 class PipelineState:
-    def __init__(self, ann_nodes: typing.List, grfn2_2: bool):
+    def __init__(
+        self,
+        ann_nodes: typing.List,
+        grfn2_2: bool,
+        context: typing.Optional[PipelineContext] = None,
+    ):
         self.GENERATE_GRFN_2_2 = grfn2_2
         self.PRINT_DEBUGGING_INFO = False
         self.nodes = ann_nodes
         # populated after IdCollapsePass, and used to give ids to GrFN condition variables
         self.collapsed_id_counter = 0
-        # dict mapping FunctionDef container scopestr to its id
-        self.func_con_scopestr_to_id = {}
-        # dict mapping container scope strings to their nodes
-        self.con_scopestr_to_node = {}
+        # the table that gives container scopes their scope ids and
+        # variable versions their fullids
+        self.symbols = SymbolTable()
+        # dict mapping FunctionDef container scope id to its id
+        self.func_con_scope_to_id = {}
+        # dict mapping container scope ids to their nodes
+        self.con_scope_to_node = {}
         # dict mapping function IDs to their FunctionDef nodes.
         self.func_id_to_def = {}
-        self.grfn_id_to_grfn_var = {}
-        # the fullid of a AnnCastName node is a string which includes its
-        # variable name, numerical id, version, and scope
+        # the GrFN VariableNodes created so far, a grfn_id is an index in this list
+        self.grfn_vars: typing.List[VariableNode] = []
+        # the fullid of a AnnCastName node is the id its variable name,
+        # numerical id, version, and scope have in `symbols`
         self.fullid_to_grfn_id = {}
         # `module_node` is simply a reference to the AnnCastModule node
         # FUTURE: to handle multiple modules for Python this will need to be extended
@@ -62,36 +73,39 @@ class PipelineState:
 
         self.gromet_collection = None
 
+        # per-run state of the pipeline (root directory for imports, RNG for UUIDs)
+        self.context = context if context is not None else PipelineContext()
+
     def get_nodes(self):
         return self.nodes
 
-    def is_var_local_to_func(self, scopestr: str, id: int):
+    def is_var_local_to_func(self, scope_id: int, id: int):
         """
-        Precondition: scopestr is the scopestr of a FunctionDef
+        Precondition: scope_id is the scope id of a FunctionDef
         Check if the variable with id `id` is neither a global nor a formal parameter
         """
         if self.is_global_var(id):
             return False
 
-        func_def_node = self.func_def_node_from_scopestr(scopestr)
+        func_def_node = self.func_def_node_from_scope_id(scope_id)
         for param in func_def_node.func_args:
             if id == param.val.id:
                 return False
 
         return True
 
-    def is_container(self, scopestr: str):
+    def is_container(self, scope_id: int):
         """
-        Check if scopestr is a container scopestr
+        Check if scope_id is a container scope id
         """
-        return scopestr in self.con_scopestr_to_node
+        return scope_id in self.con_scope_to_node
 
-    def con_node_from_scopestr(self, scopestr: str):
+    def con_node_from_scope_id(self, scope_id: int):
         """
-        Precondition: scopestr is a container scopestr
-        Return the container node associated with scopestr
+        Precondition: scope_id is a container scope id
+        Return the container node associated with scope_id
         """
-        return self.con_scopestr_to_node[scopestr]
+        return self.con_scope_to_node[scope_id]
 
     def get_grfn(self) -> typing.Optional[GroundedFunctionNetwork]:
         return self.grfn
@@ -102,15 +116,15 @@ class PipelineState:
         """
         return id in self.func_id_to_def
 
-    def is_con_scopestr_func_def(self, con_scopestr: str):
-        return con_scopestr in self.func_con_scopestr_to_id
+    def is_con_scope_func_def(self, con_scope_id: int):
+        return con_scope_id in self.func_con_scope_to_id
 
-    def func_def_node_from_scopestr(self, con_scopestr: str):
+    def func_def_node_from_scope_id(self, con_scope_id: int):
         """
         Return the AnnCastFuncitonDef node for the container scope
-        defined by `con_scopestr`
+        with scope id `con_scope_id`
         """
-        function_id = self.func_con_scopestr_to_id[con_scopestr]
+        function_id = self.func_con_scope_to_id[con_scope_id]
         return self.func_id_to_def[function_id]
 
     def func_def_node_from_id(self, id: int):
@@ -140,27 +154,29 @@ class PipelineState:
         self.collapsed_id_counter += 1
         return to_return
 
-    def store_grfn_var(self, fullid: str, grfn_var: VariableNode):
+    def store_grfn_var(self, fullid: int, grfn_var: VariableNode) -> int:
         """
-        Cache `grfn_var` in `grfn_id_to_grfn_var` and add `fullid` to `fullid_to_grfn_id`
+        Cache `grfn_var` in `grfn_vars` and add `fullid` to `fullid_to_grfn_id`
+        Returns the grfn_id of `grfn_var`
         """
-        self.fullid_to_grfn_id[fullid] = grfn_var.uid
-        self.grfn_id_to_grfn_var[grfn_var.uid] = grfn_var
+        grfn_id = len(self.grfn_vars)
+        self.grfn_vars.append(grfn_var)
+        self.fullid_to_grfn_id[fullid] = grfn_id
+        return grfn_id
 
-    def grfn_var_exists(self, fullid: str):
+    def grfn_var_exists(self, fullid: int):
         """
         Returns the whether the GrFN VariableNode associated with `fullid` has already been created
         """
         return fullid in self.fullid_to_grfn_id
 
-    def get_grfn_var(self, fullid: str):
+    def get_grfn_var(self, fullid: int):
         """
         Returns the cached GrFN VariableNode associated with `fullid`
         """
-        grfn_id = self.fullid_to_grfn_id[fullid]
-        return self.grfn_id_to_grfn_var[grfn_id]
+        return self.grfn_vars[self.fullid_to_grfn_id[fullid]]
 
-    def alias_grfn_vars(self, src_fullid: str, tgt_fullid: str):
+    def alias_grfn_vars(self, src_fullid: int, tgt_fullid: int):
         """
         Put the GrFN id associated with `tgt_fullid` into dict `fullid_to_grfn_id` for key
         `src_fullid`
@@ -461,8 +477,8 @@ class AnnCastLoop(AnnCastNode):
 
         # Loop container scope
         self.con_scope: typing.List
-        # Function scopestr this Loop node is "living" in
-        self.base_func_scopestr: str = ""
+        # Scope id of the Function this Loop node is "living" in
+        self.base_func_scope_id: typing.Optional[int] = None
 
         # dicts mapping a Name id to its string name
         # used for container interfaces
@@ -512,7 +528,7 @@ class AnnCastLoop(AnnCastNode):
         result["expr"] = self.expr.to_dict()
         result["body"] = [node.to_dict() for node in self.body]
         result["con_scope"] = self.con_scope
-        result["base_func_scopestr"] = self.base_func_scopestr
+        result["base_func_scope_id"] = self.base_func_scope_id
         # FUTURE: add attributes to enhance test coverage
         return result
 
@@ -593,8 +609,8 @@ class AnnCastModelIf(AnnCastNode):
 
         # ModelIf container scope
         self.con_scope: typing.List
-        # Function scopestr this ModelIf node is "living" in
-        self.base_func_scopestr: str = ""
+        # Scope id of the Function this ModelIf node is "living" in
+        self.base_func_scope_id: typing.Optional[int] = None
 
         # dicts mapping a Name id to string name
         # used for container interfaces
@@ -640,7 +656,7 @@ class AnnCastModelIf(AnnCastNode):
         result["body"] = [node.to_dict() for node in self.body]
         result["orelse"] = [node.to_dict() for node in self.orelse]
         result["con_scope"] = self.con_scope
-        result["base_func_scopestr"] = self.base_func_scopestr
+        result["base_func_scope_id"] = self.base_func_scope_id
         # FUTURE: add attributes to enhance test coverage
         return result
 
@@ -719,8 +735,8 @@ class AnnCastName(AnnCastNode):
         self.source_refs = source_refs
         # container_scope is used to aid GrFN generation
         self.con_scope: typing.List = []
-        # Function scopestr this Name node is "living" in
-        self.base_func_scopestr: str = ""
+        # Scope id of the Function this Name node is "living" in
+        self.base_func_scope_id: typing.Optional[int] = None
         # versions are bound to the cope of the variable
         self.version = None
         self.grfn_id = None
@@ -1,7 +1,8 @@
-from functools import singledispatchmethod
 import typing
 
 from skema.program_analysis.CAST2FN.cast import CAST
+from skema.program_analysis.CAST2FN.interning import InternTable
+from skema.utils.dispatch import call_with_deep_recursion, typedispatchmethod
 
 from skema.program_analysis.CAST2FN.model.cast import (
     AstNode,
@@ -50,14 +51,19 @@ class CastToAnnotatedCastVisitor:
     def visit_node_list(self, node_list: typing.List[AstNode]):
         return [self.visit(node) for node in node_list]
 
-    def generate_annotated_cast(self, grfn_2_2: bool = False):
+    def generate_annotated_cast(
+        self, grfn_2_2: bool = False, context=None, deep_recursion: bool = False
+    ):
         nodes = self.cast.nodes
 
-        annotated_cast = []
-        for node in nodes:
-            annotated_cast.append(self.visit(node))
+        # With deep_recursion, the CAST is visited in a thread with a larger
+        # stack and recursion limit, for deeply nested CAST
+        if deep_recursion:
+            annotated_cast = call_with_deep_recursion(self.visit_node_list, nodes)
+        else:
+            annotated_cast = self.visit_node_list(nodes)
 
-        return PipelineState(annotated_cast, grfn_2_2)
+        return PipelineState(annotated_cast, grfn_2_2, context)
 
     def visit(self, node: AstNode) -> AnnCastNode:
         # print current node being visited.
@@ -66,7 +72,7 @@ class CastToAnnotatedCastVisitor:
         # print(f"\nProcessing node type {class_name}")
         return self._visit(node)
 
-    @singledispatchmethod
+    @typedispatchmethod
     def _visit(self, node: AstNode):
         raise NameError(f"Unrecognized node type: {type(node)}")
 
@@ -185,7 +191,8 @@ class CastToAnnotatedCastVisitor:
 
     @_visit.register
     def visit_name(self, node: Name):
-        return AnnCastName(node.name, node.id, node.source_refs)
+        # Names are interned, since the passes key their tables on them
+        return AnnCastName(InternTable.name(node.name), node.id, node.source_refs)
 
     @_visit.register
     def visit_var(self, node: Var):
@@ -1,11 +1,9 @@
-import copy
 import typing
 from collections import defaultdict
 from enum import Enum
 from functools import singledispatchmethod
 
 from skema.program_analysis.CAST2FN.ann_cast.ann_cast_helpers import (
-    CON_STR_SEP,
     ELSEBODY,
     IFBODY,
     IFEXPR,
@@ -18,7 +16,7 @@ from skema.program_analysis.CAST2FN.ann_cast.ann_cast_helpers import (
     call_container_name,
     combine_grfn_con_src_refs,
     combine_source_refs,
-    con_scope_to_str,
+    copy_func_def,
     func_def_container_name,
     var_dict_to_str,
 )
@@ -50,22 +48,24 @@ class ContainerData:
 class ContainerScopePass:
     def __init__(self, pipeline_state: PipelineState):
         self.pipeline_state = pipeline_state
-        # dicts mapping container scope strs to the if/loop count inside
+        # container scopes are given scope ids by the SymbolTable of the pipeline
+        self.symbols = self.pipeline_state.symbols
+        # dicts mapping container scope ids to the if/loop count inside
         # the container
         self.if_count = defaultdict(int)
         self.loop_count = defaultdict(int)
-        # dict mapping container scope str to AnnCastNode
-        self.con_str_to_node = {}
-        # dict mapping container scope str to cached Container Data
-        self.con_str_to_con_data = {}
+        # dict mapping container scope id to AnnCastNode
+        self.con_scope_to_node = {}
+        # dict mapping container scope id to cached Container Data
+        self.con_scope_to_con_data = {}
         self.calls_to_process = list()
 
         for node in self.pipeline_state.nodes:
             # assign_side is False at the start of our visitor
-            base_scopestr = ""
+            base_scope_id = self.symbols.scope_id([])
             enclosing_con_scope = []
             self.visit(
-                node, base_scopestr, enclosing_con_scope, AssignSide.NEITHER
+                node, base_scope_id, enclosing_con_scope, AssignSide.NEITHER
             )
         self.nodes = self.pipeline_state.nodes
 
@@ -73,20 +73,20 @@ class ContainerScopePass:
         self.add_container_data_to_nodes()
 
         # save the dict mapping container scope to AnnCastNode
-        self.pipeline_state.con_scopestr_to_node = self.con_str_to_node
+        self.pipeline_state.con_scope_to_node = self.con_scope_to_node
 
         self.propagate_globals_through_calls()
 
     def next_if_scope(self, enclosing_con_scope):
-        scopestr = con_scope_to_str(enclosing_con_scope)
-        count = self.if_count[scopestr]
-        self.if_count[scopestr] += 1
+        scope_id = self.symbols.scope_id(enclosing_con_scope)
+        count = self.if_count[scope_id]
+        self.if_count[scope_id] += 1
         return enclosing_con_scope + [f"if{count}"]
 
     def next_loop_scope(self, enclosing_con_scope):
-        scopestr = con_scope_to_str(enclosing_con_scope)
-        count = self.loop_count[scopestr]
-        self.loop_count[scopestr] += 1
+        scope_id = self.symbols.scope_id(enclosing_con_scope)
+        count = self.loop_count[scope_id]
+        self.loop_count[scope_id] += 1
         return enclosing_con_scope + [f"loop{count}"]
 
     def propagate_globals_through_calls(self):
@@ -96,28 +96,23 @@ class ContainerScopePass:
             )
 
             # propagate up used variables to enclosing container scopes
-            scopestr = ""
-            for index, name in enumerate(call_node.func.con_scope):
-                scopestr2 = CON_STR_SEP.join(
+            module_scope_id = self.symbols.scope_id([MODULE_SCOPE])
+            for index in range(len(call_node.func.con_scope)):
+                scope_id = self.symbols.scope_id(
                     call_node.func.con_scope[: index + 1]
                 )
-                # add separator between container scope component names
-                if index != 0:
-                    scopestr += f"{CON_STR_SEP}"
-                scopestr += f"{name}"
-                assert scopestr == scopestr2
 
                 if (
-                    scopestr == MODULE_SCOPE
-                    or not self.pipeline_state.is_container(scopestr)
+                    scope_id == module_scope_id
+                    or not self.pipeline_state.is_container(scope_id)
                 ):
                     continue
 
-                container_node = self.pipeline_state.con_node_from_scopestr(
-                    scopestr
+                container_node = self.pipeline_state.con_node_from_scope_id(
+                    scope_id
                 )
 
-                if self.pipeline_state.is_con_scopestr_func_def(scopestr):
+                if self.pipeline_state.is_con_scope_func_def(scope_id):
                     container_node.used_globals.update(func_def.used_globals)
                     container_node.modified_globals.update(
                         func_def.modified_globals
@@ -140,9 +135,10 @@ class ContainerScopePass:
         container.expr_used_vars = data.used_vars
 
     def add_container_data_to_nodes(self):
-        for scopestr, data in self.con_str_to_con_data.items():
+        for scope_id, data in self.con_scope_to_con_data.items():
             # DEBUG printing
             if self.pipeline_state.PRINT_DEBUGGING_INFO:
+                scopestr = self.symbols.scopestr(scope_id)
                 print(f"For scopestr: {scopestr} found data with")
                 modified_vars = var_dict_to_str(
                     "  Modified: ", data.modified_vars
@@ -159,25 +155,24 @@ class ContainerScopePass:
 
             # Note: for the ModelIf.Expr and Loop.Expr nodes,
             # we put the ModelIf and Loop nodes respectively in
-            # `con_str_to_node`.
+            # `con_scope_to_node`.
             # We need to put the container data for the Expr nodes in
             # the expr_*_vars attributes of their associated container nodes
             # so we call `add_container_data_to_expr()`
-            if_expr_suffix = CON_STR_SEP + IFEXPR
-            if scopestr.endswith(if_expr_suffix):
-                if_container = self.con_str_to_node[scopestr]
+            scope_name = self.symbols.scope(scope_id)[-1]
+            if scope_name == IFEXPR:
+                if_container = self.con_scope_to_node[scope_id]
                 self.add_container_data_to_expr(if_container, data)
                 continue
 
-            loop_expr_suffix = CON_STR_SEP + LOOPEXPR
-            if scopestr.endswith(loop_expr_suffix):
-                loop_container = self.con_str_to_node[scopestr]
+            if scope_name == LOOPEXPR:
+                loop_container = self.con_scope_to_node[scope_id]
                 self.add_container_data_to_expr(loop_container, data)
                 continue
 
             # otherwise, store container data, in the container nodes
             # *_vars attributes
-            container = self.con_str_to_node[scopestr]
+            container = self.con_scope_to_node[scope_id]
             container.vars_accessed_before_mod = data.vars_accessed_before_mod
             container.modified_vars = data.modified_vars
             container.used_vars = data.used_vars
@@ -199,20 +194,20 @@ class ContainerScopePass:
 
     def initialize_con_scope_data(self, con_scope: typing.List, node):
         """
-        Create an empty `ContainterData` in `self.con_str_to_con_data`
-        and cache the container `node` in `self.con_str_to_node`
+        Create an empty `ContainterData` in `self.con_scope_to_con_data`
+        and cache the container `node` in `self.con_scope_to_node`
         """
-        con_scopestr = con_scope_to_str(con_scope)
+        con_scope_id = self.symbols.scope_id(con_scope)
         # initialize container data for this node
-        self.con_str_to_con_data[con_scopestr] = ContainerData()
+        self.con_scope_to_con_data[con_scope_id] = ContainerData()
 
-        # map con_scopestr to passed in node
-        self.con_str_to_node[con_scopestr] = node
+        # map con_scope_id to passed in node
+        self.con_scope_to_node[con_scope_id] = node
 
     def visit(
         self,
         node: AnnCastNode,
-        base_func_scopestr: str,
+        base_func_scope_id: int,
         enclosing_con_scope: typing.List,
         assign_side: AssignSide,
     ):
@@ -222,7 +217,7 @@ class ContainerScopePass:
         # print(f"\nProcessing node type {class_name}")
 
         children_src_ref = self._visit(
-            node, base_func_scopestr, enclosing_con_scope, assign_side
+            node, base_func_scope_id, enclosing_con_scope, assign_side
         )
         if children_src_ref is None:
             children_src_ref = GrfnContainerSrcRef(None, None, None)
@@ -245,7 +240,7 @@ class ContainerScopePass:
     def _visit(
         self,
         node: AnnCastNode,
-        base_func_scopestr: str,
+        base_func_scope_id: int,
         enclosing_con_scope: typing.List,
         assign_side: AssignSide,
     ):
@@ -262,13 +257,13 @@ class ContainerScopePass:
     def visit_node_list(
         self,
         node_list: typing.List[AnnCastNode],
-        base_func_scopestr,
+        base_func_scope_id,
         enclosing_con_scope,
         assign_side,
     ):
         grfn_src_refs = [
             self.visit(
-                node, base_func_scopestr, enclosing_con_scope, assign_side
+                node, base_func_scope_id, enclosing_con_scope, assign_side
             )
             for node in node_list
         ]
@@ -282,13 +277,13 @@ class ContainerScopePass:
     def visit_assignment(
         self,
         node: AnnCastAssignment,
-        base_func_scopestr,
+        base_func_scope_id,
         enclosing_con_scope,
         assign_side,
     ):
         right_src_ref = self.visit(
             node.right,
-            base_func_scopestr,
+            base_func_scope_id,
             enclosing_con_scope,
             AssignSide.RIGHT,
         )
@@ -300,7 +295,7 @@ class ContainerScopePass:
             or isinstance(node.left, AnnCastAttribute)
         ), f"container_scope: visit_assigment: node.left is {type(node.left)}"
         left_src_ref = self.visit(
-            node.left, base_func_scopestr, enclosing_con_scope, AssignSide.LEFT
+            node.left, base_func_scope_id, enclosing_con_scope, AssignSide.LEFT
         )
 
         return combine_grfn_con_src_refs([right_src_ref, left_src_ref])
@@ -309,20 +304,20 @@ class ContainerScopePass:
     def visit_attribute(
         self,
         node: AnnCastAttribute,
-        base_func_scopestr,
+        base_func_scope_id,
         enclosing_con_scope,
         assign_side,
     ):
         # TODO: what to do with the attr?
         self.visit(
-            node.value, base_func_scopestr, enclosing_con_scope, assign_side
+            node.value, base_func_scope_id, enclosing_con_scope, assign_side
         )
         
     @_visit.register
     def visit_call(
         self,
         node: AnnCastCall,
-        base_func_scopestr,
+        base_func_scope_id,
         enclosing_con_scope,
         assign_side,
     ):
@@ -341,7 +336,7 @@ class ContainerScopePass:
         if self.pipeline_state.GENERATE_GRFN_2_2 and node.has_func_def:
             node.is_grfn_2_2 = True
             return self.visit_call_grfn_2_2(
-                node, base_func_scopestr, enclosing_con_scope, assign_side
+                node, base_func_scope_id, enclosing_con_scope, assign_side
             )
 
         # otherwise, this Call should not be treated as a GrFN 2.2 call,
@@ -362,13 +357,13 @@ class ContainerScopePass:
 
         if isinstance(node.func, AnnCastAttribute):
             self.visit(
-                node.func, base_func_scopestr, enclosing_con_scope, assign_side
+                node.func, base_func_scope_id, enclosing_con_scope, assign_side
             )
 
         # For a call, we do not care about the arguments source refs
         return self.visit_node_list(
             node.arguments,
-            base_func_scopestr,
+            base_func_scope_id,
             enclosing_con_scope,
             assign_side,
         )
@@ -376,7 +371,7 @@ class ContainerScopePass:
     def visit_call_grfn_2_2(
         self,
         node: AnnCastCall,
-        base_func_scopestr,
+        base_func_scope_id,
         enclosing_con_scope,
         assign_side,
     ):
@@ -385,12 +380,12 @@ class ContainerScopePass:
         # the children GrFN source ref for the call node is the src ref of the call's arguments
         args_src_ref = self.visit_node_list(
             node.arguments,
-            base_func_scopestr,
+            base_func_scope_id,
             enclosing_con_scope,
             assign_side,
         )
 
-        node.func_def_copy = copy.deepcopy(
+        node.func_def_copy = copy_func_def(
             self.pipeline_state.func_id_to_def[node.func.id]
         )
         # make a new id for the copy's Name node, and store in func_id_to_def
@@ -402,7 +397,7 @@ class ContainerScopePass:
         call_assign_side = AssignSide.NEITHER
         self.visit_function_def(
             node.func_def_copy,
-            base_func_scopestr,
+            base_func_scope_id,
             calling_scope,
             call_assign_side,
         )
@@ -414,7 +409,7 @@ class ContainerScopePass:
     def visit_record_def(
         self,
         node: AnnCastRecordDef,
-        base_func_scopestr,
+        base_func_scope_id,
         enclosing_con_scope,
         assign_side,
     ):
@@ -428,13 +423,13 @@ class ContainerScopePass:
         # node.funcs is a list of Vars
         # node.fields is a list of Vars
 
-        # ClassDef's reset the `base_func_scopestr`
-        base_scopestr = con_scope_to_str(classscope)
+        # ClassDef's reset the `base_func_scope_id`
+        base_scope_id = self.symbols.scope_id(classscope)
         funcs_src_ref = self.visit_node_list(
-            node.funcs, base_scopestr, classscope, assign_side
+            node.funcs, base_scope_id, classscope, assign_side
         )
         fields_src_ref = self.visit_node_list(
-            node.fields, base_scopestr, classscope, assign_side
+            node.fields, base_scope_id, classscope, assign_side
         )
 
         return combine_grfn_con_src_refs([funcs_src_ref, fields_src_ref])
@@ -443,7 +438,7 @@ class ContainerScopePass:
     def visit_function_def(
         self,
         node: AnnCastFunctionDef,
-        base_func_scopestr,
+        base_func_scope_id,
         enclosing_con_scope,
         assign_side,
     ):
@@ -465,22 +460,22 @@ class ContainerScopePass:
 
         self.initialize_con_scope_data(funcscope, node)
         node.con_scope = funcscope
-        # FunctionDef's reset the `base_func_scopestr`
-        base_scopestr = con_scope_to_str(funcscope)
+        # FunctionDef's reset the `base_func_scope_id`
+        base_scope_id = self.symbols.scope_id(funcscope)
 
-        # Cache function container scopestr for use during Variable Version pass
-        self.pipeline_state.func_con_scopestr_to_id[
-            base_scopestr
+        # Cache function container scope id for use during Variable Version pass
+        self.pipeline_state.func_con_scope_to_id[
+            base_scope_id
         ] = node.name.id
 
         # Each argument is a AnnCastVar node
         # Initialize each Name and visit to modify its scope
         args_src_ref = self.visit_node_list(
-            node.func_args, base_scopestr, funcscope, assign_side
+            node.func_args, base_scope_id, funcscope, assign_side
         )
 
         body_src_ref = self.visit_node_list(
-            node.body, base_scopestr, funcscope, assign_side
+            node.body, base_scope_id, funcscope, assign_side
         )
 
         # return children GrfnContainerSrcRef
@@ -490,7 +485,7 @@ class ContainerScopePass:
     def visit_literal_value(
         self,
         node: AnnCastLiteralValue,
-        base_func_scopestr,
+        base_func_scope_id,
         enclosing_con_scope,
         assign_side,
     ):
@@ -503,13 +498,13 @@ class ContainerScopePass:
 
             # visit size's anncast name node
             self.visit(
-                val.size, base_func_scopestr, enclosing_con_scope, assign_side
+                val.size, base_func_scope_id, enclosing_con_scope, assign_side
             )
 
             # List literal doesn't need to add any other changes
             # to the anncast at this pass
         elif node.value_type == StructureType.TUPLE: # or node.value_type == StructureType.LIST:
-            self.visit_node_list(node.value, base_func_scopestr, enclosing_con_scope, assign_side)
+            self.visit_node_list(node.value, base_func_scope_id, enclosing_con_scope, assign_side)
         elif node.value_type == ScalarType.INTEGER:
             pass
         elif node.value_type == ScalarType.ABSTRACTFLOAT:
@@ -520,7 +515,7 @@ class ContainerScopePass:
     def visit_loop(
         self,
         node: AnnCastLoop,
-        base_func_scopestr,
+        base_func_scope_id,
         enclosing_con_scope,
         assign_side,
     ):
@@ -530,8 +525,8 @@ class ContainerScopePass:
             assign_side == AssignSide.NEITHER
             or assign_side == AssignSide.RIGHT
         )
-        # store the base_func_scopestr for this container
-        node.base_func_scopestr = base_func_scopestr
+        # store the base_func_scope_id for this container
+        node.base_func_scope_id = base_func_scope_id
 
         loopscope = self.next_loop_scope(enclosing_con_scope)
         # print(f"-----------{loopscope}-----------")
@@ -543,20 +538,20 @@ class ContainerScopePass:
             loopprescope = loopscope + [LOOPPRE]
             # self.initialize_con_scope_data(loopinitscope, node)
             init_src_ref = self.visit_node_list(
-                node.pre, base_func_scopestr, loopprescope, assign_side
+                node.pre, base_func_scope_id, loopprescope, assign_side
             )
 
         # we store an additional ContainerData for the loop expression, but
-        # we store the Loop node in `self.con_str_to_node`
+        # we store the Loop node in `self.con_scope_to_node`
         loopexprscope = loopscope + [LOOPEXPR]
         self.initialize_con_scope_data(loopexprscope, node)
         expr_src_ref = self.visit(
-            node.expr, base_func_scopestr, loopexprscope, assign_side
+            node.expr, base_func_scope_id, loopexprscope, assign_side
         )
 
         loopbodyscope = loopscope + [LOOPBODY]
         body_src_ref = self.visit_node_list(
-            node.body, base_func_scopestr, loopbodyscope, assign_side
+            node.body, base_func_scope_id, loopbodyscope, assign_side
         )
 
         if len(node.post) > 0:
@@ -564,7 +559,7 @@ class ContainerScopePass:
             looppostscope = loopscope + [LOOPPOST]
             # self.initialize_con_scope_data(loopinitscope, node)
             post_src_ref = self.visit_node_list(
-                node.post, base_func_scopestr, looppostscope, assign_side
+                node.post, base_func_scope_id, looppostscope, assign_side
             )
 
         # store GrfnContainerSrcRef for this loop
@@ -591,7 +586,7 @@ class ContainerScopePass:
     def visit_model_break(
         self,
         node: AnnCastModelBreak,
-        base_func_scopestr,
+        base_func_scope_id,
         enclosing_con_scope,
         assign_side,
     ):
@@ -601,7 +596,7 @@ class ContainerScopePass:
     def visit_model_continue(
         self,
         node: AnnCastModelContinue,
-        base_func_scopestr,
+        base_func_scope_id,
         enclosing_con_scope,
         assign_side,
     ):
@@ -611,7 +606,7 @@ class ContainerScopePass:
     def visit_model_import(
         self,
         node: AnnCastModelImport,
-        base_func_scopestr,
+        base_func_scope_id,
         enclosing_con_scope,
         assign_side,
     ):
@@ -621,7 +616,7 @@ class ContainerScopePass:
     def visit_model_if(
         self,
         node: AnnCastModelIf,
-        base_func_scopestr,
+        base_func_scope_id,
         enclosing_con_scope,
         assign_side,
     ):
@@ -631,29 +626,29 @@ class ContainerScopePass:
             assign_side == AssignSide.NEITHER
             or assign_side == AssignSide.RIGHT
         )
-        # store the base_func_scopestr for this container
-        node.base_func_scopestr = base_func_scopestr
+        # store the base_func_scope_id for this container
+        node.base_func_scope_id = base_func_scope_id
         # want orig enclosing
         ifscope = self.next_if_scope(enclosing_con_scope)
         self.initialize_con_scope_data(ifscope, node)
         node.con_scope = ifscope
 
         # we store an additional ContainerData for the if expression, but
-        # we store the ModelIf node in `self.con_str_to_node`
+        # we store the ModelIf node in `self.con_scope_to_node`
         ifexprscope = ifscope + [IFEXPR]
         self.initialize_con_scope_data(ifexprscope, node)
         expr_src_ref = self.visit(
-            node.expr, base_func_scopestr, ifexprscope, assign_side
+            node.expr, base_func_scope_id, ifexprscope, assign_side
         )
 
         ifbodyscope = ifscope + [IFBODY]
         body_src_ref = self.visit_node_list(
-            node.body, base_func_scopestr, ifbodyscope, assign_side
+            node.body, base_func_scope_id, ifbodyscope, assign_side
         )
 
         orelsebodyscope = ifscope + [ELSEBODY]
         orelse_src_ref = self.visit_node_list(
-            node.orelse, base_func_scopestr, orelsebodyscope, assign_side
+            node.orelse, base_func_scope_id, orelsebodyscope, assign_side
         )
 
         # store GrfnContainerSrcRef for this loop
@@ -667,26 +662,26 @@ class ContainerScopePass:
     def visit_return(
         self,
         node: AnnCastModelReturn,
-        base_func_scopestr,
+        base_func_scope_id,
         enclosing_con_scope,
         assign_side,
     ):
         # store the owning FunctionDef, and mark it as having a return value
-        function_def = self.pipeline_state.func_def_node_from_scopestr(
-            base_func_scopestr
+        function_def = self.pipeline_state.func_def_node_from_scope_id(
+            base_func_scope_id
         )
         node.owning_func_def = function_def
         node.owning_func_def.has_ret_val = True
 
         return self.visit(
-            node.value, base_func_scopestr, enclosing_con_scope, assign_side
+            node.value, base_func_scope_id, enclosing_con_scope, assign_side
         )
 
     @_visit.register
     def visit_module(
         self,
         node: AnnCastModule,
-        base_func_scopestr,
+        base_func_scope_id,
         enclosing_con_scope,
         assign_side,
     ):
@@ -694,12 +689,12 @@ class ContainerScopePass:
         assert assign_side == AssignSide.NEITHER
         module_con_scope = [MODULE_SCOPE]
         node.con_scope = module_con_scope
-        # module resets the `base_func_scopestr`
-        base_scopestr = con_scope_to_str(module_con_scope)
+        # module resets the `base_func_scope_id`
+        base_scope_id = self.symbols.scope_id(module_con_scope)
         # initialize container data for module which will store global variables
         self.initialize_con_scope_data(module_con_scope, node)
         body_src_ref = self.visit_node_list(
-            node.body, base_scopestr, module_con_scope, assign_side
+            node.body, base_scope_id, module_con_scope, assign_side
         )
 
         # store GrfnContainerSrcRef for the module
@@ -711,37 +706,36 @@ class ContainerScopePass:
     def visit_name(
         self,
         node: AnnCastName,
-        base_func_scopestr,
+        base_func_scope_id,
         enclosing_con_scope,
         assign_side,
     ):
         node.con_scope = enclosing_con_scope
-        node.base_func_scopestr = base_func_scopestr
+        node.base_func_scope_id = base_func_scope_id
 
         # check every prefix of enclosing_con_scope and add this Name node
         # to the associated container data if either
-        #  1. the container scopestr extends base_func_scopestr
+        #  1. the container scope is nested in base_func_scope_id
         #  2. this Name node is a global variable
-        for index, name in enumerate(enclosing_con_scope):
-            # add separator between container scope component names
-            scopestr = CON_STR_SEP.join(enclosing_con_scope[: index + 1])
+        for index in range(len(enclosing_con_scope)):
+            scope_id = self.symbols.scope_id(enclosing_con_scope[: index + 1])
 
-            # if this Name node is a global, or if the scopestr extends base_func_scopestr
-            # we will add the node to scopestr's container data
+            # if this Name node is a global, or if the scope is nested in base_func_scope_id
+            # we will add the node to the scope's container data
             # otherwise, we skip it
             # we must do a compound check to propagate globals correctly
-            # we would like to stop propagation of variable use at base_func_scopestr, but
+            # we would like to stop propagation of variable use at base_func_scope_id, but
             # this would only be correct for function locals.  global use must be propagated above
-            # base_func_scopestr
+            # base_func_scope_id
             if not (
                 self.pipeline_state.is_global_var(node.id)
-                or scopestr.startswith(base_func_scopestr)
+                or self.symbols.is_sub_scope(scope_id, base_func_scope_id)
             ):
                 continue
 
-            # fill in container data if this is a cached container str
-            if scopestr in self.con_str_to_con_data:
-                con_data = self.con_str_to_con_data[scopestr]
+            # fill in container data if this is a cached container scope
+            if scope_id in self.con_scope_to_con_data:
+                con_data = self.con_scope_to_con_data[scope_id]
                 # if we are on LHS of assignment, this Name should be
                 # added to modified vars
                 if assign_side == AssignSide.LEFT:
@@ -756,7 +750,7 @@ class ContainerScopePass:
 
     @_visit.register
     def visit_operator(self, node: AnnCastOperator, 
-        base_func_scopestr,
+        base_func_scope_id,
         enclosing_con_scope,
         assign_side,
     ):
@@ -766,7 +760,7 @@ class ContainerScopePass:
         for operand in node.operands:
             src_refs.append(
                 self.visit(
-                    operand, base_func_scopestr, enclosing_con_scope, assign_side
+                    operand, base_func_scope_id, enclosing_con_scope, assign_side
                 )            
             )
 
@@ -787,22 +781,22 @@ class ContainerScopePass:
     def visit_tuple(
         self,
         node: AnnCastTuple,
-        base_func_scopestr,
+        base_func_scope_id,
         enclosing_con_scope,
         assign_side,
     ):
         self.visit_node_list(
-            node.values, base_func_scopestr, enclosing_con_scope, assign_side
+            node.values, base_func_scope_id, enclosing_con_scope, assign_side
         )
 
     @_visit.register
     def visit_var(
         self,
         node: AnnCastVar,
-        base_func_scopestr,
+        base_func_scope_id,
         enclosing_con_scope,
         assign_side,
     ):
         return self.visit(
-            node.val, base_func_scopestr, enclosing_con_scope, assign_side
+            node.val, base_func_scope_id, enclosing_con_scope, assign_side
         )
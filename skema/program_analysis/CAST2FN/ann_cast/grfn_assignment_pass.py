@@ -4,7 +4,6 @@ from functools import singledispatchmethod
 from skema.model_assembly.metadata import LambdaType
 from skema.program_analysis.CAST2FN.ann_cast.ann_cast_helpers import (
     GrfnAssignment,
-    ann_cast_name_to_fullid,
     create_grfn_assign_node,
     create_grfn_literal_node,
     create_grfn_pack_node,
@@ -21,15 +20,32 @@ from skema.program_analysis.CAST2FN.model.cast import (
 
 
 class GrfnAssignmentPass:
-    def __init__(self, pipeline_state: PipelineState):
+    def __init__(self, pipeline_state: PipelineState, fused: bool = False):
         self.pipeline_state = pipeline_state
+        # scope ids and fullids are given by the SymbolTable of the pipeline
+        self.symbols = self.pipeline_state.symbols
         self.nodes = self.pipeline_state.nodes
         # Any other state variables that are needed during
         # the pass
+        # the `add_to` dict of the statements of the module being visited
+        self.module_add_to = {}
+        # when fused, the PassManager visits the nodes through the hooks
+        # enter_module, visit_statement and exit_module (see pass_manager.py)
+        if fused:
+            return
         for node in self.pipeline_state.nodes:
             add_to = {}
             self.visit(node, add_to)
 
+    def enter_module(self, node: AnnCastModule):
+        self.module_add_to = {}
+
+    def visit_statement(self, node: AnnCastNode):
+        self.visit(node, self.module_add_to)
+
+    def exit_module(self, node: AnnCastModule):
+        pass
+
     def visit(self, node: AnnCastNode, add_to: typing.Dict):
         """
         `add_to` is either the input or outputs to an GrFN Assignment/Literal node
@@ -109,15 +125,14 @@ class GrfnAssignmentPass:
 
         # add ret_val to add_to dict
         for id, fullid in node.out_ret_val.items():
-            grfn_var = self.pipeline_state.get_grfn_var(fullid)
-            add_to[fullid] = grfn_var.uid
+            add_to[fullid] = self.pipeline_state.fullid_to_grfn_id[fullid]
 
         # populate `arg_assignments` attribute of node
         for i, n in enumerate(node.arguments):
-            # grab GrFN variable for argument
+            # grab GrFN variable id for argument
             if i in node.arg_index_to_fullid.keys():  # NOTE: M7 Placeholder
                 arg_fullid = node.arg_index_to_fullid[i]
-                arg_grfn_var = self.pipeline_state.get_grfn_var(arg_fullid)
+                arg_grfn_id = self.pipeline_state.fullid_to_grfn_id[arg_fullid]
 
                 # create GrfnAssignment based on assignment type
                 metadata = create_lambda_node_metadata(node.source_refs)
@@ -131,7 +146,7 @@ class GrfnAssignmentPass:
                     )
 
                 # store argument as output to GrfnAssignment
-                arg_assignment.outputs[arg_fullid] = arg_grfn_var.uid
+                arg_assignment.outputs[arg_fullid] = arg_grfn_id
                 # populate GrfnAssignment inputs for arguments
                 self.visit(n, arg_assignment.inputs)
                 # store GrfnAssignment for this argument
@@ -147,14 +162,13 @@ class GrfnAssignmentPass:
         assert isinstance(node.func, AnnCastName)
         # add ret_val to add_to dict
         for id, fullid in node.out_ret_val.items():
-            grfn_var = self.pipeline_state.get_grfn_var(fullid)
-            add_to[fullid] = grfn_var.uid
+            add_to[fullid] = self.pipeline_state.fullid_to_grfn_id[fullid]
 
         # populate `arg_assignments` attribute of node
         for i, n in enumerate(node.arguments):
-            # grab GrFN variable for argument
+            # grab GrFN variable id for argument
             arg_fullid = node.arg_index_to_fullid[i]
-            arg_grfn_var = self.pipeline_state.get_grfn_var(arg_fullid)
+            arg_grfn_id = self.pipeline_state.fullid_to_grfn_id[arg_fullid]
 
             # create GrfnAssignment based on assignment type
             metadata = create_lambda_node_metadata(node.source_refs)
@@ -168,7 +182,7 @@ class GrfnAssignmentPass:
                 )
 
             # store argument as output to GrfnAssignment
-            arg_assignment.outputs[arg_fullid] = arg_grfn_var.uid
+            arg_assignment.outputs[arg_fullid] = arg_grfn_id
             # populate GrfnAssignment inputs for arguments
             self.visit(n, arg_assignment.inputs)
             # store GrfnAssignment for this argument
@@ -271,8 +285,9 @@ class GrfnAssignmentPass:
         self.visit(node.value, node.grfn_assignment.inputs)
 
         for id, fullid in node.owning_func_def.in_ret_val.items():
-            grfn_var = self.pipeline_state.get_grfn_var(fullid)
-            node.grfn_assignment.outputs[fullid] = grfn_var.uid
+            node.grfn_assignment.outputs[
+                fullid
+            ] = self.pipeline_state.fullid_to_grfn_id[fullid]
 
         # DEBUG printing
         if self.pipeline_state.PRINT_DEBUGGING_INFO:
@@ -288,12 +303,14 @@ class GrfnAssignmentPass:
 
     @_visit.register
     def visit_module(self, node: AnnCastModule, add_to: typing.Dict):
-        add_to = {}
-        self.visit_node_list(node.body, add_to)
+        self.enter_module(node)
+        for statement in node.body:
+            self.visit_statement(statement)
+        self.exit_module(node)
 
     @_visit.register
     def visit_name(self, node: AnnCastName, add_to: typing.Dict):
-        fullid = ann_cast_name_to_fullid(node)
+        fullid = self.symbols.name_fullid(node)
 
         # store fullid/grfn id in add_to
         add_to[fullid] = node.grfn_id
@@ -3,7 +3,6 @@ from functools import singledispatchmethod
 
 from skema.model_assembly.metadata import VariableCreationReason
 from skema.program_analysis.CAST2FN.ann_cast.ann_cast_helpers import (
-    CON_STR_SEP,
     ELSEBODY,
     IFBODY,
     IFEXPR,
@@ -16,10 +15,7 @@ from skema.program_analysis.CAST2FN.ann_cast.ann_cast_helpers import (
     VAR_INIT_VERSION,
     add_metadata_from_name_node,
     add_metadata_to_grfn_var,
-    ann_cast_name_to_fullid,
-    build_fullid,
     call_container_name,
-    con_scope_to_str,
     create_grfn_var,
     create_grfn_var_from_name_node,
     generate_from_source_metadata,
@@ -37,9 +33,9 @@ from skema.program_analysis.CAST2FN.model.cast import (
 class GrfnVarCreationPass:
     def __init__(self, pipeline_state: PipelineState):
         self.pipeline_state = pipeline_state
+        # scope ids and fullids are given by the SymbolTable of the pipeline
+        self.symbols = self.pipeline_state.symbols
         self.nodes = self.pipeline_state.nodes
-        # the fullid of a AnnCastName node is a string which includes its
-        # variable name, numerical id, version, and scope
         for node in self.pipeline_state.nodes:
             self.visit(node)
 
@@ -69,10 +65,8 @@ class GrfnVarCreationPass:
         Obtains the GrFN variable node for the fullid of
         this AnnCastName node
         """
-        fullid = ann_cast_name_to_fullid(node)
-        return self.pipeline_state.grfn_id_to_grfn_var[
-            self.pipeline_state.fullid_to_grfn_id[fullid]
-        ]
+        fullid = self.symbols.name_fullid(node)
+        return self.pipeline_state.get_grfn_var(fullid)
 
     def alias_copied_func_body_init_vers(self, node: AnnCastCall):
         """
@@ -83,21 +77,21 @@ class GrfnVarCreationPass:
         `VAR_INIT_VERSION` of calling container sccope.
         """
         func_def_copy = node.func_def_copy
-        call_con_scopestr = con_scope_to_str(
+        call_con_scope_id = self.symbols.scope_id(
             node.func.con_scope + [call_container_name(node)]
         )
-        func_con_scopestr = con_scope_to_str(func_def_copy.con_scope)
+        func_con_scope_id = self.symbols.scope_id(func_def_copy.con_scope)
 
-        # alias `VAR_INIT_VERSION` variables in call_con_scopestr
+        # alias `VAR_INIT_VERSION` variables in call_con_scope_id
         # to the `VAR_INIT_VERSION` version occuring the func body
         version = VAR_INIT_VERSION
         # we alias globals which are used for the top interface
         for id, var_name in node.top_interface_vars.items():
-            body_fullid = build_fullid(
-                var_name, id, version, func_con_scopestr
+            body_fullid = self.symbols.fullid(
+                var_name, id, version, func_con_scope_id
             )
-            call_fullid = build_fullid(
-                var_name, id, version, call_con_scopestr
+            call_fullid = self.symbols.fullid(
+                var_name, id, version, call_con_scope_id
             )
             # we create GrFN variables with call_fullid during VariableVersionPass
             self.pipeline_state.alias_grfn_vars(body_fullid, call_fullid)
@@ -109,8 +103,8 @@ class GrfnVarCreationPass:
             name = var.val
             func_id = name.id
             var_name = name.name
-            func_fullid = build_fullid(
-                var_name, func_id, version, func_con_scopestr
+            func_fullid = self.symbols.fullid(
+                var_name, func_id, version, func_con_scope_id
             )
             # we create GrFN variables with call_fullid during VariableVersionPass
             self.pipeline_state.alias_grfn_vars(func_fullid, call_fullid)
@@ -124,21 +118,21 @@ class GrfnVarCreationPass:
         `VAR_EXIT_VERSION` of calling container sccope.
         """
         func_def_copy = node.func_def_copy
-        call_con_scopestr = con_scope_to_str(
+        call_con_scope_id = self.symbols.scope_id(
             node.func.con_scope + [call_container_name(node)]
         )
-        func_con_scopestr = con_scope_to_str(func_def_copy.con_scope)
+        func_con_scope_id = self.symbols.scope_id(func_def_copy.con_scope)
 
-        # alias `VAR_EXIT_VERSION` variables in call_con_scopestr
+        # alias `VAR_EXIT_VERSION` variables in call_con_scope_id
         # to the highest version occuring the func body
         exit_version = VAR_EXIT_VERSION
         for id, var_name in node.bot_interface_vars.items():
             body_version = func_def_copy.body_highest_var_vers[id]
-            body_fullid = build_fullid(
-                var_name, id, body_version, func_con_scopestr
+            body_fullid = self.symbols.fullid(
+                var_name, id, body_version, func_con_scope_id
             )
-            exit_fullid = build_fullid(
-                var_name, id, exit_version, call_con_scopestr
+            exit_fullid = self.symbols.fullid(
+                var_name, id, exit_version, call_con_scope_id
             )
             self.pipeline_state.alias_grfn_vars(exit_fullid, body_fullid)
 
@@ -150,22 +144,22 @@ class GrfnVarCreationPass:
          - `VAR_INIT_VERSION` of if-body variables
          - `VAR_INIT_VERSION` of else-body variables
         """
-        con_scopestr = con_scope_to_str(node.con_scope)
+        con_scope_id = self.symbols.scope_id(node.con_scope)
 
         # alias all top_interface_vars in if body and else body to the
         # highest version GrFN variable from if-expr
         body_version = VAR_INIT_VERSION
         for id, var_name in node.top_interface_vars.items():
             expr_version = node.expr_highest_var_vers[id]
-            expr_scopestr = con_scopestr + CON_STR_SEP + IFEXPR
-            expr_fullid = build_fullid(
-                var_name, id, expr_version, expr_scopestr
+            expr_scope_id = self.symbols.sub_scope_id(con_scope_id, IFEXPR)
+            expr_fullid = self.symbols.fullid(
+                var_name, id, expr_version, expr_scope_id
             )
 
             for body in [IFBODY, ELSEBODY]:
-                body_scopestr = con_scopestr + CON_STR_SEP + body
-                body_fullid = build_fullid(
-                    var_name, id, body_version, body_scopestr
+                body_scope_id = self.symbols.sub_scope_id(con_scope_id, body)
+                body_fullid = self.symbols.fullid(
+                    var_name, id, body_version, body_scope_id
                 )
                 self.pipeline_state.alias_grfn_vars(body_fullid, expr_fullid)
 
@@ -180,13 +174,15 @@ class GrfnVarCreationPass:
             - for modified variables, creates version `VAR_EXIT_VERSION` GrFN variables to
                be used for the `decision_out` and `top_interface_in`
         """
-        con_scopestr = con_scope_to_str(node.con_scope)
+        con_scope_id = self.symbols.scope_id(node.con_scope)
 
         # by convention, we introduce version `VAR_INIT_VERSION` at the top of the container
         for id, var_name in node.top_interface_vars.items():
             version = VAR_INIT_VERSION
-            grfn_var = create_grfn_var(var_name, id, version, con_scopestr)
-            fullid = build_fullid(var_name, id, version, con_scopestr)
+            grfn_var = create_grfn_var(
+                var_name, id, version, self.symbols.scopestr(con_scope_id)
+            )
+            fullid = self.symbols.fullid(var_name, id, version, con_scope_id)
             self.pipeline_state.store_grfn_var(fullid, grfn_var)
             # create From Source metadata for the GrFN var
             # See comment above declaration for `FROM_SOURCE_FOR_GE` in annotated_cast.py
@@ -199,16 +195,18 @@ class GrfnVarCreationPass:
             add_metadata_to_grfn_var(grfn_var, from_source_mdata)
 
             # alias VAR_INIT_VERSION expr variables
-            expr_scopestr = con_scopestr + CON_STR_SEP + IFEXPR
-            expr_fullid = build_fullid(var_name, id, version, expr_scopestr)
+            expr_scope_id = self.symbols.sub_scope_id(con_scope_id, IFEXPR)
+            expr_fullid = self.symbols.fullid(var_name, id, version, expr_scope_id)
             self.pipeline_state.alias_grfn_vars(expr_fullid, fullid)
 
         # by convention, we introduce `VAR_EXIT_VERSION` for modified variables
         # to be used as the output of the Decision node, and input to bot interface
         for id, var_name in node.bot_interface_vars.items():
             version = VAR_EXIT_VERSION
-            grfn_var = create_grfn_var(var_name, id, version, con_scopestr)
-            fullid = build_fullid(var_name, id, version, con_scopestr)
+            grfn_var = create_grfn_var(
+                var_name, id, version, self.symbols.scopestr(con_scope_id)
+            )
+            fullid = self.symbols.fullid(var_name, id, version, con_scope_id)
             self.pipeline_state.store_grfn_var(fullid, grfn_var)
             # create From Source metadata for the GrFN var
             # See comment above declaration for `FROM_SOURCE_FOR_GE` in annotated_cast.py
@@ -227,25 +225,25 @@ class GrfnVarCreationPass:
         attributes based on the if expr's used variables and the newly
         created GrFN condition variable.
         """
-        if_scopestr = con_scope_to_str(node.con_scope)
-        expr_scopestr = con_scope_to_str(node.con_scope + [IFEXPR])
+        if_scope_id = self.symbols.scope_id(node.con_scope)
+        expr_scope_id = self.symbols.scope_id(node.con_scope + [IFEXPR])
 
         # inputs to condition node are the highest versions of used variables of the expr
         for id, var_name in node.expr_used_vars.items():
             highest_ver = node.expr_highest_var_vers[id]
-            fullid = build_fullid(var_name, id, highest_ver, expr_scopestr)
+            fullid = self.symbols.fullid(var_name, id, highest_ver, expr_scope_id)
             node.condition_in[id] = fullid
 
         # build condition variable
-        cond_name = make_cond_var_name(if_scopestr)
+        cond_name = make_cond_var_name(self.symbols.scopestr(if_scope_id))
         # use new collapsed id
         cond_id = self.pipeline_state.next_collapsed_id()
         cond_version = VAR_INIT_VERSION
-        cond_fullid = build_fullid(
-            cond_name, cond_id, cond_version, if_scopestr
+        cond_fullid = self.symbols.fullid(
+            cond_name, cond_id, cond_version, if_scope_id
         )
         cond_var = create_grfn_var(
-            cond_name, cond_id, cond_version, if_scopestr
+            cond_name, cond_id, cond_version, self.symbols.scopestr(if_scope_id)
         )
         self.pipeline_state.store_grfn_var(cond_fullid, cond_var)
         # create From Source metadata for the GrFN var
@@ -274,25 +272,25 @@ class GrfnVarCreationPass:
         but we do not add it to the `decision_in` dict to make iterating over that
         dict simpler
         """
-        if_scopestr = con_scope_to_str(node.con_scope)
-        ifbody_scopestr = con_scope_to_str(node.con_scope + [IFBODY])
-        elsebody_scopestr = con_scope_to_str(node.con_scope + [ELSEBODY])
+        if_scope_id = self.symbols.scope_id(node.con_scope)
+        ifbody_scope_id = self.symbols.scope_id(node.con_scope + [IFBODY])
+        elsebody_scope_id = self.symbols.scope_id(node.con_scope + [ELSEBODY])
         # inputs to decision node are the highest versions in if-body and else-body
         # of variables modified within if container
         # NOTE: bot_interface_vars is the same as modified_vars
         for id, var_name in node.bot_interface_vars.items():
             if_highest = node.ifbody_highest_var_vers[id]
-            if_fullid = build_fullid(var_name, id, if_highest, ifbody_scopestr)
+            if_fullid = self.symbols.fullid(var_name, id, if_highest, ifbody_scope_id)
             else_highest = node.elsebody_highest_var_vers[id]
-            else_fullid = build_fullid(
-                var_name, id, else_highest, elsebody_scopestr
+            else_fullid = self.symbols.fullid(
+                var_name, id, else_highest, elsebody_scope_id
             )
             node.decision_in[id] = {IFBODY: if_fullid, ELSEBODY: else_fullid}
 
         # outputs to the decision node are version `VAR_EXIT_VERSION` variables in if container scope
         out_version = VAR_EXIT_VERSION
         for id, var_name in node.bot_interface_vars.items():
-            fullid = build_fullid(var_name, id, out_version, if_scopestr)
+            fullid = self.symbols.fullid(var_name, id, out_version, if_scope_id)
             node.decision_out[id] = fullid
 
     def create_grfn_vars_loop(self, node: AnnCastLoop):
@@ -307,13 +305,15 @@ class GrfnVarCreationPass:
             - creates a version VAR_EXIT_VERSION GrFN variable for all modified variables
               These GrFN variables are used for `bot_interface_in`.
         """
-        con_scopestr = con_scope_to_str(node.con_scope)
+        con_scope_id = self.symbols.scope_id(node.con_scope)
 
         # create version `VAR_INIT_VERSION` for used variables
         for id, var_name in node.top_interface_vars.items():
             version = VAR_INIT_VERSION
-            grfn_var = create_grfn_var(var_name, id, version, con_scopestr)
-            fullid = build_fullid(var_name, id, version, con_scopestr)
+            grfn_var = create_grfn_var(
+                var_name, id, version, self.symbols.scopestr(con_scope_id)
+            )
+            fullid = self.symbols.fullid(var_name, id, version, con_scope_id)
             self.pipeline_state.store_grfn_var(fullid, grfn_var)
             # create From Source metadata for the GrFN var
             # See comment above declaration for `FROM_SOURCE_FOR_GE` in annotated_cast.py
@@ -327,9 +327,9 @@ class GrfnVarCreationPass:
 
             # alias VAR_INIT_VERSION expr variables
             expr_version = VAR_INIT_VERSION
-            expr_scopestr = con_scopestr + CON_STR_SEP + LOOPEXPR
-            expr_fullid = build_fullid(
-                var_name, id, expr_version, expr_scopestr
+            expr_scope_id = self.symbols.sub_scope_id(con_scope_id, LOOPEXPR)
+            expr_fullid = self.symbols.fullid(
+                var_name, id, expr_version, expr_scope_id
             )
             self.pipeline_state.alias_grfn_vars(expr_fullid, fullid)
 
@@ -337,8 +337,10 @@ class GrfnVarCreationPass:
         # for modified variables (which are the same as bot interface_vars)
         for id, var_name in node.bot_interface_vars.items():
             for version in [LOOP_VAR_UPDATED_VERSION, VAR_EXIT_VERSION]:
-                grfn_var = create_grfn_var(var_name, id, version, con_scopestr)
-                fullid = build_fullid(var_name, id, version, con_scopestr)
+                grfn_var = create_grfn_var(
+                    var_name, id, version, self.symbols.scopestr(con_scope_id)
+                )
+                fullid = self.symbols.fullid(var_name, id, version, con_scope_id)
                 self.pipeline_state.store_grfn_var(fullid, grfn_var)
                 # we intentionally do not add metadata to the GrFN variables here, since
                 # these variables will be aliased to other variables created from Name nodes
@@ -352,7 +354,7 @@ class GrfnVarCreationPass:
          - `VAR_INIT_VERSION` of loop-body variables
          - `VAR_EXIT_VERSION` of modified variables
         """
-        con_scopestr = con_scope_to_str(node.con_scope)
+        con_scope_id = self.symbols.scope_id(node.con_scope)
 
         # alias intial body version for top_interface_vars to the
         # highest version GrFN variable from loop-expr
@@ -362,20 +364,20 @@ class GrfnVarCreationPass:
         exit_version = VAR_EXIT_VERSION
         for id, var_name in node.top_interface_vars.items():
             expr_version = node.expr_highest_var_vers[id]
-            expr_scopestr = con_scopestr + CON_STR_SEP + LOOPEXPR
-            expr_fullid = build_fullid(
-                var_name, id, expr_version, expr_scopestr
+            expr_scope_id = self.symbols.sub_scope_id(con_scope_id, LOOPEXPR)
+            expr_fullid = self.symbols.fullid(
+                var_name, id, expr_version, expr_scope_id
             )
-            body_scopestr = con_scopestr + CON_STR_SEP + LOOPBODY
-            body_fullid = build_fullid(
-                var_name, id, body_version, body_scopestr
+            body_scope_id = self.symbols.sub_scope_id(con_scope_id, LOOPBODY)
+            body_fullid = self.symbols.fullid(
+                var_name, id, body_version, body_scope_id
             )
             self.pipeline_state.alias_grfn_vars(body_fullid, expr_fullid)
 
             if id in node.bot_interface_vars:
-                exit_scopestr = con_scopestr
-                exit_fullid = build_fullid(
-                    var_name, id, exit_version, exit_scopestr
+                exit_scope_id = con_scope_id
+                exit_fullid = self.symbols.fullid(
+                    var_name, id, exit_version, exit_scope_id
                 )
                 self.pipeline_state.alias_grfn_vars(exit_fullid, expr_fullid)
 
@@ -386,19 +388,19 @@ class GrfnVarCreationPass:
         Aliases highest version variables from the loop init to
         `LOOP_VAR_UPDATED_VERSION` variables.
         """
-        con_scopestr = con_scope_to_str(node.con_scope)
+        con_scope_id = self.symbols.scope_id(node.con_scope)
 
         # alias `LOOP_VAR_UPDATED_VERSION` modified variables
         # to the highest version occuring the loop body
         updated_version = LOOP_VAR_UPDATED_VERSION
         for id, var_name in node.modified_vars.items():
             init_version = node.init_highest_var_vers[id]
-            init_scopestr = con_scopestr + CON_STR_SEP + LOOPPRE
-            init_fullid = build_fullid(
-                var_name, id, init_version, init_scopestr
+            init_scope_id = self.symbols.sub_scope_id(con_scope_id, LOOPPRE)
+            init_fullid = self.symbols.fullid(
+                var_name, id, init_version, init_scope_id
             )
-            updated_fullid = build_fullid(
-                var_name, id, updated_version, con_scopestr
+            updated_fullid = self.symbols.fullid(
+                var_name, id, updated_version, con_scope_id
             )
             self.pipeline_state.alias_grfn_vars(updated_fullid, init_fullid)
 
@@ -409,19 +411,19 @@ class GrfnVarCreationPass:
         Aliases highest version variables from the loop body to
         `LOOP_VAR_UPDATED_VERSION` variables.
         """
-        con_scopestr = con_scope_to_str(node.con_scope)
+        con_scope_id = self.symbols.scope_id(node.con_scope)
 
         # alias `LOOP_VAR_UPDATED_VERSION` modified variables
         # to the highest version occuring the loop body
         updated_version = LOOP_VAR_UPDATED_VERSION
         for id, var_name in node.modified_vars.items():
             body_version = node.body_highest_var_vers[id]
-            body_scopestr = con_scopestr + CON_STR_SEP + LOOPBODY
-            body_fullid = build_fullid(
-                var_name, id, body_version, body_scopestr
+            body_scope_id = self.symbols.sub_scope_id(con_scope_id, LOOPBODY)
+            body_fullid = self.symbols.fullid(
+                var_name, id, body_version, body_scope_id
             )
-            updated_fullid = build_fullid(
-                var_name, id, updated_version, con_scopestr
+            updated_fullid = self.symbols.fullid(
+                var_name, id, updated_version, con_scope_id
             )
             self.pipeline_state.alias_grfn_vars(updated_fullid, body_fullid)
 
@@ -432,25 +434,25 @@ class GrfnVarCreationPass:
         attributes based on the loop expr's used variables and the newly
         created GrFN condition variable.
         """
-        loop_scopestr = con_scope_to_str(node.con_scope)
-        expr_scopestr = con_scope_to_str(node.con_scope + [LOOPEXPR])
+        loop_scope_id = self.symbols.scope_id(node.con_scope)
+        expr_scope_id = self.symbols.scope_id(node.con_scope + [LOOPEXPR])
 
         # inputs to condition node are the highest versions of used variables of the expr
         for id, var_name in node.expr_used_vars.items():
             highest_ver = node.expr_highest_var_vers[id]
-            fullid = build_fullid(var_name, id, highest_ver, expr_scopestr)
+            fullid = self.symbols.fullid(var_name, id, highest_ver, expr_scope_id)
             node.condition_in[id] = fullid
 
         # build condition variable
-        cond_name = make_loop_exit_name(loop_scopestr)
+        cond_name = make_loop_exit_name(self.symbols.scopestr(loop_scope_id))
         # use new collapsed id
         cond_id = self.pipeline_state.next_collapsed_id()
         cond_version = VAR_INIT_VERSION
-        cond_fullid = build_fullid(
-            cond_name, cond_id, cond_version, loop_scopestr
+        cond_fullid = self.symbols.fullid(
+            cond_name, cond_id, cond_version, loop_scope_id
         )
         cond_var = create_grfn_var(
-            cond_name, cond_id, cond_version, loop_scopestr
+            cond_name, cond_id, cond_version, self.symbols.scopestr(loop_scope_id)
         )
         # mark the node as an exit
         cond_var.is_exit = True
@@ -471,11 +473,12 @@ class GrfnVarCreationPass:
     def print_created_grfn_vars(self):
         print("Created the follwing GrFN variables")
         print("-" * 50)
-        print(f"{'fullid':<70}{'grfn_id':<70}{'index':<2}")
-        print(f"{'------':<70}{'-------':<70}{'-----':<2}")
+        print(f"{'fullid':<70}{'grfn uid':<70}{'index':<2}")
+        print(f"{'------':<70}{'--------':<70}{'-----':<2}")
         for fullid, grfn_id in self.pipeline_state.fullid_to_grfn_id.items():
-            grfn_var = self.pipeline_state.grfn_id_to_grfn_var[grfn_id]
-            print(f"{fullid:<70}{grfn_id:<70}{grfn_var.identifier.index:<2}")
+            grfn_var = self.pipeline_state.grfn_vars[grfn_id]
+            fullid_str = self.symbols.fullid_str(fullid)
+            print(f"{fullid_str:<70}{grfn_var.uid:<70}{grfn_var.identifier.index:<2}")
 
     @singledispatchmethod
     def _visit(self, node: AnnCastNode):
@@ -616,7 +619,7 @@ class GrfnVarCreationPass:
 
     @_visit.register
     def visit_name(self, node: AnnCastName):
-        fullid = ann_cast_name_to_fullid(node)
+        fullid = self.symbols.name_fullid(node)
         # if we haven't already created the GrFN `VariableNode`, create it
         if fullid not in self.pipeline_state.fullid_to_grfn_id:
             grfn_var = create_grfn_var_from_name_node(node)
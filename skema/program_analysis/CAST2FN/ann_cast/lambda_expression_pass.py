@@ -5,11 +5,10 @@ from skema.program_analysis.CAST2FN.ann_cast.ann_cast_helpers import (
     ELSEBODY,
     IFBODY,
     GrfnAssignment,
-    ann_cast_name_to_fullid,
     cast_op_to_str,
-    lambda_var_from_fullid,
 )
 from skema.program_analysis.CAST2FN.ann_cast.annotated_cast import *
+from skema.program_analysis.CAST2FN.ann_cast.symbol_table import SymbolTable
 from skema.program_analysis.CAST2FN.model.cast import (
     ScalarType,
     StructureType,
@@ -18,9 +17,9 @@ from skema.program_analysis.CAST2FN.model.cast import (
 
 
 def lambda_for_grfn_assignment(
-    grfn_assignment: GrfnAssignment, lambda_body: str
+    symbols: SymbolTable, grfn_assignment: GrfnAssignment, lambda_body: str
 ) -> str:
-    var_names = map(lambda_var_from_fullid, grfn_assignment.inputs.keys())
+    var_names = map(symbols.lambda_var, grfn_assignment.inputs.keys())
 
     param_str = ", ".join(var_names)
     lambda_expr = f"lambda {param_str}: {lambda_body}"
@@ -28,8 +27,10 @@ def lambda_for_grfn_assignment(
     return lambda_expr
 
 
-def lambda_for_condition(condition_in: typing.Dict, lambda_body: str) -> str:
-    var_names = map(lambda_var_from_fullid, condition_in.values())
+def lambda_for_condition(
+    symbols: SymbolTable, condition_in: typing.Dict, lambda_body: str
+) -> str:
+    var_names = map(symbols.lambda_var, condition_in.values())
 
     param_str = ", ".join(var_names)
     lambda_expr = f"lambda {param_str}: {lambda_body}"
@@ -38,7 +39,7 @@ def lambda_for_condition(condition_in: typing.Dict, lambda_body: str) -> str:
 
 
 def lambda_for_decision(
-    condition_fullid: str, decision_in: typing.Dict
+    symbols: SymbolTable, condition_fullid: int, decision_in: typing.Dict
 ) -> str:
     """
     Lambdas for decision nodes chooses betweeen IFBODY and ELSEBODY variables from
@@ -49,7 +50,7 @@ def lambda_for_decision(
     """
     if len(decision_in) == 0:
         return f"lambda: None"
-    cond_name = lambda_var_from_fullid(condition_fullid)
+    cond_name = symbols.lambda_var(condition_fullid)
 
     lambda_body = ""
 
@@ -57,9 +58,9 @@ def lambda_for_decision(
     else_names = []
     for dec in decision_in.values():
         if_fullid = dec[IFBODY]
-        if_names.append(lambda_var_from_fullid(if_fullid) + "_if")
+        if_names.append(symbols.lambda_var(if_fullid) + "_if")
         else_fullid = dec[ELSEBODY]
-        else_names.append(lambda_var_from_fullid(else_fullid) + "_else")
+        else_names.append(symbols.lambda_var(else_fullid) + "_else")
 
     if_names_str = ", ".join(if_names)
     else_names_str = ", ".join(else_names)
@@ -73,14 +74,14 @@ def lambda_for_decision(
     return lambda_expr
 
 
-def lambda_for_interface(interface_in: typing.Dict) -> str:
+def lambda_for_interface(symbols: SymbolTable, interface_in: typing.Dict) -> str:
     """
     Lambdas for plain interface nodes are simply multi-parameter identity functions
     """
     if len(interface_in) == 0:
         return "lambda: None"
 
-    var_names = map(lambda_var_from_fullid, interface_in.values())
+    var_names = map(symbols.lambda_var, interface_in.values())
     param_str = ", ".join(var_names)
 
     lambda_expr = f"lambda {param_str}: ({param_str})"
@@ -89,7 +90,9 @@ def lambda_for_interface(interface_in: typing.Dict) -> str:
 
 
 def lambda_for_loop_top_interface(
-    top_interface_initial: typing.Dict, top_interface_updated: typing.Dict
+    symbols: SymbolTable,
+    top_interface_initial: typing.Dict,
+    top_interface_updated: typing.Dict,
 ) -> str:
     """
     Lambda for loop top interface chooses between initial and updated version
@@ -102,9 +105,9 @@ def lambda_for_loop_top_interface(
     The `use_initial` value comes from the internal state of the LoopTopInterface during execution.
     """
 
-    init_name = lambda fullid: lambda_var_from_fullid(fullid) + "_init"
+    init_name = lambda fullid: symbols.lambda_var(fullid) + "_init"
     init_names = map(init_name, top_interface_initial.values())
-    updt_name = lambda fullid: lambda_var_from_fullid(fullid) + "_update"
+    updt_name = lambda fullid: symbols.lambda_var(fullid) + "_update"
     updt_names = map(updt_name, top_interface_updated.values())
 
     # NOTE: the lengths of top_interface_initial and top_interface_updated may not be the same
@@ -137,8 +140,8 @@ def lambda_for_loop_top_interface(
     return lambda_expr
 
 
-def lambda_for_loop_condition(condition_in, lambda_body):
-    var_names = map(lambda_var_from_fullid, condition_in.values())
+def lambda_for_loop_condition(symbols: SymbolTable, condition_in, lambda_body):
+    var_names = map(symbols.lambda_var, condition_in.values())
 
     param_str = ", ".join(var_names)
     lambda_expr = f"lambda {param_str}: {lambda_body}"
@@ -147,14 +150,36 @@ def lambda_for_loop_condition(condition_in, lambda_body):
 
 
 class LambdaExpressionPass:
-    def __init__(self, pipeline_state: PipelineState):
+    def __init__(self, pipeline_state: PipelineState, fused: bool = False):
         self.pipeline_state = pipeline_state
+        # scope ids and fullids are given by the SymbolTable of the pipeline
+        self.symbols = self.pipeline_state.symbols
         self.nodes = self.pipeline_state.nodes
         # Any other state variables that are needed during
         # the pass
+        # the lambda expressions of the statements of the module being visited
+        self.module_body_expr = []
+        # when fused, the PassManager visits the nodes through the hooks
+        # enter_module, visit_statement and exit_module (see pass_manager.py)
+        if fused:
+            return
         for node in self.pipeline_state.nodes:
             self.visit(node)
 
+    def enter_module(self, node: AnnCastModule):
+        self.module_body_expr = []
+
+    def visit_statement(self, node: AnnCastNode):
+        self.module_body_expr.append(self.visit(node))
+
+    def exit_module(self, node: AnnCastModule):
+        # DEBUG printing
+        if self.pipeline_state.PRINT_DEBUGGING_INFO:
+            print(f"Module")
+            print(f"\t Body Expressions:")
+            for e in self.module_body_expr:
+                print(f"\t\t{e}")
+
     def visit(self, node: AnnCastNode) -> str:
         """
         External visit that calls the internal visit
@@ -186,7 +211,9 @@ class LambdaExpressionPass:
         right = self.visit(node.right)
         # build the lambda expression for the assignment
         # and store in GrfnAssignment
-        lambda_expr = lambda_for_grfn_assignment(node.grfn_assignment, right)
+        lambda_expr = lambda_for_grfn_assignment(
+            self.symbols, node.grfn_assignment, right
+        )
         node.grfn_assignment.lambda_expr = lambda_expr
         node.expr_str = lambda_expr
 
@@ -206,17 +233,21 @@ class LambdaExpressionPass:
         for i, grfn_assignment in node.arg_assignments.items():
             lambda_body = self.visit(node.arguments[i])
             grfn_assignment.lambda_expr = lambda_for_grfn_assignment(
-                grfn_assignment, lambda_body
+                self.symbols, grfn_assignment, lambda_body
             )
 
         # top interface lambda
-        node.top_interface_lambda = lambda_for_interface(node.top_interface_in)
+        node.top_interface_lambda = lambda_for_interface(
+            self.symbols, node.top_interface_in
+        )
 
         # build lamba expressions for function def copy body
         body_expr = self.visit_function_def_copy(node.func_def_copy)
 
         # bot interface lambda
-        node.bot_interface_lambda = lambda_for_interface(node.bot_interface_in)
+        node.bot_interface_lambda = lambda_for_interface(
+            self.symbols, node.bot_interface_in
+        )
 
         # DEBUG printing
         if self.pipeline_state.PRINT_DEBUGGING_INFO:
@@ -243,14 +274,18 @@ class LambdaExpressionPass:
         for i, grfn_assignment in node.arg_assignments.items():
             lambda_body = self.visit(node.arguments[i])
             grfn_assignment.lambda_expr = lambda_for_grfn_assignment(
-                grfn_assignment, lambda_body
+                self.symbols, grfn_assignment, lambda_body
             )
 
         # top interface lambda
-        node.top_interface_lambda = lambda_for_interface(node.top_interface_in)
+        node.top_interface_lambda = lambda_for_interface(
+            self.symbols, node.top_interface_in
+        )
 
         # bot interface lambda
-        node.bot_interface_lambda = lambda_for_interface(node.bot_interface_in)
+        node.bot_interface_lambda = lambda_for_interface(
+            self.symbols, node.bot_interface_in
+        )
 
         # DEBUG printing
         if self.pipeline_state.PRINT_DEBUGGING_INFO:
@@ -275,7 +310,7 @@ class LambdaExpressionPass:
         if node.has_ret_val:
             assert len(node.out_ret_val) == 1
             ret_val_fullid = list(node.out_ret_val.values())[0]
-            node.expr_str = lambda_var_from_fullid(ret_val_fullid)
+            node.expr_str = self.symbols.lambda_var(ret_val_fullid)
 
         return node.expr_str
 
@@ -289,11 +324,15 @@ class LambdaExpressionPass:
 
     @_visit.register
     def visit_function_def(self, node: AnnCastFunctionDef) -> str:
-        node.top_interface_lambda = lambda_for_interface(node.top_interface_in)
+        node.top_interface_lambda = lambda_for_interface(
+            self.symbols, node.top_interface_in
+        )
         # NOTE: we do not visit node.func_args because those parameters are
         # included in the outputs of the top interface lambda
         body_expr = self.visit_node_list(node.body)
-        node.bot_interface_lambda = lambda_for_interface(node.bot_interface_in)
+        node.bot_interface_lambda = lambda_for_interface(
+            self.symbols, node.bot_interface_in
+        )
 
         # DEBUG printing
         if self.pipeline_state.PRINT_DEBUGGING_INFO:
@@ -343,7 +382,7 @@ class LambdaExpressionPass:
     def visit_loop(self, node: AnnCastLoop) -> str:
         # top interface lambda
         node.top_interface_lambda = lambda_for_loop_top_interface(
-            node.top_interface_initial, node.top_interface_updated
+            self.symbols, node.top_interface_initial, node.top_interface_updated
         )
         # init lambda
         if len(node.pre) > 0:
@@ -352,12 +391,14 @@ class LambdaExpressionPass:
         # condition lambda
         loop_expr = self.visit(node.expr)
         node.condition_lambda = lambda_for_loop_condition(
-            node.condition_in, loop_expr
+            self.symbols, node.condition_in, loop_expr
         )
 
         body_expr = self.visit_node_list(node.body)
 
-        node.bot_interface_lambda = lambda_for_interface(node.bot_interface_in)
+        node.bot_interface_lambda = lambda_for_interface(
+            self.symbols, node.bot_interface_in
+        )
 
         # DEBUG printing
         if self.pipeline_state.PRINT_DEBUGGING_INFO:
@@ -389,12 +430,14 @@ class LambdaExpressionPass:
     @_visit.register
     def visit_model_if(self, node: AnnCastModelIf) -> str:
         # top interface lambda
-        node.top_interface_lambda = lambda_for_interface(node.top_interface_in)
+        node.top_interface_lambda = lambda_for_interface(
+            self.symbols, node.top_interface_in
+        )
 
         # make condition lambda
         expr_str = self.visit(node.expr)
         node.condition_lambda = lambda_for_condition(
-            node.condition_in, expr_str
+            self.symbols, node.condition_in, expr_str
         )
 
         body_expr = self.visit_node_list(node.body)
@@ -403,11 +446,13 @@ class LambdaExpressionPass:
         # make decision lambda
         cond_fullid = list(node.condition_out.values())[0]
         node.decision_lambda = lambda_for_decision(
-            cond_fullid, node.decision_in
+            self.symbols, cond_fullid, node.decision_in
         )
 
         # bot interface lambda
-        node.bot_interface_lambda = lambda_for_interface(node.bot_interface_in)
+        node.bot_interface_lambda = lambda_for_interface(
+            self.symbols, node.bot_interface_in
+        )
 
         # DEBUG printing
         if self.pipeline_state.PRINT_DEBUGGING_INFO:
@@ -434,7 +479,9 @@ class LambdaExpressionPass:
         val = self.visit(node.value)
         # build the lambda expression for the ret_val assignment
         # and store in GrfnAssignment
-        lambda_expr = lambda_for_grfn_assignment(node.grfn_assignment, val)
+        lambda_expr = lambda_for_grfn_assignment(
+            self.symbols, node.grfn_assignment, val
+        )
         node.grfn_assignment.lambda_expr = lambda_expr
         node.expr_str = lambda_expr
 
@@ -442,21 +489,17 @@ class LambdaExpressionPass:
 
     @_visit.register
     def visit_module(self, node: AnnCastModule) -> str:
-        body_expr = self.visit_node_list(node.body)
-
-        # DEBUG printing
-        if self.pipeline_state.PRINT_DEBUGGING_INFO:
-            print(f"Module")
-            print(f"\t Body Expressions:")
-            for e in body_expr:
-                print(f"\t\t{e}")
+        self.enter_module(node)
+        for statement in node.body:
+            self.visit_statement(statement)
+        self.exit_module(node)
 
         return node.expr_str
 
     @_visit.register
     def visit_name(self, node: AnnCastName) -> str:
-        fullid = ann_cast_name_to_fullid(node)
-        node.expr_str = lambda_var_from_fullid(fullid)
+        fullid = self.symbols.name_fullid(node)
+        node.expr_str = self.symbols.lambda_var(fullid)
         return node.expr_str
 
     @_visit.register
@@ -0,0 +1,252 @@
+"""
+pass_manager.py defines the PassManager, which runs the passes of the
+Annotated CAST pipeline from their declarations.
+
+Every pass declares the passes whose results it reads, so a PassManager only
+runs the passes that the passes asked for depend on: i.e. ToGrometPass only reads
+what IdCollapsePass, ContainerScopePass and VariableVersionPass fill in, so
+generating GroMEt doesn't walk the tree for GrfnVarCreationPass, GrfnAssignmentPass
+and LambdaExpressionPass, which only ToGrfnPass needs.
+
+A pass can also declare itself fusable: it then defines the per-node hooks
+enter_module, visit_statement and exit_module, which visit a module one statement
+at a time, and doesn't do any work once it has visited the tree. Consecutive
+fusable passes run in one traversal of the modules, every statement being
+visited by each of them in turn. This gives the same results as running them one
+after the other, as long as a fusable pass only reads the results of the passes it's
+fused with on the statement being visited (i.e. LambdaExpressionPass builds the
+lambda expression of the GrfnAssignment that GrfnAssignmentPass just created
+for the same statement).
+
+With the deep_recursion option of the PipelineContext, every traversal runs
+in a thread with a larger stack and recursion limit (see call_with_deep_recursion).
+"""
+import typing
+
+from skema.utils.dispatch import call_with_deep_recursion
+from skema.program_analysis.CAST2FN.ann_cast.annotated_cast import (
+    AnnCastModule,
+    AnnCastNode,
+    PipelineState,
+)
+from skema.program_analysis.CAST2FN.ann_cast.id_collapse_pass import (
+    IdCollapsePass,
+)
+from skema.program_analysis.CAST2FN.ann_cast.container_scope_pass import (
+    ContainerScopePass,
+)
+from skema.program_analysis.CAST2FN.ann_cast.variable_version_pass import (
+    VariableVersionPass,
+)
+from skema.program_analysis.CAST2FN.ann_cast.grfn_var_creation_pass import (
+    GrfnVarCreationPass,
+)
+from skema.program_analysis.CAST2FN.ann_cast.grfn_assignment_pass import (
+    GrfnAssignmentPass,
+)
+from skema.program_analysis.CAST2FN.ann_cast.lambda_expression_pass import (
+    LambdaExpressionPass,
+)
+from skema.program_analysis.CAST2FN.ann_cast.to_grfn_pass import ToGrfnPass
+from skema.program_analysis.CAST2FN.ann_cast.to_gromet_pass import (
+    ToGrometPass,
+)
+
+# Separates the names of passes that ran in one traversal, in the name of their run
+FUSED_PASS_SEP = "+"
+
+
+class PassManagerException(Exception):
+    """Raised when the passes of a PassManager can't be run in the order they
+    were declared in, i.e. a pass requires a pass that isn't declared before it.
+    """
+
+
+class PassDeclaration:
+    """Class PassDeclaration
+    Declares a pass of the Annotated CAST pipeline to the PassManager.
+
+    Current Fields:
+        - name: The name of the pass, used in the requirements of other passes and
+                for the progress reports and profiles of a run
+        - pass_class: The class of the pass: creating it with a PipelineState runs the pass
+        - requires: The names of the passes whose results this pass reads
+        - fusable: Whether the pass can share its traversal with other passes: its class
+                   then defines the hooks enter_module, visit_statement and exit_module,
+                   and takes fused=True to leave the traversal to the PassManager
+    """
+
+    def __init__(
+        self,
+        name: str,
+        pass_class: typing.Callable,
+        requires: typing.List[str] = (),
+        fusable: bool = False,
+    ):
+        self.name = name
+        self.pass_class = pass_class
+        self.requires = list(requires)
+        self.fusable = fusable
+
+
+# The passes of the Annotated CAST pipeline, in the order they run in
+ANN_CAST_PASSES = [
+    PassDeclaration("IdCollapsePass", IdCollapsePass),
+    PassDeclaration(
+        "ContainerScopePass", ContainerScopePass, requires=["IdCollapsePass"]
+    ),
+    PassDeclaration(
+        "VariableVersionPass",
+        VariableVersionPass,
+        requires=["IdCollapsePass", "ContainerScopePass"],
+    ),
+    PassDeclaration(
+        "GrfnVarCreationPass",
+        GrfnVarCreationPass,
+        requires=["VariableVersionPass"],
+    ),
+    PassDeclaration(
+        "GrfnAssignmentPass",
+        GrfnAssignmentPass,
+        requires=["GrfnVarCreationPass"],
+        fusable=True,
+    ),
+    PassDeclaration(
+        "LambdaExpressionPass",
+        LambdaExpressionPass,
+        requires=["GrfnAssignmentPass"],
+        fusable=True,
+    ),
+    PassDeclaration(
+        "ToGrfnPass",
+        ToGrfnPass,
+        requires=["GrfnVarCreationPass", "LambdaExpressionPass"],
+    ),
+    PassDeclaration(
+        "ToGrometPass",
+        ToGrometPass,
+        requires=["IdCollapsePass", "ContainerScopePass", "VariableVersionPass"],
+    ),
+]
+
+
+class PassManager:
+    """Class PassManager
+    Runs the passes of the Annotated CAST pipeline over a PipelineState, fusing
+    the traversals of consecutive fusable passes.
+
+    Current Fields:
+        - pipeline_state: The PipelineState the passes run over
+        - passes: The PassDeclarations of the passes that can be run, by name, in the
+                  order they run in
+        - completed: The names of the passes that ran over pipeline_state
+        - fuse: Whether consecutive fusable passes run in one traversal
+    """
+
+    def __init__(
+        self,
+        pipeline_state: PipelineState,
+        passes: typing.List[PassDeclaration] = None,
+        fuse: bool = True,
+    ):
+        self.pipeline_state = pipeline_state
+        self.passes: typing.Dict[str, PassDeclaration] = {}
+        for declaration in passes if passes is not None else ANN_CAST_PASSES:
+            for required in declaration.requires:
+                if required not in self.passes:
+                    raise PassManagerException(
+                        f"{declaration.name} requires {required}, which isn't declared before it"
+                    )
+            if declaration.name in self.passes:
+                raise PassManagerException(
+                    f"{declaration.name} is declared more than once"
+                )
+            self.passes[declaration.name] = declaration
+        self.completed: typing.Set[str] = set()
+        self.fuse = fuse
+
+    def schedule(
+        self, targets: typing.List[str]
+    ) -> typing.List[typing.List[PassDeclaration]]:
+        """Returns the passes that running the passes targets takes, i.e. the targets
+        and the passes they require that haven't run yet, in the order they run in.
+        The passes are grouped by traversal: a group of more than one pass is a run
+        of fusable passes, which share their traversal.
+
+        Raises:
+            PassManagerException: If a target isn't a declared pass
+        """
+        needed = set()
+        stack = list(targets)
+        while stack:
+            name = stack.pop()
+            if name not in self.passes:
+                raise PassManagerException(f"Unknown pass {name}")
+            if name in needed or name in self.completed:
+                continue
+            needed.add(name)
+            stack.extend(self.passes[name].requires)
+
+        groups = []
+        for name, declaration in self.passes.items():
+            if name not in needed:
+                continue
+            if (
+                self.fuse
+                and declaration.fusable
+                and len(groups) > 0
+                and groups[-1][-1].fusable
+            ):
+                groups[-1].append(declaration)
+            else:
+                groups.append([declaration])
+        return groups
+
+    def run(self, targets: typing.List[str]):
+        """Runs the passes targets over the PipelineState, after the passes they
+        require that haven't run yet. Every traversal is wrapped in a pass of the
+        PipelineContext (which reports and profiles it), named after the passes that
+        ran in it, i.e. "GrfnAssignmentPass+LambdaExpressionPass".
+        """
+        context = self.pipeline_state.context
+        for group in self.schedule(targets):
+            name = FUSED_PASS_SEP.join(declaration.name for declaration in group)
+            print(f"\nCalling {name}-------------------")
+            with context.run_pass(name, self.pipeline_state.nodes, AnnCastNode):
+                if context.deep_recursion:
+                    call_with_deep_recursion(self.run_group, group)
+                else:
+                    self.run_group(group)
+            self.completed.update(declaration.name for declaration in group)
+
+    def run_group(self, group: typing.List[PassDeclaration]):
+        """Runs the passes of group, in one traversal if there are several"""
+        if len(group) == 1:
+            group[0].pass_class(self.pipeline_state)
+        else:
+            self.run_fused(group)
+
+    def run_fused(self, group: typing.List[PassDeclaration]):
+        """Runs the fusable passes of group in one traversal of the modules:
+        every statement of a module is visited by each pass in turn"""
+        # The hooks only visit modules, so any other top level node
+        # falls back on running the passes one after the other
+        if not all(
+            isinstance(node, AnnCastModule) for node in self.pipeline_state.nodes
+        ):
+            for declaration in group:
+                declaration.pass_class(self.pipeline_state)
+            return
+
+        passes = [
+            declaration.pass_class(self.pipeline_state, fused=True)
+            for declaration in group
+        ]
+        for node in self.pipeline_state.nodes:
+            for fused_pass in passes:
+                fused_pass.enter_module(node)
+            for statement in node.body:
+                for fused_pass in passes:
+                    fused_pass.visit_statement(statement)
+            for fused_pass in passes:
+                fused_pass.exit_module(node)
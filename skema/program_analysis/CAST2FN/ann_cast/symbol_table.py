@@ -0,0 +1,127 @@
+"""
+symbol_table.py defines the SymbolTable of a PipelineState, which gives the
+container scopes and the variable versions of the Annotated CAST integer ids.
+
+The passes refer to a container scope by its scope id, and to a variable version
+(its name, id, version and container scope) by its fullid, and key their tables
+on them. The con_scopestr of a scope, which joins the names of the scopes enclosing
+it, and the string form of a fullid, which joins its parts, are only formatted
+when they are emitted, i.e. in the GrFN and the lambda expressions.
+
+con_scope_to_str and build_fullid format the strings.
+"""
+import sys
+import typing
+
+# NOTE: the GrFN json loading seems to rely on "." as the separator for container scopes
+# For the Annotated Cast pipeline, it is fine to change these separators as long as they
+# don't collide
+# used in `con_scope_to_str()`
+CON_STR_SEP = "."
+# delimiter for fullids
+FULLID_SEP = ":"
+
+
+def con_scope_to_str(scope: typing.List):
+    return sys.intern(CON_STR_SEP.join(scope))
+
+
+def build_fullid(var_name: str, id: int, version: int, con_scopestr: str):
+    """
+    Returns a string representing the fullid.
+    The fullid has format
+      'var_name.id.version.con_scopestr'
+    The fullid is interned
+    """
+    pieces = [var_name, str(id), str(version), con_scopestr]
+    if pieces[0] == None:
+        pieces[0] = ""
+    return sys.intern(FULLID_SEP.join(pieces))
+
+
+class SymbolTable:
+    """Class SymbolTable
+    Gives the container scopes and variable versions of a PipelineState integer ids.
+
+    Current Fields:
+        - scopes: The tuple of scope names of every scope id
+        - scope_ids: The scope id of every container scope, by the tuple of its scope names
+        - var_versions: The (var_name, id, version, scope_id) of every fullid
+        - fullids: The fullid of every variable version, by its (var_name, id, version, scope_id)
+        - scopestrs: The con_scopestrs formatted so far, by scope id
+    """
+
+    def __init__(self):
+        self.scopes: typing.List[tuple] = []
+        self.scope_ids: typing.Dict[tuple, int] = {}
+        self.var_versions: typing.List[tuple] = []
+        self.fullids: typing.Dict[tuple, int] = {}
+        self.scopestrs: typing.Dict[int, str] = {}
+
+    def scope_id(self, scope: typing.List[str]) -> int:
+        """Returns the scope id of the container scope scope, a list of scope names"""
+        key = tuple(scope)
+        scope_id = self.scope_ids.get(key)
+        if scope_id is None:
+            scope_id = self.scope_ids[key] = len(self.scopes)
+            self.scopes.append(key)
+        return scope_id
+
+    def sub_scope_id(self, scope_id: int, name: str) -> int:
+        """Returns the scope id of the scope name inside the scope scope_id"""
+        return self.scope_id(self.scopes[scope_id] + (name,))
+
+    def scope(self, scope_id: int) -> tuple:
+        """Returns the tuple of scope names of scope_id"""
+        return self.scopes[scope_id]
+
+    def is_sub_scope(self, scope_id: int, base_scope_id: int) -> bool:
+        """Checks if the scope scope_id is base_scope_id or is nested inside it"""
+        base_scope = self.scopes[base_scope_id]
+        return self.scopes[scope_id][: len(base_scope)] == base_scope
+
+    def scopestr(self, scope_id: int) -> str:
+        """Returns the con_scopestr of scope_id, like con_scope_to_str"""
+        scopestr = self.scopestrs.get(scope_id)
+        if scopestr is None:
+            scopestr = self.scopestrs[scope_id] = con_scope_to_str(
+                self.scopes[scope_id]
+            )
+        return scopestr
+
+    def fullid(self, var_name: str, id: int, version: int, scope_id: int) -> int:
+        """Returns the fullid of the version version of the variable var_name, id
+        in the container scope scope_id"""
+        key = (var_name, id, version, scope_id)
+        fullid = self.fullids.get(key)
+        if fullid is None:
+            fullid = self.fullids[key] = len(self.var_versions)
+            self.var_versions.append(key)
+        return fullid
+
+    def name_fullid(self, node) -> int:
+        """Returns the fullid of the AnnCastName node"""
+        return self.fullid(
+            node.name, node.id, node.version, self.scope_id(node.con_scope)
+        )
+
+    def var_version(self, fullid: int) -> tuple:
+        """Returns the (var_name, id, version, scope_id) of fullid"""
+        return self.var_versions[fullid]
+
+    def var_name(self, fullid: int) -> str:
+        """Returns the variable name of fullid"""
+        return self.var_versions[fullid][0]
+
+    def fullid_str(self, fullid: int) -> str:
+        """Returns the string form of fullid, like build_fullid"""
+        var_name, id, version, scope_id = self.var_versions[fullid]
+        return build_fullid(var_name, id, version, self.scopestr(scope_id))
+
+    def lambda_var(self, fullid: int) -> str:
+        """Returns the name of the lambda parameter for fullid, which is
+        the variable name and id of fullid"""
+        var_name, id, _, _ = self.var_versions[fullid]
+        if var_name is None:
+            var_name = ""
+        return f"{var_name}_{id}"
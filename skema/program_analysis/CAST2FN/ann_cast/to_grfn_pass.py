@@ -25,7 +25,6 @@ from skema.program_analysis.CAST2FN.ann_cast.ann_cast_helpers import (
     con_scope_to_str,
     create_container_metadata,
     is_func_def_main,
-    lambda_var_from_fullid,
 )
 from skema.program_analysis.CAST2FN.ann_cast.annotated_cast import *
 from skema.program_analysis.CAST2FN.model.cast import (
@@ -37,17 +36,17 @@ from skema.program_analysis.CAST2FN.model.cast import (
 class ToGrfnPass:
     def __init__(self, pipeline_state: PipelineState):
         self.pipeline_state = pipeline_state
+        # fullids are formatted by the SymbolTable of the pipeline
+        self.symbols = self.pipeline_state.symbols
         self.nodes = self.pipeline_state.nodes
         self.network = nx.DiGraph()
         self.subgraphs = nx.DiGraph()
         self.hyper_edges = []
 
         # populate network with variable nodes
-        for grfn_var in self.pipeline_state.grfn_id_to_grfn_var.values():
+        for grfn_var in self.pipeline_state.grfn_vars:
             self.network.add_node(grfn_var, **grfn_var.get_kwargs())
 
-        # the fullid of a AnnCastName node is a string which includes its
-        # variable name, numerical id, version, and scope
         for node in self.pipeline_state.nodes:
             self.visit(node, subgraph=None)
 
@@ -225,12 +224,12 @@ class ToGrfnPass:
         if isinstance(assignment_node, (PackNode, UnpackNode)):
             assignment_node.inputs = ",".join(
                 list(
-                    map(lambda_var_from_fullid, grfn_assignment.inputs.keys())
+                    map(self.symbols.lambda_var, grfn_assignment.inputs.keys())
                 )
             )
             assignment_node.output = ",".join(
                 list(
-                    map(lambda_var_from_fullid, grfn_assignment.outputs.keys())
+                    map(self.symbols.lambda_var, grfn_assignment.outputs.keys())
                 )
             )
 
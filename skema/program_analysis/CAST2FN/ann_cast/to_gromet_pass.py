@@ -1,5 +1,5 @@
-from copy import deepcopy
 import sys
+from collections import ChainMap
 import os.path
 import pprint
 
@@ -46,10 +46,10 @@ from skema.program_analysis.PyAST2CAST.builtin_map import(
 from skema.program_analysis.CAST2FN.model.cast.scalar_type import ScalarType
 
 from skema.program_analysis.CAST2FN.ann_cast.annotated_cast import *
-from skema.program_analysis.PyAST2CAST.modules_list import (
-    BUILTINS,
-    find_func_in_module,
-    find_std_lib_module,
+from skema.program_analysis.PyAST2CAST.modules_list import BUILTINS
+from skema.program_analysis.pipeline_context import (
+    METADATA_NONE,
+    METADATA_FULL,
 )
 
 from skema.gromet.execution_engine.primitive_map import (
@@ -65,6 +65,87 @@ def is_inline(func_name):
     return func_name == "iter" or func_name == "next" or func_name == "range"
 
 
+class GrometTable(list):
+    """Class GrometTable
+    A GroMEt table (i.e. the pof or the wff of a GroMEt FN), as built by
+    insert_gromet_object. Next to its objects, it keeps what giving a new port
+    its id and finding a port by its name take, so that neither scans the table.
+
+    Current Fields:
+        - box_port_counts: The number of ports of the table on every box
+        - port_indices: The index (starting at 1) of the first port of the table
+                        with every name, as named when it was inserted
+    """
+
+    def __init__(self, objs=()):
+        super().__init__()
+        self.box_port_counts = {}
+        self.port_indices = {}
+        for obj in objs:
+            if isinstance(obj, GrometPort):
+                self.count_port(obj)
+            self.append(obj)
+
+    def count_port(self, port: GrometPort) -> int:
+        """Counts port, about to be appended to the table, on its box and under
+        its name, and returns the number of ports on its box with it"""
+        box = port.box
+        box_port_count = self.box_port_counts.get(box, 0) + 1
+        self.box_port_counts[box] = box_port_count
+        self.port_indices.setdefault(port.name, len(self) + 1)
+        return box_port_count
+
+    def find_port(self, name) -> int:
+        """Returns the index (starting at 1) of the first port named name, or -1.
+        A port is found under the name it was inserted with: the ports that get
+        renamed afterwards (the pof of an assignment) aren't looked up by name.
+        """
+        idx = self.port_indices.get(name, -1)
+        if idx != -1 and self[idx - 1].name != name:
+            idx = next(
+                (i for i, port in enumerate(self, 1) if port.name == name), -1
+            )
+        return idx
+
+
+class VarEnvironmentStack:
+    """Class VarEnvironmentStack
+    Scopes the variable environments of a ToGrometPass. Entering a scope (a function
+    def, or the body of a loop or an if, which become FNs of their own) hides the
+    current "args" and "local" environments behind the ones of the scope, and exiting
+    it puts them back: neither copies an environment.
+    The environment of a scope either starts empty, or starts with what the environment
+    it hides has (i.e. for a function def nested in another), in which case what is
+    added to it goes away with the scope.
+
+    Current Fields:
+        - var_environment: The variable environments, by kind ("global", "args" or "local")
+        - scopes: The environments hidden by every scope entered, with their kinds,
+                  innermost scope last
+    """
+
+    def __init__(self, var_environment: dict):
+        self.var_environment = var_environment
+        self.scopes = []
+
+    def enter_scope(self, new=(), inherited=()):
+        """Enters a scope, where the environments of the kinds new start empty, and
+        the ones of the kinds inherited start with what the current ones have"""
+        hidden = []
+        for kind in new:
+            hidden.append((kind, self.var_environment[kind]))
+            self.var_environment[kind] = {}
+        for kind in inherited:
+            hidden.append((kind, self.var_environment[kind]))
+            self.var_environment[kind] = ChainMap({}, self.var_environment[kind])
+        self.scopes.append(hidden)
+
+    def exit_scope(self):
+        """Exits the innermost scope, putting back the environments it hid"""
+        for kind, env in reversed(self.scopes.pop()):
+            self.var_environment[kind] = env
+
+
 def insert_gromet_object(t: list, obj):
     """Inserts a GroMEt object obj into a GroMEt table t
     Where obj can be
@@ -78,29 +159,93 @@ def insert_gromet_object(t: list, obj):
 
     If the table we're trying to insert into doesn't already exist, then we
     first create it, and then insert the value.
+    The table returned is a GrometTable, which gives a port its id
+    (one more than the number of ports on its box) without scanning the table.
     """
+    if not isinstance(t, GrometTable):
+        t = GrometTable(t if t != None else ())
 
     # Logic for generating port ids
     if isinstance(obj, GrometPort):
-        if t == None:
-            obj.id = 1
-        else:
-            current_box = obj.box
-            current_box_ports = [port for port in t if port.box == current_box]
-            obj.id = len(current_box_ports) + 1
-
-    if t == None:
-        t = []
+        obj.id = t.count_port(obj)
     t.append(obj)
 
     return t
 
 
-def generate_provenance():
-    timestamp = str(datetime.fromtimestamp(time()))
+def generate_provenance(created=None):
+    # created is the time (from time()) the metadata was created at, defaulting to now
+    timestamp = str(datetime.fromtimestamp(created if created != None else time()))
     method_name = "skema_code2fn_program_analysis"
     return Provenance(method=method_name, timestamp=timestamp)
 
+
+class LazySourceCodeReference(SourceCodeReference):
+    """Class LazySourceCodeReference
+    A SourceCodeReference whose Provenance is only created when it's read
+    (i.e. when the GroMEt it's in is serialized, through to_dict). Its fields are
+    set directly instead of through the generated setters, since a module has
+    one reference per GroMEt object.
+
+    Current Fields:
+        - created: The time (from time()) the reference was created at, the timestamp of its Provenance
+        - code_file_reference_uid, line_begin, line_end, col_begin, col_end: The fields of the SourceCodeReference
+    """
+
+    def __init__(
+        self, created, code_file_reference_uid, line_begin, line_end, col_begin, col_end
+    ):
+        self.created = created
+        self._provenance = None
+        self._metadata_type = "source_code_reference"
+        self._code_file_reference_uid = code_file_reference_uid
+        self._line_begin = line_begin
+        self._line_end = line_end
+        self._col_begin = col_begin
+        self._col_end = col_end
+        self.discriminator = None
+
+    @property
+    def provenance(self):
+        if self._provenance == None:
+            self._provenance = generate_provenance(self.created)
+        return self._provenance
+
+    @provenance.setter
+    def provenance(self, provenance):
+        self._provenance = provenance
+
+    def key(self):
+        """Returns a hashable key of the reference, see metadata_key"""
+        return (
+            LazySourceCodeReference,
+            self.created,
+            self._code_file_reference_uid,
+            self._line_begin,
+            self._line_end,
+            self._col_begin,
+            self._col_end,
+        )
+
+    def __eq__(self, other):
+        if not isinstance(other, SourceCodeReference):
+            return False
+        return self.to_dict() == other.to_dict()
+
+    def __ne__(self, other):
+        return not self == other
+
+
+def metadata_key(metadata):
+    """Returns a hashable key of the GroMEt metadata object metadata,
+    which is the same for metadata objects that are equal"""
+    if metadata == None:
+        return None
+    # By far the most common metadata, keyed by its fields
+    if isinstance(metadata, LazySourceCodeReference):
+        return metadata.key()
+    return (type(metadata), repr(metadata.to_dict()))
+
 def is_tuple(node):
     # Checks if an AnnCast Node is a Tuple LiteralValue
     return isinstance(node, AnnCastLiteralValue) and node.value_type == StructureType.TUPLE
@@ -153,27 +298,27 @@ def comp_name_nodes(n1, n2):
 
 
 def find_existing_opi(gromet_fn, opi_name):
-    idx = 1
     if gromet_fn.opi == None:
-        return False, idx
+        return False, 1
 
-    for opi in gromet_fn.opi:
-        if opi_name == opi.name:
-            return True, idx
-        idx += 1
-    return False, idx
+    idx = find_port(gromet_fn.opi, opi_name)
+    if idx == -1:
+        return False, len(gromet_fn.opi) + 1
+    return True, idx
 
 
 def find_existing_pil(gromet_fn, opi_name):
     if gromet_fn.pil == None:
         return -1
 
-    idx = 1
-    for pil in gromet_fn.pil:
-        if opi_name == pil.name:
-            return idx
-        idx += 1
-    return -1
+    return find_port(gromet_fn.pil, opi_name)
+
+
+def find_port(t: list, name):
+    """Returns the index (starting at 1) of the first port named name in the GroMEt table t, or -1"""
+    if isinstance(t, GrometTable):
+        return t.find_port(name)
+    return next((i for i, port in enumerate(t, 1) if port.name == name), -1)
 
 
 def get_left_side_name(node):
@@ -204,13 +349,23 @@ class ToGrometPass:
     def __init__(self, pipeline_state: PipelineState):
         self.pipeline_state = pipeline_state
         self.nodes = self.pipeline_state.nodes
+        # The per-run state of the pipeline, see PipelineContext
+        self.context = self.pipeline_state.context
 
         self.var_environment = {"global": {}, "args": {}, "local": {}}
         self.symbol_table = {"functions": {}, "variables" : {"global": {}, "args": {}, "local": {}}, "records": {}}
+        # Function defs, loops and ifs scope the "args" and "local" variable environments
+        self.var_scopes = VarEnvironmentStack(self.symbol_table["variables"])
         # Attribute accesses check this collection
         # to see if we're using an imported item
         # Function calls to imported functions without their attributes will also check here
         self.import_collection = {}
+        # Indices over self.import_collection for func_in_module:
+        # the position of every imported module in it, the first module (by position)
+        # that imports every symbol, and the modules imported with 'from mname import *'
+        self.import_positions = {}
+        self.imported_symbols = {}
+        self.star_imports = []
 
         # creating a GroMEt FN object here or a collection of GroMEt FNs
         # generally, programs are complex, so a collection of GroMEt FNs is usually created
@@ -223,9 +378,34 @@ class ToGrometPass:
             fn_array=[],
             metadata_collection=[],
         )
+        # Index over self.gromet_module.fn_array for find_gromet:
+        # the index of the first FN with every name, the number of FNs indexed,
+        # and the indices of the FNs that didn't have their box (and so their name) yet
+        self.fn_indices = {}
+        self.indexed_fn_count = 0
+        self.unnamed_fns = []
+
+        # the built-in map is built once and shared through the context
+        self.builtins = self.context.builtins
+
+        # With the context's dedup_metadata, identical entries of the metadata_collection
+        # are only inserted once, under the index of the first one (see insert_metadata),
+        # and all the metadata of the pass shares one Provenance
+        self.dedup_metadata = self.context.dedup_metadata
+        self.provenance_created = time() if self.dedup_metadata else None
+        self.provenance = (
+            generate_provenance(self.provenance_created)
+            if self.dedup_metadata
+            else None
+        )
+        self.metadata_indices = {}
 
-        # build the built-in map
-        build_map()
+        # The context's metadata_level: below full, GroMEt objects don't get metadata
+        # (see insert_metadata), and with none, neither does the module
+        self.metadata_level = self.context.metadata_level
+        self.object_metadata = self.metadata_level == METADATA_FULL
+        # The uid of the CodeFileReference that source code references refer to
+        self.code_file_uid = None
 
         # Everytime we see an AnnCastRecordDef we can store information for it
         # for example the name of the class and indices to its functions
@@ -305,27 +485,20 @@ class ToGrometPass:
             )
 
     def create_source_code_reference(self, ref_info):
-        # return None # comment this when we want metadata
-        if ref_info == None:
+        # Below the full metadata_level, GroMEt objects don't have metadata
+        if ref_info == None or not self.object_metadata:
             return None
 
-        line_begin = ref_info.row_start
-        line_end = ref_info.row_end
-        col_begin = ref_info.col_start
-        col_end = ref_info.col_end
-
-        # file_uid = str(self.gromet_module.metadata[-1].files[0].uid)
-        file_uid = str(
-            self.gromet_module.metadata_collection[1][0].files[0].uid
-        )
-        # file_uid = ""
-        return SourceCodeReference(
-            provenance=generate_provenance(),
-            code_file_reference_uid=file_uid,
-            line_begin=line_begin,
-            line_end=line_end,
-            col_begin=col_begin,
-            col_end=col_end,
+        # The Provenance of the reference is only created when it's read
+        return LazySourceCodeReference(
+            self.provenance_created
+            if self.provenance_created != None
+            else time(),
+            self.code_file_uid,
+            ref_info.row_start,
+            ref_info.row_end,
+            ref_info.col_start,
+            ref_info.col_end,
         )
 
     def insert_metadata(self, *metadata):
@@ -334,21 +507,48 @@ class ToGrometPass:
         Then, the index of where this metadata lives is returned
         The idea is that all GroMEt objects that store metadata will store an index
         into metadata_collection that points to the metadata they stored
+        With dedup_metadata, metadata equal to an entry that's already in the
+        metadata_collection isn't inserted again: the index of that entry is returned
+        Below the full metadata_level, nothing is inserted and None is returned
+        """
+        if not self.object_metadata:
+            return None
+        return self.insert_metadata_entry(list(metadata))
+
+    def insert_metadata_entry(self, to_insert):
         """
-        # return None # Uncomment this line if we don't want metadata
-        to_insert = []
-        for md in metadata:
-            to_insert.append(md)
+        insert_metadata_entry inserts the list of metadata to_insert into the
+        metadata_collection as one entry, regardless of the metadata_level,
+        and returns its index (see insert_metadata)
+        """
+        if self.dedup_metadata:
+            key = tuple(metadata_key(md) for md in to_insert)
+            idx = self.metadata_indices.get(key)
+            if idx != None:
+                return idx
+            self.metadata_indices[key] = (
+                len(self.gromet_module.metadata_collection) + 1
+            )
+
         self.gromet_module.metadata_collection.append(to_insert)
         return len(self.gromet_module.metadata_collection)
 
+    def generate_provenance(self):
+        """Returns the Provenance of new metadata: with dedup_metadata, the
+        one that all the metadata of the pass shares, otherwise a new one"""
+        if self.provenance != None:
+            return self.provenance
+        return generate_provenance()
+
     def insert_record_info(self, metadata: ProgramAnalysisRecordBookkeeping):
         """
         insert_record_info inserts a ProgramAnalysisRecordBookkeping metadata
         into the metadata table
         All metadata of this kind lives in the first index of the entire collection
+        With the none metadata_level, it isn't inserted
         """
-        self.gromet_module.metadata_collection[0].append(metadata)
+        if self.metadata_level != METADATA_NONE:
+            self.gromet_module.metadata_collection[0].append(metadata)
 
     def set_index(self):
         """Called after a Gromet FN is added to the whole collection
@@ -565,19 +765,33 @@ class ToGrometPass:
         If it doesn't find it, the func_idx then represents the index at
         the end of the self.gromet_module.fn_array collection.
         """
-        func_idx = 0
-        found_func = False
-        for attribute in self.gromet_module.fn_array:
-            gromet_fn = attribute
-            if gromet_fn.b != None:
-                gromet_fn_b = gromet_fn.b[0]
-                if gromet_fn_b.name == func_name:
-                    found_func = True
-                    break
+        self.index_fn_array()
+        func_idx = self.fn_indices.get(func_name)
+        if func_idx == None:
+            return len(self.gromet_module.fn_array) + 1, False
 
-            func_idx += 1
+        return func_idx + 1, True
 
-        return func_idx + 1, found_func
+    def index_fn_array(self):
+        """Brings self.fn_indices up to date with self.gromet_module.fn_array,
+        by indexing the FNs added since it was last brought up to date, and
+        the FNs that got their box since (an FN is added before its box)
+        """
+        fn_array = self.gromet_module.fn_array
+        pending = self.unnamed_fns
+        if self.indexed_fn_count < len(fn_array):
+            pending.extend(range(self.indexed_fn_count, len(fn_array)))
+            self.indexed_fn_count = len(fn_array)
+
+        self.unnamed_fns = []
+        for func_idx in pending:
+            gromet_fn = fn_array[func_idx]
+            if gromet_fn.b != None:
+                func_name = gromet_fn.b[0].name
+                if func_idx < self.fn_indices.get(func_name, len(fn_array)):
+                    self.fn_indices[func_name] = func_idx
+            else:
+                self.unnamed_fns.append(func_idx)
 
     def retrieve_var_port(self, var_name):
         """Given a variable named var_name in the variable environment
@@ -910,7 +1124,7 @@ class ToGrometPass:
             return (FunctionType.ABSTRACT, None, None, None, None, None)
 
         if isinstance(node, AnnCastCall):
-            if func_name in BUILTINS or check_builtin(func_name):
+            if func_name in BUILTINS or check_builtin(func_name, self.builtins):
                 # print(f"{func_name} is a python builtin")
                 if isinstance(node.func, AnnCastAttribute):
                     attr_node = node.func
@@ -930,7 +1144,7 @@ class ToGrometPass:
                 # print("Hey")
                 return (FunctionType.IMPORTED_METHOD, ImportType.OTHER, None, None, "Python", "3.10")
         elif isinstance(node, AnnCastAttribute):
-            if func_name in BUILTINS or check_builtin(func_name):
+            if func_name in BUILTINS or check_builtin(func_name, self.builtins):
                 # print(f"{func_name} is a python builtin")
                 if func_name in self.import_collection:
                     # print(f"Module {func_name} has imported function {node.attr.name}")
@@ -2088,20 +2302,26 @@ class ToGrometPass:
         if we found it or not and the string denotes the module if we did find it
 
         """
-        # print(self.import_collection)
-        for mname in self.import_collection.keys():
-            curr_module = self.import_collection[mname]
-            if curr_module[2] and find_func_in_module(
+        symbol_module = self.imported_symbols.get(func_name)
+        for mname in self.star_imports:
+            # The module that imports func_name individually comes first
+            if (
+                symbol_module != None
+                and self.import_positions[symbol_module]
+                <= self.import_positions[mname]
+            ):
+                break
+            if self.context.import_resolver().defines(
                 mname, func_name
             ):  # If curr module is of form 'from mname import *'
                 return (True, mname)
-            if (
-                func_name in curr_module[1]
-            ):  # If the function has been imported individually and is in the symbols list
-                return (
-                    True,
-                    mname,
-                )  # With the form 'from mname import func_name'
+        if (
+            symbol_module != None
+        ):  # If the function has been imported individually and is in the symbols list
+            return (
+                True,
+                symbol_module,
+            )  # With the form 'from mname import func_name'
 
         return (False, "")
 
@@ -2376,7 +2596,7 @@ class ToGrometPass:
 
             # Make a placeholder for this function if we haven't visited its FunctionDef at the end
             # of the list of the Gromet FNs
-            if check_builtin(func_name):
+            if check_builtin(func_name, self.builtins):
                 func_info = self.determine_func_type(node)
                 parent_gromet_fn.bf = insert_gromet_object(
                     parent_gromet_fn.bf,
@@ -2731,12 +2951,12 @@ class ToGrometPass:
         # function definition
         var_environment = self.symtab_variables()
         
-        if isinstance(parent_cast_node, AnnCastFunctionDef):
-            prev_local_env = deepcopy(var_environment["local"])
+        nested = isinstance(parent_cast_node, AnnCastFunctionDef)
+        if nested:
+            self.var_scopes.enter_scope(inherited=["local"])
         else:
             # Initialize the function argument variable environment and populate it as we
             # visit the function arguments
-            prev_local_env = {}
             var_environment["local"] = {}
 
         for n in func_body:
@@ -2783,7 +3003,10 @@ class ToGrometPass:
 
         # We're out of the function definition here, so we
         # can clear the local  variable environment
-        var_environment["local"] = deepcopy(prev_local_env)
+        if nested:
+            self.var_scopes.exit_scope()
+        else:
+            var_environment["local"] = {}
 
     @_visit.register
     def visit_function_def(
@@ -2825,12 +3048,12 @@ class ToGrometPass:
         # Then we need to do some merging of function argument environments
         # so that this inner function definition can see and use the arguments from the outer
         # function definition
-        if isinstance(parent_cast_node, AnnCastFunctionDef):
-            prev_arg_env = deepcopy(var_environment["args"])
+        nested = isinstance(parent_cast_node, AnnCastFunctionDef)
+        if nested:
+            self.var_scopes.enter_scope(inherited=["args"])
         else:
             # Initialize the function argument variable environment and populate it as we
             # visit the function arguments
-            prev_arg_env = {}
             var_environment["args"] = {}
         arg_env = var_environment["args"]
 
@@ -2918,7 +3141,10 @@ class ToGrometPass:
             node, new_gromet, node.body, parent_cast_node=parent_cast_node
         )
 
-        var_environment["args"] = deepcopy(prev_arg_env)
+        if nested:
+            self.var_scopes.exit_scope()
+        else:
+            var_environment["args"] = {}
 
     @_visit.register
     def visit_literal_value(
@@ -2936,12 +3162,16 @@ class ToGrometPass:
                 node.source_refs[0]
             )
 
-            code_data_metadata = SourceCodeDataType(
-                metadata_type="source_code_data_type",
-                provenance=generate_provenance(),
-                source_language=ref[0],
-                source_language_version=ref[1],
-                data_type=str(ref[2]),
+            code_data_metadata = (
+                SourceCodeDataType(
+                    metadata_type="source_code_data_type",
+                    provenance=self.generate_provenance(),
+                    source_language=ref[0],
+                    source_language_version=ref[1],
+                    data_type=str(ref[2]),
+                )
+                if self.object_metadata
+                else None
             )
             val = GLiteralValue(
                 node.value_type if node.value_type is not None else "None",
@@ -3055,10 +3285,7 @@ class ToGrometPass:
         # Variable environment for the local variables and function arguments
         # While preserving the old one
         # After we're done with the body of the loop, we restore the old environment
-        previous_func_def_args = deepcopy(var_environment["args"])
-        previous_local_args = deepcopy(var_environment["local"])
-
-        var_environment["args"] = {}
+        self.var_scopes.enter_scope(new=["args"], inherited=["local"])
 
         # The Gromet FN for the loop body needs to have its opis and opos generated here, since it isn't an actual FunctionDef here to make it with
         # Any opis we create for this Gromet FN are also added to the variable environment
@@ -3088,8 +3315,7 @@ class ToGrometPass:
         # If the opo's name doesn't appear as a pof
         # then it hasn't been changed, create a wopio for it
         # Restore the old variable environment
-        var_environment["args"] = previous_func_def_args
-        var_environment["local"] = previous_local_args
+        self.var_scopes.exit_scope()
 
 
         return body_array_idx
@@ -3144,12 +3370,8 @@ class ToGrometPass:
                 GrometBoxFunction(function_type=FunctionType.FUNCTION),
             )
 
-            # Copy the var environment, as we're in a 'function' of sorts
-            # so we need a new var environment
-            var_args_copy = deepcopy(var_environment["args"])
-            var_local_copy = deepcopy(var_environment["local"])
-            var_environment["args"] = {}
-            var_environment["local"] = {}
+            # Enter a new var environment, as we're in a 'function' of sorts
+            self.var_scopes.enter_scope(new=["args", "local"])
 
             for _,val in node.used_vars.items():
                 gromet_pre_fn.opi = insert_gromet_object(
@@ -3223,8 +3445,7 @@ class ToGrometPass:
                                                                GrometWire(src=i,tgt=i))
                 i += 1
 
-            var_environment["args"] = var_args_copy
-            var_environment["local"] = var_local_copy
+            self.var_scopes.exit_scope()
 
             gromet_bl.pre = pre_array_idx 
 
@@ -3265,12 +3486,8 @@ class ToGrometPass:
                 GrometBoxFunction(function_type=FunctionType.FUNCTION),
             )
 
-            # Copy the var environment, as we're in a 'function' of sorts
-            # so we need a new var environment
-            var_args_copy = deepcopy(var_environment["args"])
-            var_local_copy = deepcopy(var_environment["local"])
-            var_environment["args"] = {}
-            var_environment["local"] = {}
+            # Enter a new var environment, as we're in a 'function' of sorts
+            self.var_scopes.enter_scope(new=["args", "local"])
 
             for _,val in node.used_vars.items():
                 gromet_post_fn.opi = insert_gromet_object(
@@ -3302,8 +3519,7 @@ class ToGrometPass:
                                                                GrometWire(src=i,tgt=i))
                 i += 1
 
-            var_environment["args"] = var_args_copy
-            var_environment["local"] = var_local_copy
+            self.var_scopes.exit_scope()
 
             gromet_bl.post = post_array_idx 
 
@@ -3458,11 +3674,8 @@ class ToGrometPass:
             metadata = self.insert_metadata(self.create_source_code_reference(ref))
 
         body_if_fn.metadata = metadata
-        # copy the old var environments over since we're going into a function
-        previous_func_def_args = deepcopy(var_environment["args"])
-        previous_local_args = deepcopy(var_environment["local"])
-
-        var_environment["args"] = {}
+        # enter new var environments since we're going into a function
+        self.var_scopes.enter_scope(new=["args"], inherited=["local"])
 
         # TODO: determine a better for loop that only grabs 
         # what appears in the body of the if_true
@@ -3503,8 +3716,7 @@ class ToGrometPass:
             )
 
         # restore previous var environments
-        var_environment["args"] = previous_func_def_args
-        var_environment["local"] = previous_local_args
+        self.var_scopes.exit_scope()
 
         return body_if_idx
 
@@ -3538,11 +3750,8 @@ class ToGrometPass:
             metadata = self.insert_metadata(self.create_source_code_reference(ref))
 
         orelse_if_fn.metadata = metadata
-        # copy the old var environments over since we're going into a function
-        previous_func_def_args = deepcopy(var_environment["args"])
-        previous_local_args = deepcopy(var_environment["local"])
-
-        var_environment["args"] = {}
+        # enter new var environments since we're going into a function
+        self.var_scopes.enter_scope(new=["args"], inherited=["local"])
 
         # TODO: determine a better for loop that only grabs 
         # what appears in the orelse of the if_true
@@ -3583,8 +3792,7 @@ class ToGrometPass:
             )
 
         # restore previous var environments
-        var_environment["args"] = previous_func_def_args
-        var_environment["local"] = previous_local_args
+        self.var_scopes.exit_scope()
 
         return orelse_if_idx
 
@@ -3737,6 +3945,28 @@ class ToGrometPass:
                     symbol, parent_gromet_fn, parent_cast_node
                 )
 
+        self.index_import(name, symbol)
+
+    def index_import(self, name, symbol):
+        """Brings the indices over self.import_collection up to date with the
+        import of symbol (or of the whole module, if it's None) from the module name
+        """
+        if name not in self.import_positions:
+            self.import_positions[name] = len(self.import_positions)
+        if symbol != None:
+            symbol_module = self.imported_symbols.get(symbol)
+            if (
+                symbol_module == None
+                or self.import_positions[name]
+                < self.import_positions[symbol_module]
+            ):
+                self.imported_symbols[symbol] = name
+        self.star_imports = [
+            mname
+            for mname, (_, _, import_all) in self.import_collection.items()
+            if import_all
+        ]
+
     @_visit.register
     def visit_model_return(
         self, node: AnnCastModelReturn, parent_gromet_fn, parent_cast_node
@@ -3797,21 +4027,28 @@ class ToGrometPass:
         # Initialie the Gromet module's Record Bookkeeping metadata
         # Which lives in the very first element of the metadata array
         self.gromet_module.metadata_collection = [[]]
+        self.metadata_indices = {}
         self.gromet_module.metadata = 0
 
         # Initialize the Gromet module's SourceCodeCollection of CodeFileReferences
         code_file_references = [
-            CodeFileReference(uid=str(uuid.uuid4()), name=file_name, path="")
+            CodeFileReference(uid=str(self.context.uuid4()), name=file_name, path="")
         ]
-        self.gromet_module.metadata = self.insert_metadata(
-            SourceCodeCollection(
-                provenance=generate_provenance(),
-                name="",
-                global_reference_id="",
-                files=code_file_references,
-            ),
-            GrometCreation(provenance=generate_provenance()),
-        )
+        self.code_file_uid = str(code_file_references[0].uid)
+        if self.metadata_level != METADATA_NONE:
+            self.gromet_module.metadata = self.insert_metadata_entry(
+                [
+                    SourceCodeCollection(
+                        provenance=self.generate_provenance(),
+                        name="",
+                        global_reference_id="",
+                        files=code_file_references,
+                    ),
+                    GrometCreation(provenance=self.generate_provenance()),
+                ]
+            )
+        else:
+            self.gromet_module.metadata = None
 
         # Outer module box only has name 'module' and its type 'Module'
         new_gromet.b = insert_gromet_object(
@@ -3880,11 +4117,8 @@ class ToGrometPass:
 
         # Because "new:Record" is a function definition itself we
         # need to maintain an argument environment for it
-        # store copies of previous ones and create new ones
-        arg_env_copy = deepcopy(var_environment["args"])
-        local_env_copy = deepcopy(var_environment["local"])
-
-        var_environment["args"] = {}
+        # hide the previous ones behind new ones
+        self.var_scopes.enter_scope(new=["args"], inherited=["local"])
 
         # Generate the init new:ClassName FN
         new_gromet.b = insert_gromet_object(
@@ -4141,15 +4375,12 @@ class ToGrometPass:
             self.gromet_module.fn_array
         )
 
-        var_environment["args"] = deepcopy(arg_env_copy)
-        var_environment["local"] = deepcopy(local_env_copy)
+        self.var_scopes.exit_scope()
 
         # Generate and store the rest of the functions associated with this record
         for f in node.funcs:
             if isinstance(f, AnnCastFunctionDef) and f.name.name != "__init__":
-                arg_env_copy = deepcopy(var_environment["args"])
-                local_env_copy = deepcopy(var_environment["local"])
-                var_environment["args"] = {}
+                self.var_scopes.enter_scope(new=["args"], inherited=["local"])
 
                 # This is a new function, so  create a GroMEt FN
                 new_gromet = GrometFN()
@@ -4207,14 +4438,13 @@ class ToGrometPass:
                         ),
                     )
 
-                var_environment["args"] = deepcopy(arg_env_copy)
-                var_environment["local"] = deepcopy(local_env_copy)
+                self.var_scopes.exit_scope()
 
                 self.record[node.name][f.name.name] = len(
                     self.gromet_module.fn_array
                 )
 
-        record_metadata = ProgramAnalysisRecordBookkeeping(provenance=generate_provenance(), 
+        record_metadata = ProgramAnalysisRecordBookkeeping(provenance=self.generate_provenance(), 
                                                             type_name=record_name, 
                                                             field_declarations=record_fields, 
                                                             method_declarations=record_methods)
@@ -17,7 +17,6 @@ from skema.program_analysis.CAST2FN.ann_cast.ann_cast_helpers import (
     GrfnAssignment,
     add_metadata_from_name_node,
     add_metadata_to_grfn_var,
-    build_fullid,
     call_argument_name,
     call_container_name,
     call_param_name,
@@ -43,9 +42,11 @@ from skema.program_analysis.CAST2FN.model.cast import (
 class VariableVersionPass:
     def __init__(self, pipeline_state: PipelineState):
         self.pipeline_state = pipeline_state
+        # scope ids and fullids are given by the SymbolTable of the pipeline
+        self.symbols = self.pipeline_state.symbols
         self.nodes = self.pipeline_state.nodes
 
-        # dict mapping container scopes strs to dicts which
+        # dict mapping container scope ids to dicts which
         # map Name id to highest version in that container scope
         self.con_scope_to_highest_var_vers = {}
 
@@ -53,57 +54,59 @@ class VariableVersionPass:
             # when visitor starts, assign_lhs is False
             self.visit(node, False)
 
-    def init_highest_var_vers_dict(self, con_scopestr, var_ids):
+    def init_highest_var_vers_dict(self, con_scope_id, var_ids):
         """
-        Initialize highest var version dict for scope `con_scopestr`
+        Initialize highest var version dict for scope `con_scope_id`
         If the scope is the module, then use a defaultdict starting at zero
         otherwise, create a dictionary mapping each of the ids to zero
         """
-        self.con_scope_to_highest_var_vers[con_scopestr] = {}
+        self.con_scope_to_highest_var_vers[con_scope_id] = {}
         for id in var_ids:
-            self.con_scope_to_highest_var_vers[con_scopestr][id] = 0
+            self.con_scope_to_highest_var_vers[con_scope_id][id] = 0
         # DEBUG printing
         if self.pipeline_state.PRINT_DEBUGGING_INFO:
             print(
-                f"initialized highest_vars_vers_dict {self.con_scope_to_highest_var_vers[con_scopestr]}"
+                f"initialized highest_vars_vers_dict {self.con_scope_to_highest_var_vers[con_scope_id]}"
             )
 
-    def get_highest_ver_in_con_scope(self, con_scopestr, id):
+    def get_highest_ver_in_con_scope(self, con_scope_id, id):
         """
-        Grab the current version of `id` in scope for `con_scopestr`
-        Should only be called after `con_scopestr` is in the `self.con_scope_to_highest_var_vers`
+        Grab the current version of `id` in scope for `con_scope_id`
+        Should only be called after `con_scope_id` is in the `self.con_scope_to_highest_var_vers`
         """
-        return self.con_scope_to_highest_var_vers[con_scopestr][id]
+        return self.con_scope_to_highest_var_vers[con_scope_id][id]
 
-    def is_var_in_con_scope(self, con_scopestr: str, id: int):
-        return id in self.con_scope_to_highest_var_vers[con_scopestr]
+    def is_var_in_con_scope(self, con_scope_id: int, id: int):
+        return id in self.con_scope_to_highest_var_vers[con_scope_id]
 
     def incr_version_in_con_scope(
-        self, con_scopestr: str, id: int, var_name: str
+        self, con_scope_id: int, id: int, var_name: str
     ):
         """
-        Grab the next version of `id` in scope for `con_scopestr`
-        Should only be called after `con_scopestr` is in the `self.con_scope_to_highest_var_vers`
+        Grab the next version of `id` in scope for `con_scope_id`
+        Should only be called after `con_scope_id` is in the `self.con_scope_to_highest_var_vers`
 
         Also creates a GrFN variable for the newly added version
         """
         # NOTE: we should have added id to con_scope_to_highest_var_vers when we call
         # init_highest_var_vers_dict
         # if this does not happen, some logic has failed
-        assert id in self.con_scope_to_highest_var_vers[con_scopestr]
-        self.con_scope_to_highest_var_vers[con_scopestr][id] += 1
-        version = self.con_scope_to_highest_var_vers[con_scopestr][id]
-        grfn_var = create_grfn_var(var_name, id, version, con_scopestr)
-        fullid = build_fullid(var_name, id, version, con_scopestr)
+        assert id in self.con_scope_to_highest_var_vers[con_scope_id]
+        self.con_scope_to_highest_var_vers[con_scope_id][id] += 1
+        version = self.con_scope_to_highest_var_vers[con_scope_id][id]
+        grfn_var = create_grfn_var(
+            var_name, id, version, self.symbols.scopestr(con_scope_id)
+        )
+        fullid = self.symbols.fullid(var_name, id, version, con_scope_id)
         self.pipeline_state.store_grfn_var(fullid, grfn_var)
 
-    def incr_vars_in_con_scope(self, scopestr, vars):
+    def incr_vars_in_con_scope(self, scope_id, vars):
         """
-        This will increment all versions of variables in `scopestr` that are
+        This will increment all versions of variables in `scope_id` that are
         in the dict `vars` which contains variable ids mapped to AnnCastName nodes
         """
         for var_id, var_name in vars.items():
-            self.incr_version_in_con_scope(scopestr, var_id, var_name)
+            self.incr_version_in_con_scope(scope_id, var_id, var_name)
 
     def add_default_bot_interface_metadata(self, interface_vars):
         """
@@ -123,11 +126,11 @@ class VariableVersionPass:
             )
 
     def fix_for_python_gcc_declaration_distinction(
-        self, con_scopestr, id, var_name
+        self, con_scope_id, id, var_name
     ):
         """
         This function adds a dummy GrfnAssignment to `None` for variable with id `id`
-        in the container for con_scopestr
+        in the container for con_scope_id
 
         The motivation for this is the difference between how the gcc and Python handle
         variable declaration.
@@ -149,14 +152,14 @@ class VariableVersionPass:
         selection between two values, but this does not align with dynamic/conditional variable creation in Python,
         as in the above code example.
         """
-        version = self.con_scope_to_highest_var_vers[con_scopestr][id]
+        version = self.con_scope_to_highest_var_vers[con_scope_id][id]
         # this function should only be called in cases where we need to implement a dummy assignment
         # which creates a version 1 variable
         assert version == VAR_INIT_VERSION
         # increment the version, and create an GrFN variable for the incremented version
-        self.incr_version_in_con_scope(con_scopestr, id, var_name)
-        new_version = self.con_scope_to_highest_var_vers[con_scopestr][id]
-        new_fullid = build_fullid(var_name, id, new_version, con_scopestr)
+        self.incr_version_in_con_scope(con_scope_id, id, var_name)
+        new_version = self.con_scope_to_highest_var_vers[con_scope_id][id]
+        new_fullid = self.symbols.fullid(var_name, id, new_version, con_scope_id)
         grfn_var = self.pipeline_state.get_grfn_var(new_fullid)
         from_source_mdata = generate_from_source_metadata(
             False, VariableCreationReason.DUMMY_ASSIGN
@@ -172,78 +175,80 @@ class VariableVersionPass:
         dummy_assignment = GrfnAssignment(
             literal_node, LambdaType.LITERAL, lambda_expr=lambda_expr
         )
-        dummy_assignment.outputs[new_fullid] = grfn_var.uid
+        dummy_assignment.outputs[
+            new_fullid
+        ] = self.pipeline_state.fullid_to_grfn_id[new_fullid]
 
         # add dummy assignment to function def node
-        assert self.pipeline_state.is_con_scopestr_func_def(con_scopestr)
-        func_def_node = self.pipeline_state.func_def_node_from_scopestr(
-            con_scopestr
+        assert self.pipeline_state.is_con_scope_func_def(con_scope_id)
+        func_def_node = self.pipeline_state.func_def_node_from_scope_id(
+            con_scope_id
         )
 
         func_def_node.dummy_grfn_assignments.append(dummy_assignment)
 
-    def populate_interface(self, con_scopestr, vars, interface):
+    def populate_interface(self, con_scope_id, vars, interface):
         """
         Parameters:
-          - `con_scopestr`: a cached container scope
+          - `con_scope_id`: a cached container scope
           - `vars`: a dict mapping numerical ids to variable names
           - `interface`: a dict mapping numerical variable ids to fullids
                          (e.g. the top or bottom interface of a container node)
 
         For each variable from `vars`, put the highest version of that variable
-        from container `con_scopestr` into `interface`
+        from container `con_scope_id` into `interface`
         """
         # add vars to interface
         for id, var_name in vars.items():
-            highest_ver = self.get_highest_ver_in_con_scope(con_scopestr, id)
-            # if con_scopestr is a FunctionDef container, and highest_ver is VAR_INIT_VERSION
+            highest_ver = self.get_highest_ver_in_con_scope(con_scope_id, id)
+            # if con_scope_id is a FunctionDef container, and highest_ver is VAR_INIT_VERSION
             # we call fix_for_python_gcc_declaration_distinction
             # this creates a dummy assignment to the variable in the FunctionDef container
             # most likely, this is not the ideal long term solution
-            scopestr_is_func = self.pipeline_state.is_con_scopestr_func_def(
-                con_scopestr
+            scope_id_is_func = self.pipeline_state.is_con_scope_func_def(
+                con_scope_id
             )
             local_var = (
-                scopestr_is_func
-                and self.pipeline_state.is_var_local_to_func(con_scopestr, id)
+                scope_id_is_func
+                and self.pipeline_state.is_var_local_to_func(con_scope_id, id)
             )
             if local_var and highest_ver == VAR_INIT_VERSION:
                 self.fix_for_python_gcc_declaration_distinction(
-                    con_scopestr, id, var_name
+                    con_scope_id, id, var_name
                 )
                 # update highest ver after the dummy assignment
                 highest_ver = self.get_highest_ver_in_con_scope(
-                    con_scopestr, id
+                    con_scope_id, id
                 )
-            fullid = build_fullid(var_name, id, highest_ver, con_scopestr)
+            fullid = self.symbols.fullid(var_name, id, highest_ver, con_scope_id)
             interface[id] = fullid
 
     def populate_loop_interfaces(self, node: AnnCastLoop):
         # populate interfaces and increment versions in previous scope of modified variables
-        prev_scopestr = con_scope_to_str(node.con_scope[:-1])
+        prev_scope_id = self.symbols.scope_id(node.con_scope[:-1])
         # populate top interface initial
         # these are all used variables
         node.top_interface_vars = node.used_vars
         self.populate_interface(
-            prev_scopestr, node.top_interface_vars, node.top_interface_initial
+            prev_scope_id, node.top_interface_vars, node.top_interface_initial
         )
         # increment versions of modified vars
-        self.incr_vars_in_con_scope(prev_scopestr, node.modified_vars)
+        self.incr_vars_in_con_scope(prev_scope_id, node.modified_vars)
         # populate bot interface out
         node.bot_interface_vars = node.modified_vars
         self.populate_interface(
-            prev_scopestr, node.bot_interface_vars, node.bot_interface_out
+            prev_scope_id, node.bot_interface_vars, node.bot_interface_out
         )
         self.add_default_bot_interface_metadata(node.bot_interface_out)
 
         # populate "inside" of interfaces
-        con_scopestr = con_scope_to_str(node.con_scope)
+        con_scope_id = self.symbols.scope_id(node.con_scope)
         # populate top interface updated
         # these are all modified variables
         node.top_interface_updated_vars = node.modified_vars
         for id, var_name in node.top_interface_updated_vars.items():
             version = LOOP_VAR_UPDATED_VERSION
-            fullid = build_fullid(var_name, id, version, con_scopestr)
+            fullid = self.symbols.fullid(var_name, id, version, con_scope_id)
             node.top_interface_updated[id] = fullid
         # populate top interface out
         # the top interface chooses between initial and updated versions;
@@ -251,7 +256,7 @@ class VariableVersionPass:
         # which is consistent with other containers
         for id, var_name in node.top_interface_vars.items():
             version = VAR_INIT_VERSION
-            fullid = build_fullid(var_name, id, version, con_scopestr)
+            fullid = self.symbols.fullid(var_name, id, version, con_scope_id)
             node.top_interface_out[id] = fullid
         # populate bot interface in
         # the bot interface takes `VAR_EXIT_VERSION` modified variables
@@ -259,34 +264,34 @@ class VariableVersionPass:
         # the highest version occuring in the loop expr
         for id, var_name in node.bot_interface_vars.items():
             version = VAR_EXIT_VERSION
-            fullid = build_fullid(var_name, id, version, con_scopestr)
+            fullid = self.symbols.fullid(var_name, id, version, con_scope_id)
             node.bot_interface_in[id] = fullid
 
     def populate_model_if_interfaces(self, node: AnnCastModelIf):
         # populate interfaces and increment versions in previous scope of modified variables
-        prev_scopestr = con_scope_to_str(node.con_scope[:-1])
+        prev_scope_id = self.symbols.scope_id(node.con_scope[:-1])
         # populate top interface in
         node.top_interface_vars = node.used_vars
         self.populate_interface(
-            prev_scopestr, node.top_interface_vars, node.top_interface_in
+            prev_scope_id, node.top_interface_vars, node.top_interface_in
         )
         # increment versions
-        self.incr_vars_in_con_scope(prev_scopestr, node.modified_vars)
+        self.incr_vars_in_con_scope(prev_scope_id, node.modified_vars)
         # populate bot interface out
         node.bot_interface_vars = node.modified_vars
         self.populate_interface(
-            prev_scopestr, node.bot_interface_vars, node.bot_interface_out
+            prev_scope_id, node.bot_interface_vars, node.bot_interface_out
         )
         self.add_default_bot_interface_metadata(node.bot_interface_out)
 
         # populate "inside" of interfaces
-        con_scopestr = con_scope_to_str(node.con_scope)
+        con_scope_id = self.symbols.scope_id(node.con_scope)
         # populate top interface out
         # by convention the top interface produces version VAR_INIT_VERSION variables
         # and these are propagated to if expr, if body, and else body
         for id, var_name in node.top_interface_vars.items():
             version = VAR_INIT_VERSION
-            fullid = build_fullid(var_name, id, version, con_scopestr)
+            fullid = self.symbols.fullid(var_name, id, version, con_scope_id)
             node.top_interface_out[id] = fullid
         # populate bot interface in
         # by convention, the bot interface in takes version VAR_EXIT_VERSION variables
@@ -294,7 +299,7 @@ class VariableVersionPass:
         # and they are created during GrfnVariableCreationPass
         for id, var_name in node.bot_interface_vars.items():
             version = VAR_EXIT_VERSION
-            fullid = build_fullid(var_name, id, version, con_scopestr)
+            fullid = self.symbols.fullid(var_name, id, version, con_scope_id)
             node.bot_interface_in[id] = fullid
 
     def func_def_top_interface_args(self, node: AnnCastFunctionDef):
@@ -303,10 +308,10 @@ class VariableVersionPass:
         Links these argument and parameters through the `top_interface_in` and `top_interface_out`
         """
         # function container is used to scope parameters
-        param_con_scopestr = con_scope_to_str(node.con_scope)
+        param_con_scope_id = self.symbols.scope_id(node.con_scope)
         # enclosing container is used to scope arguments
         enclosing_con_scope = node.con_scope[:-1]
-        arg_con_scopestr = con_scope_to_str(enclosing_con_scope)
+        arg_con_scope_id = self.symbols.scope_id(enclosing_con_scope)
 
         # create argument and parameter variables
         # argument variables are inputs to the top interface
@@ -315,7 +320,7 @@ class VariableVersionPass:
             # argument name and scope str
             arg_name = func_def_argument_name(node, i)
 
-            # parameter name and scopestr
+            # parameter name and scope_id
             assert isinstance(param, AnnCastVar)
             param_name = param.val.name
 
@@ -325,9 +330,9 @@ class VariableVersionPass:
 
             # build and store GrFN variables for argument and parameter
             arg_grfn_var = create_grfn_var(
-                arg_name, id, version, arg_con_scopestr
+                arg_name, id, version, self.symbols.scopestr(arg_con_scope_id)
             )
-            arg_fullid = build_fullid(arg_name, id, version, arg_con_scopestr)
+            arg_fullid = self.symbols.fullid(arg_name, id, version, arg_con_scope_id)
             self.pipeline_state.store_grfn_var(arg_fullid, arg_grfn_var)
             # store arg_fullid
             node.arg_index_to_fullid[i] = arg_fullid
@@ -339,10 +344,10 @@ class VariableVersionPass:
             add_metadata_to_grfn_var(arg_grfn_var, from_source_mdata)
 
             param_grfn_var = create_grfn_var(
-                param_name, id, version, param_con_scopestr
+                param_name, id, version, self.symbols.scopestr(param_con_scope_id)
             )
-            param_fullid = build_fullid(
-                param_name, id, version, param_con_scopestr
+            param_fullid = self.symbols.fullid(
+                param_name, id, version, param_con_scope_id
             )
             self.pipeline_state.store_grfn_var(param_fullid, param_grfn_var)
             # store param_fullid
@@ -374,10 +379,12 @@ class VariableVersionPass:
         version = VAR_INIT_VERSION
 
         # interior container scope
-        func_scopestr = con_scope_to_str(node.con_scope)
+        func_scope_id = self.symbols.scope_id(node.con_scope)
 
-        in_ret_val = create_grfn_var(var_name, id, version, func_scopestr)
-        in_fullid = build_fullid(var_name, id, version, func_scopestr)
+        in_ret_val = create_grfn_var(
+            var_name, id, version, self.symbols.scopestr(func_scope_id)
+        )
+        in_fullid = self.symbols.fullid(var_name, id, version, func_scope_id)
         self.pipeline_state.store_grfn_var(in_fullid, in_ret_val)
         # create From Source metadata for the GrFN var
         from_source = False
@@ -388,11 +395,11 @@ class VariableVersionPass:
 
         # exterior container scope
         enclosing_con = node.con_scope[:-1]
-        enclosing_scopestr = con_scope_to_str(enclosing_con)
+        enclosing_scope_id = self.symbols.scope_id(enclosing_con)
         out_ret_val = create_grfn_var(
-            var_name, id, version, enclosing_scopestr
+            var_name, id, version, self.symbols.scopestr(enclosing_scope_id)
         )
-        out_fullid = build_fullid(var_name, id, version, enclosing_scopestr)
+        out_fullid = self.symbols.fullid(var_name, id, version, enclosing_scope_id)
         self.pipeline_state.store_grfn_var(out_fullid, out_ret_val)
         # create From Source metadata for the GrFN var
         add_metadata_to_grfn_var(out_ret_val, from_source_mdata)
@@ -425,35 +432,37 @@ class VariableVersionPass:
         # in the enclosing scope, increment all versions of global variables
         # that are modified by main
         enclosing_con_scope = node.con_scope[:-1]
-        enclosing_scopestr = con_scope_to_str(enclosing_con_scope)
+        enclosing_scope_id = self.symbols.scope_id(enclosing_con_scope)
 
         # add globals to exterior interfaces
         # add global variables to top_interface_in these are all used globals
         node.top_interface_vars = node.used_globals
         self.populate_interface(
-            enclosing_scopestr, node.top_interface_vars, node.top_interface_in
+            enclosing_scope_id, node.top_interface_vars, node.top_interface_in
         )
         # the bot interface globals are all modified globals
         node.bot_interface_vars = node.modified_globals
         # increment versions of all modified global variables
         self.incr_vars_in_con_scope(
-            enclosing_scopestr, node.bot_interface_vars
+            enclosing_scope_id, node.bot_interface_vars
         )
         # add modified globals to bot interface out
         self.populate_interface(
-            enclosing_scopestr, node.bot_interface_vars, node.bot_interface_out
+            enclosing_scope_id, node.bot_interface_vars, node.bot_interface_out
         )
 
         # add globals to interior interfaces
         # interior container scope
-        func_scopestr = con_scope_to_str(node.con_scope)
+        func_scope_id = self.symbols.scope_id(node.con_scope)
         # create globals for top_interface_out and bot interface in
         # by convention the top interface produces version VAR_INIT_VERSION variables
         # by convention, the bot interface in takes version VAR_EXIT_VERSION variables
         for id, var_name in node.top_interface_vars.items():
             version = VAR_INIT_VERSION
-            init_fullid = build_fullid(var_name, id, version, func_scopestr)
-            init_global = create_grfn_var(var_name, id, version, func_scopestr)
+            init_fullid = self.symbols.fullid(var_name, id, version, func_scope_id)
+            init_global = create_grfn_var(
+                var_name, id, version, self.symbols.scopestr(func_scope_id)
+            )
             self.pipeline_state.store_grfn_var(init_fullid, init_global)
             node.top_interface_out[id] = init_fullid
             # See comment above declaration for `FROM_SOURCE_FOR_GE` in annotated_cast.py
@@ -469,7 +478,7 @@ class VariableVersionPass:
         # here, since it is done while visitng Assignment node during GrfnVarCreation pass
         for id, var_name in node.bot_interface_vars.items():
             version = node.body_highest_var_vers[id]
-            exit_fullid = build_fullid(var_name, id, version, func_scopestr)
+            exit_fullid = self.symbols.fullid(var_name, id, version, func_scope_id)
             node.bot_interface_in[id] = exit_fullid
 
         # DEBUG printing
@@ -494,9 +503,9 @@ class VariableVersionPass:
             Links these specialized globals through the `bot_interface_in` and `bot_interface_out`
         """
         enclosing_con_scope = node.con_scope[:-1]
-        enclosing_scopestr = con_scope_to_str(enclosing_con_scope)
+        enclosing_scope_id = self.symbols.scope_id(enclosing_con_scope)
         # interior container scope
-        func_scopestr = con_scope_to_str(node.con_scope)
+        func_scope_id = self.symbols.scope_id(node.con_scope)
 
         # add global variables to top_interface_in
         # these are all used globals
@@ -516,11 +525,11 @@ class VariableVersionPass:
         for id, var_name in node.top_interface_vars.items():
             # exterior specialized top global
             specialized_name = specialized_global_name(node, var_name)
-            in_fullid = build_fullid(
-                specialized_name, id, version, enclosing_scopestr
+            in_fullid = self.symbols.fullid(
+                specialized_name, id, version, enclosing_scope_id
             )
             in_global = create_grfn_var(
-                specialized_name, id, version, enclosing_scopestr
+                specialized_name, id, version, self.symbols.scopestr(enclosing_scope_id)
             )
             self.pipeline_state.store_grfn_var(in_fullid, in_global)
             node.top_interface_in[id] = in_fullid
@@ -534,8 +543,10 @@ class VariableVersionPass:
             )
             add_metadata_to_grfn_var(in_global, from_source_mdata)
             # interior top global
-            out_fullid = build_fullid(var_name, id, version, func_scopestr)
-            out_global = create_grfn_var(var_name, id, version, func_scopestr)
+            out_fullid = self.symbols.fullid(var_name, id, version, func_scope_id)
+            out_global = create_grfn_var(
+                var_name, id, version, self.symbols.scopestr(func_scope_id)
+            )
             self.pipeline_state.store_grfn_var(out_fullid, out_global)
             node.top_interface_out[id] = out_fullid
             # create From Source metadata for the GrFN var
@@ -555,16 +566,16 @@ class VariableVersionPass:
             # we do not create the GrFN VariableNode for the highest version global
             # here, since it is done while visitng Assignment node during GrfnVarCreation pass
             version = node.body_highest_var_vers[id]
-            in_fullid = build_fullid(var_name, id, version, func_scopestr)
+            in_fullid = self.symbols.fullid(var_name, id, version, func_scope_id)
             node.bot_interface_in[id] = in_fullid
             # exterior specialized bot global
             version = VAR_EXIT_VERSION
             specialized_name = specialized_global_name(node, var_name)
-            out_fullid = build_fullid(
-                specialized_name, id, version, enclosing_scopestr
+            out_fullid = self.symbols.fullid(
+                specialized_name, id, version, enclosing_scope_id
             )
             out_global = create_grfn_var(
-                specialized_name, id, version, enclosing_scopestr
+                specialized_name, id, version, self.symbols.scopestr(enclosing_scope_id)
             )
             self.pipeline_state.store_grfn_var(out_fullid, out_global)
             node.bot_interface_out[id] = out_fullid
@@ -604,17 +615,17 @@ class VariableVersionPass:
         # argument variables are inputs to the top interface
         # paramter variables are outputs of the top interface
         for i, n in enumerate(node.arguments):
-            # parameter name and scopestr
+            # parameter name and scope_id
             func_def = self.pipeline_state.func_def_node_from_id(node.func.id)
             if i < len(func_def.func_args):  # NOTE: M7 Placeholder
                 # argument name and scope str
                 arg_name = call_argument_name(node, i)
-                arg_con_scopestr = con_scope_to_str(node.func.con_scope)
+                arg_con_scope_id = self.symbols.scope_id(node.func.con_scope)
 
                 param = func_def.func_args[i]
                 assert isinstance(param, AnnCastVar)
                 param_name = param.val.name
-                param_con_scopestr = con_scope_to_str(
+                param_con_scope_id = self.symbols.scope_id(
                     node.func.con_scope + [call_con_name]
                 )
 
@@ -624,10 +635,10 @@ class VariableVersionPass:
 
                 # build and store GrFN variables for argument and parameter
                 arg_grfn_var = create_grfn_var(
-                    arg_name, id, version, arg_con_scopestr
+                    arg_name, id, version, self.symbols.scopestr(arg_con_scope_id)
                 )
-                arg_fullid = build_fullid(
-                    arg_name, id, version, arg_con_scopestr
+                arg_fullid = self.symbols.fullid(
+                    arg_name, id, version, arg_con_scope_id
                 )
                 self.pipeline_state.store_grfn_var(arg_fullid, arg_grfn_var)
                 # store arg_fullid
@@ -640,10 +651,10 @@ class VariableVersionPass:
                 add_metadata_to_grfn_var(arg_grfn_var, from_source_mdata)
 
                 param_grfn_var = create_grfn_var(
-                    param_name, id, version, param_con_scopestr
+                    param_name, id, version, self.symbols.scopestr(param_con_scope_id)
                 )
-                param_fullid = build_fullid(
-                    param_name, id, version, param_con_scopestr
+                param_fullid = self.symbols.fullid(
+                    param_name, id, version, param_con_scope_id
                 )
                 self.pipeline_state.store_grfn_var(
                     param_fullid, param_grfn_var
@@ -680,11 +691,11 @@ class VariableVersionPass:
         for i, n in enumerate(node.arguments):
             # argument name and scope str
             arg_name = call_argument_name(node, i)
-            arg_con_scopestr = con_scope_to_str(node.func.con_scope)
+            arg_con_scope_id = self.symbols.scope_id(node.func.con_scope)
 
-            # parameter name and scopestr
+            # parameter name and scope_id
             param_name = call_param_name(node, i)
-            param_con_scopestr = con_scope_to_str(
+            param_con_scope_id = self.symbols.scope_id(
                 node.func.con_scope + [call_con_name]
             )
 
@@ -694,9 +705,9 @@ class VariableVersionPass:
 
             # build and store GrFN variables for argument and parameter
             arg_grfn_var = create_grfn_var(
-                arg_name, id, version, arg_con_scopestr
+                arg_name, id, version, self.symbols.scopestr(arg_con_scope_id)
             )
-            arg_fullid = build_fullid(arg_name, id, version, arg_con_scopestr)
+            arg_fullid = self.symbols.fullid(arg_name, id, version, arg_con_scope_id)
             self.pipeline_state.store_grfn_var(arg_fullid, arg_grfn_var)
             # store arg_fullid
             node.arg_index_to_fullid[i] = arg_fullid
@@ -708,10 +719,10 @@ class VariableVersionPass:
             add_metadata_to_grfn_var(arg_grfn_var, from_source_mdata)
 
             param_grfn_var = create_grfn_var(
-                param_name, id, version, param_con_scopestr
+                param_name, id, version, self.symbols.scopestr(param_con_scope_id)
             )
-            param_fullid = build_fullid(
-                param_name, id, version, param_con_scopestr
+            param_fullid = self.symbols.fullid(
+                param_name, id, version, param_con_scope_id
             )
             self.pipeline_state.store_grfn_var(param_fullid, param_grfn_var)
             # store param_fullid
@@ -743,12 +754,14 @@ class VariableVersionPass:
         version = VAR_INIT_VERSION
 
         # interior container scope
-        call_con_scopestr = con_scope_to_str(
+        call_con_scope_id = self.symbols.scope_id(
             node.func.con_scope + [call_container_name(node)]
         )
 
-        in_ret_val = create_grfn_var(var_name, id, version, call_con_scopestr)
-        in_fullid = build_fullid(var_name, id, version, call_con_scopestr)
+        in_ret_val = create_grfn_var(
+            var_name, id, version, self.symbols.scopestr(call_con_scope_id)
+        )
+        in_fullid = self.symbols.fullid(var_name, id, version, call_con_scope_id)
         self.pipeline_state.store_grfn_var(in_fullid, in_ret_val)
         # create From Source metadata for the GrFN var
         from_source = False
@@ -758,9 +771,11 @@ class VariableVersionPass:
         add_metadata_to_grfn_var(in_ret_val, from_source_mdata)
 
         # exterior container scope
-        con_scopestr = con_scope_to_str(node.func.con_scope)
-        out_ret_val = create_grfn_var(var_name, id, version, con_scopestr)
-        out_fullid = build_fullid(var_name, id, version, con_scopestr)
+        con_scope_id = self.symbols.scope_id(node.func.con_scope)
+        out_ret_val = create_grfn_var(
+            var_name, id, version, self.symbols.scopestr(con_scope_id)
+        )
+        out_fullid = self.symbols.fullid(var_name, id, version, con_scope_id)
         self.pipeline_state.store_grfn_var(out_fullid, out_ret_val)
         add_metadata_to_grfn_var(out_ret_val, from_source_mdata)
 
@@ -790,13 +805,13 @@ class VariableVersionPass:
         for i, n in enumerate(node.arguments):
             # argument name and scope str
             arg_name = call_argument_name(node, i)
-            arg_con_scopestr = con_scope_to_str(node.func.con_scope)
+            arg_con_scope_id = self.symbols.scope_id(node.func.con_scope)
 
-            # parameter name and scopestr
+            # parameter name and scope_id
             param = node.func_def_copy.func_args[i]
             assert isinstance(param, AnnCastVar)
             param_name = param.val.name
-            param_con_scopestr = con_scope_to_str(
+            param_con_scope_id = self.symbols.scope_id(
                 node.func.con_scope + [call_con_name]
             )
 
@@ -806,9 +821,9 @@ class VariableVersionPass:
 
             # build and store GrFN variables for argument and parameter
             arg_grfn_var = create_grfn_var(
-                arg_name, id, version, arg_con_scopestr
+                arg_name, id, version, self.symbols.scopestr(arg_con_scope_id)
             )
-            arg_fullid = build_fullid(arg_name, id, version, arg_con_scopestr)
+            arg_fullid = self.symbols.fullid(arg_name, id, version, arg_con_scope_id)
             self.pipeline_state.store_grfn_var(arg_fullid, arg_grfn_var)
             # store arg_fullid
             node.arg_index_to_fullid[i] = arg_fullid
@@ -820,10 +835,10 @@ class VariableVersionPass:
             add_metadata_to_grfn_var(arg_grfn_var, from_source_mdata)
 
             param_grfn_var = create_grfn_var(
-                param_name, id, version, param_con_scopestr
+                param_name, id, version, self.symbols.scopestr(param_con_scope_id)
             )
-            param_fullid = build_fullid(
-                param_name, id, version, param_con_scopestr
+            param_fullid = self.symbols.fullid(
+                param_name, id, version, param_con_scope_id
             )
             self.pipeline_state.store_grfn_var(param_fullid, param_grfn_var)
             # store param_fullid
@@ -853,12 +868,14 @@ class VariableVersionPass:
         version = VAR_INIT_VERSION
 
         # interior container scope
-        call_con_scopestr = con_scope_to_str(
+        call_con_scope_id = self.symbols.scope_id(
             node.func.con_scope + [call_container_name(node)]
         )
 
-        in_ret_val = create_grfn_var(var_name, id, version, call_con_scopestr)
-        in_fullid = build_fullid(var_name, id, version, call_con_scopestr)
+        in_ret_val = create_grfn_var(
+            var_name, id, version, self.symbols.scopestr(call_con_scope_id)
+        )
+        in_fullid = self.symbols.fullid(var_name, id, version, call_con_scope_id)
         self.pipeline_state.store_grfn_var(in_fullid, in_ret_val)
         # create From Source metadata for the GrFN var
         from_source = False
@@ -868,9 +885,11 @@ class VariableVersionPass:
         add_metadata_to_grfn_var(in_ret_val, from_source_mdata)
 
         # exterior container scope
-        con_scopestr = con_scope_to_str(node.func.con_scope)
-        out_ret_val = create_grfn_var(var_name, id, version, con_scopestr)
-        out_fullid = build_fullid(var_name, id, version, con_scopestr)
+        con_scope_id = self.symbols.scope_id(node.func.con_scope)
+        out_ret_val = create_grfn_var(
+            var_name, id, version, self.symbols.scopestr(con_scope_id)
+        )
+        out_fullid = self.symbols.fullid(var_name, id, version, con_scope_id)
         self.pipeline_state.store_grfn_var(out_fullid, out_ret_val)
         # create From Source metadata for the GrFN var
         add_metadata_to_grfn_var(out_ret_val, from_source_mdata)
@@ -902,40 +921,40 @@ class VariableVersionPass:
         # in the current scope, increment all versions of global variables
         # that are modified by this call
         # the calling container scope is stored in the Call's AnnCastName node
-        calling_scopestr = con_scope_to_str(node.func.con_scope)
+        calling_scope_id = self.symbols.scope_id(node.func.con_scope)
 
         # add globals to exterior interfaces
         # add global variables to top_interface_in
         # these are all used globals
         node.top_interface_vars = node.func_def_copy.used_globals
         self.populate_interface(
-            calling_scopestr, node.top_interface_vars, node.top_interface_in
+            calling_scope_id, node.top_interface_vars, node.top_interface_in
         )
         # the bot interface globals are all modified globals
         node.bot_interface_vars = node.func_def_copy.modified_globals
         # increment versions of all modified global variables
-        self.incr_vars_in_con_scope(calling_scopestr, node.bot_interface_vars)
+        self.incr_vars_in_con_scope(calling_scope_id, node.bot_interface_vars)
         # add modified globals to bot interface out
         self.populate_interface(
-            calling_scopestr, node.bot_interface_vars, node.bot_interface_out
+            calling_scope_id, node.bot_interface_vars, node.bot_interface_out
         )
 
         # add globals to interior interfaces
         # interior container scope
-        call_con_scopestr = con_scope_to_str(
+        call_con_scope_id = self.symbols.scope_id(
             node.func.con_scope + [call_container_name(node)]
         )
-        copied_func_scopestr = con_scope_to_str(node.func_def_copy.con_scope)
+        copied_func_scope_id = self.symbols.scope_id(node.func_def_copy.con_scope)
         # create globals for top_interface_out and bot interface in
         # by convention the top interface produces version VAR_INIT_VERSION variables
         # by convention, the bot interface in takes version VAR_EXIT_VERSION variables
         for id, var_name in node.top_interface_vars.items():
             version = VAR_INIT_VERSION
-            call_init_fullid = build_fullid(
-                var_name, id, version, call_con_scopestr
+            call_init_fullid = self.symbols.fullid(
+                var_name, id, version, call_con_scope_id
             )
             call_init_global = create_grfn_var(
-                var_name, id, version, call_con_scopestr
+                var_name, id, version, self.symbols.scopestr(call_con_scope_id)
             )
             self.pipeline_state.store_grfn_var(
                 call_init_fullid, call_init_global
@@ -951,8 +970,8 @@ class VariableVersionPass:
             add_metadata_to_grfn_var(call_init_global, from_source_mdata)
 
             # alias the func copies init version
-            func_copy_init_fullid = build_fullid(
-                var_name, id, version, copied_func_scopestr
+            func_copy_init_fullid = self.symbols.fullid(
+                var_name, id, version, copied_func_scope_id
             )
             self.pipeline_state.alias_grfn_vars(
                 func_copy_init_fullid, call_init_fullid
@@ -960,11 +979,11 @@ class VariableVersionPass:
 
         for id, var_name in node.bot_interface_vars.items():
             version = VAR_EXIT_VERSION
-            exit_fullid = build_fullid(
-                var_name, id, version, call_con_scopestr
+            exit_fullid = self.symbols.fullid(
+                var_name, id, version, call_con_scope_id
             )
             exit_global = create_grfn_var(
-                var_name, id, version, call_con_scopestr
+                var_name, id, version, self.symbols.scopestr(call_con_scope_id)
             )
             self.pipeline_state.store_grfn_var(exit_fullid, exit_global)
             node.bot_interface_in[id] = exit_fullid
@@ -991,7 +1010,7 @@ class VariableVersionPass:
         # in the current scope, increment all versions of global variables
         # that are modified by this call
         # the calling container scope is stored in the Call's AnnCastName node
-        calling_scopestr = con_scope_to_str(node.func.con_scope)
+        calling_scope_id = self.symbols.scope_id(node.func.con_scope)
         func_def = self.pipeline_state.func_def_node_from_id(node.func.id)
 
         # add globals to exterior interfaces
@@ -1000,20 +1019,20 @@ class VariableVersionPass:
 
         # add global variables to top_interface_in
         self.populate_interface(
-            calling_scopestr, node.top_interface_vars, node.top_interface_in
+            calling_scope_id, node.top_interface_vars, node.top_interface_in
         )
         # the bot interface globals are all modified globals
         node.bot_interface_vars = func_def.modified_globals
         # increment versions of all modified global variables
-        self.incr_vars_in_con_scope(calling_scopestr, node.bot_interface_vars)
+        self.incr_vars_in_con_scope(calling_scope_id, node.bot_interface_vars)
         # add modified globals to bot interface out
         self.populate_interface(
-            calling_scopestr, node.bot_interface_vars, node.bot_interface_out
+            calling_scope_id, node.bot_interface_vars, node.bot_interface_out
         )
 
         # add globals to interior interfaces
         # interior container scope
-        call_con_scopestr = con_scope_to_str(
+        call_con_scope_id = self.symbols.scope_id(
             node.func.con_scope + [call_container_name(node)]
         )
         # create globals for top_interface_out and bot interface in
@@ -1021,11 +1040,11 @@ class VariableVersionPass:
         # by convention, the bot interface in takes version VAR_EXIT_VERSION variables
         for id, var_name in node.top_interface_vars.items():
             version = VAR_INIT_VERSION
-            init_fullid = build_fullid(
-                var_name, id, version, call_con_scopestr
+            init_fullid = self.symbols.fullid(
+                var_name, id, version, call_con_scope_id
             )
             init_global = create_grfn_var(
-                var_name, id, version, call_con_scopestr
+                var_name, id, version, self.symbols.scopestr(call_con_scope_id)
             )
             self.pipeline_state.store_grfn_var(init_fullid, init_global)
             node.top_interface_out[id] = init_fullid
@@ -1040,11 +1059,11 @@ class VariableVersionPass:
 
         for id, var_name in node.bot_interface_vars.items():
             version = VAR_EXIT_VERSION
-            exit_fullid = build_fullid(
-                var_name, id, version, call_con_scopestr
+            exit_fullid = self.symbols.fullid(
+                var_name, id, version, call_con_scope_id
             )
             exit_global = create_grfn_var(
-                var_name, id, version, call_con_scopestr
+                var_name, id, version, self.symbols.scopestr(call_con_scope_id)
             )
             self.pipeline_state.store_grfn_var(exit_fullid, exit_global)
             node.bot_interface_in[id] = exit_fullid
@@ -1173,9 +1192,9 @@ class VariableVersionPass:
         Used for GrFN 2.2 Generation
         """
         # Initialize scope_to_highest_var_vers
-        con_scopestr = con_scope_to_str(node.con_scope)
+        con_scope_id = self.symbols.scope_id(node.con_scope)
         # create VAR_INIT_VERSION of any modified or accessed variables
-        self.init_highest_var_vers_dict(con_scopestr, node.used_vars.keys())
+        self.init_highest_var_vers_dict(con_scope_id, node.used_vars.keys())
 
         # visit children
         self.visit_node_list(node.func_args, assign_lhs)
@@ -1183,20 +1202,20 @@ class VariableVersionPass:
 
         # store highest var version
         node.body_highest_var_vers = self.con_scope_to_highest_var_vers[
-            con_scopestr
+            con_scope_id
         ]
 
         # DEBUG printing
         if self.pipeline_state.PRINT_DEBUGGING_INFO:
-            print(f"\nFor FUNCTION COPY: {con_scopestr}")
+            print(f"\nFor FUNCTION COPY: {self.symbols.scopestr(con_scope_id)}")
             print(f"  BodyHighestVers: {node.body_highest_var_vers}")
 
     @_visit.register
     def visit_function_def(self, node: AnnCastFunctionDef, assign_lhs: bool):
         # Initialize scope_to_highest_var_vers
-        con_scopestr = con_scope_to_str(node.con_scope)
+        con_scope_id = self.symbols.scope_id(node.con_scope)
         # create versions 0 of any modified or accessed variables
-        self.init_highest_var_vers_dict(con_scopestr, node.used_vars.keys())
+        self.init_highest_var_vers_dict(con_scope_id, node.used_vars.keys())
 
         # visit children
         self.visit_node_list(node.func_args, assign_lhs)
@@ -1204,7 +1223,7 @@ class VariableVersionPass:
 
         # store highest var version
         node.body_highest_var_vers = self.con_scope_to_highest_var_vers[
-            con_scopestr
+            con_scope_id
         ]
 
         # populate FunctionDef nodes's top interface with arguments
@@ -1227,7 +1246,7 @@ class VariableVersionPass:
 
         # DEBUG printing
         if self.pipeline_state.PRINT_DEBUGGING_INFO:
-            print(f"\nFor FUNCTION: {con_scopestr}")
+            print(f"\nFor FUNCTION: {self.symbols.scopestr(con_scope_id)}")
             print(f"  BodyHighestVers: {node.body_highest_var_vers}")
 
     @_visit.register
@@ -1257,31 +1276,31 @@ class VariableVersionPass:
     def visit_loop(self, node: AnnCastLoop, assign_lhs: bool):
         # Initialize scope_to_highest_var_version
         if len(node.pre) > 0:
-            pre_scopestr = con_scope_to_str(node.con_scope + [LOOPPRE])
-        expr_scopestr = con_scope_to_str(node.con_scope + [LOOPEXPR])
-        body_scopestr = con_scope_to_str(node.con_scope + [LOOPBODY])
+            pre_scope_id = self.symbols.scope_id(node.con_scope + [LOOPPRE])
+        expr_scope_id = self.symbols.scope_id(node.con_scope + [LOOPEXPR])
+        body_scope_id = self.symbols.scope_id(node.con_scope + [LOOPBODY])
         if len(node.post) > 0:
-            post_scopestr = con_scope_to_str(node.con_scope + [LOOPPOST])
+            post_scope_id = self.symbols.scope_id(node.con_scope + [LOOPPOST])
 
         # Initialize LoopInit
         # create versions 0 of any modified or accessed variables
         if len(node.pre) > 0:
             self.init_highest_var_vers_dict(
-                pre_scopestr, node.used_vars.keys()
+                pre_scope_id, node.used_vars.keys()
             )
 
         # Initialize LoopExpr
         # create versions 0 of any modified or accessed variables
-        self.init_highest_var_vers_dict(expr_scopestr, node.used_vars.keys())
+        self.init_highest_var_vers_dict(expr_scope_id, node.used_vars.keys())
 
         # Initialize LoopBody
         # create versions 0 of any modified or accessed variables
-        self.init_highest_var_vers_dict(body_scopestr, node.used_vars.keys())
+        self.init_highest_var_vers_dict(body_scope_id, node.used_vars.keys())
 
         # Initialize LoopPost
         if len(node.post) > 0:
             self.init_highest_var_vers_dict(
-                post_scopestr, node.used_vars.keys()
+                post_scope_id, node.used_vars.keys()
             )
 
         ######## visit children ########
@@ -1299,19 +1318,19 @@ class VariableVersionPass:
         # store highest var version
         if len(node.pre) > 0:
             node.pre_highest_var_vers = self.con_scope_to_highest_var_vers[
-                pre_scopestr
+                pre_scope_id
             ]
 
         node.expr_highest_var_vers = self.con_scope_to_highest_var_vers[
-            expr_scopestr
+            expr_scope_id
         ]
         node.body_highest_var_vers = self.con_scope_to_highest_var_vers[
-            body_scopestr
+            body_scope_id
         ]
 
         if len(node.post) > 0:
             node.post_highest_var_vers = self.con_scope_to_highest_var_vers[
-                post_scopestr
+                post_scope_id
             ]
 
         # populate all of this loops interfaces
@@ -1344,21 +1363,21 @@ class VariableVersionPass:
     @_visit.register
     def visit_model_if(self, node: AnnCastModelIf, assign_lhs: bool):
         # Initialize scope_to_highest_var_version
-        expr_scopestr = con_scope_to_str(node.con_scope + [IFEXPR])
-        ifbody_scopestr = con_scope_to_str(node.con_scope + [IFBODY])
-        elsebody_scopestr = con_scope_to_str(node.con_scope + [ELSEBODY])
+        expr_scope_id = self.symbols.scope_id(node.con_scope + [IFEXPR])
+        ifbody_scope_id = self.symbols.scope_id(node.con_scope + [IFBODY])
+        elsebody_scope_id = self.symbols.scope_id(node.con_scope + [ELSEBODY])
         # initialize IfExpr
         # create versions 0 of any modified or accessed variables
-        self.init_highest_var_vers_dict(expr_scopestr, node.used_vars.keys())
+        self.init_highest_var_vers_dict(expr_scope_id, node.used_vars.keys())
 
         # initialize IfBody
         # create versions 0 of any modified or accessed variables
-        self.init_highest_var_vers_dict(ifbody_scopestr, node.used_vars.keys())
+        self.init_highest_var_vers_dict(ifbody_scope_id, node.used_vars.keys())
 
         # initialize ElseBody
         # create versions 0 of any modified or accessed variables
         self.init_highest_var_vers_dict(
-            elsebody_scopestr, node.used_vars.keys()
+            elsebody_scope_id, node.used_vars.keys()
         )
 
         # visit children
@@ -1368,13 +1387,13 @@ class VariableVersionPass:
 
         # store highest var versions
         node.expr_highest_var_vers = self.con_scope_to_highest_var_vers[
-            expr_scopestr
+            expr_scope_id
         ]
         node.ifbody_highest_var_vers = self.con_scope_to_highest_var_vers[
-            ifbody_scopestr
+            ifbody_scope_id
         ]
         node.elsebody_highest_var_vers = self.con_scope_to_highest_var_vers[
-            elsebody_scopestr
+            elsebody_scope_id
         ]
 
         # populate interfaces
@@ -1393,18 +1412,18 @@ class VariableVersionPass:
 
     @_visit.register
     def visit_module(self, node: AnnCastModule, assign_lhs: bool):
-        con_scopestr = con_scope_to_str(node.con_scope)
+        con_scope_id = self.symbols.scope_id(node.con_scope)
         # create VAR_INIT_VERSION of any modified or accessed variables
-        self.init_highest_var_vers_dict(con_scopestr, node.used_vars.keys())
+        self.init_highest_var_vers_dict(con_scope_id, node.used_vars.keys())
         self.visit_node_list(node.body, assign_lhs)
 
     @_visit.register
     def visit_name(self, node: AnnCastName, assign_lhs: bool):
-        con_scopestr = con_scope_to_str(node.con_scope)
+        con_scope_id = self.symbols.scope_id(node.con_scope)
         if assign_lhs:
-            self.incr_version_in_con_scope(con_scopestr, node.id, node.name)
+            self.incr_version_in_con_scope(con_scope_id, node.id, node.name)
 
-        node.version = self.get_highest_ver_in_con_scope(con_scopestr, node.id)
+        node.version = self.get_highest_ver_in_con_scope(con_scope_id, node.id)
 
     @_visit.register
     def visit_operator(self, node: AnnCastOperator, assign_lhs: bool):
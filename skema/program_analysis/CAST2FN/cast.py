@@ -67,6 +67,40 @@ CAST_NODES_TYPES_LIST = [
     ValueConstructor,
 ]
 
+# The CAST node types by the name in the "node_type" field of their JSON
+CAST_NODE_TYPES = {node_type.__name__: node_type for node_type in CAST_NODES_TYPES_LIST}
+
+# The CAST values that are written to JSON objects or lists
+CAST_VALUE_TYPES = (list, AstNode, SourceRef)
+
+# The fields that make a JSON object without a "node_type" field a SourceRef
+SOURCE_REF_FIELDS = ("row_start", "row_end", "col_start", "col_end")
+
+# The names of the fields of every CAST node type that was encoded or decoded so far
+CAST_NODE_FIELDS = {}
+
+# The same, as sets
+CAST_NODE_FIELD_SETS = {}
+
+
+def cast_node_fields(node_type) -> typing.Tuple[str, ...]:
+    """Returns the names of the fields of CAST node type node_type,
+    in the order of its attribute_map"""
+    fields = CAST_NODE_FIELDS.get(node_type)
+    if fields is None:
+        fields = CAST_NODE_FIELDS[node_type] = tuple(node_type.attribute_map.keys())
+    return fields
+
+
+def cast_node_field_set(node_type) -> typing.FrozenSet[str]:
+    """Returns the names of the fields of CAST node type node_type as a set"""
+    fields = CAST_NODE_FIELD_SETS.get(node_type)
+    if fields is None:
+        fields = CAST_NODE_FIELD_SETS[node_type] = frozenset(
+            cast_node_fields(node_type)
+        )
+    return fields
+
 
 def compare_name_nodes(name1: Name, name2: Name) -> bool:
     """
@@ -225,20 +259,39 @@ class CAST(object):
         return grfn
 
     def write_cast_object(self, cast_value):
-        if isinstance(cast_value, list):
-            return [self.write_cast_object(val) for val in cast_value]
-        elif not isinstance(cast_value, AstNode) and not isinstance(
-            cast_value, SourceRef
-        ):
+        """
+        Returns the JSON object of a CAST value: a CAST node, a SourceRef,
+        a list of CAST values or a primitive value.
+
+        The CAST is walked with an explicit stack, so that deeply nested CAST
+        doesn't run into the recursion limit. Every JSON object is created
+        before its children, which fill in their field of it once they're written.
+        """
+        if not isinstance(cast_value, CAST_VALUE_TYPES):
             return cast_value
 
-        return dict(
-            {
-                attr: self.write_cast_object(getattr(cast_value, attr))
-                for attr in cast_value.attribute_map.keys()
-            },
-            **{"node_type": type(cast_value).__name__},
-        )
+        root = [None]
+        # The CAST values left to write, with the JSON object (or list) and the
+        # field (or index) they're written to
+        stack = [(cast_value, root, 0)]
+        while stack:
+            value, parent, key = stack.pop()
+            if isinstance(value, list):
+                json_value = list(value)
+                for i, child in enumerate(value):
+                    if isinstance(child, CAST_VALUE_TYPES):
+                        stack.append((child, json_value, i))
+            else:
+                json_value = {}
+                for field in cast_node_fields(type(value)):
+                    child = getattr(value, field)
+                    json_value[field] = child
+                    if isinstance(child, CAST_VALUE_TYPES):
+                        stack.append((child, json_value, field))
+                json_value["node_type"] = type(value).__name__
+            parent[key] = json_value
+
+        return root[0]
 
     def to_json_object(self):
         """
@@ -258,41 +311,65 @@ class CAST(object):
 
     @classmethod
     def parse_cast_json(cls, data):
-        if isinstance(data, list):
-            # If we see a list parse each one of its elements
-            return [cls.parse_cast_json(item) for item in data]
-        elif data is None:
-            return None
-        elif isinstance(data, (float, int, str, bool)):
-            # If we see a primitave type, simply return its value
-            return data
-        elif all(
-            k in data for k in ("row_start", "row_end", "col_start", "col_end")
-        ):
-            return SourceRef(
-                row_start=data["row_start"],
-                row_end=data["row_end"],
-                col_start=data["col_start"],
-                col_end=data["col_end"],
-                source_file_name=data["source_file_name"],
-            )
+        """
+        Parses a CAST JSON value: a JSON object of a CAST node, a list of
+        CAST JSON values or a primitive value.
+
+        The JSON is walked with an explicit stack, so that deeply nested CAST
+        doesn't run into the recursion limit. Every CAST node is created
+        before its children, which are set once they're parsed.
 
-        if "node_type" in data:
-            # Create the object specified by "node_type" object with the values
-            # from its children nodes
-            for node_type in CAST_NODES_TYPES_LIST:
+        Raises:
+            CASTJsonException: If we encounter an unknown CAST node
+        """
+        if not isinstance(data, (list, dict)):
+            # If we see a primitive type, simply return its value
+            return data
 
-                if node_type.__name__ == data["node_type"]:
-                    node_results = {
-                        k: cls.parse_cast_json(v)
-                        for k, v in data.items()
-                        if k != "node_type"
+        root = [None]
+        # The JSON values left to parse, with the list or CAST node
+        # and the index or field they're parsed to
+        stack = [(data, root, 0)]
+        while stack:
+            value, parent, key = stack.pop()
+            if isinstance(value, list):
+                parsed = list(value)
+                for i, child in enumerate(value):
+                    if isinstance(child, (list, dict)):
+                        stack.append((child, parsed, i))
+            else:
+                node_type = CAST_NODE_TYPES.get(value.get("node_type"))
+                if node_type is None:
+                    if not all(k in value for k in SOURCE_REF_FIELDS):
+                        raise CASTJsonException(
+                            f"Unable to decode json CAST field with field names: {set(value.keys())}"
+                        )
+                    # SourceRefs of CAST JSON written without "node_type" fields
+                    node_type = SourceRef
+                    value = {
+                        k: value[k] for k in SOURCE_REF_FIELDS + ("source_file_name",)
                     }
-                    return node_type(**node_results)
 
-        raise CASTJsonException(
-            f"Unable to decode json CAST field with field names: {set(data.keys())}"
-        )
+                node_fields = cast_node_field_set(node_type)
+                parsed = node_type()
+                for field, child in value.items():
+                    if field not in node_fields:
+                        if field == "node_type":
+                            continue
+                        raise CASTJsonException(
+                            f"Unknown field {field} of json CAST node {node_type.__name__}"
+                        )
+                    if isinstance(child, (list, dict)):
+                        stack.append((child, parsed, field))
+                    elif child is not None:
+                        setattr(parsed, field, child)
+
+            if isinstance(parent, list):
+                parent[key] = parsed
+            else:
+                setattr(parent, key, parsed)
+
+        return root[0]
 
     @classmethod
     def from_json_data(cls, json_data, cast_source_language="unknown"):
@@ -0,0 +1,755 @@
+"""
+checkpoint.py defines a compact binary format for the intermediate artifacts of
+the pipeline that are cached between stages: CAST objects, and the
+PipelineState of the Annotated CAST passes.
+
+A checkpoint is written as the graph of the objects it's made of, like pickle
+does, but schema driven and table based:
+    - every value of the graph gets an index in one table of values
+    - every constant (i.e. a string or a number) is written once, so strings are interned
+    - every class is written once to a type table, with the names of the attributes
+      of its instances, and its instances are written as the indices of their
+      attribute values
+    - objects that are created by calling a function with constants (i.e. datetimes
+      and enum members) are written as the indices of the constants, by function
+    - SourceRefs with the same values are written once, and shared when read
+The indices are written as arrays of uint32, and the sections of the file with
+marshal. This lets a checkpoint be read mostly by the interpreter's C code: the
+objects, lists and dicts are created and filled in bulk, and only the values that
+are built from their contents (tuples, sets, objects with their own __reduce_ex__...)
+are created one at a time.
+
+The file starts with a header:
+    - MAGIC (8 bytes)
+    - the format version, the kind of the checkpoint (CAST, PipelineState or any
+      other object) and the marshal version (little endian uint16s)
+    - the offset and size of every section (little endian uint64 pairs)
+followed by the sections, which are read from a memory map of the file.
+
+Objects that define how they're pickled (i.e. datetimes) are written with their
+__reduce_ex__, and the ones that can't be referred to by name (i.e. lambdas) with dill.
+"""
+import array
+import collections
+import copyreg
+import gc
+import itertools
+import marshal
+import mmap
+import struct
+import sys
+import types
+import typing
+
+import dill
+
+from skema.program_analysis.CAST2FN.cast import CAST
+from skema.program_analysis.CAST2FN.model.cast import SourceRef
+from skema.program_analysis.CAST2FN.ann_cast.annotated_cast import PipelineState
+
+MAGIC = b"SKEMACKP"
+FORMAT_VERSION = 1
+
+# The kinds of checkpoint
+KIND_OBJECT = 0
+KIND_CAST = 1
+KIND_PIPELINE_STATE = 2
+
+HEADER = struct.Struct("<8sHHH")
+SECTION = struct.Struct("<QQ")
+SECTIONS = (
+    "constants",
+    "types",
+    "calls",
+    "lists",
+    "dicts",
+    "records",
+    "shells",
+    "root",
+)
+
+# The types of the values that are written as constants
+CONSTANT_TYPES = {type(None), bool, int, float, complex, bytes, str}
+
+# The types of records
+RECORD_LIST = 0
+RECORD_DICT = 1
+RECORD_TUPLE = 2
+RECORD_SET = 3
+RECORD_FROZENSET = 4
+# A class, function or module, referred to by its module and qualified name
+RECORD_GLOBAL = 5
+# An object written as the function and arguments of its __reduce_ex__
+RECORD_CALL = 6
+# An object written as its whole __reduce_ex__ (function, arguments, state, list items, dict items)
+RECORD_REDUCE = 7
+# An object written with dill
+RECORD_PICKLE = 8
+# An object whose __reduce_ex__ creates it with copyreg.__newobj__ and sets its
+# __dict__, written as its class and its attributes
+RECORD_NEWOBJ = 9
+# An object of the type table (RECORD_OBJECT + the index of its type)
+RECORD_OBJECT = 10
+
+CONTAINER_RECORDS = {
+    list: RECORD_LIST,
+    tuple: RECORD_TUPLE,
+    dict: RECORD_DICT,
+    set: RECORD_SET,
+    frozenset: RECORD_FROZENSET,
+}
+
+GLOBAL_TYPES = (
+    type,
+    types.FunctionType,
+    types.BuiltinFunctionType,
+    types.ModuleType,
+)
+
+PICKLE_METHODS = (
+    "__reduce_ex__",
+    "__reduce__",
+    "__getstate__",
+    "__setstate__",
+    "__getnewargs__",
+    "__getnewargs_ex__",
+)
+
+
+class CheckpointException(Exception):
+    """
+    Class used to represent exceptions encountered when reading or writing checkpoints
+    """
+
+    pass
+
+
+def slot_names(cls) -> typing.List[str]:
+    """Returns the names of the slots of the instances of cls"""
+    names = []
+    for base in cls.__mro__:
+        slots = base.__dict__.get("__slots__", ())
+        if isinstance(slots, str):
+            slots = (slots,)
+        for name in slots:
+            if name in ("__dict__", "__weakref__"):
+                continue
+            if name.startswith("__") and not name.endswith("__"):
+                name = f"_{base.__name__.lstrip('_')}{name}"
+            names.append(name)
+    return names
+
+
+def is_plain_class(cls) -> bool:
+    """Checks if the instances of cls are written with their attributes, i.e. they
+    don't define how they're pickled or hashed, and cls can be found by name"""
+    if cls.__new__ is not object.__new__:
+        return False
+    # Instances that are hashed by value have to be complete before they're
+    # put in a set or a dict, so they're created in order, with their __reduce_ex__
+    if cls.__hash__ is not None and cls.__hash__ is not object.__hash__:
+        return False
+    for method in PICKLE_METHODS:
+        if getattr(cls, method, None) is not getattr(object, method, None):
+            return False
+    try:
+        return find_global(cls.__module__, cls.__qualname__) is cls
+    except Exception:
+        return False
+
+
+def find_global(module: str, qualname: str):
+    """Returns the object that qualname refers to in module, or module itself
+    if qualname is empty"""
+    value = sys.modules.get(module)
+    if value is None:
+        value = __import__(module, fromlist=["_"])
+    if qualname == "":
+        return value
+    for name in qualname.split("."):
+        value = getattr(value, name)
+    return value
+
+
+def set_state(obj, state):
+    """Sets the state of obj from its __reduce_ex__, like pickle does"""
+    setstate = getattr(obj, "__setstate__", None)
+    if setstate is not None:
+        setstate(state)
+        return
+    slot_state = None
+    if isinstance(state, tuple) and len(state) == 2:
+        state, slot_state = state
+    if state:
+        obj.__dict__.update(state)
+    if slot_state:
+        for name, value in slot_state.items():
+            setattr(obj, name, value)
+
+
+class IndexArrays:
+    """Class IndexArrays
+    A group of records, as arrays of uint32.
+
+    Current Fields:
+        - indices: The index of every record in the table of values
+        - starts: Where the values of every record start in values, followed by
+                  where the last one ends
+        - values: The indices of the values of the records
+    """
+
+    def __init__(self):
+        self.indices = array.array("I")
+        self.starts = array.array("I", [0])
+        self.values = array.array("I")
+
+    def append(self, index: int, values: typing.List[int]):
+        self.indices.append(index)
+        self.values.extend(values)
+        self.starts.append(len(self.values))
+
+    def to_bytes(self) -> typing.Tuple[bytes, bytes, bytes]:
+        return to_bytes(self.indices), to_bytes(self.starts), to_bytes(self.values)
+
+
+class CheckpointWriter:
+    """Class CheckpointWriter
+    Writes the graph of objects of a checkpoint to the sections of the format.
+
+    Current Fields:
+        - size: The number of values of the table of values
+        - constant_indices, constant_values: The constants of the table of values
+        - types: The type table, as (module, qualified name, attribute names, slotted)
+                   for classes, and (module, qualified name, number of arguments) for
+                   the functions of calls with constant arguments
+        - type_objects: The indices of the objects of every type of the type table,
+                   and the indices of their attribute values (or arguments)
+        - records: The lists, dicts and other records, in the order they're completed
+                   (children before their parents, except in reference cycles)
+        - eager: The ids of the lists and dicts that __reduce_ex__ functions are called
+                   with, which have to be complete before the functions are called
+        - shells: The indices of the lists and dicts that a reference cycle refers
+                   to before they're complete
+        - memo: The index of every object written so far, by id
+    """
+
+    def __init__(self):
+        self.size = 0
+        self.constant_indices = array.array("I")
+        self.constant_values = []
+        self.constant_index = {}
+        self.types = []
+        self.type_index = {}
+        self.type_objects = []
+        self.records = []
+        self.eager = set()
+        self.shells = set()
+        self.memo = {}
+        # The index of every SourceRef by its values, so that equal SourceRefs are shared
+        self.source_ref_index = {}
+        # Keeps the written objects alive, so that their ids aren't reused
+        self.objects = []
+        # The record types of the records that are being written
+        self.in_progress = {}
+        self.class_records = {}
+
+    def new_index(self) -> int:
+        index = self.size
+        self.size += 1
+        return index
+
+    def constant(self, value) -> int:
+        # Values of different types (i.e. 1, 1.0 and True) aren't the same constant
+        key = (type(value), value)
+        index = self.constant_index.get(key)
+        if index is None:
+            index = self.constant_index[key] = self.new_index()
+            self.constant_indices.append(index)
+            self.constant_values.append(value)
+        return index
+
+    def type_entry(self, cls, names: typing.Tuple[str, ...], slotted: bool) -> int:
+        key = (cls, names)
+        index = self.type_index.get(key)
+        if index is None:
+            index = self.type_index[key] = len(self.types)
+            self.types.append((cls.__module__, cls.__qualname__, names, slotted))
+            self.type_objects.append(IndexArrays())
+        return index
+
+    def call_entry(self, function, argument_count: int) -> typing.Optional[int]:
+        """Returns the index of the type table entry of the calls of function with
+        argument_count constant arguments, or None if function can't be found by name"""
+        key = (function, argument_count)
+        if key not in self.type_index:
+            name = (
+                getattr(function, "__module__", None),
+                getattr(function, "__qualname__", None),
+            )
+            try:
+                found = find_global(*name) is function
+            except Exception:
+                found = False
+            if found:
+                self.type_index[key] = len(self.types)
+                self.types.append(name + (argument_count,))
+                self.type_objects.append(IndexArrays())
+            else:
+                self.type_index[key] = None
+        return self.type_index[key]
+
+    def class_record(self, cls) -> int:
+        """Returns the type of record that the instances of cls are written to"""
+        record_type = self.class_records.get(cls)
+        if record_type is None:
+            if cls in CONTAINER_RECORDS:
+                record_type = CONTAINER_RECORDS[cls]
+            elif issubclass(cls, GLOBAL_TYPES):
+                record_type = RECORD_GLOBAL
+            elif is_plain_class(cls):
+                record_type = RECORD_OBJECT
+            else:
+                record_type = RECORD_REDUCE
+            self.class_records[cls] = record_type
+        return record_type
+
+    def object_state(self, value) -> typing.Tuple[dict, bool]:
+        """Returns the attributes of value (from its __dict__ and its slots),
+        and whether its class has slots"""
+        state = getattr(value, "__dict__", None)
+        slots = slot_names(type(value))
+        if slots:
+            state = dict(state) if state is not None else {}
+            for name in slots:
+                if hasattr(value, name):
+                    state[name] = getattr(value, name)
+        elif state is None:
+            state = {}
+        return state, bool(slots)
+
+    def mark_eager(self, values):
+        """Marks the lists and dicts of values, and the ones they contain (through
+        lists, dicts and tuples), as eager"""
+        pending = list(values)
+        while pending:
+            value = pending.pop()
+            cls = type(value)
+            if cls is list or cls is dict:
+                if id(value) in self.eager:
+                    continue
+                self.eager.add(id(value))
+                self.objects.append(value)
+                pending.extend(value.values() if cls is dict else value)
+                if cls is dict:
+                    pending.extend(value.keys())
+            elif cls is tuple:
+                pending.extend(value)
+
+    def children(self, value, record_type: int):
+        """Returns the type of the record of value, and the values it's made of"""
+        if record_type == RECORD_LIST or record_type == RECORD_TUPLE:
+            return record_type, value
+        elif record_type == RECORD_DICT:
+            # The keys, then the values
+            return record_type, itertools.chain(value.keys(), value.values())
+        elif record_type == RECORD_SET or record_type == RECORD_FROZENSET:
+            return record_type, value
+        elif record_type == RECORD_GLOBAL:
+            if isinstance(value, types.ModuleType):
+                name = (value.__name__, "")
+            else:
+                name = (
+                    getattr(value, "__module__", None),
+                    getattr(value, "__qualname__", None),
+                )
+            try:
+                if find_global(*name) is value:
+                    return record_type, name
+            except Exception:
+                pass
+            return RECORD_PICKLE, (dill.dumps(value),)
+        elif record_type == RECORD_REDUCE:
+            try:
+                reduced = value.__reduce_ex__(4)
+            except Exception:
+                return RECORD_PICKLE, (dill.dumps(value),)
+            if isinstance(reduced, str):
+                module = getattr(value, "__module__", None)
+                return RECORD_GLOBAL, (module, reduced)
+            function, arguments, state, list_items, dict_items = (
+                tuple(reduced) + (None,) * 5
+            )[:5]
+            if list_items is None and dict_items is None:
+                if state is None:
+                    arguments = tuple(arguments)
+                    if all(type(a) in CONSTANT_TYPES for a in arguments):
+                        # Created in bulk, before the records that refer to it
+                        type_index = self.call_entry(function, len(arguments))
+                        if type_index is not None:
+                            return RECORD_OBJECT + type_index, arguments
+                    self.mark_eager(arguments)
+                    return RECORD_CALL, (function,) + arguments
+                cls = type(value)
+                if (
+                    function is copyreg.__newobj__
+                    and tuple(arguments) == (cls,)
+                    and type(state) is dict
+                    and getattr(cls, "__setstate__", None) is None
+                ):
+                    # The keys of the attributes, then their values
+                    return RECORD_NEWOBJ, itertools.chain(
+                        (cls,), state.keys(), state.values()
+                    )
+
+            list_items = list(list_items) if list_items is not None else None
+            dict_items = list(dict_items) if dict_items is not None else None
+            self.mark_eager((arguments, state, list_items, dict_items))
+            return record_type, (function, arguments, state, list_items, dict_items)
+
+        state, slotted = self.object_state(value)
+        type_index = self.type_entry(type(value), tuple(state.keys()), slotted)
+        return RECORD_OBJECT + type_index, state.values()
+
+    def encode(self, value, stack) -> int:
+        """Returns the index of value in the table of values. New lists, dicts, objects...
+        are pushed on stack, to write their records once their children are written."""
+        cls = type(value)
+        if cls in CONSTANT_TYPES:
+            return self.constant(value)
+
+        index = self.memo.get(id(value))
+        if index is not None:
+            record_type = self.in_progress.get(index)
+            if record_type is not None and record_type < RECORD_OBJECT:
+                # A reference cycle. Objects of the type table are all created
+                # before they're filled, so they can always be part of one.
+                if record_type == RECORD_LIST or record_type == RECORD_DICT:
+                    self.shells.add(index)
+                else:
+                    raise CheckpointException(
+                        f"Can't write a reference cycle through a {cls.__name__}"
+                    )
+            return index
+
+        self.objects.append(value)
+        key = None
+        if cls is SourceRef:
+            state, _ = self.object_state(value)
+            try:
+                key = tuple((name, type(v), v) for name, v in state.items())
+                index = self.source_ref_index.get(key)
+            except TypeError:
+                key = None
+            if index is not None:
+                self.memo[id(value)] = index
+                return index
+
+        index = self.memo[id(value)] = self.new_index()
+        if key is not None:
+            self.source_ref_index[key] = index
+        record_type, children = self.children(value, self.class_record(cls))
+        self.in_progress[index] = record_type
+        stack.append((id(value), index, record_type, iter(children), []))
+        return index
+
+    def write(self, root) -> dict:
+        """Writes the graph of objects of root, and returns the sections of its checkpoint"""
+        stack = []
+        root_index = self.encode(root, stack)
+        while stack:
+            object_id, index, record_type, children, values = stack[-1]
+            depth = len(stack)
+            for child in children:
+                values.append(self.encode(child, stack))
+                if len(stack) > depth:
+                    # The child's record is completed before the rest of its parent's
+                    break
+            else:
+                stack.pop()
+                del self.in_progress[index]
+                if record_type >= RECORD_OBJECT:
+                    self.type_objects[record_type - RECORD_OBJECT].append(index, values)
+                else:
+                    self.records.append((object_id, index, record_type, values))
+
+        # The lists and dicts that aren't eager are created first and filled
+        # in bulk, the other records are created in order
+        lists = IndexArrays()
+        dicts = IndexArrays()
+        records = IndexArrays()
+        record_types = array.array("I")
+        list_shells = array.array("I")
+        dict_shells = array.array("I")
+        for object_id, index, record_type, values in self.records:
+            if record_type == RECORD_LIST and object_id not in self.eager:
+                lists.append(index, values)
+            elif record_type == RECORD_DICT and object_id not in self.eager:
+                dicts.append(index, values)
+            else:
+                records.append(index, values)
+                record_types.append(record_type)
+                if index in self.shells:
+                    if record_type == RECORD_LIST:
+                        list_shells.append(index)
+                    else:
+                        dict_shells.append(index)
+
+        return {
+            "constants": (to_bytes(self.constant_indices), tuple(self.constant_values)),
+            "types": tuple(
+                entry + objects.to_bytes()
+                for entry, objects in zip(self.types, self.type_objects)
+                if len(entry) == 4
+            ),
+            "calls": tuple(
+                entry + objects.to_bytes()
+                for entry, objects in zip(self.types, self.type_objects)
+                if len(entry) == 3
+            ),
+            "lists": lists.to_bytes(),
+            "dicts": dicts.to_bytes(),
+            "records": records.to_bytes() + (to_bytes(record_types),),
+            "shells": (to_bytes(list_shells), to_bytes(dict_shells)),
+            "root": (self.size, root_index),
+        }
+
+
+def to_bytes(values: array.array) -> bytes:
+    if sys.byteorder != "little":
+        values = array.array(values.typecode, values)
+        values.byteswap()
+    return values.tobytes()
+
+
+def from_bytes(data) -> array.array:
+    values = array.array("I")
+    values.frombytes(data)
+    if sys.byteorder != "little":
+        values.byteswap()
+    return values
+
+
+def consume(iterator):
+    """Runs iterator to its end, i.e. a map of a function called for its effect"""
+    collections.deque(iterator, maxlen=0)
+
+
+def record_values(table: list, starts: array.array, values: array.array):
+    """Returns an iterator of the values of every record of a group of records,
+    as lists"""
+    get = table.__getitem__
+    slices = map(slice, starts, itertools.islice(starts, 1, None))
+    return map(list, map(map, itertools.repeat(get), map(values.__getitem__, slices)))
+
+
+def dict_items(values: list):
+    """Returns the items of a dict record, whose values are its keys then its values"""
+    half = len(values) // 2
+    return zip(values[:half], values[half:])
+
+
+def read_checkpoint(sections: dict):
+    """Creates the graph of objects of the sections of a checkpoint, and returns its root.
+
+    The objects of the type table (and the calls with constant arguments) and the
+    lists and dicts that aren't eager are all created first. The other records are then created in the order they were
+    completed, and the objects, lists and dicts are filled last, since the other
+    records only hold references to them.
+    """
+    size, root_index = sections["root"]
+    table = [None] * size
+    constant_indices, constants = sections["constants"]
+    consume(map(table.__setitem__, from_bytes(constant_indices), constants))
+
+    classes = []
+    for module, qualname, names, slotted, indices, _, values in sections["types"]:
+        cls = find_global(module, qualname)
+        indices = from_bytes(indices)
+        objects = list(map(cls.__new__, itertools.repeat(cls, len(indices))))
+        consume(map(table.__setitem__, indices, objects))
+        classes.append((names, slotted, objects, from_bytes(values)))
+
+    get = table.__getitem__
+    for module, qualname, argument_count, indices, _, values in sections["calls"]:
+        function = find_global(module, qualname)
+        values = from_bytes(values)
+        arguments = [
+            map(get, values[i::argument_count]) for i in range(argument_count)
+        ]
+        consume(map(table.__setitem__, from_bytes(indices), map(function, *arguments)))
+
+    list_indices, list_starts, list_values = map(from_bytes, sections["lists"])
+    lists = [[] for _ in list_indices]
+    consume(map(table.__setitem__, list_indices, lists))
+    dict_indices, dict_starts, dict_values = map(from_bytes, sections["dicts"])
+    dicts = [{} for _ in dict_indices]
+    consume(map(table.__setitem__, dict_indices, dicts))
+
+    # The eager lists and dicts that reference cycles refer to before they're complete
+    list_shells, dict_shells = map(from_bytes, sections["shells"])
+    for index in list_shells:
+        table[index] = []
+    for index in dict_shells:
+        table[index] = {}
+
+    indices, starts, values, types = map(from_bytes, sections["records"])
+    for index, record_type, values in zip(
+        indices, types, record_values(table, starts, values)
+    ):
+        if record_type == RECORD_CALL:
+            table[index] = values[0](*values[1:])
+        elif record_type == RECORD_NEWOBJ:
+            cls = values[0]
+            obj = table[index] = cls.__new__(cls)
+            obj.__dict__.update(dict_items(values[1:]))
+        elif record_type == RECORD_TUPLE:
+            table[index] = tuple(values)
+        elif record_type == RECORD_LIST:
+            if table[index] is None:
+                table[index] = values
+            else:
+                table[index].extend(values)
+        elif record_type == RECORD_DICT:
+            if table[index] is None:
+                table[index] = dict(dict_items(values))
+            else:
+                table[index].update(dict_items(values))
+        elif record_type == RECORD_SET:
+            table[index] = set(values)
+        elif record_type == RECORD_FROZENSET:
+            table[index] = frozenset(values)
+        elif record_type == RECORD_GLOBAL:
+            table[index] = find_global(*values)
+        elif record_type == RECORD_REDUCE:
+            function, arguments, state, list_items, items = values
+            obj = table[index] = function(*arguments)
+            if state is not None:
+                set_state(obj, state)
+            if list_items is not None:
+                obj.extend(list_items)
+            if items is not None:
+                for key, value in items:
+                    obj[key] = value
+        elif record_type == RECORD_PICKLE:
+            table[index] = dill.loads(values[0])
+        else:
+            raise CheckpointException(f"Unknown record type {record_type}")
+
+    consume(map(list.extend, lists, record_values(table, list_starts, list_values)))
+    consume(
+        map(
+            dict.update,
+            dicts,
+            map(dict_items, record_values(table, dict_starts, dict_values)),
+        )
+    )
+
+    for names, slotted, objects, values in classes:
+        field_count = len(names)
+        if field_count == 0:
+            continue
+        if slotted:
+            for i, name in enumerate(names):
+                consume(
+                    map(
+                        object.__setattr__,
+                        objects,
+                        itertools.repeat(name),
+                        map(get, values[i::field_count]),
+                    )
+                )
+        else:
+            rows = zip(*[map(get, values)] * field_count)
+            states = map(dict, map(zip, itertools.repeat(names), rows))
+            consume(map(setattr, objects, itertools.repeat("__dict__"), states))
+
+    return table[root_index]
+
+
+def dumps(value, kind: int = KIND_OBJECT) -> bytes:
+    """Returns the checkpoint of value, of the given kind of checkpoint"""
+    sections = CheckpointWriter().write(value)
+    blobs = [marshal.dumps(sections[name]) for name in SECTIONS]
+
+    offset = HEADER.size + SECTION.size * len(SECTIONS)
+    header = [HEADER.pack(MAGIC, FORMAT_VERSION, kind, marshal.version)]
+    for blob in blobs:
+        header.append(SECTION.pack(offset, len(blob)))
+        offset += len(blob)
+    return b"".join(header + blobs)
+
+
+def loads(data, kind: typing.Optional[int] = None):
+    """Returns the object of checkpoint data (bytes or any buffer, i.e. an mmap).
+
+    Raises:
+        CheckpointException: If data isn't a checkpoint of this version of the format,
+            or of the given kind of checkpoint
+    """
+    with memoryview(data) as view:
+        if len(view) < HEADER.size or view[: len(MAGIC)] != MAGIC:
+            raise CheckpointException("Not a checkpoint: wrong magic number")
+        _, version, data_kind, marshal_version = HEADER.unpack_from(view)
+        if version != FORMAT_VERSION or marshal_version != marshal.version:
+            raise CheckpointException(
+                f"Checkpoint version {version} (marshal {marshal_version}) can't be read, "
+                f"expected version {FORMAT_VERSION} (marshal {marshal.version})"
+            )
+        if kind is not None and data_kind != kind:
+            raise CheckpointException(
+                f"Expected a checkpoint of kind {kind}, found kind {data_kind}"
+            )
+
+        sections = {}
+        for i, name in enumerate(SECTIONS):
+            offset, size = SECTION.unpack_from(view, HEADER.size + i * SECTION.size)
+            with view[offset : offset + size] as section:
+                sections[name] = marshal.loads(section)
+
+    # The objects are all reachable from the table of values, so the cyclic
+    # garbage collector would only go through them over and over while they're created
+    gc_enabled = gc.isenabled()
+    gc.disable()
+    try:
+        return read_checkpoint(sections)
+    finally:
+        if gc_enabled:
+            gc.enable()
+
+
+def dump(value, path: str, kind: int = KIND_OBJECT):
+    """Writes the checkpoint of value to the file path"""
+    with open(path, "wb") as f:
+        f.write(dumps(value, kind))
+
+
+def load(path: str, kind: typing.Optional[int] = None, use_mmap: bool = True):
+    """Reads the checkpoint of the file path. With use_mmap, the file is
+    memory mapped instead of read into memory."""
+    with open(path, "rb") as f:
+        if not use_mmap:
+            return loads(f.read(), kind)
+        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as data:
+            return loads(data, kind)
+
+
+def is_checkpoint(path: str) -> bool:
+    """Checks if the file path starts like a checkpoint"""
+    with open(path, "rb") as f:
+        return f.read(len(MAGIC)) == MAGIC
+
+
+def dump_cast(cast: CAST, path: str):
+    dump(cast, path, KIND_CAST)
+
+
+def load_cast(path: str, use_mmap: bool = True) -> CAST:
+    return load(path, KIND_CAST, use_mmap)
+
+
+def dump_pipeline_state(pipeline_state: PipelineState, path: str):
+    dump(pipeline_state, path, KIND_PIPELINE_STATE)
+
+
+def load_pipeline_state(path: str, use_mmap: bool = True) -> PipelineState:
+    return load(path, KIND_PIPELINE_STATE, use_mmap)
@@ -0,0 +1,73 @@
+"""
+interning.py defines the InternTable, which the CAST front ends and the
+Annotated CAST passes share to avoid keeping identical copies of the same
+SourceRefs and strings.
+
+Most nodes of a CAST refer to one SourceRef, and many of them refer to
+the same span of the source (i.e. the nodes created for one statement), so
+each distinct SourceRef is only created once per file. Identifiers and fullids
+are interned with sys.intern, so equal strings are one object: they take
+memory once, and comparing them (i.e. as dictionary keys) is an identity check.
+
+The SourceRefs of an InternTable are shared, so they must not be changed
+in place: a node whose span changes gets another SourceRef. The source_refs
+list of every node is its own, so appending to it doesn't affect other nodes.
+"""
+import sys
+import typing
+
+from skema.program_analysis.CAST2FN.model.cast import SourceRef
+
+
+class InternTable:
+    """Class InternTable
+    Holds the SourceRefs of the nodes of one file, one per distinct span.
+
+    Current Fields:
+        - source_refs_table: The SourceRef of every
+                            (source_file_name, col_start, col_end, row_start, row_end)
+    """
+
+    def __init__(self):
+        self.source_refs_table: typing.Dict[tuple, SourceRef] = {}
+
+    def source_ref(
+        self, source_file_name=None, col_start=None, col_end=None, row_start=None, row_end=None
+    ) -> SourceRef:
+        """Returns the SourceRef of the given span, created the first time it's asked for"""
+        key = (source_file_name, col_start, col_end, row_start, row_end)
+        source_ref = self.source_refs_table.get(key)
+        if source_ref is None:
+            source_ref = self.source_refs_table[key] = SourceRef(
+                self.name(source_file_name), col_start, col_end, row_start, row_end
+            )
+        return source_ref
+
+    def source_refs(
+        self, source_file_name=None, col_start=None, col_end=None, row_start=None, row_end=None
+    ) -> typing.List[SourceRef]:
+        """Returns a new list holding only the (shared) SourceRef of the given span,
+        for the source_refs of a node"""
+        return [
+            self.source_ref(source_file_name, col_start, col_end, row_start, row_end)
+        ]
+
+    def intern_source_ref(self, source_ref: SourceRef) -> SourceRef:
+        """Returns the SourceRef of the table with the same span as source_ref,
+        which becomes the table's if there's none yet"""
+        key = (
+            source_ref.source_file_name,
+            source_ref.col_start,
+            source_ref.col_end,
+            source_ref.row_start,
+            source_ref.row_end,
+        )
+        return self.source_refs_table.setdefault(key, source_ref)
+
+    @staticmethod
+    def name(name):
+        """Returns the interned copy of name (i.e. an identifier or a fullid),
+        or name itself if it isn't a string"""
+        if type(name) is str:
+            return sys.intern(name)
+        return name
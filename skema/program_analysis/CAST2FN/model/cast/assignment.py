@@ -17,7 +17,8 @@ import six
 from skema.program_analysis.CAST2FN.model.cast.ast_node import AstNode  # noqa: F401,E501
 
 class Assignment(AstNode):
-    """NOTE: This class is auto generated by the swagger code generator program.
+    """NOTE: This class is auto generated by the swagger code generator program,
+    and made slotted by scripts/codegen_swagger_models.py.
 
     Do not edit the class manually.
     """
@@ -28,6 +29,10 @@ class Assignment(AstNode):
       attribute_map (dict): The key is attribute name
                             and the value is json key in definition.
     """
+    __slots__ = ('left', 'right')
+
+    discriminator = None
+
     swagger_types = {
         'left': 'AstNode',
         'right': 'AstNode'
@@ -44,57 +49,10 @@ class Assignment(AstNode):
 
     def __init__(self, left=None, right=None, *args, **kwargs):  # noqa: E501
         """Assignment - a model defined in Swagger"""  # noqa: E501
-        self._left = None
-        self._right = None
-        self.discriminator = None
-        if left is not None:
-            self.left = left
-        if right is not None:
-            self.right = right
+        self.left = left
+        self.right = right
         AstNode.__init__(self, *args, **kwargs)
 
-    @property
-    def left(self):
-        """Gets the left of this Assignment.  # noqa: E501
-
-
-        :return: The left of this Assignment.  # noqa: E501
-        :rtype: AstNode
-        """
-        return self._left
-
-    @left.setter
-    def left(self, left):
-        """Sets the left of this Assignment.
-
-
-        :param left: The left of this Assignment.  # noqa: E501
-        :type: AstNode
-        """
-
-        self._left = left
-
-    @property
-    def right(self):
-        """Gets the right of this Assignment.  # noqa: E501
-
-
-        :return: The right of this Assignment.  # noqa: E501
-        :rtype: AstNode
-        """
-        return self._right
-
-    @right.setter
-    def right(self, right):
-        """Sets the right of this Assignment.
-
-
-        :param right: The right of this Assignment.  # noqa: E501
-        :type: AstNode
-        """
-
-        self._right = right
-
     def to_dict(self):
         """Returns the model properties as a dict"""
         result = {}
@@ -135,7 +93,10 @@ class Assignment(AstNode):
         if not isinstance(other, Assignment):
             return False
 
-        return self.__dict__ == other.__dict__
+        if self.swagger_types.keys() != other.swagger_types.keys():
+            return False
+        return all(getattr(self, attr) == getattr(other, attr)
+                   for attr in self.swagger_types)
 
     def __ne__(self, other):
         """Returns true if both objects are not equal"""
@@ -16,7 +16,8 @@ import re  # noqa: F401
 import six
 
 class AstNode(object):
-    """NOTE: This class is auto generated by the swagger code generator program.
+    """NOTE: This class is auto generated by the swagger code generator program,
+    and made slotted by scripts/codegen_swagger_models.py.
 
     Do not edit the class manually.
     """
@@ -27,6 +28,10 @@ class AstNode(object):
       attribute_map (dict): The key is attribute name
                             and the value is json key in definition.
     """
+    __slots__ = ('source_refs',)
+
+    discriminator = None
+
     swagger_types = {
         'source_refs': 'list[SourceRef]'
     }
@@ -37,31 +42,7 @@ class AstNode(object):
 
     def __init__(self, source_refs=None):  # noqa: E501
         """AstNode - a model defined in Swagger"""  # noqa: E501
-        self._source_refs = None
-        self.discriminator = None
-        if source_refs is not None:
-            self.source_refs = source_refs
-
-    @property
-    def source_refs(self):
-        """Gets the source_refs of this AstNode.  # noqa: E501
-
-
-        :return: The source_refs of this AstNode.  # noqa: E501
-        :rtype: list[SourceRef]
-        """
-        return self._source_refs
-
-    @source_refs.setter
-    def source_refs(self, source_refs):
-        """Sets the source_refs of this AstNode.
-
-
-        :param source_refs: The source_refs of this AstNode.  # noqa: E501
-        :type: list[SourceRef]
-        """
-
-        self._source_refs = source_refs
+        self.source_refs = source_refs
 
     def to_dict(self):
         """Returns the model properties as a dict"""
@@ -103,7 +84,10 @@ class AstNode(object):
         if not isinstance(other, AstNode):
             return False
 
-        return self.__dict__ == other.__dict__
+        if self.swagger_types.keys() != other.swagger_types.keys():
+            return False
+        return all(getattr(self, attr) == getattr(other, attr)
+                   for attr in self.swagger_types)
 
     def __ne__(self, other):
         """Returns true if both objects are not equal"""
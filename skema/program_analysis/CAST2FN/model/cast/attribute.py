@@ -17,7 +17,8 @@ import six
 from skema.program_analysis.CAST2FN.model.cast.ast_node import AstNode  # noqa: F401,E501
 
 class Attribute(AstNode):
-    """NOTE: This class is auto generated by the swagger code generator program.
+    """NOTE: This class is auto generated by the swagger code generator program,
+    and made slotted by scripts/codegen_swagger_models.py.
 
     Do not edit the class manually.
     """
@@ -28,6 +29,10 @@ class Attribute(AstNode):
       attribute_map (dict): The key is attribute name
                             and the value is json key in definition.
     """
+    __slots__ = ('value', 'attr')
+
+    discriminator = None
+
     swagger_types = {
         'value': 'AstNode',
         'attr': 'Name'
@@ -44,57 +49,10 @@ class Attribute(AstNode):
 
     def __init__(self, value=None, attr=None, *args, **kwargs):  # noqa: E501
         """Attribute - a model defined in Swagger"""  # noqa: E501
-        self._value = None
-        self._attr = None
-        self.discriminator = None
-        if value is not None:
-            self.value = value
-        if attr is not None:
-            self.attr = attr
+        self.value = value
+        self.attr = attr
         AstNode.__init__(self, *args, **kwargs)
 
-    @property
-    def value(self):
-        """Gets the value of this Attribute.  # noqa: E501
-
-
-        :return: The value of this Attribute.  # noqa: E501
-        :rtype: AstNode
-        """
-        return self._value
-
-    @value.setter
-    def value(self, value):
-        """Sets the value of this Attribute.
-
-
-        :param value: The value of this Attribute.  # noqa: E501
-        :type: AstNode
-        """
-
-        self._value = value
-
-    @property
-    def attr(self):
-        """Gets the attr of this Attribute.  # noqa: E501
-
-
-        :return: The attr of this Attribute.  # noqa: E501
-        :rtype: Name
-        """
-        return self._attr
-
-    @attr.setter
-    def attr(self, attr):
-        """Sets the attr of this Attribute.
-
-
-        :param attr: The attr of this Attribute.  # noqa: E501
-        :type: Name
-        """
-
-        self._attr = attr
-
     def to_dict(self):
         """Returns the model properties as a dict"""
         result = {}
@@ -135,7 +93,10 @@ class Attribute(AstNode):
         if not isinstance(other, Attribute):
             return False
 
-        return self.__dict__ == other.__dict__
+        if self.swagger_types.keys() != other.swagger_types.keys():
+            return False
+        return all(getattr(self, attr) == getattr(other, attr)
+                   for attr in self.swagger_types)
 
     def __ne__(self, other):
         """Returns true if both objects are not equal"""
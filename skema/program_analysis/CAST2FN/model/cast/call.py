@@ -17,7 +17,8 @@ import six
 from skema.program_analysis.CAST2FN.model.cast.ast_node import AstNode  # noqa: F401,E501
 
 class Call(AstNode):
-    """NOTE: This class is auto generated by the swagger code generator program.
+    """NOTE: This class is auto generated by the swagger code generator program,
+    and made slotted by scripts/codegen_swagger_models.py.
 
     Do not edit the class manually.
     """
@@ -28,6 +29,10 @@ class Call(AstNode):
       attribute_map (dict): The key is attribute name
                             and the value is json key in definition.
     """
+    __slots__ = ('func', 'source_language', 'source_language_version', 'arguments')
+
+    discriminator = None
+
     swagger_types = {
         'func': 'AstNode',
         'source_language': 'str',
@@ -48,109 +53,12 @@ class Call(AstNode):
 
     def __init__(self, func=None, source_language=None, source_language_version=None, arguments=None, *args, **kwargs):  # noqa: E501
         """Call - a model defined in Swagger"""  # noqa: E501
-        self._func = None
-        self._source_language = None
-        self._source_language_version = None
-        self._arguments = None
-        self.discriminator = None
-        if func is not None:
-            self.func = func
-        if source_language is not None:
-            self.source_language = source_language
-        if source_language_version is not None:
-            self.source_language_version = source_language_version
-        if arguments is not None:
-            self.arguments = arguments
+        self.func = func
+        self.source_language = source_language
+        self.source_language_version = source_language_version
+        self.arguments = arguments
         AstNode.__init__(self, *args, **kwargs)
 
-    @property
-    def func(self):
-        """Gets the func of this Call.  # noqa: E501
-
-
-        :return: The func of this Call.  # noqa: E501
-        :rtype: AstNode
-        """
-        return self._func
-
-    @func.setter
-    def func(self, func):
-        """Sets the func of this Call.
-
-
-        :param func: The func of this Call.  # noqa: E501
-        :type: AstNode
-        """
-
-        self._func = func
-
-    @property
-    def source_language(self):
-        """Gets the source_language of this Call.  # noqa: E501
-
-        The source language base name (e.g., \"Python\", \"C\", \"Fortran\")  # noqa: E501
-
-        :return: The source_language of this Call.  # noqa: E501
-        :rtype: str
-        """
-        return self._source_language
-
-    @source_language.setter
-    def source_language(self, source_language):
-        """Sets the source_language of this Call.
-
-        The source language base name (e.g., \"Python\", \"C\", \"Fortran\")  # noqa: E501
-
-        :param source_language: The source_language of this Call.  # noqa: E501
-        :type: str
-        """
-
-        self._source_language = source_language
-
-    @property
-    def source_language_version(self):
-        """Gets the source_language_version of this Call.  # noqa: E501
-
-        The version of the source language (e.g., \"3.10.9\")  # noqa: E501
-
-        :return: The source_language_version of this Call.  # noqa: E501
-        :rtype: str
-        """
-        return self._source_language_version
-
-    @source_language_version.setter
-    def source_language_version(self, source_language_version):
-        """Sets the source_language_version of this Call.
-
-        The version of the source language (e.g., \"3.10.9\")  # noqa: E501
-
-        :param source_language_version: The source_language_version of this Call.  # noqa: E501
-        :type: str
-        """
-
-        self._source_language_version = source_language_version
-
-    @property
-    def arguments(self):
-        """Gets the arguments of this Call.  # noqa: E501
-
-
-        :return: The arguments of this Call.  # noqa: E501
-        :rtype: list[AstNode]
-        """
-        return self._arguments
-
-    @arguments.setter
-    def arguments(self, arguments):
-        """Sets the arguments of this Call.
-
-
-        :param arguments: The arguments of this Call.  # noqa: E501
-        :type: list[AstNode]
-        """
-
-        self._arguments = arguments
-
     def to_dict(self):
         """Returns the model properties as a dict"""
         result = {}
@@ -191,7 +99,10 @@ class Call(AstNode):
         if not isinstance(other, Call):
             return False
 
-        return self.__dict__ == other.__dict__
+        if self.swagger_types.keys() != other.swagger_types.keys():
+            return False
+        return all(getattr(self, attr) == getattr(other, attr)
+                   for attr in self.swagger_types)
 
     def __ne__(self, other):
         """Returns true if both objects are not equal"""
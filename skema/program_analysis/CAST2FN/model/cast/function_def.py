@@ -17,7 +17,8 @@ import six
 from skema.program_analysis.CAST2FN.model.cast.ast_node import AstNode  # noqa: F401,E501
 
 class FunctionDef(AstNode):
-    """NOTE: This class is auto generated by the swagger code generator program.
+    """NOTE: This class is auto generated by the swagger code generator program,
+    and made slotted by scripts/codegen_swagger_models.py.
 
     Do not edit the class manually.
     """
@@ -28,6 +29,10 @@ class FunctionDef(AstNode):
       attribute_map (dict): The key is attribute name
                             and the value is json key in definition.
     """
+    __slots__ = ('name', 'func_args', 'body')
+
+    discriminator = None
+
     swagger_types = {
         'name': 'str',
         'func_args': 'list[Var]',
@@ -46,81 +51,11 @@ class FunctionDef(AstNode):
 
     def __init__(self, name=None, func_args=None, body=None, *args, **kwargs):  # noqa: E501
         """FunctionDef - a model defined in Swagger"""  # noqa: E501
-        self._name = None
-        self._func_args = None
-        self._body = None
-        self.discriminator = None
-        if name is not None:
-            self.name = name
-        if func_args is not None:
-            self.func_args = func_args
-        if body is not None:
-            self.body = body
+        self.name = name
+        self.func_args = func_args
+        self.body = body
         AstNode.__init__(self, *args, **kwargs)
 
-    @property
-    def name(self):
-        """Gets the name of this FunctionDef.  # noqa: E501
-
-
-        :return: The name of this FunctionDef.  # noqa: E501
-        :rtype: str
-        """
-        return self._name
-
-    @name.setter
-    def name(self, name):
-        """Sets the name of this FunctionDef.
-
-
-        :param name: The name of this FunctionDef.  # noqa: E501
-        :type: str
-        """
-
-        self._name = name
-
-    @property
-    def func_args(self):
-        """Gets the func_args of this FunctionDef.  # noqa: E501
-
-
-        :return: The func_args of this FunctionDef.  # noqa: E501
-        :rtype: list[Var]
-        """
-        return self._func_args
-
-    @func_args.setter
-    def func_args(self, func_args):
-        """Sets the func_args of this FunctionDef.
-
-
-        :param func_args: The func_args of this FunctionDef.  # noqa: E501
-        :type: list[Var]
-        """
-
-        self._func_args = func_args
-
-    @property
-    def body(self):
-        """Gets the body of this FunctionDef.  # noqa: E501
-
-
-        :return: The body of this FunctionDef.  # noqa: E501
-        :rtype: list[AstNode]
-        """
-        return self._body
-
-    @body.setter
-    def body(self, body):
-        """Sets the body of this FunctionDef.
-
-
-        :param body: The body of this FunctionDef.  # noqa: E501
-        :type: list[AstNode]
-        """
-
-        self._body = body
-
     def to_dict(self):
         """Returns the model properties as a dict"""
         result = {}
@@ -161,7 +96,10 @@ class FunctionDef(AstNode):
         if not isinstance(other, FunctionDef):
             return False
 
-        return self.__dict__ == other.__dict__
+        if self.swagger_types.keys() != other.swagger_types.keys():
+            return False
+        return all(getattr(self, attr) == getattr(other, attr)
+                   for attr in self.swagger_types)
 
     def __ne__(self, other):
         """Returns true if both objects are not equal"""
@@ -17,7 +17,8 @@ import six
 from skema.program_analysis.CAST2FN.model.cast.ast_node import AstNode  # noqa: F401,E501
 
 class LiteralValue(AstNode):
-    """NOTE: This class is auto generated by the swagger code generator program.
+    """NOTE: This class is auto generated by the swagger code generator program,
+    and made slotted by scripts/codegen_swagger_models.py.
 
     Do not edit the class manually.
     """
@@ -28,6 +29,10 @@ class LiteralValue(AstNode):
       attribute_map (dict): The key is attribute name
                             and the value is json key in definition.
     """
+    __slots__ = ('value_type', 'value', 'source_code_data_type')
+
+    discriminator = None
+
     swagger_types = {
         'value_type': 'str',
         'value': 'object',
@@ -46,81 +51,11 @@ class LiteralValue(AstNode):
 
     def __init__(self, value_type=None, value=None, source_code_data_type=None, *args, **kwargs):  # noqa: E501
         """LiteralValue - a model defined in Swagger"""  # noqa: E501
-        self._value_type = None
-        self._value = None
-        self._source_code_data_type = None
-        self.discriminator = None
-        if value_type is not None:
-            self.value_type = value_type
-        if value is not None:
-            self.value = value
-        if source_code_data_type is not None:
-            self.source_code_data_type = source_code_data_type
+        self.value_type = value_type
+        self.value = value
+        self.source_code_data_type = source_code_data_type
         AstNode.__init__(self, *args, **kwargs)
 
-    @property
-    def value_type(self):
-        """Gets the value_type of this LiteralValue.  # noqa: E501
-
-
-        :return: The value_type of this LiteralValue.  # noqa: E501
-        :rtype: str
-        """
-        return self._value_type
-
-    @value_type.setter
-    def value_type(self, value_type):
-        """Sets the value_type of this LiteralValue.
-
-
-        :param value_type: The value_type of this LiteralValue.  # noqa: E501
-        :type: str
-        """
-
-        self._value_type = value_type
-
-    @property
-    def value(self):
-        """Gets the value of this LiteralValue.  # noqa: E501
-
-
-        :return: The value of this LiteralValue.  # noqa: E501
-        :rtype: object
-        """
-        return self._value
-
-    @value.setter
-    def value(self, value):
-        """Sets the value of this LiteralValue.
-
-
-        :param value: The value of this LiteralValue.  # noqa: E501
-        :type: object
-        """
-
-        self._value = value
-
-    @property
-    def source_code_data_type(self):
-        """Gets the source_code_data_type of this LiteralValue.  # noqa: E501
-
-
-        :return: The source_code_data_type of this LiteralValue.  # noqa: E501
-        :rtype: list[SourceCodeDataType]
-        """
-        return self._source_code_data_type
-
-    @source_code_data_type.setter
-    def source_code_data_type(self, source_code_data_type):
-        """Sets the source_code_data_type of this LiteralValue.
-
-
-        :param source_code_data_type: The source_code_data_type of this LiteralValue.  # noqa: E501
-        :type: list[SourceCodeDataType]
-        """
-
-        self._source_code_data_type = source_code_data_type
-
     def to_dict(self):
         """Returns the model properties as a dict"""
         result = {}
@@ -161,7 +96,10 @@ class LiteralValue(AstNode):
         if not isinstance(other, LiteralValue):
             return False
 
-        return self.__dict__ == other.__dict__
+        if self.swagger_types.keys() != other.swagger_types.keys():
+            return False
+        return all(getattr(self, attr) == getattr(other, attr)
+                   for attr in self.swagger_types)
 
     def __ne__(self, other):
         """Returns true if both objects are not equal"""
@@ -17,7 +17,8 @@ import six
 from skema.program_analysis.CAST2FN.model.cast.ast_node import AstNode  # noqa: F401,E501
 
 class Loop(AstNode):
-    """NOTE: This class is auto generated by the swagger code generator program.
+    """NOTE: This class is auto generated by the swagger code generator program,
+    and made slotted by scripts/codegen_swagger_models.py.
 
     Do not edit the class manually.
     """
@@ -28,6 +29,10 @@ class Loop(AstNode):
       attribute_map (dict): The key is attribute name
                             and the value is json key in definition.
     """
+    __slots__ = ('pre', 'expr', 'body', 'post')
+
+    discriminator = None
+
     swagger_types = {
         'pre': 'list[AstNode]',
         'expr': 'AstNode',
@@ -48,109 +53,12 @@ class Loop(AstNode):
 
     def __init__(self, pre=None, expr=None, body=None, post=None, *args, **kwargs):  # noqa: E501
         """Loop - a model defined in Swagger"""  # noqa: E501
-        self._pre = None
-        self._expr = None
-        self._body = None
-        self._post = None
-        self.discriminator = None
-        if pre is not None:
-            self.pre = pre
-        if expr is not None:
-            self.expr = expr
-        if body is not None:
-            self.body = body
-        if post is not None:
-            self.post = post
+        self.pre = pre
+        self.expr = expr
+        self.body = body
+        self.post = post
         AstNode.__init__(self, *args, **kwargs)
 
-    @property
-    def pre(self):
-        """Gets the pre of this Loop.  # noqa: E501
-
-        This holds any expressions related to initializing a loop. In general, this is populated as a result of Program Analysis translating a loop idiom from some source language, e.g., a Python for-loop involves specifying an iterator and calling _next on it (syntactically this happens implicitly in Python; behind the scenes, Python creates an iterator and calls _next on it).   # noqa: E501
-
-        :return: The pre of this Loop.  # noqa: E501
-        :rtype: list[AstNode]
-        """
-        return self._pre
-
-    @pre.setter
-    def pre(self, pre):
-        """Sets the pre of this Loop.
-
-        This holds any expressions related to initializing a loop. In general, this is populated as a result of Program Analysis translating a loop idiom from some source language, e.g., a Python for-loop involves specifying an iterator and calling _next on it (syntactically this happens implicitly in Python; behind the scenes, Python creates an iterator and calls _next on it).   # noqa: E501
-
-        :param pre: The pre of this Loop.  # noqa: E501
-        :type: list[AstNode]
-        """
-
-        self._pre = pre
-
-    @property
-    def expr(self):
-        """Gets the expr of this Loop.  # noqa: E501
-
-
-        :return: The expr of this Loop.  # noqa: E501
-        :rtype: AstNode
-        """
-        return self._expr
-
-    @expr.setter
-    def expr(self, expr):
-        """Sets the expr of this Loop.
-
-
-        :param expr: The expr of this Loop.  # noqa: E501
-        :type: AstNode
-        """
-
-        self._expr = expr
-
-    @property
-    def body(self):
-        """Gets the body of this Loop.  # noqa: E501
-
-
-        :return: The body of this Loop.  # noqa: E501
-        :rtype: list[AstNode]
-        """
-        return self._body
-
-    @body.setter
-    def body(self, body):
-        """Sets the body of this Loop.
-
-
-        :param body: The body of this Loop.  # noqa: E501
-        :type: list[AstNode]
-        """
-
-        self._body = body
-
-    @property
-    def post(self):
-        """Gets the post of this Loop.  # noqa: E501
-
-        TODO.   # noqa: E501
-
-        :return: The post of this Loop.  # noqa: E501
-        :rtype: list[AstNode]
-        """
-        return self._post
-
-    @post.setter
-    def post(self, post):
-        """Sets the post of this Loop.
-
-        TODO.   # noqa: E501
-
-        :param post: The post of this Loop.  # noqa: E501
-        :type: list[AstNode]
-        """
-
-        self._post = post
-
     def to_dict(self):
         """Returns the model properties as a dict"""
         result = {}
@@ -191,7 +99,10 @@ class Loop(AstNode):
         if not isinstance(other, Loop):
             return False
 
-        return self.__dict__ == other.__dict__
+        if self.swagger_types.keys() != other.swagger_types.keys():
+            return False
+        return all(getattr(self, attr) == getattr(other, attr)
+                   for attr in self.swagger_types)
 
     def __ne__(self, other):
         """Returns true if both objects are not equal"""
@@ -17,7 +17,8 @@ import six
 from skema.program_analysis.CAST2FN.model.cast.ast_node import AstNode  # noqa: F401,E501
 
 class ModelContinue(AstNode):
-    """NOTE: This class is auto generated by the swagger code generator program.
+    """NOTE: This class is auto generated by the swagger code generator program,
+    and made slotted by scripts/codegen_swagger_models.py.
 
     Do not edit the class manually.
     """
@@ -28,6 +29,10 @@ class ModelContinue(AstNode):
       attribute_map (dict): The key is attribute name
                             and the value is json key in definition.
     """
+    __slots__ = ()
+
+    discriminator = None
+
     swagger_types = {
     }
     if hasattr(AstNode, "swagger_types"):
@@ -40,7 +45,6 @@ class ModelContinue(AstNode):
 
     def __init__(self, *args, **kwargs):  # noqa: E501
         """ModelContinue - a model defined in Swagger"""  # noqa: E501
-        self.discriminator = None
         AstNode.__init__(self, *args, **kwargs)
 
     def to_dict(self):
@@ -83,7 +87,10 @@ class ModelContinue(AstNode):
         if not isinstance(other, ModelContinue):
             return False
 
-        return self.__dict__ == other.__dict__
+        if self.swagger_types.keys() != other.swagger_types.keys():
+            return False
+        return all(getattr(self, attr) == getattr(other, attr)
+                   for attr in self.swagger_types)
 
     def __ne__(self, other):
         """Returns true if both objects are not equal"""
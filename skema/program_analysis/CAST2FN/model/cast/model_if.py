@@ -17,7 +17,8 @@ import six
 from skema.program_analysis.CAST2FN.model.cast.ast_node import AstNode  # noqa: F401,E501
 
 class ModelIf(AstNode):
-    """NOTE: This class is auto generated by the swagger code generator program.
+    """NOTE: This class is auto generated by the swagger code generator program,
+    and made slotted by scripts/codegen_swagger_models.py.
 
     Do not edit the class manually.
     """
@@ -28,6 +29,10 @@ class ModelIf(AstNode):
       attribute_map (dict): The key is attribute name
                             and the value is json key in definition.
     """
+    __slots__ = ('expr', 'body', 'orelse')
+
+    discriminator = None
+
     swagger_types = {
         'expr': 'AstNode',
         'body': 'list[AstNode]',
@@ -46,81 +51,11 @@ class ModelIf(AstNode):
 
     def __init__(self, expr=None, body=None, orelse=None, *args, **kwargs):  # noqa: E501
         """ModelIf - a model defined in Swagger"""  # noqa: E501
-        self._expr = None
-        self._body = None
-        self._orelse = None
-        self.discriminator = None
-        if expr is not None:
-            self.expr = expr
-        if body is not None:
-            self.body = body
-        if orelse is not None:
-            self.orelse = orelse
+        self.expr = expr
+        self.body = body
+        self.orelse = orelse
         AstNode.__init__(self, *args, **kwargs)
 
-    @property
-    def expr(self):
-        """Gets the expr of this ModelIf.  # noqa: E501
-
-
-        :return: The expr of this ModelIf.  # noqa: E501
-        :rtype: AstNode
-        """
-        return self._expr
-
-    @expr.setter
-    def expr(self, expr):
-        """Sets the expr of this ModelIf.
-
-
-        :param expr: The expr of this ModelIf.  # noqa: E501
-        :type: AstNode
-        """
-
-        self._expr = expr
-
-    @property
-    def body(self):
-        """Gets the body of this ModelIf.  # noqa: E501
-
-
-        :return: The body of this ModelIf.  # noqa: E501
-        :rtype: list[AstNode]
-        """
-        return self._body
-
-    @body.setter
-    def body(self, body):
-        """Sets the body of this ModelIf.
-
-
-        :param body: The body of this ModelIf.  # noqa: E501
-        :type: list[AstNode]
-        """
-
-        self._body = body
-
-    @property
-    def orelse(self):
-        """Gets the orelse of this ModelIf.  # noqa: E501
-
-
-        :return: The orelse of this ModelIf.  # noqa: E501
-        :rtype: list[AstNode]
-        """
-        return self._orelse
-
-    @orelse.setter
-    def orelse(self, orelse):
-        """Sets the orelse of this ModelIf.
-
-
-        :param orelse: The orelse of this ModelIf.  # noqa: E501
-        :type: list[AstNode]
-        """
-
-        self._orelse = orelse
-
     def to_dict(self):
         """Returns the model properties as a dict"""
         result = {}
@@ -161,7 +96,10 @@ class ModelIf(AstNode):
         if not isinstance(other, ModelIf):
             return False
 
-        return self.__dict__ == other.__dict__
+        if self.swagger_types.keys() != other.swagger_types.keys():
+            return False
+        return all(getattr(self, attr) == getattr(other, attr)
+                   for attr in self.swagger_types)
 
     def __ne__(self, other):
         """Returns true if both objects are not equal"""
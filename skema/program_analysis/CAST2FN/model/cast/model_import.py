@@ -17,7 +17,8 @@ import six
 from skema.program_analysis.CAST2FN.model.cast.ast_node import AstNode  # noqa: F401,E501
 
 class ModelImport(AstNode):
-    """NOTE: This class is auto generated by the swagger code generator program.
+    """NOTE: This class is auto generated by the swagger code generator program,
+    and made slotted by scripts/codegen_swagger_models.py.
 
     Do not edit the class manually.
     """
@@ -28,6 +29,10 @@ class ModelImport(AstNode):
       attribute_map (dict): The key is attribute name
                             and the value is json key in definition.
     """
+    __slots__ = ('name', 'alias', 'symbol', 'all')
+
+    discriminator = None
+
     swagger_types = {
         'name': 'str',
         'alias': 'str',
@@ -48,107 +53,12 @@ class ModelImport(AstNode):
 
     def __init__(self, name=None, alias=None, symbol=None, all=None, *args, **kwargs):  # noqa: E501
         """ModelImport - a model defined in Swagger"""  # noqa: E501
-        self._name = None
-        self._alias = None
-        self._symbol = None
-        self._all = None
-        self.discriminator = None
-        if name is not None:
-            self.name = name
-        if alias is not None:
-            self.alias = alias
-        if symbol is not None:
-            self.symbol = symbol
-        if all is not None:
-            self.all = all
+        self.name = name
+        self.alias = alias
+        self.symbol = symbol
+        self.all = all
         AstNode.__init__(self, *args, **kwargs)
 
-    @property
-    def name(self):
-        """Gets the name of this ModelImport.  # noqa: E501
-
-
-        :return: The name of this ModelImport.  # noqa: E501
-        :rtype: str
-        """
-        return self._name
-
-    @name.setter
-    def name(self, name):
-        """Sets the name of this ModelImport.
-
-
-        :param name: The name of this ModelImport.  # noqa: E501
-        :type: str
-        """
-
-        self._name = name
-
-    @property
-    def alias(self):
-        """Gets the alias of this ModelImport.  # noqa: E501
-
-
-        :return: The alias of this ModelImport.  # noqa: E501
-        :rtype: str
-        """
-        return self._alias
-
-    @alias.setter
-    def alias(self, alias):
-        """Sets the alias of this ModelImport.
-
-
-        :param alias: The alias of this ModelImport.  # noqa: E501
-        :type: str
-        """
-
-        self._alias = alias
-
-    @property
-    def symbol(self):
-        """Gets the symbol of this ModelImport.  # noqa: E501
-
-
-        :return: The symbol of this ModelImport.  # noqa: E501
-        :rtype: str
-        """
-        return self._symbol
-
-    @symbol.setter
-    def symbol(self, symbol):
-        """Sets the symbol of this ModelImport.
-
-
-        :param symbol: The symbol of this ModelImport.  # noqa: E501
-        :type: str
-        """
-
-        self._symbol = symbol
-
-    @property
-    def all(self):
-        """Gets the all of this ModelImport.  # noqa: E501
-
-        When true, then all of the symbols of the module are being imported (and Import.symbol will be empty)   # noqa: E501
-
-        :return: The all of this ModelImport.  # noqa: E501
-        :rtype: Bool
-        """
-        return self._all
-
-    @all.setter
-    def all(self, all):
-        """Sets the all of this ModelImport.
-
-        When true, then all of the symbols of the module are being imported (and Import.symbol will be empty)   # noqa: E501
-
-        :param all: The all of this ModelImport.  # noqa: E501
-        :type: Bool
-        """
-
-        self._all = all
-
     def to_dict(self):
         """Returns the model properties as a dict"""
         result = {}
@@ -189,7 +99,10 @@ class ModelImport(AstNode):
         if not isinstance(other, ModelImport):
             return False
 
-        return self.__dict__ == other.__dict__
+        if self.swagger_types.keys() != other.swagger_types.keys():
+            return False
+        return all(getattr(self, attr) == getattr(other, attr)
+                   for attr in self.swagger_types)
 
     def __ne__(self, other):
         """Returns true if both objects are not equal"""
@@ -17,7 +17,8 @@ import six
 from skema.program_analysis.CAST2FN.model.cast.ast_node import AstNode  # noqa: F401,E501
 
 class ModelReturn(AstNode):
-    """NOTE: This class is auto generated by the swagger code generator program.
+    """NOTE: This class is auto generated by the swagger code generator program,
+    and made slotted by scripts/codegen_swagger_models.py.
 
     Do not edit the class manually.
     """
@@ -28,6 +29,10 @@ class ModelReturn(AstNode):
       attribute_map (dict): The key is attribute name
                             and the value is json key in definition.
     """
+    __slots__ = ('value',)
+
+    discriminator = None
+
     swagger_types = {
         'value': 'AstNode'
     }
@@ -42,33 +47,9 @@ class ModelReturn(AstNode):
 
     def __init__(self, value=None, *args, **kwargs):  # noqa: E501
         """ModelReturn - a model defined in Swagger"""  # noqa: E501
-        self._value = None
-        self.discriminator = None
-        if value is not None:
-            self.value = value
+        self.value = value
         AstNode.__init__(self, *args, **kwargs)
 
-    @property
-    def value(self):
-        """Gets the value of this ModelReturn.  # noqa: E501
-
-
-        :return: The value of this ModelReturn.  # noqa: E501
-        :rtype: AstNode
-        """
-        return self._value
-
-    @value.setter
-    def value(self, value):
-        """Sets the value of this ModelReturn.
-
-
-        :param value: The value of this ModelReturn.  # noqa: E501
-        :type: AstNode
-        """
-
-        self._value = value
-
     def to_dict(self):
         """Returns the model properties as a dict"""
         result = {}
@@ -109,7 +90,10 @@ class ModelReturn(AstNode):
         if not isinstance(other, ModelReturn):
             return False
 
-        return self.__dict__ == other.__dict__
+        if self.swagger_types.keys() != other.swagger_types.keys():
+            return False
+        return all(getattr(self, attr) == getattr(other, attr)
+                   for attr in self.swagger_types)
 
     def __ne__(self, other):
         """Returns true if both objects are not equal"""
@@ -17,7 +17,8 @@ import six
 from skema.program_analysis.CAST2FN.model.cast.ast_node import AstNode  # noqa: F401,E501
 
 class Name(AstNode):
-    """NOTE: This class is auto generated by the swagger code generator program.
+    """NOTE: This class is auto generated by the swagger code generator program,
+    and made slotted by scripts/codegen_swagger_models.py.
 
     Do not edit the class manually.
     """
@@ -28,6 +29,10 @@ class Name(AstNode):
       attribute_map (dict): The key is attribute name
                             and the value is json key in definition.
     """
+    __slots__ = ('name', 'id')
+
+    discriminator = None
+
     swagger_types = {
         'name': 'str',
         'id': 'str'
@@ -44,57 +49,10 @@ class Name(AstNode):
 
     def __init__(self, name=None, id=None, *args, **kwargs):  # noqa: E501
         """Name - a model defined in Swagger"""  # noqa: E501
-        self._name = None
-        self._id = None
-        self.discriminator = None
-        if name is not None:
-            self.name = name
-        if id is not None:
-            self.id = id
+        self.name = name
+        self.id = id
         AstNode.__init__(self, *args, **kwargs)
 
-    @property
-    def name(self):
-        """Gets the name of this Name.  # noqa: E501
-
-
-        :return: The name of this Name.  # noqa: E501
-        :rtype: str
-        """
-        return self._name
-
-    @name.setter
-    def name(self, name):
-        """Sets the name of this Name.
-
-
-        :param name: The name of this Name.  # noqa: E501
-        :type: str
-        """
-
-        self._name = name
-
-    @property
-    def id(self):
-        """Gets the id of this Name.  # noqa: E501
-
-
-        :return: The id of this Name.  # noqa: E501
-        :rtype: str
-        """
-        return self._id
-
-    @id.setter
-    def id(self, id):
-        """Sets the id of this Name.
-
-
-        :param id: The id of this Name.  # noqa: E501
-        :type: str
-        """
-
-        self._id = id
-
     def to_dict(self):
         """Returns the model properties as a dict"""
         result = {}
@@ -135,7 +93,10 @@ class Name(AstNode):
         if not isinstance(other, Name):
             return False
 
-        return self.__dict__ == other.__dict__
+        if self.swagger_types.keys() != other.swagger_types.keys():
+            return False
+        return all(getattr(self, attr) == getattr(other, attr)
+                   for attr in self.swagger_types)
 
     def __ne__(self, other):
         """Returns true if both objects are not equal"""
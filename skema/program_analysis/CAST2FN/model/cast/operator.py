@@ -17,7 +17,8 @@ import six
 from skema.program_analysis.CAST2FN.model.cast.ast_node import AstNode  # noqa: F401,E501
 
 class Operator(AstNode):
-    """NOTE: This class is auto generated by the swagger code generator program.
+    """NOTE: This class is auto generated by the swagger code generator program,
+    and made slotted by scripts/codegen_swagger_models.py.
 
     Do not edit the class manually.
     """
@@ -28,6 +29,10 @@ class Operator(AstNode):
       attribute_map (dict): The key is attribute name
                             and the value is json key in definition.
     """
+    __slots__ = ('source_language', 'interpreter', 'version', 'op', 'operands')
+
+    discriminator = None
+
     swagger_types = {
         'source_language': 'str',
         'interpreter': 'str',
@@ -50,129 +55,13 @@ class Operator(AstNode):
 
     def __init__(self, source_language=None, interpreter=None, version=None, op=None, operands=None, *args, **kwargs):  # noqa: E501
         """Operator - a model defined in Swagger"""  # noqa: E501
-        self._source_language = None
-        self._interpreter = None
-        self._version = None
-        self._op = None
-        self._operands = None
-        self.discriminator = None
-        if source_language is not None:
-            self.source_language = source_language
-        if interpreter is not None:
-            self.interpreter = interpreter
-        if version is not None:
-            self.version = version
-        if op is not None:
-            self.op = op
-        if operands is not None:
-            self.operands = operands
+        self.source_language = source_language
+        self.interpreter = interpreter
+        self.version = version
+        self.op = op
+        self.operands = operands
         AstNode.__init__(self, *args, **kwargs)
 
-    @property
-    def source_language(self):
-        """Gets the source_language of this Operator.  # noqa: E501
-
-
-        :return: The source_language of this Operator.  # noqa: E501
-        :rtype: str
-        """
-        return self._source_language
-
-    @source_language.setter
-    def source_language(self, source_language):
-        """Sets the source_language of this Operator.
-
-
-        :param source_language: The source_language of this Operator.  # noqa: E501
-        :type: str
-        """
-
-        self._source_language = source_language
-
-    @property
-    def interpreter(self):
-        """Gets the interpreter of this Operator.  # noqa: E501
-
-
-        :return: The interpreter of this Operator.  # noqa: E501
-        :rtype: str
-        """
-        return self._interpreter
-
-    @interpreter.setter
-    def interpreter(self, interpreter):
-        """Sets the interpreter of this Operator.
-
-
-        :param interpreter: The interpreter of this Operator.  # noqa: E501
-        :type: str
-        """
-
-        self._interpreter = interpreter
-
-    @property
-    def version(self):
-        """Gets the version of this Operator.  # noqa: E501
-
-
-        :return: The version of this Operator.  # noqa: E501
-        :rtype: str
-        """
-        return self._version
-
-    @version.setter
-    def version(self, version):
-        """Sets the version of this Operator.
-
-
-        :param version: The version of this Operator.  # noqa: E501
-        :type: str
-        """
-
-        self._version = version
-
-    @property
-    def op(self):
-        """Gets the op of this Operator.  # noqa: E501
-
-
-        :return: The op of this Operator.  # noqa: E501
-        :rtype: str
-        """
-        return self._op
-
-    @op.setter
-    def op(self, op):
-        """Sets the op of this Operator.
-
-
-        :param op: The op of this Operator.  # noqa: E501
-        :type: str
-        """
-
-        self._op = op
-
-    @property
-    def operands(self):
-        """Gets the operands of this Operator.  # noqa: E501
-
-
-        :return: The operands of this Operator.  # noqa: E501
-        :rtype: list[AstNode]
-        """
-        return self._operands
-
-    @operands.setter
-    def operands(self, operands):
-        """Sets the operands of this Operator.
-
-
-        :param operands: The operands of this Operator.  # noqa: E501
-        :type: list[AstNode]
-        """
-
-        self._operands = operands
-
     def to_dict(self):
         """Returns the model properties as a dict"""
         result = {}
@@ -213,7 +102,10 @@ class Operator(AstNode):
         if not isinstance(other, Operator):
             return False
 
-        return self.__dict__ == other.__dict__
+        if self.swagger_types.keys() != other.swagger_types.keys():
+            return False
+        return all(getattr(self, attr) == getattr(other, attr)
+                   for attr in self.swagger_types)
 
     def __ne__(self, other):
         """Returns true if both objects are not equal"""
@@ -17,7 +17,8 @@ import six
 from skema.program_analysis.CAST2FN.model.cast.ast_node import AstNode  # noqa: F401,E501
 
 class RecordDef(AstNode):
-    """NOTE: This class is auto generated by the swagger code generator program.
+    """NOTE: This class is auto generated by the swagger code generator program,
+    and made slotted by scripts/codegen_swagger_models.py.
 
     Do not edit the class manually.
     """
@@ -28,6 +29,10 @@ class RecordDef(AstNode):
       attribute_map (dict): The key is attribute name
                             and the value is json key in definition.
     """
+    __slots__ = ('name', 'bases', 'funcs', 'fields')
+
+    discriminator = None
+
     swagger_types = {
         'name': 'str',
         'bases': 'list[str]',
@@ -48,105 +53,12 @@ class RecordDef(AstNode):
 
     def __init__(self, name=None, bases=None, funcs=None, fields=None, *args, **kwargs):  # noqa: E501
         """RecordDef - a model defined in Swagger"""  # noqa: E501
-        self._name = None
-        self._bases = None
-        self._funcs = None
-        self._fields = None
-        self.discriminator = None
-        if name is not None:
-            self.name = name
-        if bases is not None:
-            self.bases = bases
-        if funcs is not None:
-            self.funcs = funcs
-        if fields is not None:
-            self.fields = fields
+        self.name = name
+        self.bases = bases
+        self.funcs = funcs
+        self.fields = fields
         AstNode.__init__(self, *args, **kwargs)
 
-    @property
-    def name(self):
-        """Gets the name of this RecordDef.  # noqa: E501
-
-
-        :return: The name of this RecordDef.  # noqa: E501
-        :rtype: str
-        """
-        return self._name
-
-    @name.setter
-    def name(self, name):
-        """Sets the name of this RecordDef.
-
-
-        :param name: The name of this RecordDef.  # noqa: E501
-        :type: str
-        """
-
-        self._name = name
-
-    @property
-    def bases(self):
-        """Gets the bases of this RecordDef.  # noqa: E501
-
-
-        :return: The bases of this RecordDef.  # noqa: E501
-        :rtype: list[str]
-        """
-        return self._bases
-
-    @bases.setter
-    def bases(self, bases):
-        """Sets the bases of this RecordDef.
-
-
-        :param bases: The bases of this RecordDef.  # noqa: E501
-        :type: list[str]
-        """
-
-        self._bases = bases
-
-    @property
-    def funcs(self):
-        """Gets the funcs of this RecordDef.  # noqa: E501
-
-
-        :return: The funcs of this RecordDef.  # noqa: E501
-        :rtype: list[AstNode]
-        """
-        return self._funcs
-
-    @funcs.setter
-    def funcs(self, funcs):
-        """Sets the funcs of this RecordDef.
-
-
-        :param funcs: The funcs of this RecordDef.  # noqa: E501
-        :type: list[AstNode]
-        """
-
-        self._funcs = funcs
-
-    @property
-    def fields(self):
-        """Gets the fields of this RecordDef.  # noqa: E501
-
-
-        :return: The fields of this RecordDef.  # noqa: E501
-        :rtype: list[Var]
-        """
-        return self._fields
-
-    @fields.setter
-    def fields(self, fields):
-        """Sets the fields of this RecordDef.
-
-
-        :param fields: The fields of this RecordDef.  # noqa: E501
-        :type: list[Var]
-        """
-
-        self._fields = fields
-
     def to_dict(self):
         """Returns the model properties as a dict"""
         result = {}
@@ -187,7 +99,10 @@ class RecordDef(AstNode):
         if not isinstance(other, RecordDef):
             return False
 
-        return self.__dict__ == other.__dict__
+        if self.swagger_types.keys() != other.swagger_types.keys():
+            return False
+        return all(getattr(self, attr) == getattr(other, attr)
+                   for attr in self.swagger_types)
 
     def __ne__(self, other):
         """Returns true if both objects are not equal"""
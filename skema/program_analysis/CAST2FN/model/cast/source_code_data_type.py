@@ -16,7 +16,8 @@ import re  # noqa: F401
 import six
 
 class SourceCodeDataType(object):
-    """NOTE: This class is auto generated by the swagger code generator program.
+    """NOTE: This class is auto generated by the swagger code generator program,
+    and made slotted by scripts/codegen_swagger_models.py.
 
     Do not edit the class manually.
     """
@@ -27,6 +28,10 @@ class SourceCodeDataType(object):
       attribute_map (dict): The key is attribute name
                             and the value is json key in definition.
     """
+    __slots__ = ('source_language', 'source_language_version', 'data_type')
+
+    discriminator = None
+
     swagger_types = {
         'source_language': 'str',
         'source_language_version': 'str',
@@ -41,79 +46,9 @@ class SourceCodeDataType(object):
 
     def __init__(self, source_language=None, source_language_version=None, data_type=None):  # noqa: E501
         """SourceCodeDataType - a model defined in Swagger"""  # noqa: E501
-        self._source_language = None
-        self._source_language_version = None
-        self._data_type = None
-        self.discriminator = None
-        if source_language is not None:
-            self.source_language = source_language
-        if source_language_version is not None:
-            self.source_language_version = source_language_version
-        if data_type is not None:
-            self.data_type = data_type
-
-    @property
-    def source_language(self):
-        """Gets the source_language of this SourceCodeDataType.  # noqa: E501
-
-
-        :return: The source_language of this SourceCodeDataType.  # noqa: E501
-        :rtype: str
-        """
-        return self._source_language
-
-    @source_language.setter
-    def source_language(self, source_language):
-        """Sets the source_language of this SourceCodeDataType.
-
-
-        :param source_language: The source_language of this SourceCodeDataType.  # noqa: E501
-        :type: str
-        """
-
-        self._source_language = source_language
-
-    @property
-    def source_language_version(self):
-        """Gets the source_language_version of this SourceCodeDataType.  # noqa: E501
-
-
-        :return: The source_language_version of this SourceCodeDataType.  # noqa: E501
-        :rtype: str
-        """
-        return self._source_language_version
-
-    @source_language_version.setter
-    def source_language_version(self, source_language_version):
-        """Sets the source_language_version of this SourceCodeDataType.
-
-
-        :param source_language_version: The source_language_version of this SourceCodeDataType.  # noqa: E501
-        :type: str
-        """
-
-        self._source_language_version = source_language_version
-
-    @property
-    def data_type(self):
-        """Gets the data_type of this SourceCodeDataType.  # noqa: E501
-
-
-        :return: The data_type of this SourceCodeDataType.  # noqa: E501
-        :rtype: str
-        """
-        return self._data_type
-
-    @data_type.setter
-    def data_type(self, data_type):
-        """Sets the data_type of this SourceCodeDataType.
-
-
-        :param data_type: The data_type of this SourceCodeDataType.  # noqa: E501
-        :type: str
-        """
-
-        self._data_type = data_type
+        self.source_language = source_language
+        self.source_language_version = source_language_version
+        self.data_type = data_type
 
     def to_dict(self):
         """Returns the model properties as a dict"""
@@ -155,7 +90,10 @@ class SourceCodeDataType(object):
         if not isinstance(other, SourceCodeDataType):
             return False
 
-        return self.__dict__ == other.__dict__
+        if self.swagger_types.keys() != other.swagger_types.keys():
+            return False
+        return all(getattr(self, attr) == getattr(other, attr)
+                   for attr in self.swagger_types)
 
     def __ne__(self, other):
         """Returns true if both objects are not equal"""
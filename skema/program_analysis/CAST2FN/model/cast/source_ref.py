@@ -16,7 +16,8 @@ import re  # noqa: F401
 import six
 
 class SourceRef(object):
-    """NOTE: This class is auto generated by the swagger code generator program.
+    """NOTE: This class is auto generated by the swagger code generator program,
+    and made slotted by scripts/codegen_swagger_models.py.
 
     Do not edit the class manually.
     """
@@ -27,6 +28,10 @@ class SourceRef(object):
       attribute_map (dict): The key is attribute name
                             and the value is json key in definition.
     """
+    __slots__ = ('source_file_name', 'col_start', 'col_end', 'row_start', 'row_end')
+
+    discriminator = None
+
     swagger_types = {
         'source_file_name': 'str',
         'col_start': 'float',
@@ -45,127 +50,11 @@ class SourceRef(object):
 
     def __init__(self, source_file_name=None, col_start=None, col_end=None, row_start=None, row_end=None):  # noqa: E501
         """SourceRef - a model defined in Swagger"""  # noqa: E501
-        self._source_file_name = None
-        self._col_start = None
-        self._col_end = None
-        self._row_start = None
-        self._row_end = None
-        self.discriminator = None
-        if source_file_name is not None:
-            self.source_file_name = source_file_name
-        if col_start is not None:
-            self.col_start = col_start
-        if col_end is not None:
-            self.col_end = col_end
-        if row_start is not None:
-            self.row_start = row_start
-        if row_end is not None:
-            self.row_end = row_end
-
-    @property
-    def source_file_name(self):
-        """Gets the source_file_name of this SourceRef.  # noqa: E501
-
-
-        :return: The source_file_name of this SourceRef.  # noqa: E501
-        :rtype: str
-        """
-        return self._source_file_name
-
-    @source_file_name.setter
-    def source_file_name(self, source_file_name):
-        """Sets the source_file_name of this SourceRef.
-
-
-        :param source_file_name: The source_file_name of this SourceRef.  # noqa: E501
-        :type: str
-        """
-
-        self._source_file_name = source_file_name
-
-    @property
-    def col_start(self):
-        """Gets the col_start of this SourceRef.  # noqa: E501
-
-
-        :return: The col_start of this SourceRef.  # noqa: E501
-        :rtype: float
-        """
-        return self._col_start
-
-    @col_start.setter
-    def col_start(self, col_start):
-        """Sets the col_start of this SourceRef.
-
-
-        :param col_start: The col_start of this SourceRef.  # noqa: E501
-        :type: float
-        """
-
-        self._col_start = col_start
-
-    @property
-    def col_end(self):
-        """Gets the col_end of this SourceRef.  # noqa: E501
-
-
-        :return: The col_end of this SourceRef.  # noqa: E501
-        :rtype: float
-        """
-        return self._col_end
-
-    @col_end.setter
-    def col_end(self, col_end):
-        """Sets the col_end of this SourceRef.
-
-
-        :param col_end: The col_end of this SourceRef.  # noqa: E501
-        :type: float
-        """
-
-        self._col_end = col_end
-
-    @property
-    def row_start(self):
-        """Gets the row_start of this SourceRef.  # noqa: E501
-
-
-        :return: The row_start of this SourceRef.  # noqa: E501
-        :rtype: float
-        """
-        return self._row_start
-
-    @row_start.setter
-    def row_start(self, row_start):
-        """Sets the row_start of this SourceRef.
-
-
-        :param row_start: The row_start of this SourceRef.  # noqa: E501
-        :type: float
-        """
-
-        self._row_start = row_start
-
-    @property
-    def row_end(self):
-        """Gets the row_end of this SourceRef.  # noqa: E501
-
-
-        :return: The row_end of this SourceRef.  # noqa: E501
-        :rtype: float
-        """
-        return self._row_end
-
-    @row_end.setter
-    def row_end(self, row_end):
-        """Sets the row_end of this SourceRef.
-
-
-        :param row_end: The row_end of this SourceRef.  # noqa: E501
-        :type: float
-        """
-
-        self._row_end = row_end
+        self.source_file_name = source_file_name
+        self.col_start = col_start
+        self.col_end = col_end
+        self.row_start = row_start
+        self.row_end = row_end
 
     def to_dict(self):
         """Returns the model properties as a dict"""
@@ -207,7 +96,10 @@ class SourceRef(object):
         if not isinstance(other, SourceRef):
             return False
 
-        return self.__dict__ == other.__dict__
+        if self.swagger_types.keys() != other.swagger_types.keys():
+            return False
+        return all(getattr(self, attr) == getattr(other, attr)
+                   for attr in self.swagger_types)
 
     def __ne__(self, other):
         """Returns true if both objects are not equal"""
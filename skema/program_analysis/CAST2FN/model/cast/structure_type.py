@@ -16,7 +16,8 @@ import re  # noqa: F401
 import six
 
 class StructureType(object):
-    """NOTE: This class is auto generated by the swagger code generator program.
+    """NOTE: This class is auto generated by the swagger code generator program,
+    and made slotted by scripts/codegen_swagger_models.py.
 
     Do not edit the class manually.
     """
@@ -36,6 +37,10 @@ class StructureType(object):
       attribute_map (dict): The key is attribute name
                             and the value is json key in definition.
     """
+    __slots__ = ()
+
+    discriminator = None
+
     swagger_types = {
     }
 
@@ -44,7 +49,6 @@ class StructureType(object):
 
     def __init__(self):  # noqa: E501
         """StructureType - a model defined in Swagger"""  # noqa: E501
-        self.discriminator = None
 
     def to_dict(self):
         """Returns the model properties as a dict"""
@@ -86,7 +90,10 @@ class StructureType(object):
         if not isinstance(other, StructureType):
             return False
 
-        return self.__dict__ == other.__dict__
+        if self.swagger_types.keys() != other.swagger_types.keys():
+            return False
+        return all(getattr(self, attr) == getattr(other, attr)
+                   for attr in self.swagger_types)
 
     def __ne__(self, other):
         """Returns true if both objects are not equal"""
@@ -17,7 +17,8 @@ import six
 from skema.program_analysis.CAST2FN.model.cast.ast_node import AstNode  # noqa: F401,E501
 
 class ValueConstructor(AstNode):
-    """NOTE: This class is auto generated by the swagger code generator program.
+    """NOTE: This class is auto generated by the swagger code generator program,
+    and made slotted by scripts/codegen_swagger_models.py.
 
     Do not edit the class manually.
     """
@@ -28,6 +29,10 @@ class ValueConstructor(AstNode):
       attribute_map (dict): The key is attribute name
                             and the value is json key in definition.
     """
+    __slots__ = ('dim', 'operator', 'size', 'initial_value')
+
+    discriminator = None
+
     swagger_types = {
         'dim': 'object',
         'operator': 'object',
@@ -48,105 +53,12 @@ class ValueConstructor(AstNode):
 
     def __init__(self, dim=None, operator=None, size=None, initial_value=None, *args, **kwargs):  # noqa: E501
         """ValueConstructor - a model defined in Swagger"""  # noqa: E501
-        self._dim = None
-        self._operator = None
-        self._size = None
-        self._initial_value = None
-        self.discriminator = None
-        if dim is not None:
-            self.dim = dim
-        if operator is not None:
-            self.operator = operator
-        if size is not None:
-            self.size = size
-        if initial_value is not None:
-            self.initial_value = initial_value
+        self.dim = dim
+        self.operator = operator
+        self.size = size
+        self.initial_value = initial_value
         AstNode.__init__(self, *args, **kwargs)
 
-    @property
-    def dim(self):
-        """Gets the dim of this ValueConstructor.  # noqa: E501
-
-
-        :return: The dim of this ValueConstructor.  # noqa: E501
-        :rtype: object
-        """
-        return self._dim
-
-    @dim.setter
-    def dim(self, dim):
-        """Sets the dim of this ValueConstructor.
-
-
-        :param dim: The dim of this ValueConstructor.  # noqa: E501
-        :type: object
-        """
-
-        self._dim = dim
-
-    @property
-    def operator(self):
-        """Gets the operator of this ValueConstructor.  # noqa: E501
-
-
-        :return: The operator of this ValueConstructor.  # noqa: E501
-        :rtype: object
-        """
-        return self._operator
-
-    @operator.setter
-    def operator(self, operator):
-        """Sets the operator of this ValueConstructor.
-
-
-        :param operator: The operator of this ValueConstructor.  # noqa: E501
-        :type: object
-        """
-
-        self._operator = operator
-
-    @property
-    def size(self):
-        """Gets the size of this ValueConstructor.  # noqa: E501
-
-
-        :return: The size of this ValueConstructor.  # noqa: E501
-        :rtype: object
-        """
-        return self._size
-
-    @size.setter
-    def size(self, size):
-        """Sets the size of this ValueConstructor.
-
-
-        :param size: The size of this ValueConstructor.  # noqa: E501
-        :type: object
-        """
-
-        self._size = size
-
-    @property
-    def initial_value(self):
-        """Gets the initial_value of this ValueConstructor.  # noqa: E501
-
-
-        :return: The initial_value of this ValueConstructor.  # noqa: E501
-        :rtype: object
-        """
-        return self._initial_value
-
-    @initial_value.setter
-    def initial_value(self, initial_value):
-        """Sets the initial_value of this ValueConstructor.
-
-
-        :param initial_value: The initial_value of this ValueConstructor.  # noqa: E501
-        :type: object
-        """
-
-        self._initial_value = initial_value
-
     def to_dict(self):
         """Returns the model properties as a dict"""
         result = {}
@@ -187,7 +99,10 @@ class ValueConstructor(AstNode):
         if not isinstance(other, ValueConstructor):
             return False
 
-        return self.__dict__ == other.__dict__
+        if self.swagger_types.keys() != other.swagger_types.keys():
+            return False
+        return all(getattr(self, attr) == getattr(other, attr)
+                   for attr in self.swagger_types)
 
     def __ne__(self, other):
         """Returns true if both objects are not equal"""
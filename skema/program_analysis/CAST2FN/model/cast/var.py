@@ -17,7 +17,8 @@ import six
 from skema.program_analysis.CAST2FN.model.cast.ast_node import AstNode  # noqa: F401,E501
 
 class Var(AstNode):
-    """NOTE: This class is auto generated by the swagger code generator program.
+    """NOTE: This class is auto generated by the swagger code generator program,
+    and made slotted by scripts/codegen_swagger_models.py.
 
     Do not edit the class manually.
     """
@@ -28,6 +29,10 @@ class Var(AstNode):
       attribute_map (dict): The key is attribute name
                             and the value is json key in definition.
     """
+    __slots__ = ('val', 'type', 'default_value')
+
+    discriminator = None
+
     swagger_types = {
         'val': 'Name',
         'type': 'VarType',
@@ -46,81 +51,11 @@ class Var(AstNode):
 
     def __init__(self, val=None, type=None, default_value=None, *args, **kwargs):  # noqa: E501
         """Var - a model defined in Swagger"""  # noqa: E501
-        self._val = None
-        self._type = None
-        self._default_value = None
-        self.discriminator = None
-        if val is not None:
-            self.val = val
-        if type is not None:
-            self.type = type
-        if default_value is not None:
-            self.default_value = default_value
+        self.val = val
+        self.type = type
+        self.default_value = default_value
         AstNode.__init__(self, *args, **kwargs)
 
-    @property
-    def val(self):
-        """Gets the val of this Var.  # noqa: E501
-
-
-        :return: The val of this Var.  # noqa: E501
-        :rtype: Name
-        """
-        return self._val
-
-    @val.setter
-    def val(self, val):
-        """Sets the val of this Var.
-
-
-        :param val: The val of this Var.  # noqa: E501
-        :type: Name
-        """
-
-        self._val = val
-
-    @property
-    def type(self):
-        """Gets the type of this Var.  # noqa: E501
-
-
-        :return: The type of this Var.  # noqa: E501
-        :rtype: VarType
-        """
-        return self._type
-
-    @type.setter
-    def type(self, type):
-        """Sets the type of this Var.
-
-
-        :param type: The type of this Var.  # noqa: E501
-        :type: VarType
-        """
-
-        self._type = type
-
-    @property
-    def default_value(self):
-        """Gets the default_value of this Var.  # noqa: E501
-
-
-        :return: The default_value of this Var.  # noqa: E501
-        :rtype: LiteralValue
-        """
-        return self._default_value
-
-    @default_value.setter
-    def default_value(self, default_value):
-        """Sets the default_value of this Var.
-
-
-        :param default_value: The default_value of this Var.  # noqa: E501
-        :type: LiteralValue
-        """
-
-        self._default_value = default_value
-
     def to_dict(self):
         """Returns the model properties as a dict"""
         result = {}
@@ -161,7 +96,10 @@ class Var(AstNode):
         if not isinstance(other, Var):
             return False
 
-        return self.__dict__ == other.__dict__
+        if self.swagger_types.keys() != other.swagger_types.keys():
+            return False
+        return all(getattr(self, attr) == getattr(other, attr)
+                   for attr in self.swagger_types)
 
     def __ne__(self, other):
         """Returns true if both objects are not equal"""
@@ -16,7 +16,8 @@ import re  # noqa: F401
 import six
 
 class VarType(object):
-    """NOTE: This class is auto generated by the swagger code generator program.
+    """NOTE: This class is auto generated by the swagger code generator program,
+    and made slotted by scripts/codegen_swagger_models.py.
 
     Do not edit the class manually.
     """
@@ -27,6 +28,10 @@ class VarType(object):
       attribute_map (dict): The key is attribute name
                             and the value is json key in definition.
     """
+    __slots__ = ()
+
+    discriminator = None
+
     swagger_types = {
     }
 
@@ -35,7 +40,6 @@ class VarType(object):
 
     def __init__(self):  # noqa: E501
         """VarType - a model defined in Swagger"""  # noqa: E501
-        self.discriminator = None
 
     def to_dict(self):
         """Returns the model properties as a dict"""
@@ -77,7 +81,10 @@ class VarType(object):
         if not isinstance(other, VarType):
             return False
 
-        return self.__dict__ == other.__dict__
+        if self.swagger_types.keys() != other.swagger_types.keys():
+            return False
+        return all(getattr(self, attr) == getattr(other, attr)
+                   for attr in self.swagger_types)
 
     def __ne__(self, other):
         """Returns true if both objects are not equal"""
@@ -6,20 +6,32 @@ import yaml
 from yaml.loader import SafeLoader
 
 import os
+import threading
 from pathlib import Path
 
 BUILTINS_FILENAME = "python_builtins.yaml"
 BUILTINS = None
 
+# Guards the one time loading of the map, since the pipeline
+# may be run by several threads at once
+BUILTINS_LOCK = threading.Lock()
+
 def build_map():
     global BUILTINS
-    if BUILTINS == None: 
-        f_path = os.path.join(os.path.dirname(__file__), BUILTINS_FILENAME)
-        with open(f_path) as f:
-            BUILTINS = yaml.load(f, Loader=SafeLoader)
-        return True
-    else:
-        return False
+    with BUILTINS_LOCK:
+        if BUILTINS == None: 
+            f_path = os.path.join(os.path.dirname(__file__), BUILTINS_FILENAME)
+            with open(f_path) as f:
+                BUILTINS = yaml.load(f, Loader=SafeLoader)
+            return True
+        else:
+            return False
+
+def get_map():
+    # Returns the builtin map, building it first if necessary
+    # The map is only read after it's built, so it can be shared
+    build_map()
+    return BUILTINS
 
 def dump_map():
     if BUILTINS != None:
@@ -29,27 +41,31 @@ def dump_map():
         print("Built in map isn't generated yet")
         return False
 
-def check_builtin(func_name):
+def check_builtin(func_name, builtins=None):
     # Check if it's in the list of functions
     # Then check the actual operators afterwards
+    if builtins == None:
+        builtins = get_map()
 
-    if func_name in BUILTINS['Functions']:
+    if func_name in builtins['Functions']:
         return True
-    for op in BUILTINS['Operators']:
+    for op in builtins['Operators']:
         if func_name in op:
             return True
     
     return False
     
-def retrieve_operator(func_name):
+def retrieve_operator(func_name, builtins=None):
     # Returns the function name if it's a builtin function
     # Otherwise it returns the operator function name if it exists
     # TODO: Vincent double check this functionality
+    if builtins == None:
+        builtins = get_map()
 
-    if func_name in BUILTINS['Functions']:
+    if func_name in builtins['Functions']:
         return func_name
 
-    for op in BUILTINS['Operators']:
+    for op in builtins['Operators']:
         if func_name in op:
             return op[func_name]
 
@@ -0,0 +1,403 @@
+"""
+import_resolver.py resolves the imports of the programs we ingest statically,
+without importing anything.
+
+Resolving imports used to go through the import machinery: importlib.util.find_spec
+imports the parent packages of the modules it looks up, and looking up the
+functions of a module meant importing it, which runs the user's code and pulls
+its dependencies (i.e. numpy or torch) into the process that ingests it.
+
+Instead, modules are located with the path based finder, which only looks at
+the file system, and the symbols a module defines are read from its AST.
+Modules of the standard library that aren't written in Python (i.e. math) have
+no AST, so their symbols come from a precomputed table, python_stdlib_exports.json,
+that's generated by running this file:
+
+    python -m skema.program_analysis.PyAST2CAST.import_resolver
+
+The table is stored as JSON rather than YAML since it's loaded by every process
+that ingests a system (i.e. every worker of an isolated run), and the json
+module reads it in a fraction of the time a YAML loader takes.
+"""
+import ast
+import importlib.machinery
+import json
+import os
+import sys
+import threading
+from typing import Dict, Iterable, List, Optional, Set, Tuple
+
+from skema.program_analysis.PyAST2CAST.modules_list import (
+    BUILTINS,
+    find_local_module_spec,
+)
+
+STDLIB_EXPORTS_FILENAME = "python_stdlib_exports.json"
+STDLIB_EXPORTS = None
+
+# Guards the one time loading of the table, since the pipeline
+# may be run by several threads at once
+STDLIB_EXPORTS_LOCK = threading.Lock()
+
+# The attributes every module has, which dir() lists along with its symbols
+MODULE_ATTRIBUTES = {
+    "__builtins__",
+    "__cached__",
+    "__doc__",
+    "__file__",
+    "__loader__",
+    "__name__",
+    "__package__",
+    "__spec__",
+}
+
+# The exports of the modules that aren't part of the system being ingested
+# (standard library and installed packages) are the same for every system,
+# so they're shared by all the resolvers of the process
+LIBRARY_EXPORTS: Dict[str, Optional["ModuleExports"]] = {}
+LIBRARY_SPECS: Dict[str, object] = {}
+LIBRARY_LOCK = threading.RLock()
+
+
+def get_stdlib_exports() -> Dict[str, List[str]]:
+    """Returns the table of the symbols of the standard library modules
+    that aren't written in Python, loading it first if necessary"""
+    global STDLIB_EXPORTS
+    with STDLIB_EXPORTS_LOCK:
+        if STDLIB_EXPORTS == None:
+            f_path = os.path.join(os.path.dirname(__file__), STDLIB_EXPORTS_FILENAME)
+            with open(f_path) as f:
+                STDLIB_EXPORTS = json.load(f)["Modules"]
+    return STDLIB_EXPORTS
+
+
+def is_stdlib_module(module_name: str) -> bool:
+    return (
+        module_name in BUILTINS
+        or module_name in sys.builtin_module_names
+        or module_name in get_stdlib_exports()
+    )
+
+
+def find_library_spec(module_name: str):
+    """Returns the spec of a module of the standard library or an installed package,
+    found through the directories of sys.path without importing anything, or None"""
+    with LIBRARY_LOCK:
+        if module_name not in LIBRARY_SPECS:
+            LIBRARY_SPECS[module_name] = find_local_module_spec(
+                module_name, sys.path
+            )
+        return LIBRARY_SPECS[module_name]
+
+
+class ModuleExports:
+    """Class ModuleExports
+    The symbols of a module, read from its AST.
+
+    Current Fields:
+        - names: All the names bound in the module's namespace, like dir() of the module
+        - all: The names of the module's __all__, if it's defined statically, otherwise None
+    """
+
+    def __init__(self, names: Set[str], all: Optional[List[str]] = None):
+        self.names = names
+        self.all = all
+
+    def public_names(self) -> Iterable[str]:
+        """Returns the names that 'from module import *' binds"""
+        if self.all is not None:
+            return self.all
+        return [name for name in self.names if not name.startswith("_")]
+
+
+class ImportResolver:
+    """Class ImportResolver
+    Answers the questions the pipeline has about the imports of the system
+    being ingested, without importing anything: whether a module can be
+    imported, and whether a module defines a symbol.
+
+    Current Fields:
+        - search_path: The directories the user defined modules of the system are in
+        - virtual_modules: For systems ingested from memory, the set of names of the
+                    user defined modules that can be imported
+        - module_sources: For systems ingested from memory, a dictionary of the dotted
+                    names of the user defined modules to their source code
+        - module_exports: The index of the symbols of the user defined modules that
+                    were looked up, which are only read once per resolver
+    """
+
+    def __init__(
+        self,
+        search_path: Optional[List[str]] = None,
+        virtual_modules: Optional[Set[str]] = None,
+        module_sources: Optional[Dict[str, str]] = None,
+        module_exports: Optional[Dict[str, Optional[ModuleExports]]] = None,
+    ):
+        self.search_path = search_path
+        self.virtual_modules = virtual_modules
+        self.module_sources = module_sources
+        self.module_exports = module_exports if module_exports is not None else {}
+
+    def is_module(self, module_name: str) -> bool:
+        """Returns True if module_name can be imported, either from the system
+        being ingested, the standard library or an installed package"""
+        try:
+            if self.virtual_modules != None and module_name in self.virtual_modules:
+                return True
+            if self.module_sources != None and module_name in self.module_sources:
+                return True
+            if self.search_path != None and find_local_module_spec(
+                module_name, self.search_path
+            ):
+                return True
+            if is_stdlib_module(module_name) or module_name in sys.modules:
+                return True
+            return find_library_spec(module_name) != None
+        except:
+            return False
+
+    def defines(self, module_name: str, symbol: str) -> bool:
+        """Returns True if symbol is bound in the namespace of module_name"""
+        exports = self.exports(module_name)
+        return exports != None and symbol in exports.names
+
+    def exports(self, module_name: str) -> Optional[ModuleExports]:
+        """Returns the symbols of module_name, or None if it can't be found"""
+        if module_name in self.module_exports:
+            return self.module_exports[module_name]
+
+        source = self.find_system_source(module_name)
+        if source == None:
+            return library_exports(module_name)
+
+        # Guards against modules that import * from each other
+        self.module_exports[module_name] = ModuleExports(set())
+        exports = index_module(module_name, *source, self)
+        self.module_exports[module_name] = exports
+        return exports
+
+    def find_system_source(self, module_name: str) -> Optional[Tuple[str, bool]]:
+        """Returns the source code of a user defined module of the system, and
+        whether it's a package, or None if it isn't one of the system's modules"""
+        if self.module_sources != None:
+            if module_name not in self.module_sources:
+                return None
+            is_package = any(
+                name.startswith(module_name + ".") for name in self.module_sources
+            )
+            return self.module_sources[module_name], is_package
+
+        if self.search_path == None:
+            return None
+        try:
+            spec = find_local_module_spec(module_name, self.search_path)
+        except (ImportError, ValueError):
+            return None
+        return read_spec_source(spec)
+
+
+def read_spec_source(spec) -> Optional[Tuple[str, bool]]:
+    """Returns the source code of the module of spec and whether it's a package,
+    or None if the module isn't written in Python"""
+    if spec == None or spec.origin == None or not spec.origin.endswith(".py"):
+        return None
+    try:
+        with open(spec.origin, encoding="utf-8") as f:
+            source = f.read()
+    except (OSError, UnicodeDecodeError):
+        return None
+    return source, spec.submodule_search_locations != None
+
+
+def library_exports(module_name: str) -> Optional[ModuleExports]:
+    """Returns the symbols of a module of the standard library or an installed
+    package, or None if it can't be found"""
+    with LIBRARY_LOCK:
+        if module_name in LIBRARY_EXPORTS:
+            return LIBRARY_EXPORTS[module_name]
+
+        stdlib_exports = get_stdlib_exports()
+        if module_name in stdlib_exports:
+            exports = ModuleExports(set(stdlib_exports[module_name]))
+        else:
+            try:
+                source = read_spec_source(find_library_spec(module_name))
+            except (ImportError, ValueError):
+                source = None
+            if source == None:
+                exports = None
+            else:
+                LIBRARY_EXPORTS[module_name] = ModuleExports(set())
+                exports = index_module(module_name, *source, ImportResolver())
+        LIBRARY_EXPORTS[module_name] = exports
+        return exports
+
+
+def index_module(
+    module_name: str, source: str, is_package: bool, resolver: ImportResolver
+) -> ModuleExports:
+    """Reads the symbols of a module from its source code. 'import *' statements
+    are followed through resolver. Modules that can't be parsed have no symbols."""
+    try:
+        tree = ast.parse(source)
+    except (SyntaxError, ValueError):
+        return ModuleExports(set())
+
+    package = module_name if is_package else module_name.rpartition(".")[0]
+    names = set(MODULE_ATTRIBUTES)
+    if is_package:
+        names.add("__path__")
+    all_names = []
+    all_is_static = False
+
+    def bind_target(target):
+        if isinstance(target, ast.Name):
+            names.add(target.id)
+        elif isinstance(target, (ast.Tuple, ast.List)):
+            for elt in target.elts:
+                bind_target(elt)
+        elif isinstance(target, ast.Starred):
+            bind_target(target.value)
+
+    def literal_strings(node) -> Optional[List[str]]:
+        if not isinstance(node, (ast.List, ast.Tuple)):
+            return None
+        strings = []
+        for elt in node.elts:
+            if not isinstance(elt, ast.Constant) or not isinstance(elt.value, str):
+                return None
+            strings.append(elt.value)
+        return strings
+
+    def visit(statements):
+        nonlocal all_is_static
+        for node in statements:
+            if isinstance(node, (ast.FunctionDef, ast.AsyncFunctionDef, ast.ClassDef)):
+                names.add(node.name)
+            elif isinstance(node, ast.Assign):
+                for target in node.targets:
+                    bind_target(target)
+                    if isinstance(target, ast.Name) and target.id == "__all__":
+                        strings = literal_strings(node.value)
+                        all_is_static = strings is not None
+                        all_names[:] = strings or []
+            elif isinstance(node, (ast.AnnAssign, ast.AugAssign)):
+                bind_target(node.target)
+                if (
+                    isinstance(node, ast.AugAssign)
+                    and isinstance(node.target, ast.Name)
+                    and node.target.id == "__all__"
+                ):
+                    strings = literal_strings(node.value)
+                    if strings is None:
+                        all_is_static = False
+                    else:
+                        all_names.extend(strings)
+            elif isinstance(node, ast.Import):
+                for alias in node.names:
+                    names.add(alias.asname or alias.name.split(".")[0])
+            elif isinstance(node, ast.ImportFrom):
+                imported = node.module or ""
+                if node.level > 0:
+                    base = package.split(".") if package else []
+                    base = base[: len(base) - (node.level - 1)]
+                    imported = ".".join(base + ([imported] if imported else []))
+                for alias in node.names:
+                    if alias.name == "*":
+                        exports = resolver.exports(imported)
+                        if exports != None:
+                            names.update(exports.public_names())
+                    else:
+                        names.add(alias.asname or alias.name)
+            elif isinstance(node, (ast.For, ast.AsyncFor)):
+                bind_target(node.target)
+                visit(node.body)
+                visit(node.orelse)
+            elif isinstance(node, (ast.With, ast.AsyncWith)):
+                for item in node.items:
+                    if item.optional_vars is not None:
+                        bind_target(item.optional_vars)
+                visit(node.body)
+            elif isinstance(node, (ast.If, ast.While)):
+                visit(node.body)
+                visit(node.orelse)
+            elif isinstance(node, ast.Try):
+                visit(node.body)
+                for handler in node.handlers:
+                    if handler.name is not None:
+                        names.add(handler.name)
+                    visit(handler.body)
+                visit(node.orelse)
+                visit(node.finalbody)
+            elif (
+                isinstance(node, ast.Expr)
+                and isinstance(node.value, ast.Call)
+                and isinstance(node.value.func, ast.Attribute)
+                and isinstance(node.value.func.value, ast.Name)
+                and node.value.func.value.id == "__all__"
+            ):
+                # __all__.extend([...]) and __all__.append("...")
+                call = node.value
+                strings = None
+                if call.func.attr == "extend" and len(call.args) == 1:
+                    strings = literal_strings(call.args[0])
+                elif (
+                    call.func.attr == "append"
+                    and len(call.args) == 1
+                    and isinstance(call.args[0], ast.Constant)
+                    and isinstance(call.args[0].value, str)
+                ):
+                    strings = [call.args[0].value]
+                if strings is None:
+                    all_is_static = False
+                else:
+                    all_names.extend(strings)
+
+    visit(tree.body)
+    return ModuleExports(names, all_names if all_is_static else None)
+
+
+def generate_stdlib_exports() -> Dict[str, List[str]]:
+    """Imports every module of the standard library that isn't written in Python
+    and returns the table of their symbols. This is the only place modules are
+    imported, and it's only run to regenerate python_stdlib_exports.json."""
+    import importlib
+    import importlib.util
+
+    candidates = set(BUILTINS) | set(sys.builtin_module_names)
+    stdlib_dir = os.path.dirname(os.__file__)
+    for directory in (stdlib_dir, os.path.join(stdlib_dir, "lib-dynload")):
+        if os.path.isdir(directory):
+            for file in os.listdir(directory):
+                if file.endswith(tuple(importlib.machinery.EXTENSION_SUFFIXES)):
+                    candidates.add(file.split(".")[0])
+
+    table = {}
+    for module_name in sorted(candidates):
+        # CPython's own test modules
+        if module_name.startswith(("_test", "_xx", "xx", "_ctypes_test")):
+            continue
+        try:
+            spec = importlib.util.find_spec(module_name)
+            if spec == None or (spec.origin != None and spec.origin.endswith(".py")):
+                continue
+            if spec.submodule_search_locations != None:
+                continue
+            module = importlib.import_module(module_name)
+        except Exception:
+            continue
+        table[module_name] = sorted(dir(module))
+    return table
+
+
+if __name__ == "__main__":
+    table = generate_stdlib_exports()
+    with open(
+        os.path.join(os.path.dirname(__file__), STDLIB_EXPORTS_FILENAME), "w"
+    ) as f:
+        # The Python version the standard library modules were imported from
+        python_version = f"{sys.version_info.major}.{sys.version_info.minor}"
+        json.dump(
+            {"Python": python_version, "Modules": table}, f, indent=1, sort_keys=True
+        )
+        f.write("\n")
@@ -293,35 +293,65 @@ BUILTINS = [
     "zlib",
     "zoneinfo",
 ]
-import importlib
+import importlib.machinery
 
 
-def find_std_lib_module(module_name):
-    try:
-        library = importlib.util.find_spec(module_name)
-        if library == None:
-            return False
-        print(f"found {library.name}")
-        return True
-    except:
-        return False
+def find_local_module_spec(module_name, search_path):
+    """Looks for the module module_name in the directories of search_path only,
+    without importing anything. Dotted module names are looked up one package
+    at a time. Returns the module's spec, or None if it's not found there.
+    """
+    spec = None
+    for part in module_name.split("."):
+        spec = importlib.machinery.PathFinder.find_spec(part, search_path)
+        if spec == None:
+            return None
+        search_path = spec.submodule_search_locations
+        if search_path == None:
+            search_path = []
+    return spec
+
+
+def find_std_lib_module(module_name, search_path=None, virtual_modules=None):
+    """Checks if module_name can be found, either in the directories of
+    search_path (which is where the user defined modules of the system being
+    ingested live), the standard library or the installed packages.
+    Nothing is imported, see import_resolver.py.
+    virtual_modules is a set of the names of the user defined modules when the
+    system is ingested from memory instead of from disk.
+    """
+    # import_resolver imports BUILTINS from this module
+    from skema.program_analysis.PyAST2CAST.import_resolver import ImportResolver
 
+    found = ImportResolver(search_path, virtual_modules).is_module(module_name)
+    if found:
+        print(f"found {module_name}")
+    return found
 
-def find_func_in_module(module_name, func_name):
+
+def find_func_in_module(
+    module_name, func_name, search_path=None, module_cache=None, virtual_sources=None
+):
     """When a module is imported using
     'from x import *', all the functions for module x
     then become bound to the namespace but don't have their attributes attached to the module x
     That is, they're called using just their name as opposed to x.func_name().
-    This function attempts to find a function in such a module by importing it and then
-    using 'dir' to determine if func_name is within module_name's list of functions
+    This function finds out if func_name is within module_name's namespace by
+    reading the module's AST, without importing it (see import_resolver.py).
+
+    User defined modules are looked up in the directories of search_path, which
+    defaults to the working directory. The symbols of the modules that were read
+    are kept in the module_cache dictionary if one is given.
+
+    virtual_sources is a dictionary of module names to their source code, for
+    user defined modules that aren't on disk. These are looked up before search_path.
     """
-    # TODO: Metapath finder, find_spec
-    # TODO: cache the module objects to look back so we dont do multiple imports in a map
-    import os
-    import sys
+    from skema.program_analysis.PyAST2CAST.import_resolver import ImportResolver
 
-    sys.path.append(os.getcwd())
-    module_import = importlib.import_module(module_name)
+    if search_path == None and virtual_sources == None:
+        import os
 
-    funcs = list(dir(module_import))
-    return func_name in funcs
+        search_path = [os.getcwd()]
+    return ImportResolver(
+        search_path, module_sources=virtual_sources, module_exports=module_cache
+    ).defines(module_name, func_name)
@@ -1,11 +1,10 @@
 import ast
 from enum import unique
 import os
-import copy
 import sys
-from functools import singledispatchmethod
 
 from skema.utils.misc import uuid
+from skema.utils.dispatch import typedispatchmethod
 from skema.program_analysis.astpp import parseprint
 from skema.program_analysis.CAST2FN.model.cast import (
     AstNode,
@@ -32,10 +31,9 @@ from skema.program_analysis.CAST2FN.model.cast import (
     Var,
     ValueConstructor,
 )
-from skema.program_analysis.PyAST2CAST.modules_list import (
-    BUILTINS,
-    find_std_lib_module,
-)
+from skema.program_analysis.PyAST2CAST.modules_list import BUILTINS
+from skema.program_analysis.PyAST2CAST.import_resolver import ImportResolver
+from skema.program_analysis.CAST2FN.interning import InternTable
 
 def get_python_version():
     """
@@ -68,9 +66,9 @@ def merge_dicts(prev_scope, curr_scope):
         prev_scope (dict): Dictionary of name : ID pairs for variables in the enclosing scope
         curr_scope (dict): Dictionary of name : ID pairs for variables in the current scope
     """
-    for k in prev_scope.keys():
-        if k not in curr_scope.keys():
-            curr_scope[k] = prev_scope[k]
+    for k, v in prev_scope.items():
+        if k not in curr_scope:
+            curr_scope[k] = v
 
 
 def construct_unique_name(attr_name, var_name):
@@ -176,7 +174,14 @@ class PyASTToCAST:
         - global_identifier_dict
     """
 
-    def __init__(self, file_name: str, legacy: bool = False):
+    def __init__(
+        self,
+        file_name: str,
+        legacy: bool = False,
+        search_path=None,
+        virtual_modules=None,
+        intern_table=None,
+    ):
         """Initializes any auxiliary data structures that are used
         for generating CAST.
         The current data structures are:
@@ -196,6 +201,14 @@ class PyASTToCAST:
         - generated_fns: A list that holds any generated CAST Function Defs. Currently used for list/dict comprehensions
                   and lambda functions
         - "*_count": Identifier numbers used for list/dict comprehensions, and lambda functions
+        - search_path: A list of directories that imports of user defined modules are resolved against,
+                  usually the directory of the file being converted
+        - virtual_modules: A set of names of user defined modules that can be imported,
+                  used when the system is ingested from memory instead of from disk
+        - import_resolver: The ImportResolver that looks up the imported modules
+                  statically, from search_path and virtual_modules
+        - intern_table: The InternTable that the SourceRefs of the nodes come from, so
+                  that nodes of the same span of the source share their SourceRef
         """
 
         self.aliases = {}
@@ -211,6 +224,24 @@ class PyASTToCAST:
         self.list_comp_count = 0
         self.dict_comp_count = 0
         self.lambda_count = 0
+        self.search_path = search_path
+        self.virtual_modules = virtual_modules
+        self.import_resolver = ImportResolver(search_path, virtual_modules)
+        self.intern_table = (
+            intern_table if intern_table is not None else InternTable()
+        )
+
+    def node_source_refs(self, node):
+        """Returns the source_refs of the CAST nodes created for the PyAST node node,
+        which spans from its (lineno, col_offset) to its (end_lineno, end_col_offset)
+        in the file being visited"""
+        return self.intern_table.source_refs(
+            self.filenames[-1],
+            node.col_offset,
+            node.end_col_offset,
+            node.lineno,
+            node.end_lineno,
+        )
 
     def insert_next_id(self, scope_dict: dict, dict_key: str):
         """Given a scope_dictionary and a variable name as a key,
@@ -336,15 +367,7 @@ class PyASTToCAST:
         Either the conditional explicitly checks a value using a comparison operator or it doesnt
         In the case that it doesn't explicitly then we have to add in an explicit check
         """
-        ref = [
-            SourceRef(
-                source_file_name=self.filenames[-1],
-                col_start=node.col_offset,
-                col_end=node.end_col_offset,
-                row_start=node.lineno,
-                row_end=node.end_lineno,
-            )
-        ]
+        ref = self.node_source_refs(node)
         test_cond = self.visit(
             node.test, prev_scope_id_dict, curr_scope_id_dict
         )[0]
@@ -413,7 +436,7 @@ class PyASTToCAST:
 
         return test
 
-    @singledispatchmethod
+    @typedispatchmethod
     def visit(
         self, node: AstNode, prev_scope_id_dict, curr_scope_id_dict
     ):
@@ -431,15 +454,7 @@ class PyASTToCAST:
     ):
         # print("JoinedStr not generating CAST yet")
         str_pieces = []
-        ref = [
-            SourceRef(
-                source_file_name=self.filenames[-1],
-                col_start=node.col_offset,
-                col_end=node.end_col_offset,
-                row_start=node.lineno,
-                row_end=node.end_lineno,
-            )
-        ]
+        ref = self.node_source_refs(node)
         for s in node.values:
             source_code_data_type = ["Python", "3.8", str(type("str"))]
             if isinstance(s, ast.Str):
@@ -517,15 +532,7 @@ class PyASTToCAST:
     ):
         # print("Delete not generating CAST yet")
         source_code_data_type = ["Python", "3.8", "List"]
-        ref = [
-            SourceRef(
-                source_file_name=self.filenames[-1],
-                col_start=node.col_offset,
-                col_end=node.end_col_offset,
-                row_start=node.lineno,
-                row_end=node.end_lineno,
-            )
-        ]
+        ref = self.node_source_refs(node)
         return [
             LiteralValue(
                 StructureType.LIST,
@@ -543,15 +550,7 @@ class PyASTToCAST:
         curr_scope_id_dict,
     ):
         source_code_data_type = ["Python", "3.8", "Ellipsis"]
-        ref = [
-            SourceRef(
-                source_file_name=self.filenames[-1],
-                col_start=node.col_offset,
-                col_end=node.end_col_offset,
-                row_start=node.lineno,
-                row_end=node.end_lineno,
-            )
-        ]
+        ref = self.node_source_refs(node)
         return [
             LiteralValue(
                 ScalarType.ELLIPSIS, "...", source_code_data_type, ref
@@ -567,15 +566,9 @@ class PyASTToCAST:
     ):
         # print("Slice not generating CAST yet")
         source_code_data_type = ["Python", "3.8", "List"]
-        ref = [
-            SourceRef(
-                source_file_name=self.filenames[-1],
-                col_start=-1,
-                col_end=-1,
-                row_start=-1,
-                row_end=-1,
-            )
-        ]
+        ref = self.intern_table.source_refs(
+            self.filenames[-1], -1, -1, -1, -1
+        )
         return [
             LiteralValue(
                 StructureType.LIST,
@@ -594,15 +587,9 @@ class PyASTToCAST:
     ):
         # print("ExtSlice not generating CAST yet")
         source_code_data_type = ["Python", "3.8", "List"]
-        ref = [
-            SourceRef(
-                source_file_name=self.filenames[-1],
-                col_start=-1,
-                col_end=-1,
-                row_start=-1,
-                row_end=-1,
-            )
-        ]
+        ref = self.intern_table.source_refs(
+            self.filenames[-1], -1, -1, -1, -1
+        )
         return [
             LiteralValue(
                 StructureType.LIST,
@@ -631,15 +618,7 @@ class PyASTToCAST:
             Assignment: An assignment CAST node
         """
 
-        ref = [
-            SourceRef(
-                source_file_name=self.filenames[-1],
-                col_start=node.col_offset,
-                col_end=node.end_col_offset,
-                row_start=node.lineno,
-                row_end=node.end_lineno,
-            )
-        ]
+        ref = self.node_source_refs(node)
 
         left = []
         right = []
@@ -936,15 +915,7 @@ class PyASTToCAST:
 
         # x.T -> node.value: the node x (Name) -> node.attr is just "T"
 
-        ref = [
-            SourceRef(
-                source_file_name=self.filenames[-1],
-                col_start=node.col_offset,
-                col_end=node.end_col_offset,
-                row_start=node.lineno,
-                row_end=node.end_lineno,
-            )
-        ]
+        ref = self.node_source_refs(node)
 
         value_cast = self.visit(
             node.value, prev_scope_id_dict, curr_scope_id_dict
@@ -1091,15 +1062,7 @@ class PyASTToCAST:
         op = get_op(node.op)
         right = self.visit(node.right, prev_scope_id_dict, curr_scope_id_dict)
 
-        ref = [
-            SourceRef(
-                source_file_name=self.filenames[-1],
-                col_start=node.col_offset,
-                col_end=node.end_col_offset,
-                row_start=node.lineno,
-                row_end=node.end_lineno,
-            )
-        ]
+        ref = self.node_source_refs(node)
         leftb = []
         rightb = []
 
@@ -1138,15 +1101,7 @@ class PyASTToCAST:
 
         """
 
-        ref = [
-            SourceRef(
-                source_file_name=self.filenames[-1],
-                col_start=node.col_offset,
-                col_end=node.end_col_offset,
-                row_start=node.lineno,
-                row_end=node.end_lineno,
-            )
-        ]
+        ref = self.node_source_refs(node)
         return [ModelBreak(source_refs=ref)]
 
     def create_binary_compare_tree(self, node):
@@ -1280,15 +1235,7 @@ class PyASTToCAST:
         args = []
         func_args = []
         kw_args = []
-        ref = [
-            SourceRef(
-                source_file_name=self.filenames[-1],
-                col_start=node.col_offset,
-                col_end=node.end_col_offset,
-                row_start=node.lineno,
-                row_end=node.end_lineno,
-            )
-        ]
+        ref = self.node_source_refs(node)
 
         if len(node.args) > 0:
             for arg in node.args:
@@ -1526,15 +1473,7 @@ class PyASTToCAST:
                 attr_node = n.targets[0]
                 if isinstance(attr_node.value, ast.Attribute):
                     if attr_node.value.value == "self":
-                        ref = [
-                            SourceRef(
-                                source_file_name=self.filenames[-1],
-                                col_start=attr_node.col_offset,
-                                col_end=attr_node.end_col_offset,
-                                row_start=attr_node.lineno,
-                                row_end=attr_node.end_lineno,
-                            )
-                        ]
+                        ref = self.node_source_refs(attr_node)
                         # Need IDs for name, which one?
                         attr_id = self.insert_next_id(
                             curr_scope_id_dict, attr_node.value.attr
@@ -1551,15 +1490,7 @@ class PyASTToCAST:
                             )
                         )
                 elif attr_node.value.id == "self":
-                    ref = [
-                        SourceRef(
-                            source_file_name=self.filenames[-1],
-                            col_start=attr_node.col_offset,
-                            col_end=attr_node.end_col_offset,
-                            row_start=attr_node.lineno,
-                            row_end=attr_node.end_lineno,
-                        )
-                    ]
+                    ref = self.node_source_refs(attr_node)
                     # Need IDs for name, which one?
                     attr_id = self.insert_next_id(
                         curr_scope_id_dict, attr_node.attr
@@ -1633,15 +1564,7 @@ class PyASTToCAST:
                 ):
                     attr_node = func_node.targets[0]
                     if attr_node.value.id == "self":
-                        ref = [
-                            SourceRef(
-                                source_file_name=self.filenames[-1],
-                                col_start=attr_node.col_offset,
-                                col_end=attr_node.end_col_offset,
-                                row_start=attr_node.lineno,
-                                row_end=attr_node.end_lineno,
-                            )
-                        ]
+                        ref = self.node_source_refs(attr_node)
                         # Need IDs for name, which one?
                         attr_id = self.insert_next_id(
                             curr_scope_id_dict, attr_node.attr
@@ -1656,15 +1579,7 @@ class PyASTToCAST:
                             )
                         )
 
-        ref = [
-            SourceRef(
-                source_file_name=self.filenames[-1],
-                col_start=node.col_offset,
-                col_end=node.end_col_offset,
-                row_start=node.lineno,
-                row_end=node.end_lineno,
-            )
-        ]
+        ref = self.node_source_refs(node)
         return [RecordDef(name, bases, funcs, fields, source_refs=ref)]
 
     @visit.register
@@ -1683,15 +1598,7 @@ class PyASTToCAST:
             Operator: An Operator node, which in this case will hold a boolean
             operation
         """
-        ref = [
-            SourceRef(
-                source_file_name=self.filenames[-1],
-                col_start=node.col_offset,
-                col_end=node.end_col_offset,
-                row_start=node.lineno,
-                row_end=node.end_lineno,
-            )
-        ]
+        ref = self.node_source_refs(node)
 
 
         # Fetch the first element (which is in node.left)
@@ -1793,15 +1700,7 @@ class PyASTToCAST:
                        recognized by the other two cases
         """
 
-        ref = [
-            SourceRef(
-                source_file_name=self.filenames[-1],
-                col_start=node.col_offset,
-                col_end=node.end_col_offset,
-                row_start=node.lineno,
-                row_end=node.end_lineno,
-            )
-        ]
+        ref = self.node_source_refs(node)
         source_code_data_type = ["Python", "3.8", str(type(node.value))]
         # NOTE: We have to check the types such that no ancestor is checked before a descendant
         # boolean values are also seen as integers with isinstance()
@@ -1860,15 +1759,7 @@ class PyASTToCAST:
             ModelContinue: A CAST Continue node
         """
 
-        ref = [
-            SourceRef(
-                source_file_name=self.filenames[-1],
-                col_start=node.col_offset,
-                col_end=node.end_col_offset,
-                row_start=node.lineno,
-                row_end=node.end_lineno,
-            )
-        ]
+        ref = self.node_source_refs(node)
         return [ModelContinue(source_refs=ref)]
 
     @visit.register
@@ -1911,15 +1802,7 @@ class PyASTToCAST:
         k = [e.value if hasattr(e, "value") else e for e in keys]
         v = [e.value if hasattr(e, "value") else e for e in values]
 
-        ref = [
-            SourceRef(
-                source_file_name=self.filenames[-1],
-                col_start=node.col_offset,
-                col_end=node.end_col_offset,
-                row_start=node.lineno,
-                row_end=node.end_lineno,
-            )
-        ]
+        ref = self.node_source_refs(node)
         for key in k:
             if isinstance(key, LiteralValue) and key.value_type == StructureType.TUPLE:
                 return [
@@ -1960,15 +1843,7 @@ class PyASTToCAST:
                        of more than one node
         """
 
-        ref = [
-            SourceRef(
-                source_file_name=self.filenames[-1],
-                col_start=node.col_offset,
-                col_end=node.end_col_offset,
-                row_start=node.lineno,
-                row_end=node.end_lineno,
-            )
-        ]
+        ref = self.node_source_refs(node)
         return self.visit(node.value, prev_scope_id_dict, curr_scope_id_dict)
 
     @visit.register
@@ -1990,15 +1865,7 @@ class PyASTToCAST:
                   loops and While loops.
         """
 
-        ref = [
-            SourceRef(
-                source_file_name=self.filenames[-1],
-                col_start=node.col_offset,
-                col_end=node.end_col_offset,
-                row_start=node.lineno,
-                row_end=node.end_lineno,
-            )
-        ]
+        ref = self.node_source_refs(node)
 
         target = self.visit(
             node.target, prev_scope_id_dict, curr_scope_id_dict
@@ -2008,9 +1875,7 @@ class PyASTToCAST:
         )[0]
 
         # The body of a loop contains its own scope (it can create variables only it can see and can use
-        # variables from its enclosing scope) so we copy the current scope and merge scopes
-        # to create the enclosing scope for the loop body
-        curr_scope_copy = copy.deepcopy(curr_scope_id_dict)
+        # variables from its enclosing scope) so we merge scopes to create the enclosing scope for the loop body
         merge_dicts(prev_scope_id_dict, curr_scope_id_dict)
         loop_scope_id_dict = {}
 
@@ -2023,8 +1888,10 @@ class PyASTToCAST:
                 self.visit(piece, curr_scope_id_dict, loop_scope_id_dict)
             )
 
-        # Once we're out of the loop body we can copy the current scope back
-        curr_scope_id_dict = copy.deepcopy(curr_scope_copy)
+        # Once we're out of the loop body, the variables we generate for the loop
+        # only exist within this node, so their IDs go in a scope of their own
+        # instead of a copy of the current scope as it was before the loop
+        curr_scope_id_dict = {}
 
         # TODO: Mark these as variables that were generated by this script at some point
         # (^ This was a really old request, not sure if it's still needed at this point)
@@ -2149,10 +2016,16 @@ class PyASTToCAST:
             FunctionDef: A CAST Function Definition node
         """
 
-        # Copy the enclosing scope dictionary as it is before we visit the current function
+        # Keep the entries of the enclosing scope dictionary for this function as they are before we visit it
         # The idea for this is to prevent any weird overwritting issues that may arise from modifying
-        # dictionaries in place
-        prev_scope_id_dict_copy = copy.deepcopy(prev_scope_id_dict)
+        # dictionaries in place. These are the only entries we look at once we're done with the function,
+        # so we don't need to copy the whole dictionary
+        unique_name = construct_unique_name(self.filenames[-1], node.name)
+        prev_scope_id_dict_copy = {
+            name: prev_scope_id_dict[name]
+            for name in (node.name, unique_name)
+            if name in prev_scope_id_dict
+        }
 
         body = []
         args = []
@@ -2172,27 +2045,11 @@ class PyASTToCAST:
                             Name(
                                 arg.arg,
                                 id=curr_scope_id_dict[arg.arg],
-                                source_refs=[
-                                    SourceRef(
-                                        self.filenames[-1],
-                                        arg.col_offset,
-                                        arg.end_col_offset,
-                                        arg.lineno,
-                                        arg.end_lineno,
-                                    )
-                                ],
+                                source_refs=self.node_source_refs(arg),
                             ),
                             "float",  # TODO: Correct typing instead of just 'float'
                             None,
-                            source_refs=[
-                                SourceRef(
-                                    self.filenames[-1],
-                                    arg.col_offset,
-                                    arg.end_col_offset,
-                                    arg.lineno,
-                                    arg.end_lineno,
-                                )
-                            ],
+                            source_refs=self.node_source_refs(arg),
                         )
                     )
             else:
@@ -2210,27 +2067,11 @@ class PyASTToCAST:
                                 Name(
                                     arg.arg,
                                     id=curr_scope_id_dict[arg.arg],
-                                    source_refs=[
-                                        SourceRef(
-                                            self.filenames[-1],
-                                            arg.col_offset,
-                                            arg.end_col_offset,
-                                            arg.lineno,
-                                            arg.end_lineno,
-                                        )
-                                    ],
+                                    source_refs=self.node_source_refs(arg),
                                 ),
                                 "float",  # TODO: Correct typing instead of just 'float'
                                 val,
-                                source_refs=[
-                                    SourceRef(
-                                        self.filenames[-1],
-                                        arg.col_offset,
-                                        arg.end_col_offset,
-                                        arg.lineno,
-                                        arg.end_lineno,
-                                    )
-                                ],
+                                source_refs=self.node_source_refs(arg),
                             )
                         )
 
@@ -2246,27 +2087,11 @@ class PyASTToCAST:
                                 Name(
                                     arg.arg,
                                     id=curr_scope_id_dict[arg.arg],
-                                    source_refs=[
-                                        SourceRef(
-                                            self.filenames[-1],
-                                            arg.col_offset,
-                                            arg.end_col_offset,
-                                            arg.lineno,
-                                            arg.end_lineno,
-                                        )
-                                    ],
+                                    source_refs=self.node_source_refs(arg),
                                 ),
                                 "float",  # TODO: Correct typing instead of just 'float'
                                 None,
-                                source_refs=[
-                                    SourceRef(
-                                        self.filenames[-1],
-                                        arg.col_offset,
-                                        arg.end_col_offset,
-                                        arg.lineno,
-                                        arg.end_lineno,
-                                    )
-                                ],
+                                source_refs=self.node_source_refs(arg),
                             )
                         )
 
@@ -2289,27 +2114,11 @@ class PyASTToCAST:
                                 Name(
                                     arg.arg,
                                     id=curr_scope_id_dict[arg.arg],
-                                    source_refs=[
-                                        SourceRef(
-                                            self.filenames[-1],
-                                            arg.col_offset,
-                                            arg.end_col_offset,
-                                            arg.lineno,
-                                            arg.end_lineno,
-                                        )
-                                    ],
+                                    source_refs=self.node_source_refs(arg),
                                 ),
                                 "float",  # TODO: Correct typing instead of just 'float'
                                 val,
-                                source_refs=[
-                                    SourceRef(
-                                        self.filenames[-1],
-                                        arg.col_offset,
-                                        arg.end_col_offset,
-                                        arg.lineno,
-                                        arg.end_lineno,
-                                    )
-                                ],
+                                source_refs=self.node_source_refs(arg),
                             )
                         )
 
@@ -2327,27 +2136,11 @@ class PyASTToCAST:
                         Name(
                             arg.arg,
                             id=curr_scope_id_dict[arg.arg],
-                            source_refs=[
-                                SourceRef(
-                                    self.filenames[-1],
-                                    arg.col_offset,
-                                    arg.end_col_offset,
-                                    arg.lineno,
-                                    arg.end_lineno,
-                                )
-                            ],
+                            source_refs=self.node_source_refs(arg),
                         ),
                         "float",  # TODO: Correct typing instead of just 'float'
                         None,
-                        source_refs=[
-                            SourceRef(
-                                self.filenames[-1],
-                                arg.col_offset,
-                                arg.end_col_offset,
-                                arg.lineno,
-                                arg.end_lineno,
-                            )
-                        ],
+                        source_refs=self.node_source_refs(arg),
                     )
                 )
 
@@ -2360,27 +2153,11 @@ class PyASTToCAST:
                     Name(
                         arg.arg,
                         id=curr_scope_id_dict[arg.arg],
-                        source_refs=[
-                            SourceRef(
-                                self.filenames[-1],
-                                arg.col_offset,
-                                arg.end_col_offset,
-                                arg.lineno,
-                                arg.end_lineno,
-                            )
-                        ],
+                        source_refs=self.node_source_refs(arg),
                     ),
                     "float",  # TODO: Correct typing instead of just 'float'
                     None,
-                    source_refs=[
-                        SourceRef(
-                            self.filenames[-1],
-                            arg.col_offset,
-                            arg.end_col_offset,
-                            arg.lineno,
-                            arg.end_lineno,
-                        )
-                    ],
+                    source_refs=self.node_source_refs(arg),
                 )
             )
 
@@ -2393,27 +2170,11 @@ class PyASTToCAST:
                     Name(
                         arg.arg,
                         id=curr_scope_id_dict[arg.arg],
-                        source_refs=[
-                            SourceRef(
-                                self.filenames[-1],
-                                arg.col_offset,
-                                arg.end_col_offset,
-                                arg.lineno,
-                                arg.end_lineno,
-                            )
-                        ],
+                        source_refs=self.node_source_refs(arg),
                     ),
                     "float",  # TODO: Correct typing instead of just 'float'
                     None,
-                    source_refs=[
-                        SourceRef(
-                            self.filenames[-1],
-                            arg.col_offset,
-                            arg.end_col_offset,
-                            arg.lineno,
-                            arg.end_lineno,
-                        )
-                    ],
+                    source_refs=self.node_source_refs(arg),
                 )
             )
 
@@ -2461,20 +2222,12 @@ class PyASTToCAST:
                 body.extend(to_add)
 
         # TODO: Decorators? Returns? Type_comment?
-        ref = [
-            SourceRef(
-                source_file_name=self.filenames[-1],
-                col_start=node.col_offset,
-                col_end=node.end_col_offset,
-                row_start=node.lineno,
-                row_end=node.end_lineno,
-            )
-        ]
+        ref = self.node_source_refs(node)
 
         # "Revert" the enclosing scope dictionary to what it was before we went into this function
         # since none of the variables within here should exist outside of here..?
         # TODO: this might need to be different, since Python variables can exist outside of a scope??
-        prev_scope_id_dict = copy.deepcopy(prev_scope_id_dict_copy)
+        prev_scope_id_dict = prev_scope_id_dict_copy
 
         # Global level (i.e. module level) functions have their module names appended to them, we make sure
         # we have the correct name depending on whether or not we're visiting a global
@@ -2496,7 +2249,6 @@ class PyASTToCAST:
                     )
                 ]
         else:
-            unique_name = construct_unique_name(self.filenames[-1], node.name)
             if unique_name in prev_scope_id_dict.keys():
                 if self.legacy:
                     return [
@@ -2563,40 +2315,16 @@ class PyASTToCAST:
                         Name(
                             arg.arg,
                             id=curr_scope_id_dict[arg.arg],
-                            source_refs=[
-                                SourceRef(
-                                    self.filenames[-1],
-                                    arg.col_offset,
-                                    arg.end_col_offset,
-                                    arg.lineno,
-                                    arg.end_lineno,
-                                )
-                            ],
+                            source_refs=self.node_source_refs(arg),
                         ),
                         "float",  # TODO: Correct typing instead of just 'float'
-                        source_refs=[
-                            SourceRef(
-                                self.filenames[-1],
-                                arg.col_offset,
-                                arg.end_col_offset,
-                                arg.lineno,
-                                arg.end_lineno,
-                            )
-                        ],
+                        source_refs=self.node_source_refs(arg),
                     )
                 )
 
         body = self.visit(node.body, prev_scope_id_dict, curr_scope_id_dict)
 
-        ref = [
-            SourceRef(
-                source_file_name=self.filenames[-1],
-                col_start=node.col_offset,
-                col_end=node.end_col_offset,
-                row_start=node.lineno,
-                row_end=node.end_lineno,
-            )
-        ]
+        ref = self.node_source_refs(node)
         # TODO: add an ID for lambda name
         if self.legacy:
             return [FunctionDef("LAMBDA", args, body, source_refs=ref)]
@@ -2820,15 +2548,7 @@ class PyASTToCAST:
             loop_collection[0], prev_scope_id_dict, curr_scope_id_dict
         )
 
-        ref = [
-            SourceRef(
-                source_file_name=self.filenames[-1],
-                col_start=node.col_offset,
-                col_end=node.end_col_offset,
-                row_start=node.lineno,
-                row_end=node.end_lineno,
-            )
-        ]
+        ref = self.node_source_refs(node)
 
         # TODO: arguments for a comprehension, IDs
         return_cast = [ModelReturn(value=Var(val=Name(name=temp_list_name, source_refs=ref), source_refs=ref), source_refs=ref)]
@@ -3026,15 +2746,7 @@ class PyASTToCAST:
             loop_collection.insert(0, next_loop)
             i = i - 1
 
-        ref = [
-            SourceRef(
-                source_file_name=self.filenames[-1],
-                col_start=node.col_offset,
-                col_end=node.end_col_offset,
-                row_start=node.lineno,
-                row_end=node.end_lineno,
-            )
-        ]
+        ref = self.node_source_refs(node)
 
         temp_cast = self.visit(
             temp_assign, prev_scope_id_dict, curr_scope_id_dict
@@ -3096,15 +2808,7 @@ class PyASTToCAST:
                     self.visit(piece, prev_scope_id_dict, curr_scope_id_dict)
                 )
 
-        ref = [
-            SourceRef(
-                source_file_name=self.filenames[-1],
-                col_start=node.col_offset,
-                col_end=node.end_col_offset,
-                row_start=node.lineno,
-                row_end=node.end_lineno,
-            )
-        ]
+        ref = self.node_source_refs(node)
 
 
         if isinstance(node_test, list):
@@ -3170,15 +2874,7 @@ class PyASTToCAST:
         node_orelse = self.visit(
             node.orelse, prev_scope_id_dict, curr_scope_id_dict
         )
-        ref = [
-            SourceRef(
-                source_file_name=self.filenames[-1],
-                col_start=node.col_offset,
-                col_end=node.end_col_offset,
-                row_start=node.lineno,
-                row_end=node.end_lineno,
-            )
-        ]
+        ref = self.node_source_refs(node)
 
         return [ModelIf(node_test[0], node_body, node_orelse, source_refs=ref)]
 
@@ -3198,15 +2894,7 @@ class PyASTToCAST:
 
         Returns:
         """
-        ref = [
-            SourceRef(
-                source_file_name=self.filenames[-1],
-                col_start=node.col_offset,
-                col_end=node.end_col_offset,
-                row_start=node.lineno,
-                row_end=node.end_lineno,
-            )
-        ]
+        ref = self.node_source_refs(node)
 
         names = node.names
         to_ret = []
@@ -3229,7 +2917,7 @@ class PyASTToCAST:
                 name = alias.asname
 
             # TODO: Could use a flag to mark a Module as an import (old)
-            if orig_name in BUILTINS or find_std_lib_module(orig_name):
+            if orig_name in BUILTINS or self.import_resolver.is_module(orig_name):
                 self.insert_next_id(self.global_identifier_dict, name)
                 to_ret.append(
                     ModelImport(
@@ -3263,15 +2951,7 @@ class PyASTToCAST:
         # (TODO: Still have to handle things like '..')
         # TODO: What about importing individual functions from a module M
         #        that call other functions from that same module M
-        ref = [
-            SourceRef(
-                source_file_name=self.filenames[-1],
-                col_start=node.col_offset,
-                col_end=node.end_col_offset,
-                row_start=node.lineno,
-                row_end=node.end_lineno,
-            )
-        ]
+        ref = self.node_source_refs(node)
 
         name = node.module
         if name in self.aliases:
@@ -3287,7 +2967,7 @@ class PyASTToCAST:
             if alias.asname is not None:
                 self.aliases[alias.asname] = alias.name
 
-            if name in BUILTINS or find_std_lib_module(name):
+            if name in BUILTINS or self.import_resolver.is_module(name):
                 if alias.name == "*":
                     to_ret.append(
                         ModelImport(
@@ -3349,15 +3029,7 @@ class PyASTToCAST:
         """
 
         source_code_data_type = ["Python", "3.8", "List"]
-        ref = [
-            SourceRef(
-                source_file_name=self.filenames[-1],
-                col_start=node.col_offset,
-                col_end=node.end_col_offset,
-                row_start=node.lineno,
-                row_end=node.end_lineno,
-            )
-        ]
+        ref = self.node_source_refs(node)
         # TODO: How to handle constructors with variables?
         if len(node.elts) > 0:
             to_ret = []
@@ -3402,15 +3074,9 @@ class PyASTToCAST:
         # Visit all the nodes and make a Module object out of them
         body = []
         funcs = []
-        ref = [
-            SourceRef(
-                source_file_name=self.filenames[-1],
-                col_start=-1,
-                col_end=-1,
-                row_start=-1,
-                row_end=-1,
-            )
-        ]
+        ref = self.intern_table.source_refs(
+            self.filenames[-1], -1, -1, -1, -1
+        )
         self.module_stack.append(node)
         for piece in node.body:
             # Defer visiting function defs until all global vars are processed
@@ -3491,15 +3157,7 @@ class PyASTToCAST:
 
         """
         # TODO: Typing so it's not hardcoded to floats
-        ref = [
-            SourceRef(
-                source_file_name=self.filenames[-1],
-                col_start=node.col_offset,
-                col_end=node.end_col_offset,
-                row_start=node.lineno,
-                row_end=node.end_lineno,
-            )
-        ]
+        ref = self.node_source_refs(node)
 
         if isinstance(node.ctx, ast.Load):
             if node.id in self.aliases:
@@ -3587,15 +3245,7 @@ class PyASTToCAST:
     ):
         """A PyAST Pass visitor, for essentially NOPs."""
         source_code_data_type = ["Python", "3.8", "List"]
-        ref = [
-            SourceRef(
-                source_file_name=self.filenames[-1],
-                col_start=node.col_offset,
-                col_end=node.end_col_offset,
-                row_start=node.lineno,
-                row_end=node.end_lineno,
-            )
-        ]
+        ref = self.node_source_refs(node)
         return [
             LiteralValue(
                 StructureType.LIST,
@@ -3617,15 +3267,7 @@ class PyASTToCAST:
         TODO: To be implemented.
         """
         source_code_data_type = ["Python", "3.8", "List"]
-        ref = [
-            SourceRef(
-                source_file_name=self.filenames[-1],
-                col_start=node.col_offset,
-                col_end=node.end_col_offset,
-                row_start=node.lineno,
-                row_end=node.end_lineno,
-            )
-        ]
+        ref = self.node_source_refs(node)
 
         exc_name = ""
         if isinstance(node.exc, ast.Name):
@@ -3676,15 +3318,7 @@ class PyASTToCAST:
             ModelReturn: A CAST Return node
         """
 
-        ref = [
-            SourceRef(
-                source_file_name=self.filenames[-1],
-                col_start=node.col_offset,
-                col_end=node.end_col_offset,
-                row_start=node.lineno,
-                row_end=node.end_lineno,
-            )
-        ]
+        ref = self.node_source_refs(node)
         if node.value != None:
             return [
                 ModelReturn(
@@ -3721,15 +3355,7 @@ class PyASTToCAST:
 
         opd = self.visit(operand, prev_scope_id_dict, curr_scope_id_dict)
 
-        ref = [
-            SourceRef(
-                source_file_name=self.filenames[-1],
-                col_start=node.col_offset,
-                col_end=node.end_col_offset,
-                row_start=node.lineno,
-                row_end=node.end_lineno,
-            )
-        ]
+        ref = self.node_source_refs(node)
 
         return [Operator(source_language="Python", 
                 interpreter="Python", 
@@ -3752,15 +3378,7 @@ class PyASTToCAST:
         """
 
         source_code_data_type = ["Python", "3.8", "List"]
-        ref = [
-            SourceRef(
-                source_file_name=self.filenames[-1],
-                col_start=node.col_offset,
-                col_end=node.end_col_offset,
-                row_start=node.lineno,
-                row_end=node.end_lineno,
-            )
-        ]
+        ref = self.node_source_refs(node)
 
         if len(node.elts) > 0:
             to_ret = []
@@ -3804,15 +3422,7 @@ class PyASTToCAST:
         """
 
         # value = self.visit(node.value, prev_scope_id_dict, curr_scope_id_dict)[0]
-        ref = [
-            SourceRef(
-                source_file_name=self.filenames[-1],
-                col_start=node.col_offset,
-                col_end=node.end_col_offset,
-                row_start=node.lineno,
-                row_end=node.end_lineno,
-            )
-        ]
+        ref = self.node_source_refs(node)
 
         # 'Visit' the slice
         slc = node.slice
@@ -3966,15 +3576,7 @@ class PyASTToCAST:
             dims = slc.dims
             result = []
             source_code_data_type = ["Python", "3.8", "List"]
-            ref = [
-                SourceRef(
-                    source_file_name=self.filenames[-1],
-                    col_start=node.col_offset,
-                    col_end=node.end_col_offset,
-                    row_start=node.lineno,
-                    row_end=node.end_lineno,
-                )
-            ]
+            ref = self.node_source_refs(node)
             return [
                 LiteralValue(
                     StructureType.LIST,
@@ -4024,15 +3626,7 @@ class PyASTToCAST:
             Set: A CAST Tuple node.
         """
 
-        ref = [
-            SourceRef(
-                source_file_name=self.filenames[-1],
-                col_start=node.col_offset,
-                col_end=node.end_col_offset,
-                row_start=node.lineno,
-                row_end=node.end_lineno,
-            )
-        ]
+        ref = self.node_source_refs(node)
         # if len(node.elts) > 0:
         to_ret = []
         for piece in node.elts:
@@ -4078,15 +3672,7 @@ class PyASTToCAST:
         curr_scope_id_dict,
     ):
         source_code_data_type = ["Python", "3.8", "List"]
-        ref = [
-            SourceRef(
-                source_file_name=self.filenames[-1],
-                col_start=node.col_offset,
-                col_end=node.end_col_offset,
-                row_start=node.lineno,
-                row_end=node.end_lineno,
-            )
-        ]
+        ref = self.node_source_refs(node)
         return [
             LiteralValue(
                 StructureType.LIST,
@@ -4104,15 +3690,7 @@ class PyASTToCAST:
         curr_scope_id_dict,
     ):
         source_code_data_type = ["Python", "3.8", "List"]
-        ref = [
-            SourceRef(
-                source_file_name=self.filenames[-1],
-                col_start=node.col_offset,
-                col_end=node.end_col_offset,
-                row_start=node.lineno,
-                row_end=node.end_lineno,
-            )
-        ]
+        ref = self.node_source_refs(node)
         return [
             LiteralValue(
                 StructureType.LIST,
@@ -4138,21 +3716,12 @@ class PyASTToCAST:
             Loop: A CAST loop node, which generically represents both For
                   loops and While loops.
         """
-        ref = [
-            SourceRef(
-                source_file_name=self.filenames[-1],
-                col_start=node.col_offset,
-                col_end=node.end_col_offset,
-                row_start=node.lineno,
-                row_end=node.end_lineno,
-            )
-        ]
+        ref = self.node_source_refs(node)
 
         # test_cond = self.visit(node.test, prev_scope_id_dict, curr_scope_id_dict)[0]
         test = self.create_cond(node, prev_scope_id_dict, curr_scope_id_dict)
 
         # Loops have their own enclosing scopes
-        curr_scope_copy = copy.deepcopy(curr_scope_id_dict)
         merge_dicts(prev_scope_id_dict, curr_scope_id_dict)
         loop_body_scope = {}
         body = []
@@ -4160,8 +3729,6 @@ class PyASTToCAST:
             to_add = self.visit(piece, curr_scope_id_dict, loop_body_scope)
             body.extend(to_add)
 
-        curr_scope_id_dict = copy.deepcopy(curr_scope_copy)
-
         # loop_body_fn_def = FunctionDef(name="while_temp", func_args=None, body=body)
         # return [Loop(init=[], expr=test, body=loop_body_fn_def, source_refs=ref)]
         if isinstance(test, list):
@@ -4195,15 +3762,7 @@ class PyASTToCAST:
         ref = None
         variables = []
         for item in node.items:
-            ref = [
-                SourceRef(
-                    source_file_name=self.filenames[-1],
-                    col_start=node.col_offset,
-                    col_end=node.end_col_offset,
-                    row_start=node.lineno,
-                    row_end=node.end_lineno,
-                )
-            ]
+            ref = self.node_source_refs(node)
             if item.optional_vars != None:
                 l = self.visit(
                     item.optional_vars, prev_scope_id_dict, curr_scope_id_dict
@@ -1,16 +1,19 @@
 from typing import List, Dict
 from skema.program_analysis.CAST2FN.model.cast import SourceRef
+from skema.program_analysis.CAST2FN.interning import InternTable
 
 
 class NodeHelper(object):
-    def __init__(self, source_file_name: str, source: str):
+    def __init__(self, source_file_name: str, source: str, intern_table: InternTable = None):
         self.source_file_name = source_file_name
         self.source = source
+        # Nodes of the same span share their SourceRef
+        self.intern_table = intern_table if intern_table is not None else InternTable()
 
     def parse_tree_to_dict(self, node) -> Dict:
         node_dict = {
             "type": self.get_node_type(node),
-            "source_refs": [self.get_node_source_ref(node)],
+            "source_refs": self.get_node_source_refs(node),
             "identifier": self.get_node_identifier(node),
             "original_children_order": [],
             "children": [],
@@ -58,7 +61,12 @@ class NodeHelper(object):
     def get_node_source_ref(self, node) -> SourceRef:
         row_start, col_start = node.start_point
         row_end, col_end = node.end_point
-        return SourceRef(self.source_file_name, col_start, col_end, row_start, row_end)
+        return self.intern_table.source_ref(self.source_file_name, col_start, col_end, row_start, row_end)
+
+    def get_node_source_refs(self, node) -> List[SourceRef]:
+        row_start, col_start = node.start_point
+        row_end, col_end = node.end_point
+        return self.intern_table.source_refs(self.source_file_name, col_start, col_end, row_start, row_end)
 
     def get_node_identifier(self, node) -> str:
         source_ref = self.get_node_source_ref(node)
@@ -82,7 +90,7 @@ class NodeHelper(object):
             if in_identifier:
                 identifier += char
 
-        return identifier
+        return self.intern_table.name(identifier)
 
     def get_node_type(self, node) -> str:
         return node.type
@@ -0,0 +1,5 @@
+"Fortran grammar for tree-sitter"
+
+from ._binding import language
+
+__all__ = ["language"]
@@ -0,0 +1 @@
+def language() -> int: ...
@@ -27,20 +27,22 @@ from skema.program_analysis.CAST2FN.model.cast import (
 
 from skema.program_analysis.TS2CAST.variable_context import VariableContext
 from skema.program_analysis.TS2CAST.node_helper import NodeHelper
+from skema.program_analysis.CAST2FN.interning import InternTable
 from skema.program_analysis.TS2CAST.util import generate_dummy_source_refs, preprocess
 
 from skema.program_analysis.TS2CAST.build_tree_sitter_fortran import LANGUAGE_LIBRARY_REL_PATH
 
 class TS2CAST(object):
-    def __init__(self, source_file_path: str):
+    def __init__(self, source_file_path: str, source: str = None, intern_table: InternTable = None):
         # Initialize tree-sitter
         tree_sitter_fortran_path = os.path.join(os.path.dirname(os.path.abspath(__file__)), LANGUAGE_LIBRARY_REL_PATH)
         self.tree_sitter_fortran = Language(tree_sitter_fortran_path, "fortran")
 
-        # We load the source code from a file
-        self.source = None
-        with open(source_file_path, "r") as f:
-            self.source = f.read()
+        # We load the source code from a file, unless it was passed in directly
+        self.source = source
+        if self.source is None:
+            with open(source_file_path, "r") as f:
+                self.source = f.read()
 
         # Set up tree sitter parser
         self.parser = Parser()
@@ -55,7 +57,7 @@ class TS2CAST(object):
         # Walking data
         self.variable_context = VariableContext()
 
-        self.node_helper = NodeHelper(source_file_path, self.source)
+        self.node_helper = NodeHelper(source_file_path, self.source, intern_table)
         self.parse_dict = self.node_helper.parse_tree_to_dict(self.tree.root_node)
         # print(json.dumps(self.parse_dict))
 
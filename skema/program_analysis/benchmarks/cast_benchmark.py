@@ -0,0 +1,137 @@
+"""
+cast_benchmark.py measures how long PyASTToCAST takes to build the CAST of
+the Python files of the given corpora (see corpora.py), how much memory it
+allocates doing so, and how much memory the CAST it builds takes. Parsing is
+left out of the measurements.
+
+This is the stage that keeps a dictionary of name : ID pairs for every scope
+it visits, so it's the one to look at when changing how scopes are handled.
+Running it against two versions of the code shows the difference, i.e.:
+
+    python -m skema.program_analysis.benchmarks.cast_benchmark --corpus bucky nested
+"""
+import argparse
+import ast
+import contextlib
+import io
+import json
+import os
+import statistics
+import sys
+import time
+import tracemalloc
+from typing import List
+
+from skema.program_analysis.benchmarks.corpora import CORPORA, Corpus, get_corpora
+from skema.program_analysis.python2cast import python_ast_to_cast
+
+
+def get_args():
+    parser = argparse.ArgumentParser(
+        description="Benchmarks building the CAST of Python files with PyASTToCAST."
+    )
+    parser.add_argument(
+        "--corpus",
+        nargs="+",
+        default=["bucky", "nested"],
+        help=f"The corpora to run, among {list(CORPORA.keys())} (default: bucky nested)",
+    )
+    parser.add_argument(
+        "--repeat",
+        type=int,
+        default=5,
+        help="Number of times every corpus is run (default: 5)",
+    )
+    parser.add_argument(
+        "--output", type=str, help="Writes the results to the given JSON file"
+    )
+    options = parser.parse_args()
+    return options
+
+
+def build_casts(corpus: Corpus, trees: dict, sources: dict) -> list:
+    casts = []
+    for file, tree in trees.items():
+        if corpus.in_memory_sources is None:
+            search_path = [
+                os.path.dirname(os.path.abspath(os.path.join(corpus.root_dir, file)))
+            ]
+        else:
+            search_path = None
+        casts.append(
+            python_ast_to_cast(
+                tree,
+                os.path.basename(file),
+                len(io.StringIO(sources[file], newline=None).readlines()),
+                search_path=search_path,
+            )
+        )
+    return casts
+
+
+def measure_cast(corpus: Corpus, repeat: int = 5) -> dict:
+    """Returns the wall times of building the CAST of the Python files of corpus
+    repeat times, and the peak memory of one more run under tracemalloc, along
+    with the memory still held by the CAST it built"""
+    sources = {
+        file: source
+        for file, source in corpus.sources().items()
+        if file.endswith(".py")
+    }
+    trees = {file: ast.parse(source) for file, source in sources.items()}
+
+    wall_times = []
+    # PyASTToCAST prints the modules it finds
+    with contextlib.redirect_stdout(io.StringIO()):
+        for _ in range(repeat):
+            start = time.perf_counter()
+            build_casts(corpus, trees, sources)
+            wall_times.append(time.perf_counter() - start)
+
+        tracemalloc.start()
+        try:
+            casts = build_casts(corpus, trees, sources)
+            memory, peak_memory = tracemalloc.get_traced_memory()
+            # Whatever else the run allocated and kept (i.e. caches) isn't counted
+            del casts
+            cast_memory = memory - tracemalloc.get_traced_memory()[0]
+        finally:
+            tracemalloc.stop()
+
+    return {
+        "files": len(sources),
+        "min_wall_time": min(wall_times),
+        "median_wall_time": statistics.median(wall_times),
+        "peak_memory": peak_memory,
+        "cast_memory": cast_memory,
+    }
+
+
+def run_benchmarks(corpora: List[Corpus], repeat: int = 5) -> dict:
+    results = {}
+    for corpus in corpora:
+        print(f"Benchmarking {corpus.name}", file=sys.stderr)
+        results[corpus.name] = measure_cast(corpus, repeat)
+    return results
+
+
+if __name__ == "__main__":
+    args = get_args()
+    results = run_benchmarks(get_corpora(args.corpus), args.repeat)
+
+    print(
+        f"\n{'corpus':<28}{'files':>6}{'min (s)':>10}{'median (s)':>12}"
+        f"{'peak (KiB)':>12}{'CAST (KiB)':>12}"
+    )
+    for name, measurements in results.items():
+        print(
+            f"{name:<28}{measurements['files']:>6}"
+            f"{measurements['min_wall_time']:>10.3f}"
+            f"{measurements['median_wall_time']:>12.3f}"
+            f"{measurements['peak_memory'] / 1024:>12.0f}"
+            f"{measurements['cast_memory'] / 1024:>12.0f}"
+        )
+
+    if args.output:
+        with open(args.output, "w") as f:
+            json.dump(results, f, indent=2)
@@ -0,0 +1,345 @@
+"""
+code2fn_benchmark.py runs the CODE2FN pipeline over the bundled corpora
+(see corpora.py) and measures every stage of it separately:
+
+- parse: Parsing the source code (Python only, the Fortran frontend parses
+  and builds the CAST in one go)
+- cast: Building the CAST
+- CastToAnnotatedCast and every AnnCAST pass, up to ToGrometPass
+- to_dict: Converting the GroMEt FN module collection to dictionaries
+- json: Rendering the collection as JSON
+
+The wall time, CPU time and peak memory of every stage are totaled over the
+files of each corpus and compared against a baseline file. Stages that got
+slower or use more memory than the baseline, beyond a threshold, are flagged
+as regressions, and the script exits with a non-zero status.
+
+Example:
+    python -m skema.program_analysis.benchmarks.code2fn_benchmark --corpus examples chime
+    python -m skema.program_analysis.benchmarks.code2fn_benchmark --update_baseline
+"""
+import argparse
+import ast
+import contextlib
+import datetime
+import gc
+import io
+import json
+import os
+import platform
+import sys
+from typing import Dict, List, Optional, Tuple
+
+from skema.gromet.fn import GrometFNModuleCollection
+from skema.program_analysis.CAST2FN.model.cast import AstNode
+from skema.program_analysis.benchmarks.corpora import (
+    CORPORA,
+    DEFAULT_CORPORA,
+    Corpus,
+    get_corpora,
+)
+from skema.program_analysis.fortran2cast import fortran_source_to_cast
+from skema.program_analysis.multi_file_ingester import is_executable, module_path
+from skema.program_analysis.pipeline_context import PipelineContext
+from skema.program_analysis.pipeline_profiler import PipelineProfiler
+from skema.program_analysis.python2cast import python_ast_to_cast
+from skema.utils.fold import dictionary_to_gromet_json, del_nulls
+from skema.utils.script_functions import ann_cast_pipeline
+
+DEFAULT_BASELINE = os.path.join(os.path.dirname(__file__), "baseline.json")
+
+# Number of times every corpus is run, the fastest run is kept. The baseline is
+# recorded with the same number of runs, so that both are as free of noise
+DEFAULT_REPEAT = 3
+
+# Stages that got slower or grew by more than this fraction of the baseline are regressions
+DEFAULT_THRESHOLD = 0.25
+
+# Differences below these are considered noise, whatever the fraction
+MIN_TIME_DIFFERENCE = 0.01  # seconds
+MIN_MEMORY_DIFFERENCE = 256 * 1024  # bytes
+
+# The key of the stage that totals all the others
+TOTAL = "total"
+
+
+def get_args():
+    parser = argparse.ArgumentParser(
+        description="Benchmarks every stage of the CODE2FN pipeline over the bundled corpora."
+    )
+    parser.add_argument(
+        "--corpus",
+        nargs="+",
+        default=DEFAULT_CORPORA,
+        help=f"The corpora to run, among {list(CORPORA.keys())} (default: {DEFAULT_CORPORA})",
+    )
+    parser.add_argument(
+        "--repeat",
+        type=int,
+        default=DEFAULT_REPEAT,
+        help=f"Number of times every corpus is run, the fastest run is kept (default: {DEFAULT_REPEAT})",
+    )
+    parser.add_argument(
+        "--no_memory",
+        action="store_true",
+        help="Don't measure the peak memory of the stages, which takes an extra run with tracemalloc",
+    )
+    parser.add_argument(
+        "--baseline",
+        type=str,
+        default=DEFAULT_BASELINE,
+        help="The baseline file the results are compared against",
+    )
+    parser.add_argument(
+        "--update_baseline",
+        action="store_true",
+        help="Writes the results to the baseline file instead of comparing them against it",
+    )
+    parser.add_argument(
+        "--threshold",
+        type=float,
+        default=DEFAULT_THRESHOLD,
+        help=f"Fraction of the baseline beyond which a stage is a regression (default: {DEFAULT_THRESHOLD})",
+    )
+    parser.add_argument(
+        "--output", type=str, help="Writes the results to the given JSON file"
+    )
+    options = parser.parse_args()
+    return options
+
+
+def run_corpus(corpus: Corpus, profiler: PipelineProfiler):
+    """Runs every stage of the pipeline over every file of corpus,
+    measuring each one with profiler"""
+    sources = corpus.sources()
+    module_collection = GrometFNModuleCollection(
+        schema_version="0.1.6",
+        name=corpus.name,
+        modules=[],
+        module_index=[],
+        executables=[],
+    )
+
+    for file, source in sources.items():
+        full_file = os.path.join(corpus.root_dir, file)
+        if corpus.in_memory_sources is None:
+            context = PipelineContext(
+                root_dir=corpus.root_dir, profiler=profiler, file_name=file
+            )
+            search_path = [os.path.dirname(os.path.abspath(full_file))]
+            virtual_modules = None
+        else:
+            # Imports are resolved against the other files of the system, like for process_sources
+            context = PipelineContext(
+                sources=sources, profiler=profiler, file_name=file
+            )
+            search_path = None
+            virtual_modules = context.virtual_modules(os.path.dirname(file))
+
+        # The CAST nodes are counted once the stage is done, so the list is filled in the stage
+        cast_nodes = []
+        if file.endswith(".py"):
+            with profiler.measure(file, "parse"):
+                contents = ast.parse(source)
+            with profiler.measure(file, "cast", cast_nodes, AstNode):
+                cast = python_ast_to_cast(
+                    contents,
+                    os.path.basename(file),
+                    len(io.StringIO(source, newline=None).readlines()),
+                    search_path=search_path,
+                    virtual_modules=virtual_modules,
+                )
+                cast_nodes.append(cast.nodes)
+        else:
+            with profiler.measure(file, "cast", cast_nodes, AstNode):
+                cast = fortran_source_to_cast(source, full_file)
+                cast_nodes.append(cast.nodes)
+
+        generated_gromet = ann_cast_pipeline(
+            cast, gromet=True, to_file=False, from_obj=True, context=context
+        )
+
+        module_collection.modules.append(generated_gromet)
+        module_collection.module_index.append(module_path(corpus.root_dir, file))
+        if is_executable(generated_gromet):
+            module_collection.executables.append(
+                len(module_collection.module_index)
+            )
+
+    with profiler.measure(corpus.name, "to_dict"):
+        gromet_collection_dict = module_collection.to_dict()
+    with profiler.measure(corpus.name, "json"):
+        dictionary_to_gromet_json(del_nulls(gromet_collection_dict))
+
+
+def measure_corpus(
+    corpus: Corpus, repeat: int = 1, trace_memory: bool = True
+) -> Dict[str, dict]:
+    """Returns the wall time, CPU time and peak memory of every stage over corpus.
+    The times are those of the fastest of repeat runs, and the memory is measured
+    in a run of its own, since tracing memory slows the pipeline down.
+    Like timeit, the timed runs start from a collected heap and run with the cyclic
+    garbage collector disabled: otherwise the collections that happen to land in
+    a stage (i.e. to_dict, which allocates the most) scan whatever earlier corpora
+    left on the heap, which makes its times depend on them.
+    """
+    stages: Dict[str, dict] = {}
+
+    def record(profiler: PipelineProfiler, metrics: List[str]):
+        totals = profiler.summary()
+        # Stages are reported in the order they run in
+        for stage in dict.fromkeys(
+            pass_record.pass_name for pass_record in profiler.records
+        ):
+            total = totals[stage]
+            measurements = stages.setdefault(
+                stage, {"wall_time": None, "cpu_time": None, "peak_memory": None}
+            )
+            for metric in metrics:
+                if measurements[metric] is None or total[metric] < measurements[metric]:
+                    measurements[metric] = total[metric]
+
+    # The pipeline prints a banner for every pass
+    with contextlib.redirect_stdout(io.StringIO()):
+        for _ in range(repeat):
+            profiler = PipelineProfiler(trace_memory=False)
+            gc.collect()
+            gc.disable()
+            try:
+                run_corpus(corpus, profiler)
+            finally:
+                gc.enable()
+            record(profiler, ["wall_time", "cpu_time"])
+
+        if trace_memory:
+            profiler = PipelineProfiler(trace_memory=True)
+            run_corpus(corpus, profiler)
+            profiler.close()
+            record(profiler, ["peak_memory"])
+
+    stages[TOTAL] = {
+        "wall_time": sum(stage["wall_time"] for stage in stages.values()),
+        "cpu_time": sum(stage["cpu_time"] for stage in stages.values()),
+        "peak_memory": max(
+            (stage["peak_memory"] for stage in stages.values()), default=None
+        )
+        if trace_memory
+        else None,
+    }
+    return stages
+
+
+def run_benchmarks(
+    corpora: List[Corpus], repeat: int = 1, trace_memory: bool = True
+) -> dict:
+    """Measures every corpus of corpora, see measure_corpus"""
+    results = {
+        "metadata": {
+            "date": datetime.datetime.now().isoformat(timespec="seconds"),
+            "python": platform.python_version(),
+            "platform": platform.platform(),
+            "repeat": repeat,
+        },
+        "corpora": {},
+    }
+    for corpus in corpora:
+        print(f"Benchmarking {corpus.name} ({len(corpus.files)} files)", file=sys.stderr)
+        results["corpora"][corpus.name] = measure_corpus(corpus, repeat, trace_memory)
+    return results
+
+
+def find_regressions(
+    results: dict, baseline: dict, threshold: float = DEFAULT_THRESHOLD
+) -> List[Tuple[str, str, str, float, float]]:
+    """Compares results against baseline, and returns a (corpus, stage, metric,
+    baseline value, current value) tuple for every measurement that grew by more
+    than threshold times its baseline value. Corpora and stages that aren't in
+    both are skipped, as are differences too small to tell from noise.
+    """
+    regressions = []
+    for corpus, stages in results["corpora"].items():
+        baseline_stages = baseline.get("corpora", {}).get(corpus, {})
+        for stage, measurements in stages.items():
+            if stage not in baseline_stages:
+                continue
+            for metric, min_difference in (
+                ("wall_time", MIN_TIME_DIFFERENCE),
+                ("cpu_time", MIN_TIME_DIFFERENCE),
+                ("peak_memory", MIN_MEMORY_DIFFERENCE),
+            ):
+                current = measurements.get(metric)
+                previous = baseline_stages[stage].get(metric)
+                if current is None or previous is None:
+                    continue
+                if (
+                    current - previous > min_difference
+                    and current > previous * (1 + threshold)
+                ):
+                    regressions.append((corpus, stage, metric, previous, current))
+    return regressions
+
+
+def format_change(current: Optional[float], previous: Optional[float]) -> str:
+    if current is None or previous is None or previous == 0:
+        return ""
+    return f"{(current - previous) / previous:+.0%}"
+
+
+def print_results(results: dict, baseline: Optional[dict]):
+    baseline_corpora = baseline.get("corpora", {}) if baseline else {}
+    for corpus, stages in results["corpora"].items():
+        print(f"\n{corpus}")
+        print(f"    {'stage':<24}{'wall (s)':>10}{'':>7}{'cpu (s)':>10}{'peak (KiB)':>13}{'':>7}")
+        for stage, measurements in stages.items():
+            previous = baseline_corpora.get(corpus, {}).get(stage, {})
+            peak = measurements["peak_memory"]
+            print(
+                f"    {stage:<24}"
+                f"{measurements['wall_time']:>10.3f}"
+                f"{format_change(measurements['wall_time'], previous.get('wall_time')):>7}"
+                f"{measurements['cpu_time']:>10.3f}"
+                f"{(peak / 1024 if peak is not None else float('nan')):>13.0f}"
+                f"{format_change(peak, previous.get('peak_memory')):>7}"
+            )
+
+
+if __name__ == "__main__":
+    args = get_args()
+
+    results = run_benchmarks(get_corpora(args.corpus), args.repeat, not args.no_memory)
+
+    if args.output:
+        with open(args.output, "w") as f:
+            json.dump(results, f, indent=2)
+
+    if args.update_baseline:
+        # Keep the baseline of the corpora that weren't run this time
+        corpora = {}
+        if os.path.exists(args.baseline):
+            with open(args.baseline) as f:
+                corpora = json.load(f)["corpora"]
+        corpora.update(results["corpora"])
+        baseline = {"metadata": results["metadata"], "corpora": corpora}
+        with open(args.baseline, "w") as f:
+            json.dump(baseline, f, indent=2)
+        print_results(results, None)
+        print(f"\nWrote the baseline to {args.baseline}")
+        sys.exit(0)
+
+    baseline = None
+    if os.path.exists(args.baseline):
+        with open(args.baseline) as f:
+            baseline = json.load(f)
+    print_results(results, baseline)
+
+    if baseline is None:
+        print(f"\nNo baseline at {args.baseline}, run with --update_baseline to create one")
+        sys.exit(0)
+
+    regressions = find_regressions(results, baseline, args.threshold)
+    if len(regressions) > 0:
+        print(f"\n{len(regressions)} regressions beyond {args.threshold:.0%} of the baseline:")
+        for corpus, stage, metric, previous, current in regressions:
+            print(f"    {corpus} {stage} {metric}: {previous:.4g} -> {current:.4g}")
+        sys.exit(1)
+    print("\nNo regressions")
@@ -0,0 +1,154 @@
+"""
+corpora.py defines the systems of code the CODE2FN benchmarks run over:
+every example of data/gromet/examples, the CHIME and Bucky models, and
+synthetic systems (see synthetic.py).
+"""
+import glob
+import os
+from pathlib import Path
+from typing import Dict, List, Optional
+
+from skema.program_analysis.benchmarks.synthetic import (
+    SyntheticSystemSpec,
+    generate_system,
+)
+
+DATA_DIR = Path(__file__).parents[3] / "data"
+
+EXAMPLES_DIR = DATA_DIR / "gromet" / "examples"
+CHIME_DIR = DATA_DIR / "epidemiology" / "CHIME" / "CHIME_penn_full_model" / "code"
+BUCKY_DIR = DATA_DIR / "epidemiology" / "Bucky" / "code"
+
+SUPPORTED_EXTENSIONS = (".py", ".F", ".f95")
+
+
+class Corpus:
+    """Class Corpus
+    A system of code to benchmark the pipeline on.
+
+    Current Fields:
+        - name: The name the corpus is reported under
+        - root_dir: The root directory of the system
+        - files: The paths of the system's files, relative to root_dir
+        - in_memory_sources: For systems that aren't on disk (i.e. synthetic ones),
+                   the paths of the system's files to their source code. root_dir is
+                   then only the name of the system's root directory.
+    """
+
+    def __init__(
+        self,
+        name: str,
+        root_dir: str,
+        files: List[str],
+        in_memory_sources: Optional[Dict[str, str]] = None,
+    ):
+        self.name = name
+        self.root_dir = root_dir
+        self.files = files
+        self.in_memory_sources = in_memory_sources
+
+    def sources(self) -> Dict[str, str]:
+        """Returns the paths of the system's files to their source code"""
+        if self.in_memory_sources is not None:
+            return self.in_memory_sources
+        sources = {}
+        for file in self.files:
+            with open(os.path.join(self.root_dir, file)) as f:
+                sources[file] = f.read()
+        return sources
+
+
+def example_corpora() -> List[Corpus]:
+    """Returns a corpus for every example of data/gromet/examples,
+    made of the source files at the top of the example's directory"""
+    corpora = []
+    for example_dir in sorted(glob.glob(str(EXAMPLES_DIR / "*"))):
+        if not os.path.isdir(example_dir):
+            continue
+        files = sorted(
+            file
+            for file in os.listdir(example_dir)
+            if file.endswith(SUPPORTED_EXTENSIONS)
+        )
+        if len(files) > 0:
+            corpora.append(
+                Corpus(
+                    f"examples/{os.path.basename(example_dir)}",
+                    example_dir,
+                    files,
+                )
+            )
+    return corpora
+
+
+def file_list_corpus(name: str, root_dir: str, files: str) -> Corpus:
+    """Returns the corpus of a system whose files are listed in the file files,
+    like the ones process_file_system takes"""
+    with open(files) as f:
+        file_list = [file.strip() for file in f.readlines() if file.strip() != ""]
+    return Corpus(name, root_dir, file_list)
+
+
+def chime_corpus() -> Corpus:
+    return file_list_corpus(
+        "CHIME",
+        str(CHIME_DIR / "penn_chime"),
+        str(CHIME_DIR / "system_filepaths.txt"),
+    )
+
+
+def bucky_corpus() -> Corpus:
+    return file_list_corpus(
+        "Bucky",
+        str(BUCKY_DIR / "bucky_v2"),
+        str(BUCKY_DIR / "system_filepaths.txt"),
+    )
+
+
+def synthetic_corpus(language: str, spec: SyntheticSystemSpec) -> Corpus:
+    """Returns the corpus of a synthetic system, see synthetic.py"""
+    sources = generate_system(language, spec)
+    return Corpus(
+        f"synthetic/{language}-{spec.modules}x{spec.functions}",
+        "synthetic",
+        list(sources.keys()),
+        sources,
+    )
+
+
+# The named groups of corpora that can be selected to run
+CORPORA = {
+    "examples": example_corpora,
+    "chime": lambda: [chime_corpus()],
+    "bucky": lambda: [bucky_corpus()],
+    "synthetic": lambda: [
+        synthetic_corpus("python", SyntheticSystemSpec(modules=8, functions=8))
+    ],
+    "synthetic_fortran": lambda: [
+        synthetic_corpus("fortran", SyntheticSystemSpec(modules=8, functions=8))
+    ],
+    # Deeply nested loops in many functions, which stresses the scopes of PyASTToCAST
+    "nested": lambda: [
+        synthetic_corpus(
+            "python",
+            SyntheticSystemSpec(
+                modules=2, functions=20, depth=4, statements=4, loop_density=0.5
+            ),
+        )
+    ],
+}
+
+# The groups that run when none are selected. The Fortran ones need the
+# tree-sitter Fortran grammar to be built.
+DEFAULT_CORPORA = ["examples", "chime", "bucky", "synthetic"]
+
+
+def get_corpora(names: List[str]) -> List[Corpus]:
+    corpora = []
+    for name in names:
+        if name not in CORPORA:
+            raise ValueError(
+                f"Unknown corpus {name}, expected one of {list(CORPORA.keys())}"
+            )
+        corpora.extend(CORPORA[name]())
+    return corpora
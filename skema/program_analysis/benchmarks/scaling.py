@@ -0,0 +1,262 @@
+"""
+scaling.py measures how the ingestion time and memory of process_file_system
+grow with the size of the system ingested, over a series of synthetic systems
+of increasing size (see synthetic.py).
+
+The growth is summarized by the exponent of a power law fitted to the
+measurements: time ~ lines^exponent. An exponent well above 1 means the
+pipeline scales super-linearly, in which case the script exits with a
+non-zero status. The measurements can be written to JSON or CSV, and plotted
+if matplotlib is installed.
+
+Example:
+    python -m skema.program_analysis.benchmarks.scaling --vary modules --sizes 1 2 4 8 16
+"""
+import argparse
+import contextlib
+import csv
+import io
+import json
+import math
+import os
+import sys
+import tempfile
+import time
+import tracemalloc
+from typing import Dict, List, Optional
+
+from skema.program_analysis.benchmarks.synthetic import (
+    LANGUAGES,
+    SyntheticSystemSpec,
+    generate_system,
+)
+from skema.program_analysis.multi_file_ingester import process_file_system
+
+# The parameters of SyntheticSystemSpec that the sizes can apply to
+SIZE_PARAMETERS = ["modules", "functions", "depth", "statements"]
+
+# Growth exponents above this are reported as super-linear
+DEFAULT_MAX_EXPONENT = 1.3
+
+
+def get_args():
+    parser = argparse.ArgumentParser(
+        description="Measures how process_file_system scales with the size of synthetic systems."
+    )
+    parser.add_argument("--language", choices=LANGUAGES, default="python")
+    parser.add_argument(
+        "--vary",
+        choices=SIZE_PARAMETERS,
+        default="modules",
+        help="The parameter of the synthetic systems the sizes apply to (default: modules)",
+    )
+    parser.add_argument(
+        "--sizes",
+        type=int,
+        nargs="+",
+        default=[1, 2, 4, 8, 16],
+        help="The values of the varied parameter (default: 1 2 4 8 16)",
+    )
+    parser.add_argument("--modules", type=int, default=4)
+    parser.add_argument("--functions", type=int, default=4)
+    parser.add_argument("--depth", type=int, default=2)
+    parser.add_argument("--statements", type=int, default=3)
+    parser.add_argument("--loop_density", type=float, default=0.2)
+    parser.add_argument("--if_density", type=float, default=0.2)
+    parser.add_argument("--imports", type=int, default=1)
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument(
+        "--no_memory",
+        action="store_true",
+        help="Don't measure the peak memory, which takes an extra run with tracemalloc",
+    )
+    parser.add_argument(
+        "--max_exponent",
+        type=float,
+        default=DEFAULT_MAX_EXPONENT,
+        help=f"Growth exponent above which the scaling is flagged as super-linear (default: {DEFAULT_MAX_EXPONENT})",
+    )
+    parser.add_argument("--output", type=str, help="Writes the measurements to the given JSON file")
+    parser.add_argument("--csv", type=str, help="Writes the measurements to the given CSV file")
+    parser.add_argument(
+        "--plot",
+        type=str,
+        help="Plots the measurements to the given image file (requires matplotlib)",
+    )
+    options = parser.parse_args()
+    return options
+
+
+def write_system(sources: Dict[str, str], directory: str) -> str:
+    """Writes the files of a system under directory, along with the list of its
+    files that process_file_system takes, and returns the path of that list"""
+    for file, source in sources.items():
+        full_path = os.path.join(directory, file)
+        os.makedirs(os.path.dirname(full_path), exist_ok=True)
+        with open(full_path, "w") as f:
+            f.write(source)
+
+    files = os.path.join(directory, "system_filepaths.txt")
+    with open(files, "w") as f:
+        f.writelines(file + "\n" for file in sources.keys())
+    return files
+
+
+def measure_system(
+    language: str, spec: SyntheticSystemSpec, trace_memory: bool = True
+) -> dict:
+    """Generates the synthetic system of spec and measures its ingestion by process_file_system"""
+    sources = generate_system(language, spec)
+    measurement = spec.to_dict()
+    measurement["files"] = len(sources)
+    measurement["lines"] = sum(source.count("\n") for source in sources.values())
+
+    with tempfile.TemporaryDirectory() as tmp:
+        root_dir = os.path.join(tmp, "synthetic")
+        files = write_system(sources, root_dir)
+
+        # The pipeline prints a banner for every pass
+        with contextlib.redirect_stdout(io.StringIO()):
+            start_wall = time.perf_counter()
+            start_cpu = time.process_time()
+            process_file_system("synthetic", root_dir, files)
+            measurement["wall_time"] = time.perf_counter() - start_wall
+            measurement["cpu_time"] = time.process_time() - start_cpu
+
+            measurement["peak_memory"] = None
+            if trace_memory:
+                tracemalloc.start()
+                try:
+                    process_file_system("synthetic", root_dir, files)
+                    measurement["peak_memory"] = tracemalloc.get_traced_memory()[1]
+                finally:
+                    tracemalloc.stop()
+
+    return measurement
+
+
+def growth_exponent(measurements: List[dict], metric: str) -> Optional[float]:
+    """Returns the exponent of the power law metric ~ lines^exponent that fits
+    the measurements best (the least squares slope in log-log space),
+    or None if there aren't at least two distinct sizes to fit"""
+    points = [
+        (math.log(measurement["lines"]), math.log(measurement[metric]))
+        for measurement in measurements
+        if measurement.get(metric) and measurement["lines"] > 0
+    ]
+    if len(set(x for x, _ in points)) < 2:
+        return None
+    mean_x = sum(x for x, _ in points) / len(points)
+    mean_y = sum(y for _, y in points) / len(points)
+    covariance = sum((x - mean_x) * (y - mean_y) for x, y in points)
+    variance = sum((x - mean_x) ** 2 for x, _ in points)
+    return covariance / variance
+
+
+def run_scaling(
+    language: str,
+    base_spec: SyntheticSystemSpec,
+    vary: str,
+    sizes: List[int],
+    trace_memory: bool = True,
+) -> dict:
+    """Measures a synthetic system for every size, with the vary parameter
+    of base_spec set to that size"""
+    measurements = []
+    for size in sizes:
+        spec = SyntheticSystemSpec(**base_spec.to_dict())
+        setattr(spec, vary, size)
+        print(f"Measuring {language} system with {vary}={size}", file=sys.stderr)
+        measurements.append(measure_system(language, spec, trace_memory))
+
+    return {
+        "language": language,
+        "vary": vary,
+        "measurements": measurements,
+        "exponents": {
+            metric: growth_exponent(measurements, metric)
+            for metric in ("wall_time", "cpu_time", "peak_memory")
+        },
+    }
+
+
+def write_csv(results: dict, path: str):
+    measurements = results["measurements"]
+    with open(path, "w", newline="") as f:
+        writer = csv.DictWriter(f, fieldnames=list(measurements[0].keys()))
+        writer.writeheader()
+        writer.writerows(measurements)
+
+
+def plot(results: dict, path: str):
+    """Plots the time and memory of the measurements against the number of lines"""
+    # matplotlib is only needed for plotting, so it isn't a dependency of skema
+    import matplotlib
+
+    matplotlib.use("Agg")
+    import matplotlib.pyplot as plt
+
+    measurements = results["measurements"]
+    lines = [measurement["lines"] for measurement in measurements]
+
+    figure, (time_axes, memory_axes) = plt.subplots(1, 2, figsize=(10, 4))
+    time_axes.loglog(lines, [m["wall_time"] for m in measurements], "o-", label="wall")
+    time_axes.loglog(lines, [m["cpu_time"] for m in measurements], "o-", label="cpu")
+    time_axes.set_xlabel("lines of code")
+    time_axes.set_ylabel("time (s)")
+    time_axes.legend()
+    if all(m["peak_memory"] is not None for m in measurements):
+        memory_axes.loglog(lines, [m["peak_memory"] / 2**20 for m in measurements], "o-")
+    memory_axes.set_xlabel("lines of code")
+    memory_axes.set_ylabel("peak memory (MiB)")
+    figure.suptitle(
+        f"process_file_system, synthetic {results['language']} systems, varying {results['vary']}"
+    )
+    figure.tight_layout()
+    figure.savefig(path)
+
+
+if __name__ == "__main__":
+    args = get_args()
+    base_spec = SyntheticSystemSpec(
+        modules=args.modules,
+        functions=args.functions,
+        depth=args.depth,
+        statements=args.statements,
+        loop_density=args.loop_density,
+        if_density=args.if_density,
+        imports=args.imports,
+        seed=args.seed,
+    )
+    results = run_scaling(
+        args.language, base_spec, args.vary, args.sizes, not args.no_memory
+    )
+
+    print(f"\n{args.vary:>10}{'files':>8}{'lines':>8}{'wall (s)':>10}{'cpu (s)':>10}{'peak (MiB)':>12}")
+    for measurement in results["measurements"]:
+        peak = measurement["peak_memory"]
+        print(
+            f"{measurement[args.vary]:>10}{measurement['files']:>8}{measurement['lines']:>8}"
+            f"{measurement['wall_time']:>10.3f}{measurement['cpu_time']:>10.3f}"
+            f"{(peak / 2**20 if peak is not None else float('nan')):>12.1f}"
+        )
+
+    if args.output:
+        with open(args.output, "w") as f:
+            json.dump(results, f, indent=2)
+    if args.csv:
+        write_csv(results, args.csv)
+    if args.plot:
+        plot(results, args.plot)
+
+    super_linear = False
+    print()
+    for metric, exponent in results["exponents"].items():
+        if exponent is None:
+            continue
+        flag = ""
+        if exponent > args.max_exponent:
+            flag = "  <-- super-linear"
+            super_linear = True
+        print(f"{metric} ~ lines^{exponent:.2f}{flag}")
+    sys.exit(1 if super_linear else 0)
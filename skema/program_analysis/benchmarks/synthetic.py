@@ -0,0 +1,234 @@
+"""
+synthetic.py generates synthetic Python and Fortran systems of arbitrary size,
+to measure how the CODE2FN pipeline scales with the size of the system it
+ingests (see scaling.py).
+
+A system is made of a number of modules, each defining a number of functions.
+The body of every function is a random mix of assignments, calls, loops and
+conditionals, nested up to a given depth, and modules import functions from
+the modules before them. The same parameters and seed always generate the
+same system.
+"""
+import random
+from typing import Dict, List
+
+LANGUAGES = ["python", "fortran"]
+
+
+class SyntheticSystemSpec:
+    """Class SyntheticSystemSpec
+    The parameters of a synthetic system.
+
+    Current Fields:
+        - modules: The number of modules of the system
+        - functions: The number of functions defined in every module
+        - depth: The maximum nesting depth of the loops and conditionals of a function
+        - statements: The number of statements in every block
+        - loop_density: The probability for a statement to be a loop (if depth allows it)
+        - if_density: The probability for a statement to be a conditional (if depth allows it)
+        - imports: The number of previous modules every module imports functions from
+        - seed: The seed of the random choices
+    """
+
+    def __init__(
+        self,
+        modules: int = 4,
+        functions: int = 4,
+        depth: int = 2,
+        statements: int = 3,
+        loop_density: float = 0.2,
+        if_density: float = 0.2,
+        imports: int = 1,
+        seed: int = 0,
+    ):
+        self.modules = modules
+        self.functions = functions
+        self.depth = depth
+        self.statements = statements
+        self.loop_density = loop_density
+        self.if_density = if_density
+        self.imports = imports
+        self.seed = seed
+
+    def to_dict(self) -> dict:
+        return dict(vars(self))
+
+
+def module_name(module: int) -> str:
+    return f"synthetic_module_{module}"
+
+
+def function_name(module: int, function: int) -> str:
+    return f"func_{module}_{function}"
+
+
+def imported_modules(spec: SyntheticSystemSpec, module: int) -> List[int]:
+    """Returns the modules that module imports functions from"""
+    return list(range(max(0, module - spec.imports), module))
+
+
+class StatementChooser:
+    """Picks the kind of every statement of the function bodies"""
+
+    def __init__(self, spec: SyntheticSystemSpec, rng: random.Random):
+        self.spec = spec
+        self.rng = rng
+
+    def choose(self, level: int) -> str:
+        if level < self.spec.depth:
+            draw = self.rng.random()
+            if draw < self.spec.loop_density:
+                return "loop"
+            if draw < self.spec.loop_density + self.spec.if_density:
+                return "if"
+        return "call" if self.rng.random() < 0.25 else "assign"
+
+
+def generate_python_system(spec: SyntheticSystemSpec) -> Dict[str, str]:
+    """Returns the paths of the files of a synthetic Python system to their source code.
+    The last module has a main function that calls a function of every module.
+    """
+    rng = random.Random(spec.seed)
+    chooser = StatementChooser(spec, rng)
+    sources = {}
+
+    for module in range(spec.modules):
+        callees = [
+            function_name(imported, function)
+            for imported in imported_modules(spec, module)
+            for function in range(spec.functions)
+        ]
+        lines = [
+            f"from {module_name(imported)} import "
+            + ", ".join(function_name(imported, f) for f in range(spec.functions))
+            for imported in imported_modules(spec, module)
+        ]
+        if len(lines) > 0:
+            lines.append("")
+
+        for function in range(spec.functions):
+            lines.append("")
+            lines.append(f"def {function_name(module, function)}(x, y):")
+            lines.append("    z = x + y")
+            python_block(lines, chooser, callees, 1)
+            lines.append("    return z")
+            lines.append("")
+            # Later functions of the module can call the earlier ones
+            callees.append(function_name(module, function))
+
+        if module == spec.modules - 1:
+            lines.append("")
+            lines.append("def main():")
+            lines.append("    total = 0")
+            for called in range(spec.modules):
+                if called != module and called not in imported_modules(spec, module):
+                    continue
+                lines.append(f"    total = total + {function_name(called, 0)}(1, 2)")
+            lines.append("    return total")
+            lines.append("")
+
+        sources[f"{module_name(module)}.py"] = "\n".join(lines) + "\n"
+
+    return sources
+
+
+def python_block(lines: List[str], chooser: StatementChooser, callees: List[str], level: int):
+    indent = "    " * level
+    for _ in range(chooser.spec.statements):
+        kind = chooser.choose(level)
+        if kind == "loop":
+            lines.append(f"{indent}for i{level} in range(10):")
+            lines.append(f"{indent}    z = z + i{level}")
+            python_block(lines, chooser, callees, level + 1)
+        elif kind == "if":
+            lines.append(f"{indent}if z > {chooser.rng.randint(0, 100)}:")
+            python_block(lines, chooser, callees, level + 1)
+            lines.append(f"{indent}else:")
+            lines.append(f"{indent}    z = z - x")
+        elif kind == "call" and len(callees) > 0:
+            lines.append(f"{indent}z = z + {chooser.rng.choice(callees)}(x, z)")
+        else:
+            lines.append(f"{indent}z = z * {chooser.rng.randint(2, 9)} + y")
+
+
+def generate_fortran_system(spec: SyntheticSystemSpec) -> Dict[str, str]:
+    """Returns the paths of the files of a synthetic Fortran system to their source code.
+    Every module is a Fortran module of subroutines, and the last file is a
+    program that calls a subroutine of every module.
+    """
+    rng = random.Random(spec.seed)
+    chooser = StatementChooser(spec, rng)
+    sources = {}
+
+    for module in range(spec.modules):
+        callees = [
+            function_name(imported, function)
+            for imported in imported_modules(spec, module)
+            for function in range(spec.functions)
+        ]
+        lines = [f"module {module_name(module)}"]
+        lines.extend(
+            f"  use {module_name(imported)}"
+            for imported in imported_modules(spec, module)
+        )
+        lines.append("  implicit none")
+        lines.append("contains")
+
+        for function in range(spec.functions):
+            lines.append("")
+            lines.append(f"  subroutine {function_name(module, function)}(x, y, z)")
+            lines.append("    real, intent(in) :: x, y")
+            lines.append("    real, intent(out) :: z")
+            lines.append("    real :: w")
+            lines.extend(f"    integer :: i{level}" for level in range(1, spec.depth + 1))
+            lines.append("    z = x + y")
+            fortran_block(lines, chooser, callees, 1)
+            lines.append(f"  end subroutine {function_name(module, function)}")
+            callees.append(function_name(module, function))
+
+        lines.append(f"end module {module_name(module)}")
+        sources[f"{module_name(module)}.f95"] = "\n".join(lines) + "\n"
+
+    lines = ["program synthetic_main"]
+    lines.extend(f"  use {module_name(module)}" for module in range(spec.modules))
+    lines.append("  implicit none")
+    lines.append("  real :: z")
+    lines.extend(
+        f"  call {function_name(module, 0)}(1.0, 2.0, z)"
+        for module in range(spec.modules)
+    )
+    lines.append("end program synthetic_main")
+    sources["synthetic_main.f95"] = "\n".join(lines) + "\n"
+
+    return sources
+
+
+def fortran_block(lines: List[str], chooser: StatementChooser, callees: List[str], level: int):
+    indent = "  " * (level + 1)
+    for _ in range(chooser.spec.statements):
+        kind = chooser.choose(level)
+        if kind == "loop":
+            lines.append(f"{indent}do i{level} = 1, 10")
+            lines.append(f"{indent}  z = z + i{level}")
+            fortran_block(lines, chooser, callees, level + 1)
+            lines.append(f"{indent}end do")
+        elif kind == "if":
+            lines.append(f"{indent}if (z > {chooser.rng.randint(0, 100)}.0) then")
+            fortran_block(lines, chooser, callees, level + 1)
+            lines.append(f"{indent}else")
+            lines.append(f"{indent}  z = z - x")
+            lines.append(f"{indent}end if")
+        elif kind == "call" and len(callees) > 0:
+            lines.append(f"{indent}call {chooser.rng.choice(callees)}(x, z, w)")
+            lines.append(f"{indent}z = z + w")
+        else:
+            lines.append(f"{indent}z = z * {chooser.rng.randint(2, 9)}.0 + y")
+
+
+def generate_system(language: str, spec: SyntheticSystemSpec) -> Dict[str, str]:
+    """Returns the paths of the files of a synthetic system in language to their source code"""
+    if language == "python":
+        return generate_python_system(spec)
+    if language == "fortran":
+        return generate_fortran_system(spec)
+    raise ValueError(f"Unknown language {language}, expected one of {LANGUAGES}")
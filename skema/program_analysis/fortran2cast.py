@@ -36,6 +36,21 @@ def get_args():
     return options
 
 
+def fortran_source_to_cast(source: str, path: str, intern_table=None) -> CAST:
+    """Create a CAST object from the contents of a Fortran source file.
+
+    Args:
+        source: The Fortran source code
+        path: The path of the source file, used in the source references
+        intern_table: The InternTable the SourceRefs of the nodes are shared through
+                     (i.e. the one of the PipelineContext of the run), a new one if None.
+
+    Returns:
+        The CAST object.
+    """
+    return TS2CAST(path, source, intern_table).out_cast
+
+
 def fortran_to_cast(
     path,
     agraph=False,
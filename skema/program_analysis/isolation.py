@@ -0,0 +1,242 @@
+"""
+isolation.py runs the files of a system through the CODE2FN pipeline in
+isolated worker processes, one process per file, so that a single
+pathological file can't bring down a whole ingestion.
+
+Every worker is bounded by a wall-clock timeout and a memory limit. A file
+whose worker fails, runs out of time or out of memory is recorded as a
+ModuleFailure (with the pass it was in) and left out of the collection,
+while the other files are converted as usual.
+"""
+import multiprocessing
+import os
+import time
+import traceback
+from collections import deque
+from multiprocessing.connection import wait
+from typing import Callable, Dict, Iterator, List, Optional
+
+from skema.gromet.fn import GrometFNModule
+from skema.utils import misc
+
+
+class ModuleFailure:
+    """Class ModuleFailure
+    A file of a system that couldn't be converted.
+
+    Current Fields:
+        - file: The path of the file, relative to the root of the system
+        - pass_name: The pass the file was in when it failed, or None if it
+                     failed before entering the pipeline
+        - exception: The name of the exception the file failed with (TimeoutError
+                     if it ran out of time, WorkerExited if its worker was killed)
+        - message: The message of the exception
+        - traceback: The formatted traceback of the exception, if there is one
+    """
+
+    def __init__(
+        self,
+        file: str,
+        pass_name: Optional[str],
+        exception: str,
+        message: str,
+        traceback: Optional[str] = None,
+    ):
+        self.file = file
+        self.pass_name = pass_name
+        self.exception = exception
+        self.message = message
+        self.traceback = traceback
+
+    def to_dict(self) -> dict:
+        return {
+            "file": self.file,
+            "pass": self.pass_name,
+            "exception": self.exception,
+            "message": self.message,
+            "traceback": self.traceback,
+        }
+
+    def __str__(self):
+        return f"{self.file} failed in {self.pass_name}: {self.exception}: {self.message}"
+
+
+def address_space_size() -> int:
+    """Returns the size of the address space of this process in bytes,
+    or 0 if it can't be determined"""
+    try:
+        with open("/proc/self/statm") as f:
+            return int(f.read().split()[0]) * os.sysconf("SC_PAGE_SIZE")
+    except (OSError, ValueError):
+        return 0
+
+
+def limit_memory(memory_limit: int):
+    """Limits the memory this process can allocate on top of what it already
+    uses to memory_limit bytes. Past the limit, allocations raise a MemoryError.
+    This is a no-op on platforms without the resource module (i.e. Windows).
+    """
+    try:
+        import resource
+    except ImportError:
+        return
+
+    limit = address_space_size() + memory_limit
+    _, hard = resource.getrlimit(resource.RLIMIT_AS)
+    if hard != resource.RLIM_INFINITY:
+        limit = min(limit, hard)
+    resource.setrlimit(resource.RLIMIT_AS, (limit, hard))
+
+
+def isolated_worker(connection, convert, file: str, memory_limit: Optional[int]):
+    """Entry point of a worker process: converts file and sends every pass it
+    enters, then the generated module or the error it failed with, through connection"""
+    # Workers forked from the same parent inherit the state of the random number
+    # generator that backs uuid.uuid4, see init_worker in multi_file_ingester
+    misc.rd.seed()
+    if memory_limit is not None:
+        limit_memory(memory_limit)
+
+    try:
+        generated_gromet = convert(
+            file, on_pass=lambda pass_name: connection.send(("pass", pass_name))
+        )
+        connection.send(("result", generated_gromet))
+    except BaseException as e:
+        connection.send(
+            ("error", type(e).__name__, str(e), traceback.format_exc())
+        )
+    finally:
+        connection.close()
+
+
+class RunningFile:
+    """A file being converted by a worker process"""
+
+    def __init__(self, idx: int, file: str, process, deadline: Optional[float]):
+        self.idx = idx
+        self.file = file
+        self.process = process
+        self.deadline = deadline
+        self.pass_name = None
+
+
+def convert_isolated(
+    convert: Callable[..., GrometFNModule],
+    files: List[str],
+    workers: int = 1,
+    timeout: Optional[float] = None,
+    memory_limit: Optional[int] = None,
+    failures: Optional[List[ModuleFailure]] = None,
+    on_pass: Optional[Callable[[str, str], None]] = None,
+) -> Iterator[Optional[GrometFNModule]]:
+    """Runs convert on every file of files, each in a worker process of its own,
+    and yields the generated modules in the same order as files.
+
+    Args:
+        convert: The function that converts a file. It's called with the file and
+                 an on_pass keyword argument, like file_to_gromet.
+        files: The files to convert
+        workers: The number of worker processes that run at once
+        timeout: The number of seconds a file can take, after which its worker is killed
+        memory_limit: The number of bytes a worker can allocate
+        failures: A list the ModuleFailures of the files that fail are appended to.
+                 None is yielded in place of their modules.
+        on_pass: An optional callback, called in this process with a file and the name
+                 of every pass the file enters, as its worker reports them
+    """
+    running: Dict[object, RunningFile] = {}
+    pending = deque(enumerate(files))
+    results: Dict[int, Optional[GrometFNModule]] = {}
+    next_idx = 0
+
+    def fail(running_file: RunningFile, exception: str, message: str, trace=None):
+        failure = ModuleFailure(
+            running_file.file.strip(), running_file.pass_name, exception, message, trace
+        )
+        print(f"FAILURE: {failure}")
+        if failures is not None:
+            failures.append(failure)
+        results[running_file.idx] = None
+
+    def finish(connection):
+        running_file = running.pop(connection)
+        connection.close()
+        running_file.process.join()
+
+    try:
+        while next_idx < len(files):
+            # Hand out the results in order, as soon as they're available
+            if next_idx in results:
+                yield results.pop(next_idx)
+                next_idx += 1
+                continue
+
+            while len(pending) > 0 and len(running) < max(1, workers):
+                idx, file = pending.popleft()
+                receiver, sender = multiprocessing.Pipe(duplex=False)
+                process = multiprocessing.Process(
+                    target=isolated_worker,
+                    args=(sender, convert, file, memory_limit),
+                    daemon=True,
+                )
+                process.start()
+                sender.close()
+                deadline = time.monotonic() + timeout if timeout is not None else None
+                running[receiver] = RunningFile(idx, file, process, deadline)
+
+            deadlines = [
+                running_file.deadline
+                for running_file in running.values()
+                if running_file.deadline is not None
+            ]
+            wait_time = (
+                max(0, min(deadlines) - time.monotonic())
+                if len(deadlines) > 0
+                else None
+            )
+
+            for connection in wait(list(running.keys()), timeout=wait_time):
+                running_file = running[connection]
+                try:
+                    message = connection.recv()
+                except EOFError:
+                    # The worker died without reporting anything, i.e. it was killed
+                    # by the operating system, or crashed when it hit the memory limit
+                    finish(connection)
+                    exitcode = running_file.process.exitcode
+                    fail(
+                        running_file,
+                        "WorkerExited",
+                        f"The worker was killed by signal {-exitcode}"
+                        if exitcode < 0
+                        else f"The worker exited with code {exitcode}",
+                    )
+                    continue
+
+                if message[0] == "pass":
+                    running_file.pass_name = message[1]
+                    if on_pass is not None:
+                        on_pass(running_file.file, message[1])
+                elif message[0] == "result":
+                    finish(connection)
+                    results[running_file.idx] = message[1]
+                else:
+                    finish(connection)
+                    fail(running_file, message[1], message[2], message[3])
+
+            now = time.monotonic()
+            for connection, running_file in list(running.items()):
+                if running_file.deadline is not None and now >= running_file.deadline:
+                    running_file.process.kill()
+                    finish(connection)
+                    fail(
+                        running_file,
+                        "TimeoutError",
+                        f"The file took longer than {timeout} seconds",
+                    )
+    finally:
+        # If the caller stops early, don't leave workers behind
+        for connection, running_file in list(running.items()):
+            running_file.process.kill()
+            finish(connection)
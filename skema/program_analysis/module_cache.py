@@ -0,0 +1,340 @@
+"""
+module_cache.py implements a persistent, content-addressed cache of the
+GroMEt FN modules generated by the CODE2FN pipeline.
+
+Entries are keyed by a hash of the source file's contents together with the
+file's path within the system and the system's root directory, the contents of
+the other files of the system it imports (directly or not), the GroMEt schema
+version and the pipeline version, which includes a digest of the pipeline's own
+code. Unchanged files can then be loaded from the cache instead of going back
+through the CAST and AnnCAST passes. The cache occupies a bounded amount of
+disk space: once it grows past its maximum size, the least recently used
+entries are evicted. Entries that no longer load (i.e. pickled with classes
+that have since changed) are misses, and are removed.
+"""
+import ast
+import functools
+import hashlib
+import os
+import pickle
+import tempfile
+import threading
+from typing import Callable, Dict, List, Optional, Set
+
+from skema.gromet.fn import GrometFNModule
+
+# NOTE: Bump this whenever a change outside of PIPELINE_PACKAGES changes the
+# GroMEt the pipeline generates, or the classes of the cached modules
+PIPELINE_VERSION = "2"
+
+# The packages the code of the pipeline is in. Any change to their code
+# changes the key of every entry (see pipeline_digest)
+PIPELINE_PACKAGES = ["skema.program_analysis", "skema.gromet", "skema.utils"]
+
+CACHE_ENTRY_SUFFIX = ".gromet.pickle"
+
+# Default maximum size of the cache on disk: 1 GiB
+DEFAULT_MAX_SIZE = 1 << 30
+
+
+class GrometModuleCache:
+    """On-disk cache of generated GrometFNModule objects.
+
+    Current Fields:
+        - cache_dir: The directory the entries are stored in
+        - max_size: The maximum size, in bytes, of all the entries together
+        - schema_version: The GroMEt schema version that's part of every key
+        - hits: The number of lookups that found an entry
+        - misses: The number of lookups that didn't find an entry
+        - evictions: The number of entries removed to stay under max_size
+    """
+
+    def __init__(
+        self,
+        cache_dir: str,
+        max_size: int = DEFAULT_MAX_SIZE,
+        schema_version: str = "0.1.6",
+    ):
+        self.cache_dir = cache_dir
+        self.max_size = max_size
+        self.schema_version = schema_version
+
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+        self.lock = threading.Lock()
+
+        os.makedirs(self.cache_dir, exist_ok=True)
+        self.size = sum(os.path.getsize(path) for path in self.entry_paths())
+
+    def key(
+        self,
+        file_name: str,
+        source: bytes,
+        variant: str = "",
+        dependencies: bytes = b"",
+        root_dir: str = "",
+    ) -> str:
+        """Returns the cache key for the source file file_name whose contents are source.
+        file_name is the path of the file relative to the root of its system,
+        since it determines the name and the source references of the generated module.
+        variant names the options of the pipeline that change the module it generates
+        (i.e. "dedup_metadata"), so that modules generated with different ones don't collide.
+        dependencies is the digest of the other files of the system the file imports
+        (see dependency_digests), since the module generated for a file also depends
+        on what they define (i.e. the names a 'from module import *' binds).
+        root_dir is the root directory of the system, which some front ends
+        (i.e. Fortran's) include in the source references of the module.
+        """
+        digest = hashlib.sha256()
+        parts = (
+            PIPELINE_VERSION,
+            pipeline_digest(),
+            self.schema_version,
+            file_name.strip(),
+            root_dir.strip(),
+        )
+        if variant:
+            parts += (variant,)
+        for part in parts:
+            digest.update(part.encode("utf-8"))
+            digest.update(b"\0")
+        digest.update(dependencies)
+        digest.update(b"\0")
+        digest.update(source)
+        return digest.hexdigest()
+
+    def entry_path(self, key: str) -> str:
+        return os.path.join(self.cache_dir, key + CACHE_ENTRY_SUFFIX)
+
+    def entry_paths(self):
+        return [
+            os.path.join(self.cache_dir, entry)
+            for entry in os.listdir(self.cache_dir)
+            if entry.endswith(CACHE_ENTRY_SUFFIX)
+        ]
+
+    def get(self, key: str) -> Optional[GrometFNModule]:
+        """Returns the module stored under key, or None if there isn't one.
+        Entries that can't be loaded (i.e. written by another version of the
+        pipeline whose classes have since changed) are misses, and are removed."""
+        path = self.entry_path(key)
+        try:
+            with open(path, "rb") as f:
+                module = pickle.load(f)
+        except FileNotFoundError:
+            with self.lock:
+                self.misses += 1
+            return None
+        except Exception:
+            self.remove(path)
+            with self.lock:
+                self.misses += 1
+            return None
+
+        # Touching the entry marks it as the most recently used one
+        try:
+            os.utime(path)
+        except OSError:
+            pass
+
+        with self.lock:
+            self.hits += 1
+        return module
+
+    def put(self, key: str, module: GrometFNModule):
+        """Stores module under key, evicting the least recently used entries if
+        the cache grows past its maximum size"""
+        path = self.entry_path(key)
+
+        # Write to a temporary file first and then move it into place, so that
+        # concurrent readers never see a partially written entry
+        fd, tmp_path = tempfile.mkstemp(dir=self.cache_dir, suffix=".tmp")
+        try:
+            with os.fdopen(fd, "wb") as f:
+                pickle.dump(module, f, protocol=pickle.HIGHEST_PROTOCOL)
+            old_size = os.path.getsize(path) if os.path.exists(path) else 0
+            os.replace(tmp_path, path)
+        except BaseException:
+            if os.path.exists(tmp_path):
+                os.unlink(tmp_path)
+            raise
+
+        with self.lock:
+            self.size += os.path.getsize(path) - old_size
+            if self.size > self.max_size:
+                self.evict()
+
+    def remove(self, path: str):
+        """Removes the entry at path"""
+        try:
+            size = os.path.getsize(path)
+            os.unlink(path)
+        except OSError:
+            return
+        with self.lock:
+            self.size -= size
+
+    def evict(self):
+        """Removes the least recently used entries until the cache is within its maximum size.
+        Entries are ordered by their modification time, which get() refreshes on every hit.
+        """
+        entries = []
+        for path in self.entry_paths():
+            try:
+                stat = os.stat(path)
+            except OSError:
+                continue
+            entries.append((stat.st_mtime, stat.st_size, path))
+        entries.sort()
+
+        self.size = sum(size for _, size, _ in entries)
+        for _, size, path in entries:
+            if self.size <= self.max_size:
+                break
+            try:
+                os.unlink(path)
+            except OSError:
+                continue
+            self.size -= size
+            self.evictions += 1
+
+    def clear(self):
+        """Removes every entry from the cache"""
+        with self.lock:
+            for path in self.entry_paths():
+                try:
+                    os.unlink(path)
+                except OSError:
+                    pass
+            self.size = 0
+
+    def stats(self) -> dict:
+        with self.lock:
+            return {
+                "hits": self.hits,
+                "misses": self.misses,
+                "evictions": self.evictions,
+                "size": self.size,
+                "max_size": self.max_size,
+            }
+
+
+@functools.lru_cache(maxsize=None)
+def pipeline_digest() -> str:
+    """Returns the digest of the code of the pipeline: the Python files of
+    PIPELINE_PACKAGES (apart from their tests), read once per process"""
+    digest = hashlib.sha256()
+    skema_dir = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+    for package in PIPELINE_PACKAGES:
+        package_dir = os.path.join(os.path.dirname(skema_dir), *package.split("."))
+        for directory, subdirectories, files in os.walk(package_dir):
+            subdirectories[:] = sorted(
+                subdirectory
+                for subdirectory in subdirectories
+                if subdirectory != "tests" and not subdirectory.startswith(".")
+            )
+            for file in sorted(files):
+                if not file.endswith(".py"):
+                    continue
+                path = os.path.join(directory, file)
+                digest.update(os.path.relpath(path, skema_dir).encode("utf-8"))
+                digest.update(b"\0")
+                with open(path, "rb") as f:
+                    digest.update(f.read())
+                digest.update(b"\0")
+    return digest.hexdigest()
+
+
+def module_names(file_name: str) -> List[str]:
+    """Returns the dotted names a file of a system can be imported under.
+    Since imports may be resolved from any directory of the system (i.e. the
+    directory of the importing file), every suffix of the file's path is one.
+    """
+    parts = os.path.normpath(file_name.strip()).replace(os.path.sep, "/").split("/")
+    parts[-1] = os.path.splitext(parts[-1])[0]
+    if parts[-1] == "__init__":
+        parts.pop()
+    return [".".join(parts[i:]) for i in range(len(parts))]
+
+
+def imported_modules(file_name: str, source: bytes) -> Set[str]:
+    """Returns the dotted names of the modules the Python file file_name imports,
+    along with their parent packages and, for 'from package import name', the
+    name as a submodule of the package. Files that aren't Python, or that
+    can't be parsed, import nothing."""
+    if not file_name.strip().endswith(".py"):
+        return set()
+    try:
+        tree = ast.parse(source)
+    except (SyntaxError, ValueError):
+        return set()
+
+    package = module_names(file_name)[0].split(".")
+    if not file_name.strip().endswith("__init__.py"):
+        package = package[:-1]
+
+    imported = set()
+
+    def add(dotted_name: str):
+        parts = dotted_name.split(".")
+        for i in range(1, len(parts) + 1):
+            imported.add(".".join(parts[:i]))
+
+    for node in ast.walk(tree):
+        if isinstance(node, ast.Import):
+            for alias in node.names:
+                add(alias.name)
+        elif isinstance(node, ast.ImportFrom):
+            module = node.module or ""
+            if node.level > 0:
+                base = package[: len(package) - (node.level - 1)]
+                module = ".".join(base + ([module] if module else []))
+            if module:
+                add(module)
+            for alias in node.names:
+                if alias.name != "*":
+                    add(f"{module}.{alias.name}" if module else alias.name)
+    return imported
+
+
+def dependency_digests(
+    file_list: List[str], read_source: Callable[[str], bytes]
+) -> Dict[str, bytes]:
+    """Returns, for every file of a system, the digest of the contents of the
+    other files of the system it imports, directly or through other files.
+    The imports are over approximated: a file that may be imported under a
+    name counts as a dependency, so that no change can be missed."""
+    sources = {f: read_source(f) for f in file_list}
+
+    files_by_name = {}
+    for f in file_list:
+        for name in module_names(f):
+            files_by_name.setdefault(name, set()).add(f)
+
+    imports = {}
+    for f in file_list:
+        imports[f] = set()
+        for name in imported_modules(f, sources[f]):
+            imports[f].update(files_by_name.get(name, ()))
+        imports[f].discard(f)
+
+    digests = {}
+    for f in file_list:
+        closure = set()
+        stack = list(imports[f])
+        while stack:
+            dependency = stack.pop()
+            if dependency in closure or dependency == f:
+                continue
+            closure.add(dependency)
+            stack.extend(imports[dependency])
+
+        digest = hashlib.sha256()
+        for dependency in sorted(closure):
+            digest.update(dependency.strip().encode("utf-8"))
+            digest.update(b"\0")
+            digest.update(hashlib.sha256(sources[dependency]).digest())
+        digests[f] = digest.digest() if closure else b""
+    return digests
@@ -4,14 +4,41 @@ import glob
 import sys
 import os.path
 
+import posixpath
+
+from concurrent.futures import ProcessPoolExecutor
+from functools import partial
+from typing import Callable, Dict, Iterator, List, Optional, Union
+
 from skema.gromet.fn import (
+    GrometFNModule,
     GrometFNModuleCollection,
+    GrometObject,
 )
 
 from skema.program_analysis.run_ann_cast_pipeline import ann_cast_pipeline
-from skema.program_analysis.python2cast import python_to_cast
-from skema.program_analysis.fortran2cast import fortran_to_cast
+from skema.program_analysis.python2cast import python_source_to_cast
+from skema.program_analysis.fortran2cast import fortran_source_to_cast
+from skema.program_analysis.module_cache import (
+    GrometModuleCache,
+    dependency_digests,
+)
+from skema.program_analysis.isolation import ModuleFailure, convert_isolated
+from skema.program_analysis.pipeline_context import (
+    PipelineContext,
+    normalize_source_path,
+    METADATA_FULL,
+    METADATA_LEVELS,
+)
+from skema.program_analysis.pipeline_profiler import (
+    PipelineProfiler,
+    PROFILE_FORMATS,
+)
+from skema.program_analysis.CAST2FN.model.cast import AstNode
+from skema.program_analysis.PyAST2CAST import builtin_map
+from skema.program_analysis.PyAST2CAST.import_resolver import get_stdlib_exports
 from skema.utils.fold import dictionary_to_gromet_json, del_nulls
+from skema.utils import misc
 
 
 def get_args():
@@ -32,84 +59,581 @@ def get_args():
         action="store_true",
         help="If true, the script write the output to a JSON file",
     )
+    parser.add_argument(
+        "--workers",
+        type=int,
+        default=1,
+        help="Number of worker processes used to convert files in parallel (default: 1, no parallelism)",
+    )
+    parser.add_argument(
+        "--cache_dir",
+        type=str,
+        help="Directory of an on-disk cache of generated modules, unchanged files are loaded from it",
+    )
+    parser.add_argument(
+        "--profile",
+        type=str,
+        help="Measures the time, memory and node counts of every pass over every file, and writes them to the given file",
+    )
+    parser.add_argument(
+        "--profile_format",
+        choices=PROFILE_FORMATS,
+        default="json",
+        help="Format of the --profile file: json, or chrome for a chrome://tracing trace (default: json)",
+    )
+    parser.add_argument(
+        "--isolate",
+        action="store_true",
+        help="Converts every file in a worker process of its own, files that fail are left out of the collection",
+    )
+    parser.add_argument(
+        "--timeout",
+        type=float,
+        help="With --isolate, the number of seconds a file can take before it's abandoned",
+    )
+    parser.add_argument(
+        "--memory_limit",
+        type=int,
+        help="With --isolate, the number of MiB the worker of a file can allocate",
+    )
+    parser.add_argument(
+        "--dedup_metadata",
+        action="store_true",
+        help="Stores every distinct metadata entry of a module once, with one provenance per module",
+    )
+    parser.add_argument(
+        "--metadata_level",
+        choices=METADATA_LEVELS,
+        default=METADATA_FULL,
+        help="How much metadata the GroMEt carries: none, minimal (the code file references only) or full (default: full)",
+    )
+    parser.add_argument(
+        "--deep_recursion",
+        action="store_true",
+        help="Runs the pipeline in a thread with a larger stack and recursion limit, for deeply nested sources",
+    )
 
     options = parser.parse_args()
     return options
 
 
+# The in-memory sources of the system being ingested by a worker process,
+# set once per worker by init_worker instead of being sent with every file
+worker_sources = None
+
+
+def init_worker(sources: Dict[str, str] = None):
+    """Initializer for the worker processes of the parallel ingestion mode.
+    Workers forked from the same parent inherit the state of the random number
+    generator that backs uuid.uuid4 (see skema.utils.misc), so we reseed it
+    to keep the UUIDs generated by different workers from colliding.
+    """
+    global worker_sources
+    misc.rd.seed()
+    worker_sources = sources
+
+
+def preload_tables():
+    """Loads the tables every run of the pipeline reads (the Python builtins map and the
+    exports of the standard library), so that the worker processes forked after
+    it inherit them instead of each loading them again"""
+    builtin_map.get_map()
+    get_stdlib_exports()
+
+
+def source_to_gromet(
+    file: str, source: str, context: PipelineContext
+) -> GrometFNModule:
+    """Runs the source code of a single file of a system through the CAST -> AnnCAST -> GroMEt pipeline.
+
+    Args:
+        file: The path of the file relative to the root of the system
+        source: The contents of the file
+        context: The PipelineContext of the run. If it holds the sources of the
+                 system, imports are resolved against them, otherwise against
+                 the files in its root directory.
+
+    Returns:
+        The generated GrometFNModule, or None if the file's language
+        isn't supported.
+    """
+    file = file.strip("\n")
+    if context.sources is None:
+        full_file = os.path.join(os.path.normpath(context.root_dir), file)
+    else:
+        full_file = normalize_source_path(file)
+
+    if context.file_name is None:
+        context.file_name = file
+
+    # The CAST nodes are counted once the pass is done, so the list is filled in the pass
+    cast_nodes = []
+
+    # To maintain backwards compatibility for the process_file_system function, for now we will determine the language by file extension
+    if full_file.endswith(".py"):
+        if context.sources is None:
+            search_path = [os.path.dirname(os.path.abspath(full_file))]
+            virtual_modules = None
+        else:
+            search_path = None
+            virtual_modules = context.virtual_modules(
+                posixpath.dirname(full_file)
+            )
+        with context.run_pass("PyASTToCAST", cast_nodes, AstNode):
+            cast = python_source_to_cast(
+                source,
+                full_file.split("/")[-1],
+                search_path=search_path,
+                virtual_modules=virtual_modules,
+                deep_recursion=context.deep_recursion,
+                intern_table=context.intern_table,
+            )
+            cast_nodes.append(cast.nodes)
+    elif full_file.endswith(".F") or full_file.endswith(".f95"):
+        with context.run_pass("TS2CAST", cast_nodes, AstNode):
+            cast = fortran_source_to_cast(
+                source, full_file, intern_table=context.intern_table
+            )
+            cast_nodes.append(cast.nodes)
+    else:
+        print(f"File extension not supported for {full_file}")
+        return None
+
+    generated_gromet = ann_cast_pipeline(
+        cast, gromet=True, to_file=False, from_obj=True, context=context
+    )
+
+    return generated_gromet
+
+
+def file_to_gromet(
+    root_dir: str,
+    file: str,
+    profiler: PipelineProfiler = None,
+    on_pass: Callable[[str], None] = None,
+    dedup_metadata: bool = False,
+    metadata_level: str = METADATA_FULL,
+    deep_recursion: bool = False,
+) -> GrometFNModule:
+    """Runs a single file of a system through the CAST -> AnnCAST -> GroMEt pipeline.
+
+    Args:
+        root_dir: The root directory of the system being ingested
+        file: The path of the file relative to root_dir
+        profiler: An optional PipelineProfiler that measures every pass over the file
+        on_pass: An optional callback, called with the name of every pass the file enters
+        dedup_metadata: If true, every distinct metadata entry of the module is stored once
+                        (see PipelineContext)
+        metadata_level: How much metadata the module carries, one of METADATA_LEVELS
+                        (see PipelineContext)
+        deep_recursion: If true, the pipeline runs in a thread with a larger stack and
+                        recursion limit, for deeply nested sources (see PipelineContext)
+
+    Returns:
+        The generated GrometFNModule, or None if the file's language
+        isn't supported.
+    """
+    full_file = os.path.join(os.path.normpath(root_dir), file.strip("\n"))
+    with open(full_file) as f:
+        source = f.read()
+
+    # Imports of the system's own modules are resolved against its root directory
+    context = PipelineContext(
+        root_dir=root_dir,
+        profiler=profiler,
+        on_pass=on_pass,
+        dedup_metadata=dedup_metadata,
+        metadata_level=metadata_level,
+        deep_recursion=deep_recursion,
+    )
+    return source_to_gromet(file, source, context)
+
+
+def virtual_file_to_gromet(
+    file: str,
+    sources: Dict[str, str] = None,
+    on_pass: Callable[[str], None] = None,
+    dedup_metadata: bool = False,
+    metadata_level: str = METADATA_FULL,
+    deep_recursion: bool = False,
+) -> GrometFNModule:
+    """Runs a single file of a system that's held in memory through the CAST -> AnnCAST -> GroMEt pipeline.
+
+    Args:
+        file: The path of the file relative to the root of the system
+        sources: A dictionary of the paths of all the files of the system to their
+                 source code. Defaults to the sources the worker process was initialized with.
+        on_pass: An optional callback, called with the name of every pass the file enters
+        dedup_metadata, metadata_level, deep_recursion: See file_to_gromet
+
+    Returns:
+        The generated GrometFNModule, or None if the file's language
+        isn't supported.
+    """
+    if sources is None:
+        sources = worker_sources
+
+    # Imports of the system's own modules are resolved against its other files
+    context = PipelineContext(
+        sources=sources,
+        on_pass=on_pass,
+        dedup_metadata=dedup_metadata,
+        metadata_level=metadata_level,
+        deep_recursion=deep_recursion,
+    )
+    return source_to_gromet(file, context.sources[normalize_source_path(file)], context)
+
+
+def convert_files(
+    convert: Callable[[str], GrometFNModule],
+    files: List[str],
+    workers: int = 1,
+    sources: Dict[str, str] = None,
+) -> Iterator[GrometFNModule]:
+    """Runs convert on every file of files, with a pool of worker processes if workers > 1,
+    and yields the generated modules as they're finished, in the same order as files either way.
+    If sources is given, it's passed to every call of convert. Worker processes
+    receive it once when they start, see init_worker.
+    """
+    try:
+        if workers > 1 and len(files) > 1:
+            preload_tables()
+            with ProcessPoolExecutor(
+                max_workers=workers,
+                initializer=init_worker,
+                initargs=(sources,),
+            ) as executor:
+                # executor.map yields the results in the order the files were
+                # submitted, which keeps the assembled collection deterministic
+                yield from executor.map(convert, files)
+            return
+
+        if sources is not None:
+            convert = partial(convert, sources=sources)
+        for file in files:
+            yield convert(file)
+    except ImportError as e:
+        print("FAILURE")
+        raise e
+
+
+def check_conversion_options(
+    workers: int,
+    isolate: bool,
+    timeout: Optional[float],
+    memory_limit: Optional[int],
+    profiler: PipelineProfiler = None,
+):
+    """Raises a ValueError if the given options of process_file_system or
+    process_sources can't be combined, instead of silently ignoring some of them"""
+    if profiler is not None and isolate:
+        raise ValueError("Profiling isn't supported with isolate")
+    if profiler is not None and workers > 1:
+        raise ValueError(
+            "Profiling converts the files one at a time, it can't be combined with workers > 1"
+        )
+    if not isolate and (timeout is not None or memory_limit is not None):
+        raise ValueError("timeout and memory_limit are only supported with isolate")
+
+
+def cache_variant(dedup_metadata: bool, metadata_level: str = METADATA_FULL) -> str:
+    """Returns the variant of the cache keys of the modules generated with the given options"""
+    options = []
+    if dedup_metadata:
+        options.append("dedup_metadata")
+    if metadata_level != METADATA_FULL:
+        options.append(f"metadata_level={metadata_level}")
+    return ",".join(options)
+
+
+def module_path(root_dir: str, file: str) -> str:
+    """Returns the dotted path of file from the root of the system,
+    i.e. like "model.view.sir" as it shows up in Python
+    """
+    source_directory = os.path.basename(
+        os.path.normpath(root_dir)
+    )  # We just need the last directory of the path, not the complete path
+    os_module_path = os.path.join(source_directory, file)
+
+    # Normalize the path across os and then convert to module dot notation
+    python_module_path = ".".join(os.path.normpath(os_module_path).split(os.path.sep))
+    python_module_path = python_module_path.replace(".py", "").strip()
+
+    return python_module_path
+
+
+def is_executable(generated_gromet: GrometFNModule) -> bool:
+    """Determines if a GroMEt module goes in the 'executables' field of the collection.
+    We do this by finding all user_defined top level functions in the Gromet
+    and check if the name 'main' is among them
+    """
+    defined_functions = [
+        fn.b[0].name
+        for fn in generated_gromet.fn_array
+        if fn.b[0].function_type == "FUNCTION"
+    ]
+    return "main" in defined_functions
+
+
 def process_file_system(
-    system_name, path, files, write_to_file=False
-) -> GrometFNModuleCollection:
+    system_name,
+    path,
+    files,
+    write_to_file=False,
+    workers=1,
+    cache: GrometModuleCache = None,
+    stream=False,
+    profiler: PipelineProfiler = None,
+    isolate=False,
+    timeout: Optional[float] = None,
+    memory_limit: Optional[int] = None,
+    failures: Optional[List[ModuleFailure]] = None,
+    dedup_metadata: bool = False,
+    metadata_level: str = METADATA_FULL,
+    deep_recursion: bool = False,
+) -> Union[GrometFNModuleCollection, Iterator[GrometObject]]:
+    """Runs every file of a system through the CODE2FN pipeline and assembles
+    the generated modules into a GrometFNModuleCollection.
+
+    Args:
+        system_name: The name of the system being ingested
+        path: The root directory of the system
+        files: The path to a file containing the list of files to ingest,
+               relative to path
+        write_to_file: If true, the collection is written to a JSON file
+        workers: The number of worker processes used to convert the files.
+                 With more than one worker, the files are converted in parallel,
+                 but the modules are still assembled in the order of the file list.
+        cache: An optional GrometModuleCache. Modules of files whose contents
+               haven't changed are loaded from it, and the modules of the other
+               files are stored in it once they're generated.
+        stream: If true, returns a generator instead, see iter_module_collection.
+                Nothing is written to a file in this mode.
+        profiler: An optional PipelineProfiler that measures every pass over every file.
+                When profiling, the files are converted one at a time in this process,
+                so that the measurements aren't skewed: workers must be 1.
+        isolate: If true, every file is converted in a worker process of its own
+                 (up to workers at once), see isolation.py. Files that fail are
+                 left out of the collection instead of failing the whole system.
+                 Profiling isn't supported in this mode.
+        timeout: With isolate, the number of seconds a file can take before it's abandoned
+        memory_limit: With isolate, the number of bytes the worker of a file can allocate
+        failures: With isolate, a list the ModuleFailure of every file that fails is appended to
+        dedup_metadata: If true, every distinct metadata entry of a module is stored once,
+                        with one provenance per module (see PipelineContext)
+        metadata_level: How much metadata the modules carry: none, minimal (the code file
+                        references of the modules only) or full (see PipelineContext)
+        deep_recursion: If true, the pipeline runs in a thread with a larger stack and
+                        recursion limit, for deeply nested sources (see PipelineContext).
+                        Callers that run other threads (i.e. the server) must combine
+                        it with isolate or workers > 1, so that the files are converted
+                        in processes of their own.
+
+    Raises a ValueError if the options can't be combined (see check_conversion_options).
+    """
+    check_conversion_options(workers, isolate, timeout, memory_limit, profiler)
     root_dir = path.strip()
     file_list = open(files, "r").readlines()
 
-    module_collection = GrometFNModuleCollection(
+    def read_source(file: str) -> bytes:
+        full_file = os.path.join(os.path.normpath(root_dir), file.strip("\n"))
+        with open(full_file, "rb") as source:
+            return source.read()
+
+    convert_file = partial(
+        file_to_gromet,
+        root_dir,
+        dedup_metadata=dedup_metadata,
+        metadata_level=metadata_level,
+        deep_recursion=deep_recursion,
+    )
+
+    def convert(to_process: List[str]) -> Iterator[GrometFNModule]:
+        if isolate:
+            preload_tables()
+            return convert_isolated(
+                convert_file,
+                to_process,
+                workers,
+                timeout,
+                memory_limit,
+                failures,
+            )
+        if profiler is not None:
+            convert_file_profiled = partial(convert_file, profiler=profiler)
+            return convert_files(convert_file_profiled, to_process)
+        return convert_files(convert_file, to_process, workers)
+
+    records = iter_module_collection(
+        system_name,
+        root_dir,
+        file_list,
+        read_source,
+        convert,
+        cache,
+        cache_variant(dedup_metadata, metadata_level),
+    )
+    if stream:
+        return records
+    return assemble_module_collection(records, write_to_file)
+
+
+def process_sources(
+    system_name: str,
+    sources: Dict[str, str],
+    root_name: str = "",
+    write_to_file=False,
+    workers=1,
+    cache: GrometModuleCache = None,
+    stream=False,
+    isolate=False,
+    timeout: Optional[float] = None,
+    memory_limit: Optional[int] = None,
+    failures: Optional[List[ModuleFailure]] = None,
+    dedup_metadata: bool = False,
+    metadata_level: str = METADATA_FULL,
+    deep_recursion: bool = False,
+) -> Union[GrometFNModuleCollection, Iterator[GrometObject]]:
+    """Runs every file of a system held in memory through the CODE2FN pipeline
+    and assembles the generated modules into a GrometFNModuleCollection.
+    Nothing is written to disk: imports of the system's own modules are
+    resolved against the other files in sources.
+
+    Args:
+        system_name: The name of the system being ingested
+        sources: A dictionary of the paths of the system's files, relative to its root,
+                 to their source code. The modules are assembled in the order of this dictionary.
+        root_name: The name of the system's root directory, the first
+                   component of the module paths in the collection's module_index
+        write_to_file: If true, the collection is written to a JSON file
+        workers: The number of worker processes used to convert the files
+        cache: An optional GrometModuleCache, see process_file_system
+        stream: If true, returns a generator instead, see iter_module_collection
+        isolate, timeout, memory_limit, failures, dedup_metadata, metadata_level,
+        deep_recursion: See process_file_system
+    """
+    check_conversion_options(workers, isolate, timeout, memory_limit)
+    file_list = list(sources.keys())
+
+    def read_source(file: str) -> bytes:
+        return sources[file].encode("utf-8")
+
+    convert_file = partial(
+        virtual_file_to_gromet,
+        dedup_metadata=dedup_metadata,
+        metadata_level=metadata_level,
+        deep_recursion=deep_recursion,
+    )
+
+    def convert(to_process: List[str]) -> Iterator[GrometFNModule]:
+        if isolate:
+            preload_tables()
+            return convert_isolated(
+                partial(convert_file, sources=sources),
+                to_process,
+                workers,
+                timeout,
+                memory_limit,
+                failures,
+            )
+        return convert_files(convert_file, to_process, workers, sources)
+
+    records = iter_module_collection(
+        system_name,
+        root_name,
+        file_list,
+        read_source,
+        convert,
+        cache,
+        cache_variant(dedup_metadata, metadata_level),
+    )
+    if stream:
+        return records
+    return assemble_module_collection(records, write_to_file)
+
+
+def iter_module_collection(
+    system_name: str,
+    root_dir: str,
+    file_list: List[str],
+    read_source: Callable[[str], bytes],
+    convert: Callable[[List[str]], Iterator[GrometFNModule]],
+    cache: GrometModuleCache = None,
+    variant: str = "",
+) -> Iterator[GrometObject]:
+    """Generates the modules of the files in file_list, with convert and from the cache,
+    and yields each one as soon as it's finished, in the order of file_list.
+    read_source returns the contents of a file, which are only needed for the cache keys.
+    variant names the options convert generates the modules with, see GrometModuleCache.key
+
+    The last object yielded is a trailer: a GrometFNModuleCollection without modules,
+    holding the module_index and executables of the modules yielded before it.
+    Modules aren't kept around once they're yielded, so the collection
+    never has to be held in memory all at once.
+    """
+    generated_gromets = [None] * len(file_list)
+
+    # Look up every file in the cache first, only the files that miss
+    # go through the pipeline. The keys include the files each file imports,
+    # since the module generated for a file depends on them too
+    cache_keys = {}
+    if cache is not None:
+        dependencies = dependency_digests(file_list, read_source)
+        for idx, f in enumerate(file_list):
+            cache_keys[idx] = cache.key(
+                f, read_source(f), variant, dependencies[f], root_dir
+            )
+            generated_gromets[idx] = cache.get(cache_keys[idx])
+    to_process = [
+        idx for idx, gromet in enumerate(generated_gromets) if gromet is None
+    ]
+
+    results = convert([file_list[idx] for idx in to_process])
+
+    module_index = []
+    executables = []
+    for idx, f in enumerate(file_list):
+        generated_gromet = generated_gromets[idx]
+        generated_gromets[idx] = None
+        if generated_gromet is None:
+            # The results come in the order of to_process
+            generated_gromet = next(results)
+            if cache is not None and generated_gromet is not None:
+                cache.put(cache_keys[idx], generated_gromet)
+        if generated_gromet is None:
+            continue
+
+        # Then, after we generate the GroMEt we hand it out and store
+        # its path in the 'module_index' field
+        module_index.append(module_path(root_dir, f))
+        if is_executable(generated_gromet):
+            executables.append(len(module_index))
+
+        yield generated_gromet
+
+    yield GrometFNModuleCollection(
         schema_version="0.1.6",
         name=system_name,
-        modules=[],
-        module_index=[],
-        executables=[],
-    )
-
-    for f in file_list:
-        full_file = os.path.join(os.path.normpath(root_dir), f.strip("\n"))
-        
-        try:
-            # To maintain backwards compatibility for the process_file_system function, for now we will determine the language by file extension
-            if full_file.endswith(".py"):
-                cast = python_to_cast(full_file, cast_obj=True)
-            elif full_file.endswith(".F") or full_file.endswith(".f95"):
-                cast = fortran_to_cast(full_file, cast_obj=True)
-            else:
-                print(f"File extension not supported for {full_file}")
-            
-            cur_dir = os.getcwd()
-            os.chdir(os.path.join(os.getcwd(), path))
-            generated_gromet = ann_cast_pipeline(
-                cast, gromet=True, to_file=False, from_obj=True
-            )
-            os.chdir(cur_dir)
-
-            # Then, after we generate the GroMEt we store it in the 'modules' field
-            # and store its path in the 'module_index' field
-            module_collection.modules.append(generated_gromet)
-
-            # DONE: Change this so that it's the dotted path from the root
-            # i.e. like model.view.sir" like it shows up in Python
-            source_directory = os.path.basename(
-                os.path.normpath(root_dir)
-            )  # We just need the last directory of the path, not the complete path
-            os_module_path = os.path.join(source_directory, f)
-                       
-            # Normalize the path across os and then convert to module dot notation
-            python_module_path = ".".join(os.path.normpath(os_module_path).split(os.path.sep))
-            python_module_path = python_module_path.replace(".py", "").strip()
-            
-            module_collection.module_index.append(python_module_path)
-
-            # Done: Determine how we know a gromet goes in the 'executable' field
-            # We do this by finding all user_defined top level functions in the Gromet
-            # and check if the name 'main' is among them
-            function_networks = [
-                fn
-                for fn in generated_gromet.fn_array
-            ]
-            defined_functions = [
-                fn.b[0].name
-                for fn in function_networks
-                if fn.b[0].function_type == "FUNCTION"
-            ]
-            if "main" in defined_functions:
-                module_collection.executables.append(
-                    len(module_collection.module_index)
-                )
-
-        except ImportError as e:
-            print("FAILURE")
-            raise e
+        module_index=module_index,
+        executables=executables,
+    )
+
+
+def assemble_module_collection(
+    records: Iterator[GrometObject], write_to_file=False
+) -> GrometFNModuleCollection:
+    """Collects the modules yielded by iter_module_collection into the
+    GrometFNModuleCollection described by its trailer"""
+    modules = []
+    for record in records:
+        if isinstance(record, GrometFNModuleCollection):
+            module_collection = record
+        else:
+            modules.append(record)
+    module_collection.modules = modules
 
     if write_to_file:
-        with open(f"{system_name}--Gromet-FN-auto.json", "w") as f:
+        with open(f"{module_collection.name}--Gromet-FN-auto.json", "w") as f:
             gromet_collection_dict = module_collection.to_dict()
             f.write(
                 dictionary_to_gromet_json(del_nulls(gromet_collection_dict))
@@ -118,6 +642,17 @@ def process_file_system(
     return module_collection
 
 
+def iter_ndjson(records: Iterator[GrometObject]) -> Iterator[str]:
+    """Renders every object yielded by iter_module_collection as one line of
+    newline delimited JSON. Module lines have an "fn" field, and the trailer
+    line, which comes last, has the "module_index" and "executables" fields.
+    """
+    for record in records:
+        yield dictionary_to_gromet_json(
+            del_nulls(record.to_dict()), compact=True
+        ) + "\n"
+
+
 if __name__ == "__main__":
     args = get_args()
 
@@ -129,4 +664,36 @@ if __name__ == "__main__":
     print(f"With root directory as specified in: {path}")
     print(f"Ingesting the files as specified in: {files}")
 
-    process_file_system(system_name, path, files, args.write)
+    cache = GrometModuleCache(args.cache_dir) if args.cache_dir else None
+    profiler = PipelineProfiler() if args.profile else None
+    failures = []
+
+    process_file_system(
+        system_name,
+        path,
+        files,
+        args.write,
+        args.workers,
+        cache,
+        profiler=profiler,
+        isolate=args.isolate,
+        timeout=args.timeout,
+        memory_limit=args.memory_limit * 2**20 if args.memory_limit else None,
+        failures=failures,
+        dedup_metadata=args.dedup_metadata,
+        metadata_level=args.metadata_level,
+        deep_recursion=args.deep_recursion,
+    )
+
+    if len(failures) > 0:
+        print(f"{len(failures)} files failed:")
+        for failure in failures:
+            print(f"    {failure}")
+
+    if cache is not None:
+        print(f"Module cache: {cache.stats()}")
+
+    if profiler is not None:
+        profiler.close()
+        profiler.write(args.profile, args.profile_format)
+        print(f"Wrote profile to {args.profile}")
@@ -0,0 +1,212 @@
+"""
+pipeline_context.py defines the PipelineContext, which carries the state
+that one run of the CODE2FN pipeline needs explicitly, instead of through
+the process working directory and module level globals.
+
+This makes the pipeline reentrant: any number of systems can be converted
+concurrently within the same process (i.e. by the threads of the skema-py
+server), since no run changes the working directory or state that another
+run depends on.
+"""
+import os
+import posixpath
+import random
+import uuid
+from contextlib import contextmanager
+from typing import Callable, Dict, List, Optional, Set
+
+from skema.program_analysis.PyAST2CAST import builtin_map
+from skema.program_analysis.PyAST2CAST.import_resolver import ImportResolver
+from skema.program_analysis.pipeline_profiler import PipelineProfiler
+from skema.program_analysis.CAST2FN.interning import InternTable
+
+# The levels of metadata that the GroMEt of a run carries:
+# none: no metadata at all
+# minimal: only the module's metadata (the references of its code files)
+# full: the module's metadata and the source code reference of every GroMEt object
+METADATA_NONE = "none"
+METADATA_MINIMAL = "minimal"
+METADATA_FULL = "full"
+METADATA_LEVELS = [METADATA_NONE, METADATA_MINIMAL, METADATA_FULL]
+
+
+def check_metadata_level(metadata_level: str):
+    """Raises a ValueError if metadata_level isn't one of METADATA_LEVELS"""
+    if metadata_level not in METADATA_LEVELS:
+        raise ValueError(
+            f"Unknown metadata level {metadata_level}, expected one of {METADATA_LEVELS}"
+        )
+
+
+class PipelineContext:
+    """Class PipelineContext
+    Holds the per-run state of the CODE2FN pipeline.
+
+    Current Fields:
+        - root_dir: The root directory of the system being ingested. Imports of
+                    user defined modules are resolved against it (this used to be
+                    done by changing the working directory to it).
+        - rng: The random number generator used to create the UUIDs of this run.
+               Passing a seed makes the UUIDs of a run reproducible.
+        - builtins: The Python builtins map (see builtin_map.py)
+        - imported_modules: The index of the symbols of the user defined modules that
+                    were looked up, so that each one is only read once per run (see import_resolver.py)
+        - sources: For systems ingested from memory instead of from disk, a dictionary
+                    of the paths of the system's files, relative to its root, to their source code.
+                    Imports of user defined modules are then resolved against these files only.
+        - on_pass: An optional callback, called with the name of every pass the file
+                    being converted enters (i.e. to report the progress of a run)
+        - profiler: An optional PipelineProfiler that measures every pass
+        - file_name: The name of the file being converted, which the profiler's records refer to
+        - intern_table: The InternTable that the front ends and the passes share
+                    SourceRefs and identifiers through (see interning.py)
+        - dedup_metadata: Whether the GroMEt metadata_collection holds every distinct metadata
+                    entry once, with all the metadata of a module sharing one provenance,
+                    instead of one entry per GroMEt object (see ToGrometPass.insert_metadata)
+        - metadata_level: How much metadata the generated GroMEt carries, one of METADATA_LEVELS.
+                    Runs that don't need the metadata (i.e. batch runs) skip generating it.
+        - deep_recursion: Whether the CAST is built, and the AnnCAST passes are run, in a thread
+                    with a larger stack and recursion limit, for sources with deeply nested
+                    expressions or statements (see call_with_deep_recursion). The recursion
+                    limit is process wide, so this is only allowed in processes that run
+                    no other threads.
+    """
+
+    def __init__(
+        self,
+        root_dir: Optional[str] = None,
+        seed=None,
+        sources: Optional[Dict[str, str]] = None,
+        on_pass: Optional[Callable[[str], None]] = None,
+        profiler: Optional[PipelineProfiler] = None,
+        file_name: Optional[str] = None,
+        dedup_metadata: bool = False,
+        metadata_level: str = METADATA_FULL,
+        deep_recursion: bool = False,
+    ):
+        check_metadata_level(metadata_level)
+        self.root_dir = root_dir
+        self.rng = random.Random(seed)
+        self.builtins = builtin_map.get_map()
+        self.imported_modules: Dict[str, object] = {}
+        self._import_resolver = None
+        self.sources = (
+            {normalize_source_path(path): source for path, source in sources.items()}
+            if sources is not None
+            else None
+        )
+        self._module_sources = None
+        self.on_pass = on_pass
+        self.profiler = profiler
+        self.file_name = file_name
+        self.intern_table = InternTable()
+        self.dedup_metadata = dedup_metadata
+        self.metadata_level = metadata_level
+        self.deep_recursion = deep_recursion
+
+    def search_path(self) -> List[str]:
+        """Returns the list of directories that user defined modules are resolved against"""
+        if self.root_dir is None:
+            return [os.getcwd()]
+        return [os.path.abspath(self.root_dir)]
+
+    def virtual_modules(self, package_dir: str = "") -> Set[str]:
+        """Returns the dotted names of the in-memory modules that can be imported
+        from the directory package_dir (relative to the root of the system),
+        i.e. for the files "model/parameters.py" and "model/view/__init__.py",
+        the modules importable from "model" are "parameters", "view".
+        Returns None if the system isn't ingested from memory.
+        """
+        if self.sources is None:
+            return None
+
+        package_dir = normalize_source_path(package_dir)
+        modules = set()
+        for path in self.sources:
+            if package_dir != "":
+                if not path.startswith(package_dir + "/"):
+                    continue
+                path = path[len(package_dir) + 1 :]
+            name = python_module_name(path)
+            if name is not None:
+                modules.add(name)
+                # A submodule also makes its parent packages importable
+                parts = name.split(".")
+                for i in range(1, len(parts)):
+                    modules.add(".".join(parts[:i]))
+        return modules
+
+    def module_sources(self) -> Dict[str, str]:
+        """Returns a dictionary of the dotted names (from the root of the system)
+        of the in-memory Python modules to their source code, or None if the
+        system isn't ingested from memory.
+        """
+        if self.sources is None:
+            return None
+
+        if self._module_sources is None:
+            self._module_sources = {
+                python_module_name(path): source
+                for path, source in self.sources.items()
+                if python_module_name(path) is not None
+            }
+        return self._module_sources
+
+    def import_resolver(self) -> ImportResolver:
+        """Returns the ImportResolver that looks up the user defined modules
+        of the system statically, from its root directory or its sources"""
+        if self._import_resolver is None:
+            module_sources = self.module_sources()
+            self._import_resolver = ImportResolver(
+                self.search_path() if module_sources is None else None,
+                module_sources=module_sources,
+                module_exports=self.imported_modules,
+            )
+        return self._import_resolver
+
+    def enter_pass(self, pass_name: str):
+        """Reports that the file being converted enters the pass pass_name"""
+        if self.on_pass is not None:
+            self.on_pass(pass_name)
+
+    @contextmanager
+    def run_pass(self, pass_name: str, nodes=None, node_type=None):
+        """Wraps a pass of the pipeline: reports that the file enters it and,
+        if there's a profiler, measures it. nodes and node_type are used to
+        count the nodes of the tree once the pass is done, see PipelineProfiler.measure.
+        """
+        self.enter_pass(pass_name)
+        if self.profiler is None:
+            yield
+        else:
+            with self.profiler.measure(self.file_name, pass_name, nodes, node_type):
+                yield
+
+    def uuid4(self) -> uuid.UUID:
+        """Returns a random UUID drawn from this context's random number generator"""
+        return uuid.UUID(int=self.rng.getrandbits(128))
+
+
+def normalize_source_path(path: str) -> str:
+    """Normalizes the path of a file relative to the root of a system,
+    i.e. "./model//sir.py" becomes "model/sir.py"
+    """
+    path = path.strip().replace("\\", "/")
+    if path == "":
+        return ""
+    return posixpath.normpath(path).lstrip("/")
+
+
+def python_module_name(path: str) -> Optional[str]:
+    """Returns the dotted module name of the Python file at path,
+    i.e. "model/sir.py" is "model.sir" and "model/__init__.py" is "model".
+    Returns None if path isn't a Python file.
+    """
+    if not path.endswith(".py"):
+        return None
+    parts = path[: -len(".py")].split("/")
+    if parts[-1] == "__init__":
+        parts = parts[:-1]
+    if len(parts) == 0:
+        return None
+    return ".".join(parts)
@@ -0,0 +1,240 @@
+"""
+pipeline_profiler.py implements the instrumentation of the CODE2FN pipeline.
+
+A PipelineProfiler records, for every file and every pass the file goes
+through (CAST generation, then each AnnCAST pass), the wall time, the CPU time,
+the peak memory allocated while the pass ran, and the number of nodes of the
+tree the pass worked on. The records can be exported as JSON, or as a Chrome
+trace to be loaded into chrome://tracing or Perfetto.
+
+Passes are instrumented through the PipelineContext of a run
+(see PipelineContext.run_pass), so they don't need to know about profiling.
+"""
+import json
+import os
+import threading
+import time
+import tracemalloc
+from collections import OrderedDict
+from contextlib import contextmanager
+from typing import Dict, List, Optional, Type
+
+PROFILE_FORMATS = ["json", "chrome"]
+
+
+class PassRecord:
+    """Class PassRecord
+    The measurements of one pass over one file.
+
+    Current Fields:
+        - file_name: The file the pass ran over
+        - pass_name: The name of the pass
+        - start: The time the pass started, in seconds since the profiler was created
+        - wall_time: The elapsed time of the pass, in seconds
+        - cpu_time: The CPU time of the thread that ran the pass, in seconds
+        - peak_memory: The peak amount of memory allocated during the pass
+                       on top of what was allocated before it, in bytes, or None if
+                       memory isn't traced
+        - node_count: The number of nodes of the tree once the pass is done,
+                      or None if they aren't counted
+        - thread_id: The thread that ran the pass
+    """
+
+    def __init__(
+        self,
+        file_name: str,
+        pass_name: str,
+        start: float,
+        wall_time: float,
+        cpu_time: float,
+        peak_memory: Optional[int],
+        node_count: Optional[int],
+        thread_id: int,
+    ):
+        self.file_name = file_name
+        self.pass_name = pass_name
+        self.start = start
+        self.wall_time = wall_time
+        self.cpu_time = cpu_time
+        self.peak_memory = peak_memory
+        self.node_count = node_count
+        self.thread_id = thread_id
+
+    def to_dict(self) -> dict:
+        return {
+            "file": self.file_name,
+            "pass": self.pass_name,
+            "start": self.start,
+            "wall_time": self.wall_time,
+            "cpu_time": self.cpu_time,
+            "peak_memory": self.peak_memory,
+            "node_count": self.node_count,
+        }
+
+
+class PipelineProfiler:
+    """Class PipelineProfiler
+    Collects a PassRecord for every pass of every file of a run.
+
+    Current Fields:
+        - records: The PassRecords, in the order the passes finished
+        - trace_memory: If true, the peak memory of every pass is measured
+                        with tracemalloc. This slows the pipeline down
+                        noticeably, so the times are best compared with each other
+                        rather than with runs that don't trace memory.
+    NOTE: tracemalloc traces the whole process, so the peak memory of passes that
+    run concurrently in several threads of the same process can't be told apart.
+    """
+
+    def __init__(self, trace_memory: bool = True):
+        self.records: List[PassRecord] = []
+        self.trace_memory = trace_memory
+        self.origin = time.perf_counter()
+        self.lock = threading.Lock()
+        self.started_tracing = False
+
+    @contextmanager
+    def measure(self, file_name: str, pass_name: str, nodes=None, node_type=None):
+        """Measures the pass pass_name over file_name, for the duration of the with block.
+        If nodes and node_type are given, the node_type nodes reachable from nodes
+        are counted once the pass is done (which isn't part of the measured time).
+        """
+        if self.trace_memory:
+            if not tracemalloc.is_tracing():
+                tracemalloc.start()
+                self.started_tracing = True
+            if hasattr(tracemalloc, "reset_peak"):
+                tracemalloc.reset_peak()
+            else:
+                # Python < 3.9 has no reset_peak(), clearing the traces resets the peak too
+                tracemalloc.clear_traces()
+            base_memory = tracemalloc.get_traced_memory()[0]
+
+        start_wall = time.perf_counter()
+        start_cpu = time.thread_time()
+        yield
+        wall_time = time.perf_counter() - start_wall
+        cpu_time = time.thread_time() - start_cpu
+
+        peak_memory = None
+        if self.trace_memory:
+            peak_memory = max(0, tracemalloc.get_traced_memory()[1] - base_memory)
+
+        node_count = None
+        if nodes is not None and node_type is not None:
+            node_count = count_nodes(nodes, node_type)
+
+        record = PassRecord(
+            file_name,
+            pass_name,
+            start_wall - self.origin,
+            wall_time,
+            cpu_time,
+            peak_memory,
+            node_count,
+            threading.get_ident(),
+        )
+        with self.lock:
+            self.records.append(record)
+
+    def close(self):
+        """Stops tracing memory, if this profiler is the one that started it"""
+        if self.started_tracing and tracemalloc.is_tracing():
+            tracemalloc.stop()
+        self.started_tracing = False
+
+    def summary(self) -> Dict[str, dict]:
+        """Returns the totals of every pass over all the files,
+        by decreasing wall time"""
+        totals: Dict[str, dict] = {}
+        for record in self.records:
+            total = totals.setdefault(
+                record.pass_name,
+                {"files": 0, "wall_time": 0.0, "cpu_time": 0.0, "peak_memory": None},
+            )
+            total["files"] += 1
+            total["wall_time"] += record.wall_time
+            total["cpu_time"] += record.cpu_time
+            if record.peak_memory is not None:
+                total["peak_memory"] = max(
+                    total["peak_memory"] or 0, record.peak_memory
+                )
+        return OrderedDict(
+            sorted(totals.items(), key=lambda item: -item[1]["wall_time"])
+        )
+
+    def to_json(self) -> dict:
+        return {
+            "passes": [record.to_dict() for record in self.records],
+            "summary": self.summary(),
+        }
+
+    def to_chrome_trace(self) -> dict:
+        """Returns the records in the Trace Event Format of chrome://tracing,
+        with one complete event per pass per file"""
+        pid = os.getpid()
+        events = []
+        for record in self.records:
+            events.append(
+                {
+                    "name": record.pass_name,
+                    "cat": "pass",
+                    "ph": "X",
+                    "ts": record.start * 1e6,
+                    "dur": record.wall_time * 1e6,
+                    "pid": pid,
+                    "tid": record.thread_id,
+                    "args": {
+                        "file": record.file_name,
+                        "cpu_time": record.cpu_time,
+                        "peak_memory": record.peak_memory,
+                        "node_count": record.node_count,
+                    },
+                }
+            )
+        return {"traceEvents": events, "displayTimeUnit": "ms"}
+
+    def write(self, path: str, profile_format: str = "json"):
+        """Writes the records to path, in one of PROFILE_FORMATS"""
+        if profile_format == "json":
+            profile = self.to_json()
+        elif profile_format == "chrome":
+            profile = self.to_chrome_trace()
+        else:
+            raise ValueError(
+                f"Unknown profile format {profile_format}, expected one of {PROFILE_FORMATS}"
+            )
+        with open(path, "w") as f:
+            json.dump(profile, f, indent=2)
+
+
+def count_nodes(nodes, node_type: Type) -> int:
+    """Counts the node_type nodes reachable from nodes (a node or a list of nodes),
+    following their attributes and the lists, tuples and dictionaries they hold"""
+    count = 0
+    seen = set()
+    stack = [nodes]
+    while stack:
+        obj = stack.pop()
+        if isinstance(obj, (list, tuple)):
+            stack.extend(obj)
+        elif isinstance(obj, dict):
+            stack.extend(obj.values())
+        elif isinstance(obj, node_type):
+            if id(obj) in seen:
+                continue
+            seen.add(id(obj))
+            count += 1
+            stack.extend(node_attributes(obj))
+    return count
+
+
+def node_attributes(node) -> list:
+    """Returns the values of the attributes of node, from its __dict__ and its
+    __slots__ (i.e. the CAST model classes)"""
+    values = list(getattr(node, "__dict__", {}).values())
+    for cls in type(node).__mro__:
+        for name in cls.__dict__.get("__slots__", ()):
+            if hasattr(node, name):
+                values.append(getattr(node, name))
+    return values
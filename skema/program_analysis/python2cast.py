@@ -1,4 +1,5 @@
 import os
+import io
 import sys
 import ast
 from skema.program_analysis import astpp
@@ -11,6 +12,7 @@ from skema.program_analysis.CAST2FN.cast import CAST
 from skema.program_analysis.CAST2FN.visitors.cast_to_agraph_visitor import (
     CASTToAGraphVisitor,
 )
+from skema.utils.dispatch import call_with_deep_recursion
 from typing import Optional
 
 
@@ -46,6 +48,89 @@ def get_args():
     return options
 
 
+def python_source_to_cast(
+    source: str,
+    file_name: str,
+    legacy=False,
+    search_path=None,
+    virtual_modules=None,
+    deep_recursion=False,
+    intern_table=None,
+) -> CAST:
+    """Create a CAST object from the contents of a Python source file.
+
+    Args:
+        source: The Python source code
+        file_name: The name of the source file, used in the source references
+        legacy: If true, generate CAST for GrFN 2.2 pipeline.
+        search_path: A list of directories that imports of user defined
+                     modules are resolved against.
+        virtual_modules: A set of names of user defined modules that are
+                     importable from this file, for sources that aren't on disk.
+        deep_recursion: If true, the CAST is built in a thread with a larger stack
+                     and recursion limit, for sources with deeply nested expressions
+                     or statements.
+        intern_table: The InternTable the SourceRefs of the nodes are shared through
+                     (i.e. the one of the PipelineContext of the run), a new one if None.
+
+    Returns:
+        The CAST object.
+    """
+    # Count the number of lines in the source, with universal newlines
+    # like when the source is read from a file
+    line_count = len(io.StringIO(source, newline=None).readlines())
+
+    # Parse the Python program's AST and create the CAST
+    if deep_recursion:
+        contents = call_with_deep_recursion(ast.parse, source)
+    else:
+        contents = ast.parse(source)
+    return python_ast_to_cast(
+        contents,
+        file_name,
+        line_count,
+        legacy=legacy,
+        search_path=search_path,
+        virtual_modules=virtual_modules,
+        deep_recursion=deep_recursion,
+        intern_table=intern_table,
+    )
+
+
+def python_ast_to_cast(
+    contents: ast.Module,
+    file_name: str,
+    line_count: int,
+    legacy=False,
+    search_path=None,
+    virtual_modules=None,
+    deep_recursion=False,
+    intern_table=None,
+) -> CAST:
+    """Create a CAST object from the PyAST of a Python source file.
+    See python_source_to_cast for the arguments, line_count is the number
+    of lines of the source file.
+    """
+    # Create a PyASTToCAST Object
+    convert = py_ast_to_cast.PyASTToCAST(
+        file_name,
+        legacy=legacy,
+        search_path=search_path,
+        virtual_modules=virtual_modules,
+        intern_table=intern_table,
+    )
+
+    if deep_recursion:
+        C = call_with_deep_recursion(convert.visit, contents, {}, {})
+    else:
+        C = convert.visit(contents, {}, {})
+    C.source_refs = convert.intern_table.source_refs(
+        file_name, None, None, 1, line_count
+    )
+
+    return cast.CAST([C], "python")
+
+
 def python_to_cast(
     pyfile_path,
     agraph=False,
@@ -79,44 +164,18 @@ def python_to_cast(
 
     file_name = pyfile_path.split("/")[-1]
 
-    # Count the number of lines in the file
-    with open(pyfile_path) as f:
-        file_list = f.readlines()
-        line_count = 0
-        for l in file_list:
-            line_count += 1
-
-    # Create a PyASTToCAST Object
-    if legacy:
-        convert = py_ast_to_cast.PyASTToCAST(file_name, legacy=True)
-    else:
-        convert = py_ast_to_cast.PyASTToCAST(file_name)
+    # Imports are resolved against the directory of the
+    # source file we're generating CAST for
+    search_path = [os.path.dirname(os.path.abspath(pyfile_path))]
 
     # Additional option to allow us to view the PyAST
     # using the astpp module
     if astprint:
         astpp.parseprint(file_contents)
 
-    # 'Root' the current working directory so that it's where the
-    # Source file we're generating CAST for is (for Import statements)
-    old_path = os.getcwd()
-    try:
-        idx = pyfile_path.rfind("/")
-
-        if idx > -1:
-            curr_path = pyfile_path[0:idx]
-            os.chdir(curr_path)
-        else:
-            curr_path = "./" + pyfile_path
-
-        # Parse the Python program's AST and create the CAST
-        contents = ast.parse(file_contents)
-        C = convert.visit(contents, {}, {})
-        C.source_refs = [SourceRef(file_name, None, None, 1, line_count)]
-    finally:
-        os.chdir(old_path)
-
-    out_cast = cast.CAST([C], "python")
+    out_cast = python_source_to_cast(
+        file_contents, file_name, legacy=legacy, search_path=search_path
+    )
 
     if agraph:
         V = CASTToAGraphVisitor(out_cast)
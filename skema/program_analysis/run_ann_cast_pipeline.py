@@ -14,6 +14,15 @@ import argparse
 
 from skema.utils.script_functions import ann_cast_pipeline
 from skema.utils.fold import dictionary_to_gromet_json, del_nulls
+from skema.program_analysis.pipeline_context import (
+    PipelineContext,
+    METADATA_FULL,
+    METADATA_LEVELS,
+)
+from skema.program_analysis.pipeline_profiler import (
+    PipelineProfiler,
+    PROFILE_FORMATS,
+)
 
 
 def get_args():
@@ -35,6 +44,28 @@ def get_args():
         help="Generates a pdf of the Annotated CAST",
         action="store_true",
     )
+    parser.add_argument(
+        "--profile",
+        type=str,
+        help="Measures the time, memory and node counts of every pass, and writes them to the given file",
+    )
+    parser.add_argument(
+        "--profile_format",
+        choices=PROFILE_FORMATS,
+        default="json",
+        help="Format of the --profile file: json, or chrome for a chrome://tracing trace (default: json)",
+    )
+    parser.add_argument(
+        "--metadata_level",
+        choices=METADATA_LEVELS,
+        default=METADATA_FULL,
+        help="How much metadata the GroMEt carries: none, minimal (the code file references only) or full (default: full)",
+    )
+    parser.add_argument(
+        "--deep_recursion",
+        action="store_true",
+        help="Runs the passes in a thread with a larger stack and recursion limit, for deeply nested CAST",
+    )
     parser.add_argument("cast_json", help="input CAST.json file")
     options = parser.parse_args()
     return options
@@ -42,6 +73,7 @@ def get_args():
 
 if __name__ == "__main__":
     args = get_args()
+    profiler = PipelineProfiler() if args.profile else None
     ann_cast_pipeline(
         args.cast_json,
         gromet=args.gromet,
@@ -49,4 +81,12 @@ if __name__ == "__main__":
         a_graph=args.agraph,
         from_obj=False,
         indent_level=2,
+        context=PipelineContext(profiler=profiler, file_name=args.cast_json),
+        metadata_level=args.metadata_level,
+        deep_recursion=args.deep_recursion,
     )
+
+    if profiler is not None:
+        profiler.close()
+        profiler.write(args.profile, args.profile_format)
+        print(f"Wrote profile to {args.profile}")
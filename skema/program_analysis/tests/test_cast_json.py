@@ -0,0 +1,88 @@
+import pytest
+
+from skema.program_analysis.python2cast import python_source_to_cast
+from skema.program_analysis.CAST2FN.cast import CAST, CASTJsonException
+from skema.program_analysis.CAST2FN.model.cast import (
+    LiteralValue,
+    ModelReturn,
+    SourceRef,
+)
+
+
+def test_cast_json():
+    """Checks that CAST is written to JSON and parsed back unchanged."""
+    source = (
+        "import math\n"
+        "def f(x, y=2):\n"
+        "    z = [x, {'a': y}, (1, 2.5, None)]\n"
+        "    while x > 0:\n"
+        "        x = x - math.sqrt(y)\n"
+        "    return z if x else -x\n"
+    )
+    cast = python_source_to_cast(source, "f.py")
+    json_str = cast.to_json_str()
+    parsed = CAST.from_json_str(json_str)
+
+    assert parsed == cast
+    assert parsed.to_json_str() == json_str
+
+
+def test_cast_json_source_refs():
+    """Checks that SourceRefs written without a "node_type" field are parsed."""
+    data = {
+        "nodes": [
+            {
+                "node_type": "ModelReturn",
+                "value": None,
+                "source_refs": [
+                    {
+                        "source_file_name": "f.py",
+                        "row_start": 1,
+                        "row_end": 1,
+                        "col_start": 0,
+                        "col_end": 6,
+                    }
+                ],
+            }
+        ]
+    }
+    [node] = CAST.from_json_data(data).nodes
+    assert node == ModelReturn(source_refs=[SourceRef("f.py", 0, 6, 1, 1)])
+
+    with pytest.raises(CASTJsonException):
+        CAST.from_json_data({"nodes": [{"value": 1}]})
+    with pytest.raises(CASTJsonException):
+        CAST.from_json_data({"nodes": [{"node_type": "NotACASTNode"}]})
+
+
+def test_cast_json_deep():
+    """Checks that CAST nested deeper than the recursion limit is written and parsed."""
+    node = LiteralValue(value=1)
+    for _ in range(5000):
+        node = ModelReturn(value=node)
+    cast = CAST([node], "python")
+
+    [parsed] = CAST.from_json_data(cast.to_json_object()).nodes
+    for _ in range(5000):
+        assert isinstance(parsed, ModelReturn)
+        parsed = parsed.value
+    assert parsed.value == 1
+
+
+def test_cast_slots():
+    """Checks that the slotted CAST nodes keep the API of the Swagger generated ones."""
+    node = ModelReturn(
+        value=LiteralValue(value_type="Integer", value=1),
+        source_refs=[SourceRef("f.py", 0, 6, 1, 1)],
+    )
+    assert not hasattr(node, "__dict__")
+    assert node.discriminator is None
+    assert list(ModelReturn.attribute_map.keys()) == ["value", "source_refs"]
+    assert node.to_dict()["value"]["value"] == 1
+    assert node == ModelReturn(
+        value=LiteralValue(value_type="Integer", value=1),
+        source_refs=[SourceRef("f.py", 0, 6, 1, 1)],
+    )
+    assert node != ModelReturn(value=node.value)
+    with pytest.raises(AttributeError):
+        node.not_a_field = 1
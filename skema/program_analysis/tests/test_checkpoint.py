@@ -0,0 +1,156 @@
+import contextlib
+import io
+import os
+import re
+
+import pytest
+
+from skema.program_analysis.benchmarks.corpora import example_corpora
+from skema.program_analysis.python2cast import python_source_to_cast
+from skema.program_analysis.CAST2FN import checkpoint
+from skema.program_analysis.CAST2FN.cast import CAST
+from skema.program_analysis.CAST2FN.model.cast import ModelReturn, SourceRef
+from skema.utils.fold import dictionary_to_gromet_json, del_nulls
+from skema.utils.script_functions import (
+    ann_cast_pipeline,
+    CastToAnnotatedCastVisitor,
+    IdCollapsePass,
+    ContainerScopePass,
+    VariableVersionPass,
+    GrfnVarCreationPass,
+    GrfnAssignmentPass,
+    LambdaExpressionPass,
+    ToGrometPass,
+)
+
+PASSES = [
+    IdCollapsePass,
+    ContainerScopePass,
+    VariableVersionPass,
+    GrfnVarCreationPass,
+    GrfnAssignmentPass,
+    LambdaExpressionPass,
+    ToGrometPass,
+]
+
+
+def example_sources():
+    """Returns the Python sources of the examples of data/gromet/examples"""
+    sources = {}
+    for corpus in example_corpora():
+        for file, source in corpus.sources().items():
+            if file.endswith(".py"):
+                sources[f"{corpus.name}/{file}"] = source
+    return sources
+
+
+def gromet_json(gromet_collection) -> str:
+    return dictionary_to_gromet_json(del_nulls(gromet_collection.to_dict()))
+
+
+def without_uids(json_str: str) -> str:
+    return re.sub(r'"(\w*uid|timestamp)":\s*"[^"]*"', "", json_str)
+
+
+def test_checkpoint_cast(tmp_path):
+    """Checks that the CAST of every example is written to a checkpoint and read
+    back unchanged, from memory and from a memory mapped file."""
+    for name, source in example_sources().items():
+        with contextlib.redirect_stdout(io.StringIO()):
+            cast = python_source_to_cast(source, os.path.basename(name))
+        data = checkpoint.dumps(cast, checkpoint.KIND_CAST)
+        assert checkpoint.loads(data, checkpoint.KIND_CAST) == cast
+
+        path = str(tmp_path / "cast.ckpt")
+        checkpoint.dump_cast(cast, path)
+        assert checkpoint.is_checkpoint(path)
+        loaded = checkpoint.load_cast(path)
+        assert loaded.to_json_str() == cast.to_json_str()
+        assert checkpoint.load_cast(path, use_mmap=False) == cast
+        assert len(data) < len(cast.to_json_str())
+
+
+def test_checkpoint_source_refs():
+    """Checks that SourceRefs with the same values are written once, and shared."""
+    nodes = [
+        ModelReturn(source_refs=[SourceRef("f.py", 0, 6, 1, 1)]),
+        ModelReturn(source_refs=[SourceRef("f.py", 0, 6, 1, 1)]),
+        ModelReturn(source_refs=[SourceRef("f.py", 0, 6, 2, 2)]),
+    ]
+    cast = CAST(nodes, "python")
+    loaded = checkpoint.loads(checkpoint.dumps(cast, checkpoint.KIND_CAST))
+
+    assert loaded == cast
+    [first], [second], [third] = [node.source_refs for node in loaded.nodes]
+    assert first is second
+    assert third is not first
+
+
+def test_checkpoint_pipeline_state(tmp_path):
+    """Checks that the PipelineState of every example is written to a checkpoint
+    and read back to the same state, which generates the same GroMEt."""
+    for name, source in example_sources().items():
+        with contextlib.redirect_stdout(io.StringIO()):
+            cast = python_source_to_cast(source, os.path.basename(name))
+            pipeline_state = CastToAnnotatedCastVisitor(
+                cast
+            ).generate_annotated_cast()
+            for pipeline_pass in PASSES:
+                pipeline_pass(pipeline_state)
+        path = str(tmp_path / "state.ckpt")
+        checkpoint.dump_pipeline_state(pipeline_state, path)
+        loaded = checkpoint.load_pipeline_state(path)
+
+        assert loaded.equiv(pipeline_state)
+        assert gromet_json(loaded.gromet_collection) == gromet_json(
+            pipeline_state.gromet_collection
+        )
+
+
+def test_checkpoint_ann_cast_pipeline(tmp_path, monkeypatch):
+    """Checks that ann_cast_pipeline reads CAST checkpoints like CAST JSON files."""
+    source = "def f(x):\n    y = x + 1\n    return y\n"
+    cast = python_source_to_cast(source, "f.py")
+    monkeypatch.chdir(tmp_path)
+    checkpoint.dump_cast(cast, "f--CAST.ckpt")
+    with open("f--CAST.json", "w") as f:
+        f.write(cast.to_json_str())
+
+    with contextlib.redirect_stdout(io.StringIO()):
+        from_checkpoint = ann_cast_pipeline("f--CAST.ckpt", gromet=True, to_file=False)
+        from_json = ann_cast_pipeline("f--CAST.json", gromet=True, to_file=False)
+    # The GroMEt of two runs only differs by its uids and timestamps
+    assert without_uids(gromet_json(from_checkpoint)) == without_uids(
+        gromet_json(from_json)
+    )
+
+
+def test_checkpoint_errors(tmp_path):
+    """Checks that files that aren't checkpoints of the expected kind are rejected."""
+    cast = python_source_to_cast("x = 1\n", "x.py")
+    data = checkpoint.dumps(cast, checkpoint.KIND_CAST)
+
+    with pytest.raises(checkpoint.CheckpointException):
+        checkpoint.loads(data, checkpoint.KIND_PIPELINE_STATE)
+    with pytest.raises(checkpoint.CheckpointException):
+        checkpoint.loads(b"NOTACKPT" + data[8:])
+    with pytest.raises(checkpoint.CheckpointException):
+        checkpoint.loads(data[:8] + b"\xff\xff" + data[10:])
+
+    path = tmp_path / "x--CAST.json"
+    path.write_text(cast.to_json_str())
+    assert not checkpoint.is_checkpoint(str(path))
+
+
+def test_checkpoint_shared_objects():
+    """Checks that shared values and reference cycles are kept."""
+    shared = [1, "a"]
+    cycle = {"name": "cycle"}
+    cycle["self"] = cycle
+    value = {"shared": (shared, shared), "cycle": cycle, "set": {1.5, "b"}}
+
+    loaded = checkpoint.loads(checkpoint.dumps(value))
+    assert loaded["shared"][0] is loaded["shared"][1]
+    assert loaded["shared"][0] == shared
+    assert loaded["cycle"]["self"] is loaded["cycle"]
+    assert loaded["set"] == {1.5, "b"}
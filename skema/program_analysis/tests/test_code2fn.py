@@ -1,6 +1,16 @@
 import json
+import os
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
-from skema.program_analysis.multi_file_ingester import process_file_system
+
+import pytest
+
+from skema.program_analysis.multi_file_ingester import (
+    process_file_system,
+    process_sources,
+    iter_ndjson,
+)
+from skema.program_analysis.pipeline_profiler import PipelineProfiler
 from skema.gromet.fn import GrometFNModuleCollection
 
 
@@ -19,3 +29,162 @@ def test_code2fn():
         str(data_dir / "epidemiology/Bucky/code/bucky_v2"),
         str(data_dir / "epidemiology/Bucky/code/system_filepaths.txt"),
     )
+
+
+def test_code2fn_parallel():
+    """Checks that the parallel ingestion mode assembles the module collection
+    in the same order as the serial mode."""
+
+    data_dir = Path(__file__).parents[3] / "data"
+    system_dir = data_dir / "epidemiology/CHIME/CHIME_penn_full_model/code"
+    serial: GrometFNModuleCollection = process_file_system(
+        "chime_penn",
+        str(system_dir / "penn_chime"),
+        str(system_dir / "system_filepaths.txt"),
+    )
+    parallel: GrometFNModuleCollection = process_file_system(
+        "chime_penn",
+        str(system_dir / "penn_chime"),
+        str(system_dir / "system_filepaths.txt"),
+        workers=2,
+    )
+
+    assert parallel.module_index == serial.module_index
+    assert parallel.executables == serial.executables
+    assert [module.name for module in parallel.modules] == [
+        module.name for module in serial.modules
+    ]
+
+
+def test_code2fn_concurrent():
+    """Checks that several systems can be processed concurrently by threads
+    of the same process, and that the working directory is left untouched."""
+
+    data_dir = Path(__file__).parents[3] / "data"
+    system_dir = data_dir / "epidemiology/CHIME/CHIME_penn_full_model/code"
+    cwd = os.getcwd()
+
+    def ingest(_):
+        return process_file_system(
+            "chime_penn",
+            str(system_dir / "penn_chime"),
+            str(system_dir / "system_filepaths.txt"),
+        )
+
+    with ThreadPoolExecutor(max_workers=2) as executor:
+        collections = list(executor.map(ingest, range(2)))
+
+    assert os.getcwd() == cwd
+    assert collections[0].module_index == collections[1].module_index
+    assert collections[0].executables == collections[1].executables
+
+
+def test_code2fn_from_sources():
+    """Checks that a system ingested from memory gives the same module collection
+    as the same system ingested from disk."""
+
+    data_dir = Path(__file__).parents[3] / "data"
+    system_dir = data_dir / "epidemiology/CHIME/CHIME_penn_full_model/code"
+    from_disk: GrometFNModuleCollection = process_file_system(
+        "chime_penn",
+        str(system_dir / "penn_chime"),
+        str(system_dir / "system_filepaths.txt"),
+    )
+
+    sources = {}
+    for file in open(system_dir / "system_filepaths.txt").read().split():
+        sources[file] = (system_dir / "penn_chime" / file).read_text()
+    from_memory: GrometFNModuleCollection = process_sources(
+        "chime_penn", sources, "penn_chime"
+    )
+
+    assert from_memory.module_index == from_disk.module_index
+    assert from_memory.executables == from_disk.executables
+    assert [len(module.fn_array) for module in from_memory.modules] == [
+        len(module.fn_array) for module in from_disk.modules
+    ]
+
+
+def test_code2fn_stream():
+    """Checks that the generator mode yields the same modules as the collection,
+    followed by a trailer with its module_index and executables, and that
+    every record renders as a single line of JSON."""
+
+    data_dir = Path(__file__).parents[3] / "data"
+    system_dir = data_dir / "epidemiology/CHIME/CHIME_penn_full_model/code"
+    collection: GrometFNModuleCollection = process_file_system(
+        "chime_penn",
+        str(system_dir / "penn_chime"),
+        str(system_dir / "system_filepaths.txt"),
+    )
+    records = list(
+        process_file_system(
+            "chime_penn",
+            str(system_dir / "penn_chime"),
+            str(system_dir / "system_filepaths.txt"),
+            stream=True,
+        )
+    )
+
+    trailer = records[-1]
+    assert trailer.modules is None
+    assert trailer.module_index == collection.module_index
+    assert trailer.executables == collection.executables
+    assert [module.name for module in records[:-1]] == [
+        module.name for module in collection.modules
+    ]
+
+    lines = list(iter_ndjson(records))
+    assert all(line.count("\n") == 1 for line in lines)
+    assert json.loads(lines[-1])["module_index"] == collection.module_index
+
+
+def test_code2fn_isolated():
+    """Checks that in the isolated mode, a file that fails is recorded along
+    with the pass it failed in, and the rest of the collection is still returned."""
+
+    sources = {
+        "good.py": "def main():\n    x = 1\n    return x\n",
+        "bad.py": "def broken(:\n    return\n",
+        "other.py": "def double(y):\n    return y * 2\n",
+    }
+    failures = []
+    collection: GrometFNModuleCollection = process_sources(
+        "isolated", sources, "isolated", isolate=True, failures=failures
+    )
+
+    assert collection.module_index == ["isolated.good", "isolated.other"]
+    assert collection.executables == [1]
+    assert [(f.file, f.pass_name, f.exception) for f in failures] == [
+        ("bad.py", "PyASTToCAST", "SyntaxError")
+    ]
+
+    # No file can make it through the pipeline in a fraction of a millisecond
+    failures = []
+    collection = process_sources(
+        "isolated",
+        {"good.py": sources["good.py"]},
+        isolate=True,
+        timeout=0.0001,
+        failures=failures,
+    )
+    assert collection.modules == []
+    assert [(f.file, f.exception) for f in failures] == [("good.py", "TimeoutError")]
+
+
+def test_code2fn_conflicting_options():
+    """Checks that options that can't be combined are rejected instead of ignored."""
+
+    sources = {"good.py": "def main():\n    x = 1\n    return x\n"}
+    with pytest.raises(ValueError):
+        process_sources("conflicting", sources, timeout=10)
+    with pytest.raises(ValueError):
+        process_sources("conflicting", sources, memory_limit=2**30)
+    with pytest.raises(ValueError):
+        process_file_system(
+            "conflicting", "", "", profiler=PipelineProfiler(), isolate=True
+        )
+    with pytest.raises(ValueError):
+        process_file_system(
+            "conflicting", "", "", profiler=PipelineProfiler(), workers=2
+        )
@@ -0,0 +1,86 @@
+import copy
+
+from skema.program_analysis.benchmarks.code2fn_benchmark import (
+    TOTAL,
+    find_regressions,
+    run_benchmarks,
+)
+from skema.program_analysis.benchmarks.cast_benchmark import measure_cast
+from skema.program_analysis.benchmarks.corpora import (
+    example_corpora,
+    synthetic_corpus,
+)
+from skema.program_analysis.benchmarks.synthetic import (
+    SyntheticSystemSpec,
+    generate_system,
+)
+from skema.program_analysis.multi_file_ingester import process_sources
+
+
+def test_code2fn_benchmark():
+    """Checks that every stage of the pipeline is measured on an example,
+    and that a stage that got slower than the baseline is flagged."""
+
+    corpus = [
+        corpus for corpus in example_corpora() if corpus.name == "examples/exp0"
+    ]
+    results = run_benchmarks(corpus)
+    stages = results["corpora"]["examples/exp0"]
+
+    assert list(stages.keys())[:2] == ["parse", "cast"]
+    assert list(stages.keys())[-3:] == ["to_dict", "json", TOTAL]
+    assert "ToGrometPass" in stages
+    for measurements in stages.values():
+        assert measurements["wall_time"] >= 0
+        assert measurements["peak_memory"] is not None
+
+    assert find_regressions(results, results) == []
+
+    slower = copy.deepcopy(results)
+    slower["corpora"]["examples/exp0"]["ToGrometPass"]["wall_time"] += 1.0
+    regressions = find_regressions(slower, results)
+    assert [regression[:3] for regression in regressions] == [
+        ("examples/exp0", "ToGrometPass", "wall_time")
+    ]
+
+
+def test_synthetic_system():
+    """Checks that synthetic systems are reproducible, grow with their
+    parameters, and go through the pipeline."""
+
+    spec = SyntheticSystemSpec(modules=3, functions=2, depth=2, seed=1)
+    sources = generate_system("python", spec)
+    assert sources == generate_system("python", spec)
+    assert len(sources) == 3
+    assert "from synthetic_module_1 import" in sources["synthetic_module_2.py"]
+
+    larger = generate_system(
+        "python", SyntheticSystemSpec(modules=3, functions=4, depth=2, seed=1)
+    )
+    assert sum(map(len, larger.values())) > sum(map(len, sources.values()))
+
+    fortran_sources = generate_system("fortran", spec)
+    assert len(fortran_sources) == 4
+    assert "use synthetic_module_1" in fortran_sources["synthetic_module_2.f95"]
+
+    collection = process_sources("synthetic", sources, "synthetic")
+    assert collection.module_index == [
+        "synthetic.synthetic_module_0",
+        "synthetic.synthetic_module_1",
+        "synthetic.synthetic_module_2",
+    ]
+    assert collection.executables == [3]
+
+
+def test_cast_benchmark():
+    """Checks that building the CAST of a synthetic system is measured."""
+
+    corpus = synthetic_corpus(
+        "python", SyntheticSystemSpec(modules=2, functions=2, depth=3, loop_density=0.5)
+    )
+    measurements = measure_cast(corpus, repeat=2)
+
+    assert measurements["files"] == 2
+    assert 0 < measurements["min_wall_time"] <= measurements["median_wall_time"]
+    assert measurements["peak_memory"] > 0
+    assert 0 < measurements["cast_memory"] <= measurements["peak_memory"]
@@ -0,0 +1,95 @@
+import contextlib
+import copy
+import io
+
+from skema.program_analysis.python2cast import python_source_to_cast
+from skema.program_analysis.CAST2FN.ann_cast.annotated_cast import (
+    AnnCastCall,
+    AnnCastModelReturn,
+    AnnCastNode,
+)
+from skema.program_analysis.CAST2FN.ann_cast.ann_cast_helpers import (
+    copy_func_def,
+)
+from skema.program_analysis.CAST2FN.ann_cast.cast_to_annotated_cast import (
+    CastToAnnotatedCastVisitor,
+)
+from skema.program_analysis.CAST2FN.ann_cast.pass_manager import PassManager
+from skema.program_analysis.pipeline_profiler import node_attributes
+
+SOURCE = """
+def add(x, y):
+    z = x + y
+    return z
+
+def main():
+    a = add(1, 2)
+    b = add(a, 3)
+    return b
+"""
+
+
+def reachable(node, node_type):
+    """Returns the nodes of type node_type reachable from node"""
+    found = []
+    seen = set()
+    stack = [node]
+    while stack:
+        obj = stack.pop()
+        if isinstance(obj, (list, tuple)):
+            stack.extend(obj)
+        elif isinstance(obj, dict):
+            stack.extend(obj.values())
+        elif isinstance(obj, AnnCastNode) and id(obj) not in seen:
+            seen.add(id(obj))
+            if isinstance(obj, node_type):
+                found.append(obj)
+            stack.extend(node_attributes(obj))
+    return found
+
+
+def grfn_2_2_pipeline_state():
+    """Returns the PipelineState of SOURCE for GrFN 2.2, after ContainerScopePass"""
+    with contextlib.redirect_stdout(io.StringIO()):
+        cast = python_source_to_cast(SOURCE, "add.py")
+        pipeline_state = CastToAnnotatedCastVisitor(
+            cast
+        ).generate_annotated_cast(True)
+        PassManager(pipeline_state).run(["ContainerScopePass"])
+    return pipeline_state
+
+
+def test_copy_func_def_shares_leaves():
+    """Checks that a copy has its own nodes, but shares the SourceRefs of the FunctionDef"""
+    pipeline_state = grfn_2_2_pipeline_state()
+    add = next(
+        func_def
+        for func_def in pipeline_state.func_id_to_def.values()
+        if func_def.name.name == "add"
+    )
+    add_copy = copy_func_def(add)
+
+    assert add_copy.equiv(copy.deepcopy(add))
+    assert add_copy is not add and add_copy.body[0] is not add.body[0]
+    assert add_copy.body[0].source_refs is not add.body[0].source_refs
+    assert add_copy.body[0].source_refs[0] is add.body[0].source_refs[0]
+    (ret,) = reachable(add_copy, AnnCastModelReturn)
+    assert ret.owning_func_def is add_copy
+
+
+def test_copy_func_def_call_sites():
+    """Checks that every GrFN 2.2 call site gets its own copy of its FunctionDef"""
+    pipeline_state = grfn_2_2_pipeline_state()
+    calls = [
+        call
+        for call in reachable(pipeline_state.nodes, AnnCastCall)
+        if call.func.name == "add"
+    ]
+    copies = [call.func_def_copy for call in calls]
+
+    assert len(calls) >= 2 and all(call.is_grfn_2_2 for call in calls)
+    assert len({id(func_def_copy) for func_def_copy in copies}) == len(calls)
+    for func_def_copy in copies:
+        assert (
+            pipeline_state.func_id_to_def[func_def_copy.name.id] is func_def_copy
+        )
@@ -0,0 +1,84 @@
+import contextlib
+import io
+import json
+
+from skema.program_analysis.module_cache import GrometModuleCache
+from skema.program_analysis.multi_file_ingester import (
+    cache_variant,
+    virtual_file_to_gromet,
+)
+from skema.utils.fold import dictionary_to_gromet_json, del_nulls
+
+SOURCE = """
+def add(x, y):
+    return x + y
+
+def main():
+    a = add(1, 2); b = add(a, 3)
+    for i in range(3):
+        a = add(a, i)
+    return a + b
+"""
+
+
+def without_run_values(obj):
+    """Returns obj (a GroMEt dictionary) without the values that change from run
+    to run, i.e. the timestamps of its provenance and the uids of its files"""
+    if isinstance(obj, dict):
+        return {
+            key: without_run_values(value)
+            for key, value in obj.items()
+            if key != "timestamp" and not key.endswith("uid")
+        }
+    if isinstance(obj, list):
+        return [without_run_values(value) for value in obj]
+    return obj
+
+
+def dereference(obj, metadata_collection):
+    """Returns obj (a GroMEt dictionary) with every metadata index replaced
+    by the metadata it points to"""
+    if isinstance(obj, dict):
+        return {
+            key: metadata_collection[value - 1]
+            if key == "metadata" and isinstance(value, int)
+            else dereference(value, metadata_collection)
+            for key, value in obj.items()
+        }
+    if isinstance(obj, list):
+        return [dereference(value, metadata_collection) for value in obj]
+    return obj
+
+
+def generate(dedup_metadata: bool):
+    """Returns the GroMEt of SOURCE as a dictionary, and its metadata_collection"""
+    with contextlib.redirect_stdout(io.StringIO()):
+        module = virtual_file_to_gromet(
+            "dedup.py", {"dedup.py": SOURCE}, dedup_metadata=dedup_metadata
+        )
+    gromet = without_run_values(
+        json.loads(dictionary_to_gromet_json(del_nulls(module.to_dict())))
+    )
+    metadata_collection = gromet.pop("metadata_collection")
+    return gromet, metadata_collection
+
+
+def test_dedup_metadata():
+    """Checks that deduplicating the metadata_collection leaves every metadata
+    index pointing to the same metadata, in fewer entries"""
+    gromet, metadata_collection = generate(dedup_metadata=False)
+    deduped, deduped_collection = generate(dedup_metadata=True)
+
+    assert len(deduped_collection) < len(metadata_collection)
+    assert len(set(map(repr, deduped_collection))) == len(deduped_collection)
+    assert dereference(deduped, deduped_collection) == dereference(
+        gromet, metadata_collection
+    )
+
+
+def test_dedup_metadata_cache_key(tmp_path):
+    """Checks that modules generated with and without dedup_metadata are cached apart"""
+    cache = GrometModuleCache(str(tmp_path / "cache"))
+    key = cache.key("dedup.py", SOURCE.encode())
+    assert cache.key("dedup.py", SOURCE.encode(), cache_variant(False)) == key
+    assert cache.key("dedup.py", SOURCE.encode(), cache_variant(True)) != key
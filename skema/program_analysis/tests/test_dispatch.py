@@ -0,0 +1,107 @@
+import ast
+import sys
+import threading
+
+import pytest
+
+from skema.program_analysis.python2cast import python_source_to_cast
+from skema.program_analysis.multi_file_ingester import (
+    process_sources,
+    virtual_file_to_gromet,
+)
+from skema.program_analysis.CAST2FN.ann_cast.cast_to_annotated_cast import (
+    CastToAnnotatedCastVisitor,
+)
+from skema.utils.dispatch import (
+    DEEP_RECURSION_LIMIT,
+    call_with_deep_recursion,
+    typedispatchmethod,
+)
+
+
+class NodeCounter:
+    def __init__(self):
+        self.names = 0
+
+    @typedispatchmethod
+    def visit(self, node):
+        return "default"
+
+    @visit.register
+    def visit_name(self, node: ast.Name):
+        self.names += 1
+        return "name"
+
+    @visit.register(ast.expr)
+    def visit_expr(self, node):
+        return "expr"
+
+
+def test_typedispatchmethod():
+    """Checks that nodes are dispatched to the handler of their most specific type."""
+    counter = NodeCounter()
+    assert counter.visit(ast.Name()) == "name"
+    assert counter.visit(ast.Constant()) == "expr"
+    assert counter.visit(ast.Module()) == "default"
+    assert counter.visit(ast.Name()) == "name"
+    assert counter.names == 2
+    # Every visitor has its own state
+    assert NodeCounter().names == 0
+
+
+def test_deep_recursion():
+    """Checks that sources that are nested too deeply for the default recursion
+    limit are handled with deep_recursion."""
+    source = "x = " + " + ".join(["1"] * 3000) + "\n"
+
+    with pytest.raises(RecursionError):
+        python_source_to_cast(source, "deep.py")
+
+    cast = python_source_to_cast(source, "deep.py", deep_recursion=True)
+    pipeline_state = CastToAnnotatedCastVisitor(cast).generate_annotated_cast(
+        deep_recursion=True
+    )
+    assert len(pipeline_state.nodes) == 1
+
+
+def test_deep_recursion_other_threads():
+    """Checks that call_with_deep_recursion can be nested, but refuses to raise the
+    process wide recursion limit while other threads are running."""
+    limit = sys.getrecursionlimit()
+    limits = []
+
+    def nested():
+        limits.append(sys.getrecursionlimit())
+        return call_with_deep_recursion(sys.getrecursionlimit)
+
+    assert call_with_deep_recursion(nested) == DEEP_RECURSION_LIMIT
+    assert limits == [DEEP_RECURSION_LIMIT]
+    assert sys.getrecursionlimit() == limit
+
+    done = threading.Event()
+    other = threading.Thread(target=done.wait)
+    other.start()
+    try:
+        with pytest.raises(RuntimeError):
+            call_with_deep_recursion(sys.getrecursionlimit)
+    finally:
+        done.set()
+        other.join()
+    assert sys.getrecursionlimit() == limit
+    assert call_with_deep_recursion(sys.getrecursionlimit) == DEEP_RECURSION_LIMIT
+
+
+def test_deep_recursion_pipeline():
+    """Checks that a system with deeply nested sources goes through the whole
+    pipeline, down to GroMEt, with deep_recursion."""
+    source = (
+        "def main(x):\n    y = " + " + ".join(["x"] * 1500) + "\n    return y\n"
+    )
+    sources = {"deep.py": source}
+
+    with pytest.raises(RecursionError):
+        virtual_file_to_gromet("deep.py", sources)
+
+    collection = process_sources("deep", sources, "deep", deep_recursion=True)
+    assert collection.module_index == ["deep.deep"]
+    assert collection.executables == [1]
@@ -0,0 +1,77 @@
+import contextlib
+import io
+
+from skema.program_analysis.python2cast import python_source_to_cast
+from skema.program_analysis.CAST2FN.ann_cast.cast_to_annotated_cast import (
+    CastToAnnotatedCastVisitor,
+)
+from skema.program_analysis.CAST2FN.ann_cast.pass_manager import PassManager
+from skema.program_analysis.CAST2FN.ann_cast.to_gromet_pass import ToGrometPass
+
+SOURCE = """
+import os
+from os.path import join
+from math import *
+from os.path import exists
+from math import sqrt
+
+def norm(x, y):
+    return sqrt(x * x + y * y)
+
+def path(a, b):
+    if exists(a):
+        return join(a, b)
+    return b
+
+def main():
+    n = norm(3, 4)
+    for i in range(3):
+        n = n + floor(n)
+    return path("a", "b")
+"""
+
+NAMES = ["norm", "path", "main", "sqrt", "join", "exists", "floor", "cos", "unknown"]
+
+
+class RecordedGrometPass(ToGrometPass):
+    """A ToGrometPass whose lookups are checked against scans of the tables they index"""
+
+    def find_gromet(self, func_name):
+        result = super().find_gromet(func_name)
+        func_idx = 1
+        for gromet_fn in self.gromet_module.fn_array:
+            if gromet_fn.b != None and gromet_fn.b[0].name == func_name:
+                assert result == (func_idx, True)
+                return result
+            func_idx += 1
+        assert result == (func_idx, False)
+        return result
+
+    def func_in_module(self, func_name):
+        result = super().func_in_module(func_name)
+        for mname, (_, symbols, import_all) in self.import_collection.items():
+            if (
+                import_all and self.context.import_resolver().defines(mname, func_name)
+            ) or func_name in symbols:
+                assert result == (True, mname)
+                return result
+        assert result == (False, "")
+        return result
+
+
+def test_gromet_lookups():
+    """Checks that find_gromet and func_in_module find what scanning
+    fn_array and import_collection finds, while GroMEt is generated and after"""
+    with contextlib.redirect_stdout(io.StringIO()):
+        cast = python_source_to_cast(SOURCE, "lookups.py")
+        pipeline_state = CastToAnnotatedCastVisitor(cast).generate_annotated_cast()
+        PassManager(pipeline_state).run(["VariableVersionPass"])
+        gromet_pass = RecordedGrometPass(pipeline_state)
+
+    for name in NAMES:
+        gromet_pass.find_gromet(name)
+        gromet_pass.func_in_module(name)
+    assert gromet_pass.find_gromet("norm")[1]
+    assert gromet_pass.func_in_module("sqrt") == (True, "math")
+    assert gromet_pass.func_in_module("join") == (True, "os.path")
+    assert gromet_pass.func_in_module("unknown") == (False, "")
@@ -0,0 +1,46 @@
+from skema.gromet.fn import GrometFN, GrometPort, GrometWire
+from skema.program_analysis.CAST2FN.ann_cast.to_gromet_pass import (
+    GrometTable,
+    find_existing_opi,
+    find_existing_pil,
+    insert_gromet_object,
+)
+
+
+def test_insert_gromet_object_port_ids():
+    """Checks that every port gets the id of one more than the number of ports on its box"""
+    table = None
+    for box in [1, 1, 2, 1, 2, None]:
+        table = insert_gromet_object(table, GrometPort(box=box))
+
+    assert isinstance(table, GrometTable)
+    assert [port.id for port in table] == [1, 2, 1, 3, 2, 1]
+
+    # a table built some other way is indexed as it is
+    table = insert_gromet_object(list(table[:2]), GrometPort(box=1))
+    assert [port.id for port in table] == [1, 2, 3]
+
+    wires = insert_gromet_object(None, GrometWire(src=1, tgt=2))
+    assert wires[0].src == 1 and wires.box_port_counts == {}
+
+
+def test_find_existing_ports():
+    """Checks that ports are found by name at the index of the first one with the name"""
+    gromet_fn = GrometFN()
+    assert find_existing_opi(gromet_fn, "x") == (False, 1)
+    assert find_existing_pil(gromet_fn, "x") == -1
+
+    for name in ["x", "y", "x"]:
+        gromet_fn.opi = insert_gromet_object(
+            gromet_fn.opi, GrometPort(name=name, box=1)
+        )
+        gromet_fn.pil = insert_gromet_object(
+            gromet_fn.pil, GrometPort(name=name, box=1)
+        )
+
+    assert find_existing_opi(gromet_fn, "y") == (True, 2)
+    assert find_existing_opi(gromet_fn, "z") == (False, 4)
+    assert find_existing_pil(gromet_fn, "x") == 1
+
+    gromet_fn.pil[0].name = "w"
+    assert find_existing_pil(gromet_fn, "x") == 3
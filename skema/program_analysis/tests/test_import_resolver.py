@@ -0,0 +1,39 @@
+import sys
+
+from skema.program_analysis.PyAST2CAST.import_resolver import ImportResolver
+
+
+def test_import_resolver():
+    """Checks that the modules and symbols of a system are resolved from their
+    ASTs, without running the system's code."""
+
+    module_sources = {
+        "model": "from model.sir import *\n",
+        "model.sir": (
+            "raise RuntimeError('module code was run')\n"
+            "__all__ = ['sir']\n"
+            "from math import *\n"
+            "def sir(s, i, r):\n"
+            "    return s, i, r\n"
+            "def _helper():\n"
+            "    pass\n"
+        ),
+        "main": "from model import *\nimport model.sir as m\n",
+    }
+    resolver = ImportResolver(module_sources=module_sources)
+
+    assert resolver.is_module("model.sir")
+    assert resolver.is_module("math")
+    assert not resolver.is_module("not_a_module_of_the_system")
+
+    # dir() of model.sir, which star imports math
+    assert resolver.defines("model.sir", "sir")
+    assert resolver.defines("model.sir", "_helper")
+    assert resolver.defines("model.sir", "sqrt")
+    # Star imports only bind the names of __all__
+    assert resolver.defines("main", "sir")
+    assert not resolver.defines("main", "sqrt")
+    assert resolver.defines("main", "m")
+    assert not resolver.defines("not_a_module_of_the_system", "sir")
+
+    assert "model.sir" not in sys.modules
@@ -0,0 +1,44 @@
+from skema.program_analysis.python2cast import python_source_to_cast
+from skema.program_analysis.CAST2FN.interning import InternTable
+from skema.program_analysis.CAST2FN.ann_cast.ann_cast_helpers import build_fullid
+from skema.program_analysis.CAST2FN.model.cast import Assignment, SourceRef
+
+
+def test_intern_table():
+    """Checks that the InternTable gives one SourceRef per span."""
+    table = InternTable()
+    first = table.source_ref("f.py", 0, 6, 1, 1)
+    assert first == SourceRef("f.py", 0, 6, 1, 1)
+    assert table.source_ref("f.py", 0, 6, 1, 1) is first
+    assert table.source_ref("f.py", 0, 6, 2, 2) is not first
+    assert table.source_refs("f.py", 0, 6, 1, 1) == [first]
+    assert table.source_refs("f.py", 0, 6, 1, 1)[0] is first
+    # Every node gets a list of its own around the shared SourceRef
+    source_refs = table.source_refs("f.py", 0, 6, 1, 1)
+    source_refs.append(SourceRef("f.py", 0, 6, 2, 2))
+    assert table.source_refs("f.py", 0, 6, 1, 1) == [first]
+    assert table.intern_source_ref(SourceRef("f.py", 0, 6, 1, 1)) is first
+
+
+def test_interned_cast():
+    """Checks that the nodes created for one span of the source share its SourceRef,
+    and that SourceRefs are shared across the files of one InternTable."""
+    table = InternTable()
+    source = "x = 1\ny = x + 1\n"
+    cast = python_source_to_cast(source, "f.py", intern_table=table)
+    assignment = cast.nodes[0].body[0]
+    assert isinstance(assignment, Assignment)
+    assert assignment.source_refs == [SourceRef("f", 0, 5, 1, 1)]
+    assert assignment.left.val.source_refs[0] is assignment.left.source_refs[0]
+
+    again = python_source_to_cast(source, "f.py", intern_table=table)
+    assert again == cast
+    assert again.nodes[0].body[0].source_refs[0] is assignment.source_refs[0]
+
+
+def test_interned_fullid():
+    """Checks that equal fullids are one string."""
+    var_name = "".join(["x", "y"])
+    fullid = build_fullid(var_name, 1, 0, "module")
+    assert fullid == "xy:1:0:module"
+    assert build_fullid("xy", 1, 0, "module") is fullid
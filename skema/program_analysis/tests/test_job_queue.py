@@ -0,0 +1,75 @@
+import json
+import threading
+import time
+from pathlib import Path
+
+import pytest
+
+from skema.program_analysis.multi_file_ingester import process_file_system
+from skema.skema_py.jobs import JobQueue, QueueFullError, JOB_DONE
+
+
+def chime_sources():
+    data_dir = Path(__file__).parents[3] / "data"
+    system_dir = data_dir / "epidemiology/CHIME/CHIME_penn_full_model/code"
+    files = open(system_dir / "system_filepaths.txt").read().split()
+    return system_dir, {
+        file: (system_dir / "penn_chime" / file).read_text() for file in files
+    }
+
+
+def test_job_queue():
+    """Checks that a submitted job reports its progress and ends up with
+    the same module collection as a direct run, and that the queue depth is capped."""
+
+    system_dir, sources = chime_sources()
+    job_queue = JobQueue(max_concurrent_jobs=1, max_queue_depth=1)
+
+    # Keep the only worker busy, so that the submitted job has to wait
+    release = threading.Event()
+    job_queue.executor.submit(release.wait)
+
+    job = job_queue.submit("chime_penn", "penn_chime", sources)
+    assert job.progress()["status"] == "queued"
+    with pytest.raises(QueueFullError):
+        job_queue.submit("chime_penn", "penn_chime", sources)
+
+    release.set()
+    while not job.is_finished():
+        time.sleep(0.1)
+
+    assert job.status == JOB_DONE, job.error
+    assert job.files_done == job.files_total == len(sources)
+    assert job_queue.get(job.job_id) is job
+
+    collection = process_file_system(
+        "chime_penn",
+        str(system_dir / "penn_chime"),
+        str(system_dir / "system_filepaths.txt"),
+    )
+    result = json.loads(job.result)
+    assert result["module_index"] == collection.module_index
+    assert result["executables"] == collection.executables
+    job_queue.shutdown()
+
+
+def test_job_queue_failures():
+    """Checks that a file that fails is recorded with the pass it failed in,
+    and that the job still ends up with the modules of the other files."""
+
+    sources = {
+        "good.py": "def main():\n    x = 1\n    return x\n",
+        "bad.py": "def broken(:\n    return\n",
+    }
+    job_queue = JobQueue(max_concurrent_jobs=1)
+    job = job_queue.submit("partial", "partial", sources)
+    while not job.is_finished():
+        time.sleep(0.1)
+
+    assert job.status == JOB_DONE, job.error
+    assert job.files_done == job.files_total == 2
+    assert [
+        (f["file"], f["pass"], f["exception"]) for f in job.progress()["failures"]
+    ] == [("bad.py", "PyASTToCAST", "SyntaxError")]
+    assert json.loads(job.result)["module_index"] == ["partial.good"]
+    job_queue.shutdown()
@@ -0,0 +1,135 @@
+import contextlib
+import io
+import json
+
+import pytest
+
+from skema.gromet.metadata import Provenance, SourceCodeReference
+from skema.program_analysis.CAST2FN.ann_cast.to_gromet_pass import (
+    LazySourceCodeReference,
+)
+from skema.program_analysis.multi_file_ingester import (
+    cache_variant,
+    virtual_file_to_gromet,
+)
+from skema.program_analysis.pipeline_context import (
+    PipelineContext,
+    METADATA_NONE,
+    METADATA_MINIMAL,
+    METADATA_FULL,
+)
+from skema.utils.fold import dictionary_to_gromet_json, del_nulls
+
+SOURCE = """
+class Point:
+    def __init__(self, x):
+        self.x = x
+
+def scale(p, k):
+    if k > 0 and p.x > 0:
+        return p.x * k
+    return 0.5
+"""
+
+
+def generate(metadata_level: str):
+    with contextlib.redirect_stdout(io.StringIO()):
+        return virtual_file_to_gromet(
+            "points.py", {"points.py": SOURCE}, metadata_level=metadata_level
+        )
+
+
+def metadata_indices(obj) -> list:
+    """Returns the metadata indices of the GroMEt objects in obj (a GroMEt dictionary)"""
+    indices = []
+    if isinstance(obj, dict):
+        for key, value in obj.items():
+            if key == "metadata" and isinstance(value, int):
+                indices.append(value)
+            else:
+                indices.extend(metadata_indices(value))
+    elif isinstance(obj, list):
+        for value in obj:
+            indices.extend(metadata_indices(value))
+    return indices
+
+
+def test_metadata_levels():
+    """Checks that GroMEt objects only get metadata at the full level,
+    and that the module keeps its code file references at the minimal level"""
+    full = generate(METADATA_FULL)
+    minimal = generate(METADATA_MINIMAL)
+    none = generate(METADATA_NONE)
+
+    assert len(metadata_indices(full.fn.to_dict())) > 0
+    for module in (minimal, none):
+        assert metadata_indices(module.fn.to_dict()) == []
+        for fn in module.fn_array:
+            assert metadata_indices(fn.to_dict()) == []
+
+    assert len(minimal.metadata_collection) == 2
+    assert [record.type_name for record in minimal.metadata_collection[0]] == ["Point"]
+    files = minimal.metadata_collection[minimal.metadata - 1][0].files
+    assert [file.name for file in files] == ["points.py"]
+
+    assert none.metadata is None
+    assert none.metadata_collection == [[]]
+
+    # The levels are the same GroMEt otherwise
+    without_metadata = json.loads(
+        dictionary_to_gromet_json(del_nulls(none.fn.to_dict()))
+    )
+    assert without_metadata == json.loads(
+        dictionary_to_gromet_json(del_nulls(minimal.fn.to_dict()))
+    )
+
+
+def test_lazy_source_code_references():
+    """Checks that source code references are SourceCodeReferences,
+    and are serialized as the ones they stand for"""
+    module = generate(METADATA_FULL)
+    references = [
+        metadata
+        for entry in module.metadata_collection
+        for metadata in entry
+        if isinstance(metadata, LazySourceCodeReference)
+    ]
+    assert len(references) > 0
+    for reference in references:
+        # Consumers of the GroMEt (i.e. find_source_code_reference of
+        # skema.gromet.query) find the references by their type
+        assert isinstance(reference, SourceCodeReference)
+        assert isinstance(reference.provenance, Provenance)
+        materialized = SourceCodeReference(
+            provenance=reference.provenance,
+            code_file_reference_uid=reference.code_file_reference_uid,
+            line_begin=reference.line_begin,
+            line_end=reference.line_end,
+            col_begin=reference.col_begin,
+            col_end=reference.col_end,
+        )
+        assert reference.to_dict() == materialized.to_dict()
+        assert reference == materialized
+        assert materialized.code_file_reference_uid == str(
+            module.metadata_collection[module.metadata - 1][0].files[0].uid
+        )
+
+    serialized = json.loads(dictionary_to_gromet_json(del_nulls(module.to_dict())))
+    for entry, serialized_entry in zip(
+        module.metadata_collection, serialized["metadata_collection"]
+    ):
+        assert [del_nulls(metadata.to_dict()) for metadata in entry] == serialized_entry
+
+
+def test_metadata_level_errors():
+    """Checks that unknown metadata levels are rejected, and that the levels are cached apart"""
+    with pytest.raises(ValueError):
+        PipelineContext(metadata_level="everything")
+
+    variants = {
+        cache_variant(dedup_metadata, metadata_level)
+        for dedup_metadata in (False, True)
+        for metadata_level in (METADATA_NONE, METADATA_MINIMAL, METADATA_FULL)
+    }
+    assert len(variants) == 6
+    assert cache_variant(False, METADATA_FULL) == ""
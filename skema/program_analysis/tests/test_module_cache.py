@@ -0,0 +1,94 @@
+import os
+import shutil
+from pathlib import Path
+
+from skema.gromet.fn import GrometFNModule
+from skema.program_analysis.module_cache import GrometModuleCache
+from skema.program_analysis.multi_file_ingester import (
+    process_file_system,
+    process_sources,
+)
+
+
+def test_module_cache_lru_eviction(tmp_path):
+    cache = GrometModuleCache(str(tmp_path / "cache"))
+    keys = [cache.key(f"file{i}.py", b"x = %d" % i) for i in range(3)]
+    assert len(set(keys)) == 3
+
+    assert cache.get(keys[0]) is None
+    for i, key in enumerate(keys):
+        cache.put(key, GrometFNModule(name=f"file{i}", fn_array=[]))
+        os.utime(cache.entry_path(key), (i, i))
+    assert cache.get(keys[0]).name == "file0"
+    assert (cache.hits, cache.misses) == (1, 1)
+
+    # keys[0] was used last, so keys[1] is the least recently used entry
+    cache.max_size = cache.size - 1
+    cache.evict()
+    assert cache.get(keys[1]) is None
+    assert cache.get(keys[0]) is not None
+    assert cache.evictions == 1
+
+
+def test_module_cache_unloadable_entry(tmp_path):
+    cache = GrometModuleCache(str(tmp_path / "cache"))
+    key = cache.key("file.py", b"x = 1")
+    assert key != cache.key("file.py", b"x = 1", root_dir="other_root")
+
+    # An entry pickled with a class that no longer exists is a miss, and is removed
+    cache.put(key, GrometFNModule(name="file", fn_array=[]))
+    with open(cache.entry_path(key), "rb") as f:
+        entry = f.read()
+    with open(cache.entry_path(key), "wb") as f:
+        f.write(entry.replace(b"GrometFNModule", b"GrometFNModulf"))
+    assert cache.get(key) is None
+    assert cache.misses == 1
+    assert not os.path.exists(cache.entry_path(key))
+    assert cache.size == 0
+
+
+def test_process_file_system_cache(tmp_path):
+    data_dir = Path(__file__).parents[3] / "data"
+    system_dir = tmp_path / "penn_chime"
+    shutil.copytree(
+        data_dir / "epidemiology/CHIME/CHIME_penn_full_model/code/penn_chime",
+        system_dir,
+    )
+    files = str(
+        data_dir
+        / "epidemiology/CHIME/CHIME_penn_full_model/code/system_filepaths.txt"
+    )
+    cache = GrometModuleCache(str(tmp_path / "cache"))
+
+    first = process_file_system("chime_penn", str(system_dir), files, cache=cache)
+    assert (cache.hits, cache.misses) == (0, 6)
+
+    # Only the edited file and the files that import it, directly
+    # (model/parameters.py, model/sir.py) or not (cli.py), go back
+    # through the pipeline
+    with open(system_dir / "constants.py", "a") as f:
+        f.write("\nNEW_CONSTANT = 1\n")
+    second = process_file_system("chime_penn", str(system_dir), files, cache=cache)
+    assert (cache.hits, cache.misses) == (2, 10)
+
+    assert second.module_index == first.module_index
+    assert second.executables == first.executables
+
+
+def test_process_sources_cache_imported_module(tmp_path):
+    sources = {
+        "a.py": "from b import *\n\ndef main():\n    x = f(1)\n",
+        "b.py": "def f(y):\n    return y + 1\n",
+        "c.py": "def g(z):\n    return z\n",
+    }
+    cache = GrometModuleCache(str(tmp_path / "cache"))
+
+    process_sources("system", sources, "system", cache=cache)
+    assert (cache.hits, cache.misses) == (0, 3)
+
+    # a.py is unchanged, but what its star import binds isn't,
+    # so it goes back through the pipeline along with b.py
+    sources["b.py"] = "def h(y):\n    return y + 1\n"
+    cached = process_sources("system", sources, "system", cache=cache)
+    assert (cache.hits, cache.misses) == (1, 5)
+    assert cached.module_index == ["system.a", "system.b", "system.c"]
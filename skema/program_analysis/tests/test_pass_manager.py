@@ -0,0 +1,127 @@
+import contextlib
+import io
+import os
+
+import pytest
+
+from skema.program_analysis.benchmarks.corpora import example_corpora
+from skema.program_analysis.python2cast import python_source_to_cast
+from skema.program_analysis.pipeline_profiler import node_attributes
+from skema.program_analysis.CAST2FN.ann_cast.annotated_cast import AnnCastNode
+from skema.program_analysis.CAST2FN.ann_cast.cast_to_annotated_cast import (
+    CastToAnnotatedCastVisitor,
+)
+from skema.program_analysis.CAST2FN.ann_cast.pass_manager import (
+    ANN_CAST_PASSES,
+    PassDeclaration,
+    PassManager,
+    PassManagerException,
+)
+
+# The attributes filled in by GrfnAssignmentPass and LambdaExpressionPass
+LAMBDA_ATTRIBUTES = [
+    "expr_str",
+    "top_interface_lambda",
+    "bot_interface_lambda",
+    "condition_lambda",
+    "decision_lambda",
+]
+
+
+def example_pipeline_states():
+    """Yields a new PipelineState for the Python sources of the examples of data/gromet/examples"""
+    for corpus in example_corpora():
+        for file, source in corpus.sources().items():
+            if file.endswith(".py"):
+                with contextlib.redirect_stdout(io.StringIO()):
+                    cast = python_source_to_cast(source, os.path.basename(file))
+                yield CastToAnnotatedCastVisitor(cast).generate_annotated_cast()
+
+
+def lambda_summary(nodes) -> list:
+    """Returns the lambda expressions of the nodes reachable from nodes, in the
+    order they are reached in, along with the fullids of their GrfnAssignments"""
+    summary = []
+    seen = set()
+    stack = [nodes]
+    while stack:
+        obj = stack.pop()
+        if isinstance(obj, (list, tuple)):
+            stack.extend(obj)
+        elif isinstance(obj, dict):
+            stack.extend(obj.values())
+        elif isinstance(obj, AnnCastNode) and id(obj) not in seen:
+            seen.add(id(obj))
+            summary.append(
+                [type(obj).__name__]
+                + [str(getattr(obj, name, None)) for name in LAMBDA_ATTRIBUTES]
+            )
+            assignments = [getattr(obj, "grfn_assignment", None)]
+            assignments.extend(getattr(obj, "arg_assignments", {}).values())
+            for assignment in assignments:
+                if assignment is not None:
+                    summary.append(
+                        [
+                            assignment.lambda_expr,
+                            sorted(assignment.inputs.keys()),
+                            sorted(assignment.outputs.keys()),
+                        ]
+                    )
+            stack.extend(node_attributes(obj))
+    return summary
+
+
+def test_pass_manager_schedule():
+    """Checks that only the passes that the targets depend on are run, and that
+    consecutive fusable passes share their traversal."""
+    pipeline_state = next(example_pipeline_states())
+    pass_manager = PassManager(pipeline_state)
+
+    groups = pass_manager.schedule(["ToGrometPass"])
+    assert [[p.name for p in group] for group in groups] == [
+        ["IdCollapsePass"],
+        ["ContainerScopePass"],
+        ["VariableVersionPass"],
+        ["ToGrometPass"],
+    ]
+
+    with contextlib.redirect_stdout(io.StringIO()):
+        pass_manager.run(["VariableVersionPass"])
+    groups = pass_manager.schedule(["ToGrfnPass"])
+    assert [[p.name for p in group] for group in groups] == [
+        ["GrfnVarCreationPass"],
+        ["GrfnAssignmentPass", "LambdaExpressionPass"],
+        ["ToGrfnPass"],
+    ]
+
+    unfused = PassManager(pipeline_state, fuse=False)
+    assert len(unfused.schedule(["LambdaExpressionPass"])) == 6
+
+
+def test_pass_manager_fused():
+    """Checks that the fused traversal of GrfnAssignmentPass and LambdaExpressionPass
+    gives the same lambda expressions as running them one after the other."""
+    for fused_state, unfused_state in zip(
+        example_pipeline_states(), example_pipeline_states()
+    ):
+        with contextlib.redirect_stdout(io.StringIO()):
+            PassManager(fused_state).run(["LambdaExpressionPass"])
+            PassManager(unfused_state, fuse=False).run(["LambdaExpressionPass"])
+        assert lambda_summary(fused_state.nodes) == lambda_summary(
+            unfused_state.nodes
+        )
+
+
+def test_pass_manager_errors():
+    """Checks that requirements on passes that aren't declared before are rejected."""
+    pipeline_state = next(example_pipeline_states())
+    declarations = [
+        PassDeclaration("B", None, requires=["A"]),
+        PassDeclaration("A", None),
+    ]
+    with pytest.raises(PassManagerException):
+        PassManager(pipeline_state, declarations)
+    with pytest.raises(PassManagerException):
+        PassManager(pipeline_state, ANN_CAST_PASSES + ANN_CAST_PASSES[:1])
+    with pytest.raises(PassManagerException):
+        PassManager(pipeline_state).schedule(["UnknownPass"])
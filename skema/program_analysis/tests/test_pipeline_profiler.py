@@ -0,0 +1,49 @@
+from pathlib import Path
+
+from skema.program_analysis.multi_file_ingester import process_file_system
+from skema.program_analysis.pipeline_profiler import PipelineProfiler
+
+PASSES = [
+    "PyASTToCAST",
+    "CastToAnnotatedCast",
+    "IdCollapsePass",
+    "ContainerScopePass",
+    "VariableVersionPass",
+    "ToGrometPass",
+]
+
+
+def test_pipeline_profiler():
+    """Checks that every pass over every file is measured, and that the
+    measurements export to JSON and to a Chrome trace."""
+
+    data_dir = Path(__file__).parents[3] / "data"
+    system_dir = data_dir / "epidemiology/CHIME/CHIME_penn_full_model/code"
+    files = open(system_dir / "system_filepaths.txt").read().split()
+
+    profiler = PipelineProfiler()
+    process_file_system(
+        "chime_penn",
+        str(system_dir / "penn_chime"),
+        str(system_dir / "system_filepaths.txt"),
+        profiler=profiler,
+    )
+    profiler.close()
+
+    for file in files:
+        records = [
+            record for record in profiler.records if record.file_name == file
+        ]
+        assert [record.pass_name for record in records] == PASSES
+        for record in records:
+            assert record.wall_time >= 0 and record.cpu_time >= 0
+            assert record.peak_memory is not None
+            assert record.node_count > 0
+
+    profile = profiler.to_json()
+    assert len(profile["passes"]) == len(files) * len(PASSES)
+    assert set(profile["summary"].keys()) == set(PASSES)
+
+    trace = profiler.to_chrome_trace()
+    assert len(trace["traceEvents"]) == len(files) * len(PASSES)
+    assert all(event["ph"] == "X" for event in trace["traceEvents"])
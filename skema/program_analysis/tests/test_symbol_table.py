@@ -0,0 +1,44 @@
+from skema.program_analysis.CAST2FN.ann_cast.symbol_table import (
+    SymbolTable,
+    build_fullid,
+    con_scope_to_str,
+)
+
+
+def test_symbol_table_scopes():
+    """Checks that every container scope gets one scope id, and that its
+    con_scopestr is formatted like con_scope_to_str."""
+    symbols = SymbolTable()
+    scope = ["module", "f", "loop0"]
+    scope_id = symbols.scope_id(scope)
+
+    assert symbols.scope_id(list(scope)) == scope_id
+    assert symbols.scope(scope_id) == tuple(scope)
+    assert symbols.scopestr(scope_id) == con_scope_to_str(scope) == "module.f.loop0"
+
+    body_scope_id = symbols.sub_scope_id(scope_id, "loop-body")
+    assert body_scope_id == symbols.scope_id(scope + ["loop-body"])
+    assert symbols.is_sub_scope(body_scope_id, scope_id)
+    assert not symbols.is_sub_scope(scope_id, body_scope_id)
+    # A scope named like a prefix of another one isn't nested in it
+    assert not symbols.is_sub_scope(scope_id, symbols.scope_id(["module", "f", "loop"]))
+    assert len(symbols.scopes) == 3
+
+
+def test_symbol_table_fullids():
+    """Checks that every variable version gets one fullid, and that it is
+    formatted like build_fullid."""
+    symbols = SymbolTable()
+    scope_id = symbols.scope_id(["module", "f"])
+    fullid = symbols.fullid("x", 3, 1, scope_id)
+
+    assert symbols.fullid("x", 3, 1, scope_id) == fullid
+    assert symbols.fullid("x", 3, 2, scope_id) != fullid
+    assert symbols.var_version(fullid) == ("x", 3, 1, scope_id)
+    assert symbols.fullid_str(fullid) == build_fullid("x", 3, 1, "module.f") == "x:3:1:module.f"
+    assert symbols.lambda_var(fullid) == "x_3"
+
+    unnamed = symbols.fullid(None, 3, 1, symbols.scope_id(["module"]))
+    assert symbols.fullid_str(unnamed) == ":3:1:module"
+    assert symbols.lambda_var(unnamed) == "_3"
+    assert len(symbols.var_versions) == 3
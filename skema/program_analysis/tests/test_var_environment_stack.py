@@ -0,0 +1,30 @@
+from skema.program_analysis.CAST2FN.ann_cast.to_gromet_pass import (
+    VarEnvironmentStack,
+)
+
+
+def test_var_environment_stack():
+    """Checks that a scope hides the environments of the enclosing one without
+    copying them, and that what's added in the scope goes away with it"""
+    var_environment = {"global": {}, "args": {"a": 1}, "local": {"x": 2}}
+    args, local = var_environment["args"], var_environment["local"]
+    var_scopes = VarEnvironmentStack(var_environment)
+
+    var_scopes.enter_scope(new=["args"], inherited=["local"])
+    assert "a" not in var_environment["args"]
+    assert var_environment["local"]["x"] == 2
+    var_environment["args"]["b"] = 3
+    var_environment["local"]["x"] = 4
+    var_environment["local"]["y"] = 5
+    assert set(var_environment["local"].keys()) == {"x", "y"}
+
+    var_scopes.enter_scope(inherited=["local"])
+    assert var_environment["local"]["x"] == 4
+    var_environment["local"]["z"] = 6
+    var_scopes.exit_scope()
+    assert "z" not in var_environment["local"]
+
+    var_scopes.exit_scope()
+    assert var_environment["args"] is args and args == {"a": 1}
+    assert var_environment["local"] is local and local == {"x": 2}
+    assert var_scopes.scopes == []
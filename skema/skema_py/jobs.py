@@ -0,0 +1,259 @@
+"""
+jobs.py implements the job queue behind the asynchronous ingestion API of
+the skema-py service.
+
+A system is submitted as a job and converted in the background, while clients
+poll its progress (files done out of the total, the file and the pass currently
+being converted, the files that failed) and fetch the resulting GroMEt FN module
+collection once it's done. A bounded pool of threads runs the jobs, but the
+files themselves are converted in worker processes (see
+skema.program_analysis.isolation), so that several jobs actually run in parallel
+and a file that fails is left out of the collection instead of failing its job.
+"""
+import threading
+import time
+import uuid
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from functools import partial
+from typing import Dict, Iterator, List, Optional
+
+from skema.gromet.fn import GrometFNModule
+from skema.program_analysis.isolation import ModuleFailure, convert_isolated
+from skema.program_analysis.module_cache import GrometModuleCache
+from skema.program_analysis.multi_file_ingester import (
+    assemble_module_collection,
+    cache_variant,
+    iter_module_collection,
+    preload_tables,
+    virtual_file_to_gromet,
+)
+from skema.program_analysis.pipeline_context import METADATA_FULL
+from skema.utils.fold import dictionary_to_gromet_json, del_nulls
+
+JOB_QUEUED = "queued"
+JOB_RUNNING = "running"
+JOB_DONE = "done"
+JOB_FAILED = "failed"
+
+# Default number of jobs converted at once
+DEFAULT_MAX_CONCURRENT_JOBS = 2
+# Default number of jobs that can wait for a worker
+DEFAULT_MAX_QUEUE_DEPTH = 16
+# Default number of finished jobs whose results are kept around to be fetched
+DEFAULT_MAX_FINISHED_JOBS = 64
+
+
+class QueueFullError(Exception):
+    """Raised when a job is submitted while the queue is at its maximum depth"""
+
+    pass
+
+
+class Job:
+    """Class Job
+    A system submitted for ingestion, and its progress.
+
+    Current Fields:
+        - job_id: The unique identifier of the job
+        - system_name: The name of the system being ingested
+        - root_name: The name of the root directory of the system
+        - sources: The paths of the system's files to their source code,
+                   released once the job is finished
+        - metadata_level: How much metadata the GroMEt carries (see PipelineContext)
+        - status: One of queued, running, done or failed
+        - files_total: The number of files of the system
+        - files_done: The number of files converted (or loaded from the cache) so far
+        - current_file: The file being converted
+        - current_pass: The pass of the pipeline the current file is in
+        - failures: The ModuleFailures of the files that couldn't be converted,
+                   which are left out of the result
+        - result: The GroMEt FN module collection as JSON, once the job is done
+        - error: A description of the error the job failed with, if it couldn't
+                 be carried out at all
+        - submitted, started, finished: Timestamps of the job's life cycle
+    """
+
+    def __init__(
+        self,
+        system_name: str,
+        root_name: str,
+        sources: Dict[str, str],
+        metadata_level: str = METADATA_FULL,
+    ):
+        self.job_id = uuid.uuid4().hex
+        self.system_name = system_name
+        self.root_name = root_name
+        self.sources = sources
+        self.metadata_level = metadata_level
+        self.status = JOB_QUEUED
+        self.files_total = len(sources)
+        self.files_done = 0
+        self.current_file: Optional[str] = None
+        self.current_pass: Optional[str] = None
+        self.failures: List[ModuleFailure] = []
+        self.result: Optional[str] = None
+        self.error: Optional[str] = None
+        self.submitted = time.time()
+        self.started: Optional[float] = None
+        self.finished: Optional[float] = None
+
+    def is_finished(self) -> bool:
+        return self.status in (JOB_DONE, JOB_FAILED)
+
+    def enter_pass(self, file: str, pass_name: str):
+        self.current_file = file
+        self.current_pass = pass_name
+
+    def progress(self) -> dict:
+        """Returns the status of the job, without its result"""
+        return {
+            "job_id": self.job_id,
+            "system_name": self.system_name,
+            "status": self.status,
+            "files_done": self.files_done,
+            "files_total": self.files_total,
+            "current_file": self.current_file,
+            "current_pass": self.current_pass,
+            "failures": [failure.to_dict() for failure in self.failures],
+            "error": self.error,
+            "submitted": self.submitted,
+            "started": self.started,
+            "finished": self.finished,
+        }
+
+
+class JobQueue:
+    """Class JobQueue
+    Runs the submitted jobs on a bounded pool of threads. Every thread converts
+    the files of its job one at a time, each in a worker process of its own.
+
+    Current Fields:
+        - max_concurrent_jobs: The number of jobs converted at once
+        - max_queue_depth: The number of jobs that can wait for a worker.
+                   Submitting a job beyond that raises a QueueFullError.
+        - max_finished_jobs: The number of finished jobs kept around,
+                   older ones are forgotten first
+        - cache: An optional GrometModuleCache shared by all the jobs
+        - jobs: The known jobs, by job_id, in the order they were submitted
+    """
+
+    def __init__(
+        self,
+        max_concurrent_jobs: int = DEFAULT_MAX_CONCURRENT_JOBS,
+        max_queue_depth: int = DEFAULT_MAX_QUEUE_DEPTH,
+        max_finished_jobs: int = DEFAULT_MAX_FINISHED_JOBS,
+        cache: GrometModuleCache = None,
+    ):
+        self.max_concurrent_jobs = max_concurrent_jobs
+        self.max_queue_depth = max_queue_depth
+        self.max_finished_jobs = max_finished_jobs
+        self.cache = cache
+
+        self.jobs: "OrderedDict[str, Job]" = OrderedDict()
+        self.lock = threading.Lock()
+        self.executor = ThreadPoolExecutor(
+            max_workers=max_concurrent_jobs, thread_name_prefix="skema-job"
+        )
+
+    def submit(
+        self,
+        system_name: str,
+        root_name: str,
+        sources: Dict[str, str],
+        metadata_level: str = METADATA_FULL,
+    ) -> Job:
+        """Queues a system for ingestion and returns its job.
+        Raises a QueueFullError if max_queue_depth jobs are already waiting.
+        """
+        job = Job(system_name, root_name, sources, metadata_level)
+        with self.lock:
+            if self.queue_depth() >= self.max_queue_depth:
+                raise QueueFullError(
+                    f"The job queue is full ({self.max_queue_depth} jobs waiting)"
+                )
+            self.jobs[job.job_id] = job
+        self.executor.submit(self.run, job)
+        return job
+
+    def get(self, job_id: str) -> Optional[Job]:
+        with self.lock:
+            return self.jobs.get(job_id)
+
+    def queue_depth(self) -> int:
+        """Returns the number of jobs waiting for a worker"""
+        return sum(1 for job in self.jobs.values() if job.status == JOB_QUEUED)
+
+    def stats(self) -> dict:
+        with self.lock:
+            counts = {
+                status: 0
+                for status in (JOB_QUEUED, JOB_RUNNING, JOB_DONE, JOB_FAILED)
+            }
+            for job in self.jobs.values():
+                counts[job.status] += 1
+            return dict(
+                max_concurrent_jobs=self.max_concurrent_jobs,
+                max_queue_depth=self.max_queue_depth,
+                **counts,
+            )
+
+    def run(self, job: Job):
+        """Converts the system of job, on a thread of the pool"""
+        job.status = JOB_RUNNING
+        job.started = time.time()
+
+        def convert(to_process: List[str]) -> Iterator[Optional[GrometFNModule]]:
+            # Files that aren't in to_process were loaded from the cache
+            job.files_done = job.files_total - len(to_process)
+            convert_file = partial(
+                virtual_file_to_gromet,
+                sources=job.sources,
+                metadata_level=job.metadata_level,
+            )
+            for generated_gromet in convert_isolated(
+                convert_file,
+                to_process,
+                failures=job.failures,
+                on_pass=job.enter_pass,
+            ):
+                job.files_done += 1
+                yield generated_gromet
+
+        try:
+            preload_tables()
+            records = iter_module_collection(
+                job.system_name,
+                job.root_name,
+                list(job.sources.keys()),
+                lambda file: job.sources[file].encode("utf-8"),
+                convert,
+                self.cache,
+                cache_variant(False, job.metadata_level),
+            )
+            module_collection = assemble_module_collection(records)
+            job.result = dictionary_to_gromet_json(
+                del_nulls(module_collection.to_dict())
+            )
+            job.status = JOB_DONE
+        except Exception as e:
+            job.error = f"{type(e).__name__}: {e}"
+            job.status = JOB_FAILED
+        finally:
+            job.current_file = None
+            job.current_pass = None
+            job.sources = None
+            job.finished = time.time()
+            self.forget_finished_jobs()
+
+    def forget_finished_jobs(self):
+        """Forgets the oldest finished jobs, past the max_finished_jobs most recent ones"""
+        with self.lock:
+            finished = [
+                job_id for job_id, job in self.jobs.items() if job.is_finished()
+            ]
+            for job_id in finished[: max(0, len(finished) - self.max_finished_jobs)]:
+                del self.jobs[job_id]
+
+    def shutdown(self):
+        self.executor.shutdown(wait=False)
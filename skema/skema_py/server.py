@@ -1,14 +1,27 @@
 import os
-import tempfile
 from typing import List
 
-from fastapi import FastAPI, Body
+from fastapi import FastAPI, Body, HTTPException
+from fastapi.responses import StreamingResponse
 from pydantic import BaseModel
 
 import skema.skema_py.acsets
 import skema.skema_py.petris
 
-from skema.program_analysis.multi_file_ingester import process_file_system
+from skema.program_analysis.multi_file_ingester import (
+    process_sources,
+    iter_ndjson,
+)
+from skema.program_analysis.module_cache import GrometModuleCache, DEFAULT_MAX_SIZE
+from skema.program_analysis.pipeline_context import METADATA_FULL, METADATA_LEVELS
+from skema.skema_py.jobs import (
+    JobQueue,
+    QueueFullError,
+    JOB_DONE,
+    JOB_FAILED,
+    DEFAULT_MAX_CONCURRENT_JOBS,
+    DEFAULT_MAX_QUEUE_DEPTH,
+)
 from skema.utils.fold import dictionary_to_gromet_json, del_nulls
 
 
@@ -21,10 +34,44 @@ class System(BaseModel):
     blobs: List[str]
     system_name: str
     root_name: str
+    # One of METADATA_LEVELS: none, minimal or full
+    metadata_level: str = METADATA_FULL
+
+
+def check_metadata_level(system: System):
+    if system.metadata_level not in METADATA_LEVELS:
+        raise HTTPException(
+            status_code=422,
+            detail=f"Unknown metadata level {system.metadata_level}, expected one of {METADATA_LEVELS}",
+        )
 
 
 app = FastAPI()
 
+# The generated modules are cached on disk if SKEMA_GROMET_CACHE_DIR is set,
+# so that unchanged files aren't run through the pipeline again
+GROMET_CACHE_DIR = os.environ.get("SKEMA_GROMET_CACHE_DIR")
+GROMET_CACHE_MAX_SIZE = int(
+    os.environ.get("SKEMA_GROMET_CACHE_MAX_SIZE", DEFAULT_MAX_SIZE)
+)
+gromet_cache = (
+    GrometModuleCache(GROMET_CACHE_DIR, GROMET_CACHE_MAX_SIZE)
+    if GROMET_CACHE_DIR
+    else None
+)
+
+# Systems submitted to /jobs are converted in the background, by at most
+# SKEMA_JOB_WORKERS jobs at once, with at most SKEMA_JOB_QUEUE_DEPTH jobs waiting
+job_queue = JobQueue(
+    max_concurrent_jobs=int(
+        os.environ.get("SKEMA_JOB_WORKERS", DEFAULT_MAX_CONCURRENT_JOBS)
+    ),
+    max_queue_depth=int(
+        os.environ.get("SKEMA_JOB_QUEUE_DEPTH", DEFAULT_MAX_QUEUE_DEPTH)
+    ),
+    cache=gromet_cache,
+)
+
 
 @app.get("/ping", summary="Ping endpoint to test health of service")
 def ping():
@@ -38,33 +85,115 @@ def ping():
         " get a GroMEt FN Module collection back."
     ),
 )
-async def fn_given_filepaths(system: System):
-    # Create a tempory directory to store module
-    with tempfile.TemporaryDirectory() as tmp:
-        # Recreate module structure
-        for index, file in enumerate(system.files):
-            full_path = os.path.join(tmp, system.root_name, file)
-            # Create file and intermediate directories first
-            os.makedirs(os.path.dirname(full_path), exist_ok=True)
-            with open(full_path, "w") as f:
-                f.write(system.blobs[index])
-
-        # Create system_filepaths.txt file
-        system_filepaths = os.path.join(tmp, "system_filepaths.txt")
-        with open(system_filepaths, "w") as f:
-            f.writelines(file + "\n" for file in system.files)
-
-        ## Run pipeline
-        gromet_collection = process_file_system(
-            system.system_name,
-            os.path.join(tmp, system.root_name),
-            system_filepaths,
-        )
+def fn_given_filepaths(system: System):
+    # NOTE: This endpoint is deliberately not async. FastAPI runs it in its
+    # threadpool, so several systems can be processed at once. This is safe
+    # since the pipeline doesn't change the working directory or rely on
+    # global state (see skema.program_analysis.pipeline_context).
+    # The system is ingested straight from the request, without writing
+    # its files to disk.
+    check_metadata_level(system)
+    gromet_collection = process_sources(
+        system.system_name,
+        dict(zip(system.files, system.blobs)),
+        system.root_name,
+        cache=gromet_cache,
+        metadata_level=system.metadata_level,
+    )
 
     # Convert output to json
     gromet_collection_dict = gromet_collection.to_dict()
     return dictionary_to_gromet_json(del_nulls(gromet_collection_dict))
 
+@app.post(
+    "/fn-given-filepaths-stream",
+    summary=(
+        "Send a system of code and filepaths of interest,"
+        " get its GroMEt FN Modules back as newline delimited JSON."
+    ),
+)
+def fn_given_filepaths_stream(system: System):
+    # Every module is sent as one line of JSON as soon as it's generated,
+    # followed by a trailer line with the module_index and executables of
+    # the collection. The collection is never rendered as a whole.
+    check_metadata_level(system)
+    records = process_sources(
+        system.system_name,
+        dict(zip(system.files, system.blobs)),
+        system.root_name,
+        cache=gromet_cache,
+        stream=True,
+        metadata_level=system.metadata_level,
+    )
+    return StreamingResponse(
+        iter_ndjson(records), media_type="application/x-ndjson"
+    )
+
+
+@app.post(
+    "/jobs",
+    status_code=202,
+    summary=(
+        "Submit a system of code for ingestion in the background,"
+        " get back the id of the job to poll."
+    ),
+)
+def submit_job(system: System):
+    check_metadata_level(system)
+    try:
+        job = job_queue.submit(
+            system.system_name,
+            system.root_name,
+            dict(zip(system.files, system.blobs)),
+            system.metadata_level,
+        )
+    except QueueFullError as e:
+        raise HTTPException(status_code=429, detail=str(e))
+    return job.progress()
+
+
+@app.get("/jobs", summary="Number of jobs in every state of the job queue")
+def job_stats():
+    return job_queue.stats()
+
+
+@app.get(
+    "/jobs/{job_id}",
+    summary="Status and per-file progress of an ingestion job",
+)
+def job_status(job_id: str):
+    job = job_queue.get(job_id)
+    if job is None:
+        raise HTTPException(status_code=404, detail=f"Unknown job {job_id}")
+    return job.progress()
+
+
+@app.get(
+    "/jobs/{job_id}/result",
+    summary="GroMEt FN Module collection of a finished ingestion job",
+)
+def job_result(job_id: str):
+    job = job_queue.get(job_id)
+    if job is None:
+        raise HTTPException(status_code=404, detail=f"Unknown job {job_id}")
+    if job.status == JOB_FAILED:
+        raise HTTPException(status_code=500, detail=job.error)
+    if job.status != JOB_DONE:
+        raise HTTPException(
+            status_code=409, detail=f"Job {job_id} is {job.status}"
+        )
+    return job.result
+
+
+@app.get(
+    "/cache-stats", summary="Hit/miss counters of the GroMEt module cache"
+)
+def cache_stats():
+    if gromet_cache is None:
+        return {"enabled": False}
+    return dict(enabled=True, **gromet_cache.stats())
+
+
 @app.post(
     "/get-pyacset",
     summary=("Get PyACSet for a given model"),
@@ -0,0 +1,195 @@
+"""
+dispatch.py defines typedispatchmethod, a drop-in replacement for
+functools.singledispatchmethod for the visitors of the pipeline.
+
+singledispatchmethod builds a new wrapper function (with functools.update_wrapper)
+every time the method is looked up, and goes through the dispatch cache of
+functools.singledispatch on every call. The visitors look their visit method up
+for every node they visit, so that cost adds up. A typedispatchmethod keeps a
+table of node types to handlers instead: handlers are registered the same way,
+the method is bound once per visitor, and every call is one dictionary lookup.
+
+dispatch.py also defines call_with_deep_recursion, which runs a (recursive)
+visitor in a thread with a larger stack, for inputs that are nested too deeply
+for the default recursion limit. The recursion limit is process wide, so raising
+it would also take the protection of RecursionError away from every other thread
+of the process: call_with_deep_recursion refuses to run alongside other threads.
+Processes that run several threads (i.e. the server) convert deeply nested
+sources in processes of their own instead (see isolation.py).
+"""
+import sys
+import threading
+import types
+import typing
+
+# The recursion limit and stack size (in bytes) of call_with_deep_recursion
+DEEP_RECURSION_LIMIT = 100000
+DEEP_RECURSION_STACK_SIZE = 512 * 1024 * 1024
+
+# Guards the process wide recursion limit. Calls of call_with_deep_recursion
+# may be nested (the function of a call making another one), so the limit is
+# raised by the outermost call and only restored once it's done
+RECURSION_LIMIT_LOCK = threading.Lock()
+deep_recursion_calls = 0
+restored_recursion_limit = None
+# The threads of the active calls: the threads that made them, and the threads
+# that run their functions. No other thread may run while a call is active
+deep_recursion_threads: typing.List[threading.Thread] = []
+
+
+class typedispatchmethod:
+    """Class typedispatchmethod
+    A method that dispatches on the type of its first argument after self,
+    through a table of types to handlers.
+
+    Current Fields:
+        - default: The method called for types that have no handler
+        - registry: The handlers that were registered, by type
+        - table: The handler of every type that was dispatched on so far,
+                 including subclasses of the registered types
+    """
+
+    def __init__(self, default):
+        self.default = default
+        self.registry = {object: default}
+        self.table = {}
+        self.attrname = None
+        self.dispatch = self.make_dispatch()
+        self.__doc__ = default.__doc__
+
+    def __set_name__(self, owner, name):
+        self.attrname = name
+
+    def register(self, cls, method=None):
+        """Registers method as the handler of cls. Like singledispatchmethod.register,
+        it can be used as a decorator, either with the type as argument or on
+        a method whose first argument after self is annotated with the type."""
+        if method is None and not isinstance(cls, type):
+            method = cls
+            annotations = typing.get_type_hints(method)
+            annotations.pop("return", None)
+            if len(annotations) == 0:
+                raise TypeError(
+                    f"Invalid first argument to `register()`: {method!r}. "
+                    "Use either `@register(some_class)` or plain `@register` "
+                    "on an annotated function."
+                )
+            cls = next(iter(annotations.values()))
+            if not isinstance(cls, type):
+                raise TypeError(
+                    f"Invalid annotation for {method.__name__!r}. {cls!r} is not a class."
+                )
+        elif method is None:
+            return lambda method: self.register(cls, method)
+
+        self.registry[cls] = method
+        self.table.clear()
+        return method
+
+    def resolve(self, cls):
+        """Returns the handler of cls: the handler of the first of its bases
+        (in method resolution order) that has one"""
+        for base in cls.__mro__:
+            if base in self.registry:
+                handler = self.registry[base]
+                self.table[cls] = handler
+                return handler
+        return self.default
+
+    def make_dispatch(self):
+        table = self.table
+        resolve = self.resolve
+
+        def dispatch(visitor, node, *args, **kwargs):
+            try:
+                handler = table[node.__class__]
+            except KeyError:
+                handler = resolve(node.__class__)
+            return handler(visitor, node, *args, **kwargs)
+
+        return dispatch
+
+    def __get__(self, obj, cls=None):
+        if obj is None:
+            return self
+        method = types.MethodType(self.dispatch, obj)
+        # Later lookups on the same visitor find the bound method
+        # in its __dict__, without going through the descriptor
+        if self.attrname is not None and hasattr(obj, "__dict__"):
+            obj.__dict__[self.attrname] = method
+        return method
+
+
+def call_with_deep_recursion(
+    function,
+    *args,
+    recursion_limit: int = DEEP_RECURSION_LIMIT,
+    stack_size: int = DEEP_RECURSION_STACK_SIZE,
+    **kwargs,
+):
+    """Calls function with args and kwargs in a thread with a stack of stack_size
+    bytes, with the recursion limit raised to recursion_limit, and returns its result
+    (or raises its exception). This lets the recursive visitors handle inputs that
+    are nested too deeply for the default recursion limit.
+
+    Since the recursion limit is process wide, this raises a RuntimeError if any
+    other thread is running in the process: it's only safe in a process that
+    does nothing else, like the CLI or the worker processes of isolation.py.
+    """
+    global deep_recursion_calls, restored_recursion_limit
+    result = {}
+
+    def run():
+        try:
+            result["value"] = function(*args, **kwargs)
+        except BaseException as e:
+            result["error"] = e
+
+    caller = threading.current_thread()
+    with RECURSION_LIMIT_LOCK:
+        others = [
+            thread
+            for thread in threading.enumerate()
+            if thread is not caller and thread not in deep_recursion_threads
+        ]
+        if others:
+            raise RuntimeError(
+                "call_with_deep_recursion raises the process wide recursion limit, so it "
+                f"can't run alongside other threads ({', '.join(t.name for t in others)}). "
+                "Run it in a process of its own instead."
+            )
+        thread = threading.Thread(target=run, name="deep-recursion")
+        if deep_recursion_calls == 0:
+            restored_recursion_limit = sys.getrecursionlimit()
+        deep_recursion_calls += 1
+        deep_recursion_threads.extend((caller, thread))
+        sys.setrecursionlimit(max(sys.getrecursionlimit(), recursion_limit))
+        try:
+            previous_stack_size = threading.stack_size(stack_size)
+            try:
+                thread.start()
+            finally:
+                threading.stack_size(previous_stack_size)
+        except BaseException:
+            exit_deep_recursion(caller, thread)
+            raise
+    try:
+        thread.join()
+    finally:
+        with RECURSION_LIMIT_LOCK:
+            exit_deep_recursion(caller, thread)
+
+    if "error" in result:
+        raise result["error"]
+    return result["value"]
+
+
+def exit_deep_recursion(caller: threading.Thread, thread: threading.Thread):
+    """Ends the active call of call_with_deep_recursion made by caller and run by thread,
+    restoring the recursion limit if it was the last one. Called with RECURSION_LIMIT_LOCK held."""
+    global deep_recursion_calls
+    deep_recursion_threads.remove(caller)
+    deep_recursion_threads.remove(thread)
+    deep_recursion_calls -= 1
+    if deep_recursion_calls == 0:
+        sys.setrecursionlimit(restored_recursion_limit)
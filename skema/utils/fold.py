@@ -22,9 +22,13 @@ import json
 
 
 def dictionary_to_gromet_json(
-    o, fold_level=5, indent=4, level=0, parent_key=""
+    o, fold_level=5, indent=4, level=0, parent_key="", compact=False
 ):
-    if level < fold_level:
+    """Renders the dictionary o as GroMEt JSON, folding every level below fold_level
+    onto a single line. If compact is true, the whole document is rendered
+    on a single line instead (i.e. for newline delimited JSON).
+    """
+    if level < fold_level and not compact:
         newline = "\n"
         space = " "
     else:
@@ -49,7 +53,7 @@ def dictionary_to_gromet_json(
             comma = "," + newline
             ret += space * indent * (level + 1)
             ret += dictionary_to_gromet_json(
-                e, fold_level, indent, level + 1, parent_key
+                e, fold_level, indent, level + 1, parent_key, compact
             )
         ret += newline + space * indent * level + "]"
     elif isinstance(o, dict):
@@ -61,16 +65,16 @@ def dictionary_to_gromet_json(
             ret += space * indent * (level + 1)
             ret += '"' + str(k) + '":' + space
             if k == "fn":
-                ret += dictionary_to_gromet_json(v, 4, indent, level + 1, k)
+                ret += dictionary_to_gromet_json(v, 4, indent, level + 1, k, compact)
             elif k == "attributes":
-                ret += dictionary_to_gromet_json(v, 6, indent, level + 1, k)
+                ret += dictionary_to_gromet_json(v, 6, indent, level + 1, k, compact)
             elif k == "bf" and parent_key == "fn":
-                ret += dictionary_to_gromet_json(v, 5, indent, level + 1, k)
+                ret += dictionary_to_gromet_json(v, 5, indent, level + 1, k, compact)
             elif k == "bf" and parent_key == "value":
-                ret += dictionary_to_gromet_json(v, 7, indent, level + 1, k)
+                ret += dictionary_to_gromet_json(v, 7, indent, level + 1, k, compact)
             else:
                 ret += dictionary_to_gromet_json(
-                    v, fold_level, indent, level + 1, k
+                    v, fold_level, indent, level + 1, k, compact
                 )
         ret += newline + space * indent * level + "}"
     elif o is None:
@@ -84,7 +88,7 @@ def dictionary_to_gromet_json(
         if hasattr(o, "to_dict"):
             temp = del_nulls(o.to_dict())
             ret += dictionary_to_gromet_json(
-                temp, fold_level, indent, level, parent_key
+                temp, fold_level, indent, level, parent_key, compact
             )
         else:
             ret += str(o)
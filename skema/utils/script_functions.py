@@ -11,7 +11,7 @@ from skema.gromet.fn import (
 
 from skema.utils.fold import dictionary_to_gromet_json, del_nulls
 from skema.program_analysis.PyAST2CAST import py_ast_to_cast
-from skema.program_analysis.CAST2FN import cast
+from skema.program_analysis.CAST2FN import cast, checkpoint
 from skema.program_analysis.CAST2FN.model.cast import SourceRef
 from skema.program_analysis.CAST2FN.cast import CAST
 from skema.program_analysis.CAST2FN.visitors.cast_to_agraph_visitor import (
@@ -20,6 +20,13 @@ from skema.program_analysis.CAST2FN.visitors.cast_to_agraph_visitor import (
 from skema.program_analysis.CAST2FN.ann_cast.cast_to_annotated_cast import (
     CastToAnnotatedCastVisitor,
 )
+from skema.program_analysis.CAST2FN.ann_cast.annotated_cast import (
+    AnnCastNode,
+)
+from skema.program_analysis.pipeline_context import (
+    PipelineContext,
+    check_metadata_level,
+)
 from skema.program_analysis.CAST2FN.ann_cast.id_collapse_pass import (
     IdCollapsePass,
 )
@@ -39,6 +46,7 @@ from skema.program_analysis.CAST2FN.ann_cast.lambda_expression_pass import (
     LambdaExpressionPass,
 )
 from skema.program_analysis.CAST2FN.ann_cast.to_grfn_pass import ToGrfnPass
+from skema.program_analysis.CAST2FN.ann_cast.pass_manager import PassManager
 from skema.program_analysis.CAST2FN.ann_cast.to_gromet_pass import (
     ToGrometPass,
 )
@@ -140,11 +148,19 @@ def python_to_cast(
         line_count += 1
     file_handle.close()
 
+    # Imports are resolved against the directory of the
+    # source file we're generating CAST for
+    search_path = [os.path.dirname(os.path.abspath(pyfile_path))]
+
     # Create a PyASTToCAST Object
     if legacy:
-        convert = py_ast_to_cast.PyASTToCAST(file_name, legacy=True)
+        convert = py_ast_to_cast.PyASTToCAST(
+            file_name, legacy=True, search_path=search_path
+        )
     else:
-        convert = py_ast_to_cast.PyASTToCAST(file_name)
+        convert = py_ast_to_cast.PyASTToCAST(
+            file_name, search_path=search_path
+        )
 
     # Additional option to allow us to view the PyAST
     # using the astpp module
@@ -153,26 +169,10 @@ def python_to_cast(
         print("AST Printing Currently Disabled")
         pass
 
-    # 'Root' the current working directory so that it's where the
-    # Source file we're generating CAST for is (for Import statements)
-    old_path = os.getcwd()
-    try:
-        idx = pyfile_path.rfind("/")
-
-        if idx > -1:
-            curr_path = pyfile_path[0:idx]
-            os.chdir(curr_path)
-        else:
-            curr_path = "./" + pyfile_path
-
-        # os.chdir(curr_path)
-
-        # Parse the python program's AST and create the CAST
-        contents = ast.parse(file_contents)
-        C = convert.visit(contents, {}, {})
-        C.source_refs = [SourceRef(file_name, None, None, 1, line_count)]
-    finally:
-        os.chdir(old_path)
+    # Parse the python program's AST and create the CAST
+    contents = ast.parse(file_contents)
+    C = convert.visit(contents, {}, {})
+    C.source_refs = [SourceRef(file_name, None, None, 1, line_count)]
 
     out_cast = cast.CAST([C], "python")
 
@@ -213,11 +213,14 @@ def ann_cast_pipeline(
     a_graph=False,
     from_obj=False,
     indent_level=0,
+    context=None,
+    metadata_level=None,
+    deep_recursion=None,
 ):
     """cast_to_annotated.py
 
-    This function reads a JSON file that contains the CAST representation
-    of a program, and transforms it to annotated CAST. It then calls a
+    This function reads a JSON file (or a checkpoint) that contains the CAST
+    representation of a program, and transforms it to annotated CAST. It then calls a
     series of passes that each augment the information in the annotatd CAST nodes
     in preparation for the GrFN generation.
 
@@ -225,6 +228,14 @@ def ann_cast_pipeline(
     contains the CAST data.
     TODO: Update this docstring as the program has been tweaked so that this is a function instead of
     the program
+
+    An optional PipelineContext carries the per-run state of the pipeline
+    (i.e. the root directory that imports are resolved against).
+    An optional metadata_level (none, minimal or full) sets how much metadata
+    the generated GroMEt carries, overriding the one of the context.
+    If deep_recursion is given, it overrides the one of the context too: the AnnCAST
+    is then built, and the passes run, in a thread with a larger stack and recursion
+    limit, for CAST that's nested too deeply for the default one.
     """
 
     if from_obj:
@@ -233,25 +244,39 @@ def ann_cast_pipeline(
     else:
         f_name = cast_instance
         f_name = f_name.split("/")[-1]
-        file_contents = open(f_name, "r").read()
-
-        cast_json = CAST([], "python")
-        cast = cast_json.from_json_str(file_contents)
-
-    visitor = CastToAnnotatedCastVisitor(cast)
-    # The Annotated Cast is an attribute of the PipelineState object
-    pipeline_state = visitor.generate_annotated_cast(grfn_2_2)
+        # The CAST is either a JSON file or a checkpoint (see checkpoint.py)
+        if checkpoint.is_checkpoint(f_name):
+            cast = checkpoint.load_cast(f_name)
+        else:
+            file_contents = open(f_name, "r").read()
+
+            cast_json = CAST([], "python")
+            cast = cast_json.from_json_str(file_contents)
+
+    if context is None:
+        context = PipelineContext()
+    if metadata_level is not None:
+        check_metadata_level(metadata_level)
+        context.metadata_level = metadata_level
+    if deep_recursion is not None:
+        context.deep_recursion = deep_recursion
+
+    # The nodes are counted once the pass is done, so the list is filled in the pass
+    ann_nodes = []
+    with context.run_pass("CastToAnnotatedCast", ann_nodes, AnnCastNode):
+        visitor = CastToAnnotatedCastVisitor(cast)
+        # The Annotated Cast is an attribute of the PipelineState object
+        pipeline_state = visitor.generate_annotated_cast(
+            grfn_2_2, context, deep_recursion=context.deep_recursion
+        )
+        ann_nodes.append(pipeline_state.nodes)
 
     # TODO: make filename creation more resilient
 
-    print("Calling IdCollapsePass------------------------")
-    IdCollapsePass(pipeline_state)
-
-    print("\nCalling ContainerScopePass-------------------")
-    ContainerScopePass(pipeline_state)
-
-    print("\nCalling VariableVersionPass-------------------")
-    VariableVersionPass(pipeline_state)
+    # The passes run through a PassManager, which only runs the passes that
+    # the output depends on, and fuses the traversals of the passes it can
+    pass_manager = PassManager(pipeline_state)
+    pass_manager.run(["VariableVersionPass"])
 
     # NOTE: CASTToAGraphVisitor uses misc.uuid, so placing it here means
     # that the generated GrFN uuids will not be consistent with GrFN uuids
@@ -263,18 +288,8 @@ def ann_cast_pipeline(
         pdf_file_name = f"{f_name}-AnnCast.pdf"
         agraph.to_pdf(pdf_file_name)
 
-    print("\nCalling GrfnVarCreationPass-------------------")
-    GrfnVarCreationPass(pipeline_state)
-
-    print("\nCalling GrfnAssignmentPass-------------------")
-    GrfnAssignmentPass(pipeline_state)
-
-    print("\nCalling LambdaExpressionPass-------------------")
-    LambdaExpressionPass(pipeline_state)
-
     if gromet:
-        print("\nCalling ToGrometPass-----------------------")
-        ToGrometPass(pipeline_state)
+        pass_manager.run(["ToGrometPass"])
 
         if to_file:
             with open(f"{f_name}--Gromet-FN-auto.json", "w") as f:
@@ -289,8 +304,7 @@ def ann_cast_pipeline(
         else:
             return pipeline_state.gromet_collection
     else:
-        print("\nCalling ToGrfnPass-------------------")
-        ToGrfnPass(pipeline_state)
+        pass_manager.run(["ToGrfnPass"])
         grfn = pipeline_state.get_grfn()
         grfn.to_json_file(f"{f_name}--AC-GrFN.json")
 